@@ -0,0 +1,132 @@
+"""
+Compares the bytes transferred and the time to extraction of the scrapers
+with and without the lightweight browser profile.
+
+Usage:
+    python -m benchmarks.browser_profile URL [URL ...] [--runs N]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from kami_pricing_analytics.data_collector import (
+    CollectorFactory,
+    CollectorOptions,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BaseScraper,
+)
+
+
+def get_transferred_bytes(scraper: BaseScraper) -> int:
+    """
+    Sums the encoded bytes of every request recorded by the session.
+
+    Args:
+        scraper (BaseScraper): Scraper whose session records network events.
+
+    Returns:
+        int: The bytes transferred over the network.
+    """
+    transferred = 0
+    for entry in scraper.webdriver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        if message['method'] == 'Network.loadingFinished':
+            transferred += message['params'].get('encodedDataLength', 0)
+    return int(transferred)
+
+
+async def run_once(product_url: str, profile_enabled: bool) -> Dict:
+    """
+    Scrapes a product on a fresh session and measures the scrape.
+
+    Args:
+        product_url (str): URL of the product.
+        profile_enabled (bool): Whether the lightweight profile is applied.
+
+    Returns:
+        Dict: The sellers found, the seconds to extraction and the bytes transferred.
+    """
+    scraper = CollectorFactory.get_strategy(
+        CollectorOptions.WEB_SCRAPING.value, product_url
+    )
+    scraper.use_driver_pool = False
+    scraper.browser_profile = scraper.browser_profile.model_copy(
+        update={'enabled': profile_enabled, 'record_network': True}
+    )
+    await scraper.set_webdriver()
+    try:
+        started_at = time.perf_counter()
+        sellers = await scraper.get_sellers_info(
+            await scraper.get_sellers_list()
+        )
+        elapsed = time.perf_counter() - started_at
+        transferred = await scraper.run_in_driver(
+            get_transferred_bytes, scraper
+        )
+    finally:
+        await scraper.release_webdriver()
+
+    return {
+        'sellers': len(sellers),
+        'seconds': elapsed,
+        'bytes': transferred,
+    }
+
+
+async def benchmark(product_urls: List[str], runs: int) -> List[Dict]:
+    """
+    Runs every product `runs` times with and without the profile.
+
+    Args:
+        product_urls (List[str]): URLs of the products.
+        runs (int): Runs per product and profile.
+
+    Returns:
+        List[Dict]: One summary per product and profile.
+    """
+    results = []
+    for product_url in product_urls:
+        for profile_enabled in (False, True):
+            samples = [
+                await run_once(product_url, profile_enabled)
+                for _ in range(runs)
+            ]
+            results.append(
+                {
+                    'product_url': product_url,
+                    'profile': 'lightweight' if profile_enabled else 'full',
+                    'sellers': samples[-1]['sellers'],
+                    'median_seconds': statistics.median(
+                        sample['seconds'] for sample in samples
+                    ),
+                    'median_bytes': statistics.median(
+                        sample['bytes'] for sample in samples
+                    ),
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('product_urls', nargs='+')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args.product_urls, args.runs))
+    print(f"{'profile':<12}{'sellers':>8}{'seconds':>10}{'KiB':>12}  url")
+    for result in results:
+        print(
+            f"{result['profile']:<12}{result['sellers']:>8}"
+            f"{result['median_seconds']:>10.2f}"
+            f"{result['median_bytes'] / 1024:>12.1f}  {result['product_url']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+Measures the cold import time of a module, such as the API application, in
+fresh interpreters, and lists the third-party packages weighing the most on it.
+
+Usage:
+    python -m benchmarks.import_time [MODULE] [--runs N] [--top N]
+        [--max-seconds SECONDS]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+DEFAULT_MODULE = 'kami_pricing_analytics.interface.api.fastapi.app'
+
+IMPORT_TIME_PATTERN = re.compile(
+    r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$'
+)
+
+
+def parse_import_time(report: str) -> Dict:
+    """
+    Parses the report of `python -X importtime`.
+
+    Args:
+        report (str): The report, as written to the standard error.
+
+    Returns:
+        Dict: The total seconds of the imports, and the seconds spent in the
+            modules of every top-level package, excluding their own imports.
+
+    Examples:
+        >>> parse_import_time(
+        ...     'import time:       500 |        500 |   b.c\\n'
+        ...     'import time:      1500 |       2000 | a\\n'
+        ... )
+        {'seconds': 0.002, 'packages': {'b': 0.0005, 'a': 0.0015}}
+    """
+    total = 0
+    packages = defaultdict(int)
+    for line in report.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        own, cumulative, indent, module = match.groups()
+        packages[module.split('.')[0]] += int(own)
+        if len(indent) == 1:
+            total += int(cumulative)
+    return {
+        'seconds': total / 1e6,
+        'packages': {
+            package: microseconds / 1e6
+            for package, microseconds in packages.items()
+        },
+    }
+
+
+def run_once(module: str) -> Dict:
+    """
+    Imports a module in a fresh interpreter, with `-X importtime`.
+
+    Args:
+        module (str): The module to import.
+
+    Returns:
+        Dict: The parsed import time report.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f'Could not import {module}:\n{process.stderr}')
+    return parse_import_time(process.stderr)
+
+
+def benchmark(module: str, runs: int) -> Dict:
+    """
+    Imports a module `runs` times, each in a fresh interpreter.
+
+    Args:
+        module (str): The module to import.
+        runs (int): Imports to measure.
+
+    Returns:
+        Dict: The median total seconds, and the median seconds of every
+            top-level package.
+    """
+    samples = [run_once(module) for _ in range(runs)]
+    packages = {
+        package for sample in samples for package in sample['packages']
+    }
+    return {
+        'median_seconds': statistics.median(
+            sample['seconds'] for sample in samples
+        ),
+        'packages': {
+            package: statistics.median(
+                sample['packages'].get(package, 0.0) for sample in samples
+            )
+            for package in packages
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('module', nargs='?', default=DEFAULT_MODULE)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--max-seconds', type=float, default=None)
+    args = parser.parse_args()
+
+    result = benchmark(args.module, args.runs)
+    heaviest: List = sorted(
+        result['packages'].items(), key=lambda item: item[1], reverse=True
+    )
+    print(f"{'seconds':>10}  package")
+    for package, seconds in heaviest[: args.top]:
+        print(f'{seconds:>10.3f}  {package}')
+    print(f"{result['median_seconds']:>10.3f}  total ({args.module})")
+
+    if (
+        args.max_seconds is not None
+        and result['median_seconds'] > args.max_seconds
+    ):
+        sys.exit(
+            f"Import took {result['median_seconds']:.3f}s, over the"
+            f' {args.max_seconds:.3f}s budget'
+        )
+
+
+if __name__ == '__main__':
+    main()
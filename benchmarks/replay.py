@@ -0,0 +1,157 @@
+"""
+Records marketplace responses as fixtures, and measures the scrapers
+throughput against them on a local replay server, with reproducible latency
+and bandwidth.
+
+Usage:
+    python -m benchmarks.replay record FIXTURES URL [URL ...]
+    python -m benchmarks.replay run FIXTURES URL [URL ...] [--runs N]
+        [--latency SECONDS] [--bandwidth BYTES_PER_SECOND]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+
+from kami_pricing_analytics.data_collector import (
+    CollectorFactory,
+    CollectorOptions,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    DriverPoolRegistry,
+    PageArchive,
+    ReplayFixtures,
+    ReplayServer,
+)
+
+
+async def record(fixtures_directory: str, product_urls: List[str]):
+    """
+    Scrapes the live marketplaces once per product, archiving every page the
+    scrapers fetch, and saves the latest fetch of each URL as fixtures.
+
+    Args:
+        fixtures_directory (str): Directory of the fixtures.
+        product_urls (List[str]): URLs of the products.
+    """
+    with tempfile.TemporaryDirectory() as archive_directory:
+        archive = PageArchive(archive_directory, max_age=0, max_bytes=0)
+        try:
+            for product_url in product_urls:
+                scraper = CollectorFactory.get_strategy(
+                    CollectorOptions.WEB_SCRAPING.value, product_url
+                )
+                scraper.page_archive = archive
+                sellers = await scraper.execute()
+                print(f'{len(sellers):>4} sellers recorded from {product_url}')
+            fixtures = ReplayFixtures.from_archive(archive, fixtures_directory)
+        finally:
+            archive.close()
+            await DriverPoolRegistry.close_all()
+    print(f'{len(fixtures.entries)} responses saved to {fixtures_directory}')
+
+
+async def run_once(product_url: str) -> Dict:
+    """
+    Scrapes a product against the replay server.
+
+    Args:
+        product_url (str): URL of the product.
+
+    Returns:
+        Dict: The sellers found and the seconds the scrape took.
+    """
+    scraper = CollectorFactory.get_strategy(
+        CollectorOptions.WEB_SCRAPING.value, product_url
+    )
+    started_at = time.perf_counter()
+    sellers = await scraper.execute()
+    return {
+        'sellers': len(sellers),
+        'seconds': time.perf_counter() - started_at,
+    }
+
+
+async def benchmark(
+    fixtures_directory: str,
+    product_urls: List[str],
+    runs: int,
+    latency: float,
+    bandwidth: int,
+) -> List[Dict]:
+    """
+    Runs every product `runs` times against a replay server of the fixtures.
+
+    Args:
+        fixtures_directory (str): Directory of the fixtures.
+        product_urls (List[str]): URLs of the products.
+        runs (int): Runs per product.
+        latency (float): Seconds added before every response.
+        bandwidth (int): Bytes per second of the responses, 0 for no limit.
+
+    Returns:
+        List[Dict]: One summary per product.
+    """
+    results = []
+    server = ReplayServer(
+        ReplayFixtures(fixtures_directory),
+        latency=latency,
+        bandwidth=bandwidth,
+    )
+    with server:
+        CollectorFactory.replay_url = server.url
+        try:
+            for product_url in product_urls:
+                samples = [await run_once(product_url) for _ in range(runs)]
+                seconds = [sample['seconds'] for sample in samples]
+                results.append(
+                    {
+                        'product_url': product_url,
+                        'sellers': samples[-1]['sellers'],
+                        'median_seconds': statistics.median(seconds),
+                        'sellers_per_second': samples[-1]['sellers']
+                        / statistics.median(seconds),
+                    }
+                )
+        finally:
+            CollectorFactory.replay_url = None
+            await DriverPoolRegistry.close_all()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('mode', choices=['record', 'run'])
+    parser.add_argument('fixtures')
+    parser.add_argument('product_urls', nargs='+')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--bandwidth', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        asyncio.run(record(args.fixtures, args.product_urls))
+        return
+
+    results = asyncio.run(
+        benchmark(
+            args.fixtures,
+            args.product_urls,
+            args.runs,
+            args.latency,
+            args.bandwidth,
+        )
+    )
+    print(f"{'sellers':>8}{'seconds':>10}{'sellers/s':>12}  url")
+    for result in results:
+        print(
+            f"{result['sellers']:>8}{result['median_seconds']:>10.2f}"
+            f"{result['sellers_per_second']:>12.2f}  {result['product_url']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,3 @@
 from .base_collector import BaseCollector, CollectorOptions, MarketPlaceOptions
+from .batch_collector import BatchCollector, BatchResult
 from .collector_factory import CollectorFactory
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import AsyncIterator, Optional
+from urllib.parse import parse_qs, quote_plus, urlparse
 
 from pydantic import BaseModel, HttpUrl
 
@@ -49,6 +51,7 @@ class MarketPlaceOptions(Enum):
         BELEZA_NA_WEB (tuple): Beleza na Web marketplace.
         AMAZON (tuple): Amazon marketplace.
         MERCADO_LIVRE (tuple): Mercado Livre marketplace.
+        GOOGLE_SHOPPING (tuple): Google Shopping results, identified by their search query.
     """
 
     BELEZA_NA_WEB = ('beleza_na_web', None)
@@ -57,6 +60,10 @@ class MarketPlaceOptions(Enum):
         'mercado_livre',
         'https://produto.mercadolivre.com.br/{marketplace_id}',
     )
+    GOOGLE_SHOPPING = (
+        'google_shopping',
+        'https://www.google.com.br/search?tbm=shop&q={marketplace_id}',
+    )
 
     def __init__(self, name, url_pattern):
         self._name = name
@@ -87,6 +94,32 @@ class MarketPlaceOptions(Enum):
             raise ValueError(f'Invalid Mercado Livre ID: {marketplace_id}')
         return marketplace_id
 
+    @staticmethod
+    def get_search_query(url: str) -> Optional[str]:
+        """
+        Reads the search query of a Google search URL, which identifies the
+        product of the Google Shopping results.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            Optional[str]: The search query, or None if the URL is not a Google search with a query.
+
+        Examples:
+            >>> MarketPlaceOptions.get_search_query(
+            ...     'https://www.google.com.br/search?tbm=shop&q=shampoo+300ml'
+            ... )
+            'shampoo 300ml'
+        """
+        parsed_url = urlparse(url)
+        if 'google.' not in parsed_url.netloc or parsed_url.path != '/search':
+            return None
+        query = parse_qs(parsed_url.query).get('q')
+        if not query or not query[0].strip():
+            return None
+        return query[0].strip()
+
     def build_url(self, marketplace_id) -> str:
         """
         Builds the URL for the marketplace based on the provided marketplace ID.
@@ -107,6 +140,8 @@ class MarketPlaceOptions(Enum):
                 marketplace_id = self.format_mercado_libre_id(
                     marketplace_id=marketplace_id
                 )
+            if self.name == 'GOOGLE_SHOPPING':
+                marketplace_id = quote_plus(marketplace_id)
             if self.url_pattern:
                 url = self.url_pattern.format(marketplace_id=marketplace_id)
         except Exception as e:
@@ -126,6 +161,7 @@ class BaseCollector(BaseModel, ABC):
 
     Methods:
         execute(): Abstract method that must be implemented by subclasses. This method is intended to carry out the specific actions of the strategy.
+        stream(): Yields the records of the strategy one at a time, as they are collected.
     """
 
     product_url: HttpUrl
@@ -145,3 +181,16 @@ class BaseCollector(BaseModel, ABC):
             value should be documented by subclasses.
         """
         pass
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """
+        Yields the records collected by the strategy one at a time. Strategies
+        able to produce records incrementally override it so callers can
+        forward each record as soon as it is collected; by default, the records
+        are yielded once `execute` returns.
+
+        Yields:
+            dict: A collected record.
+        """
+        for record in await self.execute():
+            yield record
@@ -0,0 +1,164 @@
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field, model_validator
+
+from .base_collector import CollectorOptions
+from .collector_factory import CollectorFactory
+from .strategies.web_scraping.constants import BATCH_SESSIONS
+
+if TYPE_CHECKING:
+    from .strategies.web_scraping import BaseScraper
+
+
+class BatchResult(BaseModel):
+    """
+    Outcome of the scrape of a product of a batch.
+
+    Attributes:
+        index (int): The position of the product in the batch.
+        product_url (str): The URL of the product.
+        sellers (List[Dict]): The sellers scraped, empty if the scrape failed.
+        error (Optional[str]): The error that aborted the scrape, None if it completed.
+        telemetry (Optional[Dict]): The execution report of the scrape, None if it did not start.
+    """
+
+    index: int
+    product_url: str
+    sellers: List[Dict] = Field(default_factory=list)
+    error: Optional[str] = Field(default=None)
+    telemetry: Optional[Dict] = Field(default=None)
+
+
+class BatchCollector(BaseModel):
+    """
+    Scrapes many products of the same marketplace with a few WebDriver sessions
+    reused across them, in place of a session per product.
+
+    Every session is driven by a worker taking the products in order from the
+    batch: the scraper of each product takes over the session kept by the
+    previous one, and the session is only released when it fails, reaches the
+    page limit of its pool or is deemed unhealthy, and once the batch is done.
+    Page loads keep going through the per-host rate limiters, robots.txt rules
+    are read from the shared RobotsCache, and the failure of a product is
+    reported in its result without stopping the batch.
+
+    Attributes:
+        product_urls (List[str]): The URLs of the products, all from the same marketplace.
+        collector_option (int): Identifier for the strategy used for every product.
+        sessions (int): WebDriver sessions scraping at once, at most one per product.
+    """
+
+    product_urls: List[str]
+    collector_option: int = Field(default=CollectorOptions.WEB_SCRAPING.value)
+    sessions: int = Field(default=BATCH_SESSIONS)
+
+    @model_validator(mode='after')
+    def validate_marketplace(self) -> 'BatchCollector':
+        """
+        Ensures every product of the batch is on the same host.
+
+        Raises:
+            ValueError: If the products are on different hosts.
+
+        Returns:
+            BatchCollector: The validated batch.
+        """
+        hosts = {urlparse(url).netloc for url in self.product_urls}
+        if len(hosts) > 1:
+            raise ValueError(
+                f'Batch products must share a marketplace, got {sorted(hosts)}'
+            )
+        return self
+
+    def _get_strategy(self, product_url: str) -> 'BaseScraper':
+        strategy = CollectorFactory.get_strategy(
+            collector_option=self.collector_option, product_url=product_url
+        )
+        strategy.keep_webdriver = True
+        return strategy
+
+    async def _scrape(
+        self, index: int, strategy: 'BaseScraper'
+    ) -> BatchResult:
+        result = BatchResult(
+            index=index, product_url=str(strategy.product_url)
+        )
+        try:
+            result.sellers = await strategy.execute()
+            result.error = strategy.telemetry.error
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.telemetry = strategy.telemetry.model_dump()
+        return result
+
+    async def _work(self, products: deque, results: asyncio.Queue):
+        """
+        Scrapes products from the batch until there are none left, reusing the
+        WebDriver session of each scrape for the next one while it stays fit.
+
+        Args:
+            products (deque): The products left, as (index, URL) pairs.
+            results (asyncio.Queue): Where the results are put.
+        """
+        previous = None
+        try:
+            while products:
+                index, product_url = products.popleft()
+                try:
+                    strategy = self._get_strategy(product_url)
+                except Exception as e:
+                    await results.put(
+                        BatchResult(
+                            index=index, product_url=product_url, error=str(e)
+                        )
+                    )
+                    continue
+
+                if previous is not None:
+                    previous.hand_over_webdriver(strategy)
+                previous = strategy
+                await results.put(await self._scrape(index, strategy))
+
+                if not await strategy.is_webdriver_reusable():
+                    await strategy.release_webdriver()
+        finally:
+            if previous is not None:
+                await previous.release_webdriver()
+
+    async def stream(self) -> AsyncIterator[BatchResult]:
+        """
+        Scrapes the products of the batch, yielding the result of every product
+        as soon as it is scraped. Products are started in order; with a single
+        session, results are yielded in order too. Closing the stream early
+        cancels the remaining scrapes and releases the sessions.
+
+        Yields:
+            BatchResult: The result of a product.
+        """
+        products = deque(enumerate(self.product_urls))
+        results = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._work(products, results))
+            for _ in range(min(max(self.sessions, 1), len(products)))
+        ]
+
+        try:
+            for _ in range(len(self.product_urls)):
+                yield await results.get()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def execute(self) -> List[BatchResult]:
+        """
+        Scrapes the products of the batch and returns their results.
+
+        Returns:
+            List[BatchResult]: The result of every product, in the order of `product_urls`.
+        """
+        results = [result async for result in self.stream()]
+        return sorted(results, key=lambda result: result.index)
@@ -1,10 +1,22 @@
+from typing import TYPE_CHECKING, Dict, Optional, Type, Union
+
+from kami_pricing_analytics.lazy_imports import resolve
+
 from .base_collector import CollectorOptions
-from .strategies.web_scraping import (
-    AmazonScraper,
-    BaseScraper,
-    BelezaNaWebScraper,
-    MercadoLibreScraper,
+from .strategies.web_scraping.circuit_breaker import CircuitBreakerRegistry
+from .strategies.web_scraping.constants import (
+    CIRCUIT_BREAKER_ENABLED,
+    REPLAY_URL,
 )
+from .strategies.web_scraping.http_client import HttpClientRegistry
+
+if TYPE_CHECKING:
+    from .base_collector import BaseCollector
+    from .strategies.pricing_apis import BaseAPI
+    from .strategies.web_scraping import BaseScraper
+
+WEB_SCRAPING = 'kami_pricing_analytics.data_collector.strategies.web_scraping'
+PRICING_APIS = 'kami_pricing_analytics.data_collector.strategies.pricing_apis'
 
 
 class CollectorFactory:
@@ -12,14 +24,76 @@ class CollectorFactory:
     Factory class for creating scraper instances based on the specified strategy
     and marketplace. This class allows for the dynamic selection of scraping strategies
     based on the provided product URL, optimizing the scraping process for different
-    marketplaces.
+    marketplaces. Scrapers receive the shared HTTP client of the product host
+    when the HttpClientRegistry is started, are pointed at the replay server
+    when `replay_url` is set, and are guarded by the circuit breaker of their
+    marketplace when `circuit_breaker_enabled` is set. Options other than web
+    scraping are served by the pricing API registered for them, whatever the
+    marketplace of the product.
+
+    Scrapers and APIs are registered by import path and imported on first use,
+    so the WebDriver dependencies are only loaded once a product is scraped.
+
+    Attributes:
+        scraper_mapping (Dict[str, Union[str, Type[BaseScraper]]]): Maps marketplace host keywords to their scraper class or its 'module:class' path.
+        api_mapping (Dict[int, Union[str, Type[BaseAPI]]]): Maps collector options to their pricing API class or its 'module:class' path.
+        replay_url (Optional[str]): Base URL of a ReplayServer serving recorded marketplace responses, None to scrape the live marketplaces.
+        circuit_breaker_enabled (bool): Whether the strategies are guarded by the CircuitBreakerRegistry.
 
     Methods:
-        get_strategy (int, str) -> BaseScraper: Returns an instance of a scraper strategy based on the marketplace identified in the product URL.
+        get_strategy (int, str) -> BaseCollector: Returns an instance of a scraper strategy based on the marketplace identified in the product URL, or of the pricing API of the option.
     """
 
+    scraper_mapping: Dict[str, Union[str, Type['BaseScraper']]] = {
+        'belezanaweb': f'{WEB_SCRAPING}.beleza_na_web:BelezaNaWebScraper',
+        'amazon': f'{WEB_SCRAPING}.amazon:AmazonScraper',
+        'mercadolivre': f'{WEB_SCRAPING}.mercado_libre:MercadoLibreScraper',
+    }
+    api_mapping: Dict[int, Union[str, Type['BaseAPI']]] = {
+        CollectorOptions.GOOGLE_SHOPPING.value: f'{PRICING_APIS}.google_shopping:GoogleShoppingAPI',
+    }
+    replay_url: Optional[str] = REPLAY_URL
+    circuit_breaker_enabled: bool = CIRCUIT_BREAKER_ENABLED
+
+    @classmethod
+    def register_scraper(
+        cls, keyword: str, scraper: Union[str, Type['BaseScraper']]
+    ) -> bool:
+        """
+        Registers the scraper of the marketplace whose product URLs contain the
+        given keyword.
+
+        Args:
+            keyword (str): Keyword of the marketplace host, such as 'amazon'.
+            scraper (Union[str, Type[BaseScraper]]): The scraper class, or its 'module:class' path to import it on first use.
+
+        Returns:
+            bool: True if the scraper was successfully registered.
+        """
+        cls.scraper_mapping[keyword] = scraper
+        return True
+
+    @classmethod
+    def register_api(
+        cls, collector_option: int, api: Union[str, Type['BaseAPI']]
+    ) -> bool:
+        """
+        Registers the pricing API serving a collector option.
+
+        Args:
+            collector_option (int): Numeric identifier of the collector option.
+            api (Union[str, Type[BaseAPI]]): The API class, or its 'module:class' path to import it on first use.
+
+        Returns:
+            bool: True if the API was successfully registered.
+        """
+        cls.api_mapping[collector_option] = api
+        return True
+
     @staticmethod
-    def get_strategy(collector_option: int, product_url: str) -> BaseScraper:
+    def get_strategy(
+        collector_option: int, product_url: str
+    ) -> 'BaseCollector':
         """
         Determines the appropriate scraper instance to use based on the marketplace
         in the product URL and the selected strategy option.
@@ -29,25 +103,40 @@ class CollectorFactory:
             product_url (str): URL of the product to be scraped.
 
         Returns:
-            strategy (BaseScraper): An instance of a scraper appropriate for the identified marketplace.
+            strategy (BaseCollector): An instance of a scraper appropriate for the identified marketplace, or of the pricing API of the option.
 
         Raises:
             ValueError: If no appropriate scraper is found for the marketplace or if
                         the strategy option is not supported.
         """
 
-        strategy = BaseScraper
+        api = CollectorFactory.api_mapping.get(collector_option)
+        if api is not None:
+            return resolve(api)(product_url=product_url)
 
         if collector_option != CollectorOptions.WEB_SCRAPING.value:
             raise ValueError('Unsupported strategy option')
 
-        if 'belezanaweb' in product_url:
-            strategy = BelezaNaWebScraper(product_url=product_url)
-        elif 'amazon' in product_url:
-            strategy = AmazonScraper(product_url=product_url)
-        elif 'mercadolivre' in product_url:
-            strategy = MercadoLibreScraper(product_url=product_url)
-        else:
+        scraper = next(
+            (
+                scraper
+                for keyword, scraper in CollectorFactory.scraper_mapping.items()
+                if keyword in product_url
+            ),
+            None,
+        )
+        if scraper is None:
             raise ValueError('Unsupported marketplace for web scraping')
 
+        strategy = resolve(scraper)(
+            product_url=product_url,
+            http_client=HttpClientRegistry.get_client(product_url),
+            replay_url=CollectorFactory.replay_url,
+        )
+
+        if CollectorFactory.circuit_breaker_enabled:
+            strategy.circuit_breaker = CircuitBreakerRegistry.get_breaker(
+                strategy.marketplace
+            )
+
         return strategy
@@ -0,0 +1,9 @@
+from .base_api import ApiTelemetry, BaseAPI, PricingApiException
+from .google_shopping import GoogleShoppingAPI, GoogleShoppingSettings
+from .quota import (
+    ApiQuota,
+    ApiQuotaStats,
+    QuotaExceededException,
+    QuotaRegistry,
+)
+from .response_cache import ResponseCache, ResponseCacheStats
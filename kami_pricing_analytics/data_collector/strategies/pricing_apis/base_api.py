@@ -0,0 +1,365 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+from ...base_collector import BaseCollector
+from ..web_scraping.fetch_policy import FetchPolicy
+from ..web_scraping.http_client import HttpClientRegistry, build_http_client
+from .constants import API_CONCURRENCY
+from .quota import QuotaExceededException, QuotaRegistry
+from .response_cache import ResponseCache
+
+
+class PricingApiException(Exception):
+    """
+    Custom exception class for pricing API errors.
+    """
+
+    pass
+
+
+class ApiTelemetry(BaseModel):
+    """
+    Per-collection execution report of a pricing API, reset at the beginning of
+    every collection.
+
+    Attributes:
+        requests (int): Requests sent to the API, each one spending its quota.
+        cache_hits (int): Responses served from the ResponseCache.
+        pages (int): Result pages read.
+        offers (int): Offers collected.
+        retries (int): Retries sent, spent from the retry budget of the fetch policy.
+        seconds (float): Seconds spent waiting for the API.
+        error (Optional[str]): The error that aborted the collection, None if it completed.
+    """
+
+    requests: int = Field(default=0)
+    cache_hits: int = Field(default=0)
+    pages: int = Field(default=0)
+    offers: int = Field(default=0)
+    retries: int = Field(default=0)
+    seconds: float = Field(default=0.0)
+    error: Optional[str] = Field(default=None)
+
+
+class BaseAPI(BaseCollector, ABC):
+    """
+    Abstract base class for the collectors querying a pricing API, which return
+    the offers of many stores for a product without a browser.
+
+    A query is read page by page until the API has no next page or `max_pages`
+    pages were read. Every request is looked up in the ResponseCache first, and
+    only requests reaching the API spend its quota from the QuotaRegistry; over
+    the quota, requests are rejected before being sent. Failed requests are
+    retried with the retry statuses, backoff and budget of the `fetch_policy`.
+    Batches of queries are sent `concurrency` at a time.
+
+    Subclasses define the query of the product, the parameters of each page and
+    how offers are read from a page.
+
+    Attributes:
+        name (str): Name of the API, identifying its quota.
+        api_url (str): Endpoint of the API.
+        http_client (httpx.AsyncClient): Shared async HTTP client. When unset, the client of the HttpClientRegistry or a short-lived client is used.
+        max_pages (int): Pages read per query.
+        concurrency (int): Queries of a batch sent at once.
+        quota_limit (int): Requests allowed per quota period, 0 for no limit.
+        quota_period (float): Seconds of the quota period.
+        cache_enabled (bool): Whether responses are served from and stored in the ResponseCache.
+        fetch_policy (FetchPolicy): Retry policy of the requests.
+        telemetry (ApiTelemetry): Execution report of the last collection.
+    """
+
+    name: str = Field(default='api')
+    api_url: str = Field(default='')
+    http_client: Optional[httpx.AsyncClient] = Field(default=None)
+    max_pages: int = Field(default=1)
+    concurrency: int = Field(default=API_CONCURRENCY)
+    quota_limit: int = Field(default=0)
+    quota_period: float = Field(default=86400)
+    cache_enabled: bool = Field(default=True)
+    fetch_policy: FetchPolicy = Field(default_factory=FetchPolicy)
+    telemetry: ApiTelemetry = Field(default_factory=ApiTelemetry)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @abstractmethod
+    def get_query(self) -> str:
+        """
+        Returns the search query of the product.
+
+        Raises:
+            ValueError: If no query can be built for the product.
+
+        Returns:
+            str: The search query.
+        """
+        pass
+
+    @abstractmethod
+    def build_params(self, query: str, page: int) -> Dict[str, Any]:
+        """
+        Builds the query parameters of a result page, without credentials.
+
+        Args:
+            query (str): The search query.
+            page (int): The page number, starting at 0.
+
+        Returns:
+            Dict[str, Any]: The query parameters.
+        """
+        pass
+
+    @abstractmethod
+    def parse_offers(self, payload: Dict, query: str) -> List[Dict]:
+        """
+        Reads the offers of a result page.
+
+        Args:
+            payload (Dict): The decoded response of the page.
+            query (str): The search query of the page.
+
+        Raises:
+            PricingApiException: If the API answered an error.
+
+        Returns:
+            List[Dict]: The offers, as seller records.
+        """
+        pass
+
+    def get_credentials(self) -> Dict[str, str]:
+        """
+        Returns the credentials sent along the query parameters. They are left
+        out of the cache keys and of the errors raised.
+
+        Returns:
+            Dict[str, str]: The credential parameters.
+        """
+        return {}
+
+    def has_next_page(self, payload: Dict, offers: List[Dict]) -> bool:
+        """
+        Tells whether the query has a page after the given one.
+
+        Args:
+            payload (Dict): The decoded response of the page.
+            offers (List[Dict]): The offers read from the page.
+
+        Returns:
+            bool: True if the next page should be read.
+        """
+        return bool(offers)
+
+    def is_cacheable(self, payload: Dict) -> bool:
+        """
+        Tells whether a response can be served again from the cache.
+
+        Args:
+            payload (Dict): The decoded response.
+
+        Returns:
+            bool: True if the response can be cached.
+        """
+        return True
+
+    @asynccontextmanager
+    async def get_http_client(self):
+        """
+        Context manager yielding the injected `http_client`, or the shared client
+        of the API host when the HttpClientRegistry is started, leaving it open
+        for the next requests; otherwise opens a client that is closed on exit.
+        """
+        client = self.http_client
+        if client is None or client.is_closed:
+            client = HttpClientRegistry.get_client(self.api_url)
+        if client is not None:
+            yield client
+            return
+
+        async with build_http_client() as client:
+            yield client
+
+    def _take_retry(self) -> bool:
+        if self.telemetry.retries >= self.fetch_policy.retry_budget:
+            return False
+        self.telemetry.retries += 1
+        return True
+
+    async def _send_attempt(self, params: Dict[str, Any]) -> httpx.Response:
+        QuotaRegistry.get_quota(
+            self.name, self.quota_limit, self.quota_period
+        ).acquire()
+        self.telemetry.requests += 1
+        start = time.monotonic()
+        try:
+            async with self.get_http_client() as client:
+                return await asyncio.wait_for(
+                    client.get(
+                        self.api_url,
+                        params={**params, **self.get_credentials()},
+                    ),
+                    self.fetch_policy.attempt_timeout,
+                )
+        finally:
+            self.telemetry.seconds += time.monotonic() - start
+
+    async def _send(self, params: Dict[str, Any]) -> Dict:
+        policy = self.fetch_policy
+        attempt = 1
+        while True:
+            response, error = None, None
+            try:
+                response = await self._send_attempt(params)
+            except QuotaExceededException:
+                raise
+            except Exception as e:
+                error = e
+
+            if (
+                attempt >= policy.max_attempts
+                or not policy.is_retryable(response, error)
+                or not self._take_retry()
+            ):
+                break
+
+            await asyncio.sleep(policy.backoff(attempt, response))
+            attempt += 1
+
+        # Errors are raised without the request URL, which holds the credentials
+        if error is not None:
+            raise PricingApiException(
+                f'{self.name} request failed: {type(error).__name__}'
+            )
+        if response.status_code >= 400:
+            raise PricingApiException(
+                f'{self.name} answered {response.status_code}: {response.text[:200]}'
+            )
+        try:
+            return response.json()
+        except ValueError:
+            raise PricingApiException(
+                f'{self.name} answered {response.status_code} with an invalid body: {response.text[:200]}'
+            )
+
+    async def request(self, params: Dict[str, Any]) -> Dict:
+        """
+        Sends a request to the API, or serves it from the ResponseCache.
+
+        Args:
+            params (Dict[str, Any]): The query parameters, without credentials.
+
+        Raises:
+            QuotaExceededException: If the quota of the API is spent.
+            PricingApiException: If the request failed once the retries ran out.
+
+        Returns:
+            Dict: The decoded response.
+        """
+        key = ResponseCache.build_key(self.api_url, params)
+        if self.cache_enabled:
+            payload = ResponseCache.get(key)
+            if payload is not None:
+                self.telemetry.cache_hits += 1
+                return payload
+
+        payload = await self._send(params)
+        if self.cache_enabled and self.is_cacheable(payload):
+            ResponseCache.store(key, payload)
+        return payload
+
+    async def stream_query(self, query: str) -> AsyncIterator[Dict]:
+        """
+        Reads the result pages of a query, yielding its offers page by page.
+
+        Args:
+            query (str): The search query.
+
+        Yields:
+            Dict: An offer, as a seller record.
+        """
+        for page in range(max(self.max_pages, 1)):
+            payload = await self.request(self.build_params(query, page))
+            offers = self.parse_offers(payload, query)
+            self.telemetry.pages += 1
+            self.telemetry.offers += len(offers)
+            for offer in offers:
+                yield offer
+            if not self.has_next_page(payload, offers):
+                break
+
+    async def search(self, query: str) -> List[Dict]:
+        """
+        Reads every result page of a query.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            List[Dict]: The offers of the query.
+        """
+        return [offer async for offer in self.stream_query(query)]
+
+    async def search_many(self, queries: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Reads the results of a batch of queries, `concurrency` queries at a time.
+        Repeated queries are sent once. If a query fails, the pending ones are
+        cancelled and the error is raised.
+
+        Args:
+            queries (List[str]): The search queries.
+
+        Raises:
+            QuotaExceededException: If the quota of the API is spent.
+            PricingApiException: If a query failed once the retries ran out.
+
+        Returns:
+            Dict[str, List[Dict]]: The offers of every query, in the order of `queries`.
+        """
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def search(query: str) -> List[Dict]:
+            async with semaphore:
+                return await self.search(query)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = {
+                    query: group.create_task(search(query))
+                    for query in dict.fromkeys(queries)
+                }
+        except ExceptionGroup as errors:
+            # The task group wraps the failures, raise the query error itself,
+            # a spent quota first as it is answered differently
+            quota_errors, _ = errors.split(QuotaExceededException)
+            raise (quota_errors or errors).exceptions[0] from None
+        return {query: task.result() for query, task in tasks.items()}
+
+    async def stream(self) -> AsyncIterator[Dict]:
+        """
+        Collects the offers of the product query, yielding each one as soon as
+        its page is read.
+
+        Yields:
+            Dict: An offer, as a seller record.
+        """
+        self.telemetry = ApiTelemetry()
+        try:
+            async for offer in self.stream_query(self.get_query()):
+                yield offer
+        except Exception as e:
+            self.telemetry.error = str(e) or type(e).__name__
+            raise
+
+    async def execute(self) -> List[Dict]:
+        """
+        Collects the offers of the product query.
+
+        Returns:
+            List[Dict]: The offers, as seller records.
+        """
+        return [offer async for offer in self.stream()]
@@ -0,0 +1,34 @@
+import configparser
+import os
+
+settings_path = os.path.join('config', 'settings.cfg')
+settings = configparser.ConfigParser()
+settings.read(settings_path)
+
+API_CONCURRENCY = settings.getint('pricing_api', 'CONCURRENCY', fallback=4)
+API_CACHE_TTL = settings.getfloat('pricing_api', 'CACHE_TTL', fallback=900)
+API_CACHE_MAX_ENTRIES = settings.getint(
+    'pricing_api', 'CACHE_MAX_ENTRIES', fallback=1024
+)
+
+GOOGLE_SHOPPING_API_URL = settings.get(
+    'google_shopping', 'API_URL', fallback='https://serpapi.com/search.json'
+)
+GOOGLE_SHOPPING_COUNTRY = settings.get(
+    'google_shopping', 'COUNTRY', fallback='br'
+)
+GOOGLE_SHOPPING_LANGUAGE = settings.get(
+    'google_shopping', 'LANGUAGE', fallback='pt-br'
+)
+GOOGLE_SHOPPING_PAGE_SIZE = settings.getint(
+    'google_shopping', 'PAGE_SIZE', fallback=40
+)
+GOOGLE_SHOPPING_MAX_PAGES = settings.getint(
+    'google_shopping', 'MAX_PAGES', fallback=3
+)
+GOOGLE_SHOPPING_QUOTA = settings.getint(
+    'google_shopping', 'QUOTA', fallback=100
+)
+GOOGLE_SHOPPING_QUOTA_PERIOD = settings.getfloat(
+    'google_shopping', 'QUOTA_PERIOD', fallback=86400
+)
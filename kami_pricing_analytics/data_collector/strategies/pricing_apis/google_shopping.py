@@ -0,0 +1,164 @@
+from typing import Any, Dict, List
+
+from pydantic import ConfigDict, Field, SecretStr
+from pydantic_settings import BaseSettings
+
+from ...base_collector import MarketPlaceOptions
+from .base_api import BaseAPI, PricingApiException
+from .constants import (
+    GOOGLE_SHOPPING_API_URL,
+    GOOGLE_SHOPPING_COUNTRY,
+    GOOGLE_SHOPPING_LANGUAGE,
+    GOOGLE_SHOPPING_MAX_PAGES,
+    GOOGLE_SHOPPING_PAGE_SIZE,
+    GOOGLE_SHOPPING_QUOTA,
+    GOOGLE_SHOPPING_QUOTA_PERIOD,
+)
+
+NO_RESULTS_ERROR = "hasn't returned any results"
+
+
+class GoogleShoppingSettings(BaseSettings):
+    """
+    Credentials of the Google Shopping API.
+
+    Attributes:
+        google_shopping_api_key (SecretStr): The API key, empty for endpoints without authentication.
+    """
+
+    google_shopping_api_key: SecretStr = Field(default=SecretStr(''))
+
+    model_config = ConfigDict(
+        title='Google Shopping Settings',
+        str_strip_whitespace=True,
+        env_file='.env',
+        env_file_encoding='utf-8',
+        extra='ignore',
+    )
+
+
+class GoogleShoppingAPI(BaseAPI):
+    """
+    Collects the offers of a product from the Google Shopping results, through a
+    SerpApi compatible search endpoint. A single query returns the offers of
+    many stores, each one read as a seller of the product.
+
+    The query is the `q` parameter of the product URL, a Google Shopping search
+    such as https://www.google.com.br/search?tbm=shop&q=shampoo+300ml. It is the
+    marketplace ID of the product in the google_shopping marketplace, so a SKU
+    is searched by researching the google_shopping marketplace with the SKU as
+    its marketplace ID.
+
+    Attributes:
+        country (str): Country of the offers, the `gl` parameter.
+        language (str): Language of the results, the `hl` parameter.
+        page_size (int): Offers requested per page.
+        settings (GoogleShoppingSettings): Credentials of the API.
+    """
+
+    name: str = Field(default='google_shopping')
+    api_url: str = Field(default=GOOGLE_SHOPPING_API_URL)
+    max_pages: int = Field(default=GOOGLE_SHOPPING_MAX_PAGES)
+    quota_limit: int = Field(default=GOOGLE_SHOPPING_QUOTA)
+    quota_period: float = Field(default=GOOGLE_SHOPPING_QUOTA_PERIOD)
+    country: str = Field(default=GOOGLE_SHOPPING_COUNTRY)
+    language: str = Field(default=GOOGLE_SHOPPING_LANGUAGE)
+    page_size: int = Field(default=GOOGLE_SHOPPING_PAGE_SIZE)
+    settings: GoogleShoppingSettings = Field(
+        default_factory=GoogleShoppingSettings
+    )
+
+    def get_query(self) -> str:
+        """
+        Returns the search query of the product, read from the `q` parameter of
+        the product URL.
+
+        Raises:
+            ValueError: If the product URL is not a Google search with a query.
+
+        Returns:
+            str: The search query.
+        """
+        query = MarketPlaceOptions.get_search_query(str(self.product_url))
+        if not query:
+            raise ValueError(
+                'Google Shopping needs a Google search URL with a q parameter'
+            )
+        return query
+
+    def build_params(self, query: str, page: int) -> Dict[str, Any]:
+        """
+        Builds the query parameters of a result page, without credentials.
+
+        Args:
+            query (str): The search query.
+            page (int): The page number, starting at 0.
+
+        Returns:
+            Dict[str, Any]: The query parameters.
+
+        Examples:
+            >>> api = GoogleShoppingAPI(
+            ...     product_url='https://www.google.com/search?q=shampoo',
+            ...     country='br', language='pt-br', page_size=40,
+            ... )
+            >>> api.build_params('shampoo', 1)['start']
+            40
+        """
+        return {
+            'engine': 'google_shopping',
+            'q': query,
+            'gl': self.country,
+            'hl': self.language,
+            'num': self.page_size,
+            'start': page * self.page_size,
+        }
+
+    def get_credentials(self) -> Dict[str, str]:
+        api_key = self.settings.google_shopping_api_key.get_secret_value()
+        return {'api_key': api_key} if api_key else {}
+
+    def parse_offers(self, payload: Dict, query: str) -> List[Dict]:
+        """
+        Reads the offers of a result page as seller records. Offers take the
+        query as their marketplace ID, the ID of the research they belong to.
+
+        Args:
+            payload (Dict): The decoded response of the page.
+            query (str): The search query of the page.
+
+        Raises:
+            PricingApiException: If the API answered an error other than a search without results.
+
+        Returns:
+            List[Dict]: The offers, as seller records.
+        """
+        error = payload.get('error')
+        if error:
+            if NO_RESULTS_ERROR in error:
+                return []
+            raise PricingApiException(f'{self.name} answered: {error}')
+
+        return [
+            {
+                'marketplace_id': query,
+                'brand': '',
+                'description': result.get('title') or '',
+                'price': result.get('price') or '',
+                'seller_id': '',
+                'seller_name': result.get('source') or '',
+                'seller_url': result.get('link')
+                or result.get('product_link')
+                or '',
+            }
+            for result in payload.get('shopping_results') or []
+        ]
+
+    def has_next_page(self, payload: Dict, offers: List[Dict]) -> bool:
+        return bool(offers) and bool(
+            (payload.get('serpapi_pagination') or {}).get('next')
+        )
+
+    def is_cacheable(self, payload: Dict) -> bool:
+        error = payload.get('error')
+        return not error or NO_RESULTS_ERROR in error
@@ -0,0 +1,185 @@
+import threading
+import time
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class QuotaExceededException(Exception):
+    """
+    Raised when a request is rejected because the quota of its API is spent.
+
+    Attributes:
+        api (str): The API whose quota is spent.
+        retry_after (float): Seconds until the quota period restarts.
+    """
+
+    def __init__(self, api: str, retry_after: float):
+        self.api = api
+        self.retry_after = retry_after
+        super().__init__(
+            f'Quota of {api} is spent, retry in {retry_after:.0f}s'
+        )
+
+
+class ApiQuotaStats(BaseModel):
+    """
+    Snapshot of an ApiQuota usage.
+
+    Attributes:
+        api (str): The API the quota applies to.
+        limit (int): Requests allowed per period, 0 for no limit.
+        period (float): Seconds of the quota period.
+        used (int): Requests sent in the current period.
+        rejected (int): Total number of requests rejected over the quota.
+        requests (int): Total number of requests sent.
+        resets_in (float): Seconds until the current period ends.
+    """
+
+    api: str
+    limit: int
+    period: float
+    used: int = Field(default=0)
+    rejected: int = Field(default=0)
+    requests: int = Field(default=0)
+    resets_in: float = Field(default=0.0)
+
+
+class ApiQuota:
+    """
+    Request quota of a pricing API over fixed periods, such as a daily plan.
+    Every request sent takes a unit of the quota; once the quota is spent,
+    requests are rejected until the period ends, without reaching the API.
+
+    The counters are guarded by a thread lock, so the same quota can be shared
+    by collectors running on different event loops.
+
+    Attributes:
+        api (str): The API the quota applies to.
+        limit (int): Requests allowed per period, 0 for no limit.
+        period (float): Seconds of the quota period.
+    """
+
+    def __init__(self, api: str, limit: int, period: float):
+        self.api = api
+        self.limit = limit
+        self.period = period
+
+        self._lock = threading.Lock()
+        self._period_start = time.monotonic()
+        self._used = 0
+        self._rejected = 0
+        self._requests = 0
+
+    def _roll(self, now: float):
+        if now - self._period_start >= self.period:
+            elapsed_periods = (now - self._period_start) // self.period
+            self._period_start += elapsed_periods * self.period
+            self._used = 0
+
+    def _get_resets_in(self, now: float) -> float:
+        return max(0.0, self._period_start + self.period - now)
+
+    def set_limit(self, limit: int, period: float):
+        """
+        Changes the quota, keeping the requests already sent in the period.
+
+        Args:
+            limit (int): Requests allowed per period, 0 for no limit.
+            period (float): Seconds of the quota period.
+        """
+        with self._lock:
+            self.limit = limit
+            self.period = period
+
+    def acquire(self):
+        """
+        Takes a unit of the quota for a request about to be sent.
+
+        Raises:
+            QuotaExceededException: If the quota of the period is spent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._roll(now)
+            if self.limit and self._used >= self.limit:
+                self._rejected += 1
+                raise QuotaExceededException(
+                    self.api, self._get_resets_in(now)
+                )
+            self._used += 1
+            self._requests += 1
+
+    def stats(self) -> ApiQuotaStats:
+        """
+        Returns a snapshot of the quota usage.
+
+        Returns:
+            ApiQuotaStats: The quota statistics.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._roll(now)
+            return ApiQuotaStats(
+                api=self.api,
+                limit=self.limit,
+                period=self.period,
+                used=self._used,
+                rejected=self._rejected,
+                requests=self._requests,
+                resets_in=self._get_resets_in(now),
+            )
+
+
+class QuotaRegistry:
+    """
+    Process-wide registry of API quotas, one per API, shared by every collector
+    querying it.
+
+    Attributes:
+        quotas (Dict[str, ApiQuota]): Maps API names to their quotas.
+    """
+
+    quotas: Dict[str, ApiQuota] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_quota(cls, api: str, limit: int, period: float) -> ApiQuota:
+        """
+        Returns the quota of an API, creating it on first use and updating its
+        limit when the configuration changed.
+
+        Args:
+            api (str): The API name.
+            limit (int): Requests allowed per period, 0 for no limit.
+            period (float): Seconds of the quota period.
+
+        Returns:
+            ApiQuota: The API quota.
+        """
+        with cls._lock:
+            quota = cls.quotas.get(api)
+            if quota is None:
+                quota = ApiQuota(api, limit, period)
+                cls.quotas[api] = quota
+        if (quota.limit, quota.period) != (limit, period):
+            quota.set_limit(limit, period)
+        return quota
+
+    @classmethod
+    def stats(cls) -> List[ApiQuotaStats]:
+        """
+        Returns the statistics of every registered quota.
+
+        Returns:
+            List[ApiQuotaStats]: One snapshot per API.
+        """
+        return [quota.stats() for quota in list(cls.quotas.values())]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every registered quota.
+        """
+        with cls._lock:
+            cls.quotas.clear()
@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field, computed_field
+
+from .constants import API_CACHE_MAX_ENTRIES, API_CACHE_TTL
+
+
+class ResponseCacheStats(BaseModel):
+    """
+    Snapshot of the ResponseCache usage.
+
+    Attributes:
+        entries (int): Responses currently cached.
+        max_entries (int): Maximum number of responses kept.
+        ttl (float): Seconds a response is served from the cache.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups missing or expired in the cache.
+        evictions (int): Responses dropped to stay within `max_entries`.
+    """
+
+    entries: int = Field(default=0)
+    max_entries: int
+    ttl: float
+    hits: int = Field(default=0)
+    misses: int = Field(default=0)
+    evictions: int = Field(default=0)
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """
+    Process-wide cache of decoded pricing API responses, keyed by endpoint and
+    query parameters, so the same query sent again within `ttl` seconds, by the
+    same batch or by another research, neither reaches the API nor spends its
+    quota. The least recently used responses are dropped once `max_entries`
+    responses are cached. Credentials must be left out of the cached parameters.
+
+    Attributes:
+        entries (OrderedDict): Maps cache keys to their expiry and response, least recently used first.
+        ttl (float): Seconds a response is served from the cache, 0 to disable caching.
+        max_entries (int): Maximum number of responses kept.
+    """
+
+    entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+    ttl: float = API_CACHE_TTL
+    max_entries: int = API_CACHE_MAX_ENTRIES
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build_key(url: str, params: Dict[str, Any]) -> str:
+        """
+        Builds the cache key of a request, independent of the parameters order.
+
+        Args:
+            url (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters, without credentials.
+
+        Returns:
+            str: The cache key.
+
+        Examples:
+            >>> ResponseCache.build_key('https://api/search', {'q': 'a', 'start': 0})
+            'https://api/search?{"q": "a", "start": 0}'
+            >>> ResponseCache.build_key('https://api/search', {'start': 0, 'q': 'a'})
+            'https://api/search?{"q": "a", "start": 0}'
+        """
+        return f'{url}?{json.dumps(params, sort_keys=True, default=str)}'
+
+    @classmethod
+    def get(cls, key: str) -> Optional[Any]:
+        """
+        Returns the cached response of a key, if it did not expire.
+
+        Args:
+            key (str): The cache key of the request.
+
+        Returns:
+            Optional[Any]: The cached response, or None on a miss.
+        """
+        with cls._lock:
+            entry = cls.entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del cls.entries[key]
+                cls._misses += 1
+                return None
+            cls.entries.move_to_end(key)
+            cls._hits += 1
+            return entry[1]
+
+    @classmethod
+    def store(cls, key: str, response: Any):
+        """
+        Caches a response for `ttl` seconds, dropping the least recently used
+        responses over `max_entries`.
+
+        Args:
+            key (str): The cache key of the request.
+            response (Any): The decoded response.
+        """
+        if cls.ttl <= 0 or cls.max_entries <= 0:
+            return
+        with cls._lock:
+            cls.entries[key] = (time.monotonic() + cls.ttl, response)
+            cls.entries.move_to_end(key)
+            while len(cls.entries) > cls.max_entries:
+                cls.entries.popitem(last=False)
+                cls._evictions += 1
+
+    @classmethod
+    def stats(cls) -> ResponseCacheStats:
+        """
+        Returns a snapshot of the cache usage.
+
+        Returns:
+            ResponseCacheStats: The cache statistics.
+        """
+        with cls._lock:
+            return ResponseCacheStats(
+                entries=len(cls.entries),
+                max_entries=cls.max_entries,
+                ttl=cls.ttl,
+                hits=cls._hits,
+                misses=cls._misses,
+                evictions=cls._evictions,
+            )
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every cached response and resets the counters.
+        """
+        with cls._lock:
+            cls.entries.clear()
+            cls._hits = 0
+            cls._misses = 0
+            cls._evictions = 0
@@ -1,4 +1,63 @@
-from .amazon import AmazonScraper, AmazonScraperException
-from .base_scraper import BaseScraper
-from .beleza_na_web import BelezaNaWebScraper, BelezaNaWebScraperException
-from .mercado_libre import MercadoLibreScraper, MercadoLibreScraperException
+from kami_pricing_analytics.lazy_imports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        'AdaptiveWaitRegistry': '.adaptive_wait',
+        'SelectorLatency': '.adaptive_wait',
+        'SelectorWaitStats': '.adaptive_wait',
+        'AmazonScraper': '.amazon',
+        'AmazonScraperException': '.amazon',
+        'BaseScraper': '.base_scraper',
+        'BelezaNaWebScraper': '.beleza_na_web',
+        'BelezaNaWebScraperException': '.beleza_na_web',
+        'BrowserProfile': '.browser_profile',
+        'BrowserProcessStats': '.browser_supervisor',
+        'BrowserSupervisor': '.browser_supervisor',
+        'BrowserSupervisorStats': '.browser_supervisor',
+        'ProbeResult': '.change_probe',
+        'fingerprint_html': '.change_probe',
+        'CircuitAdmission': '.circuit_breaker',
+        'CircuitBreaker': '.circuit_breaker',
+        'CircuitBreakerRegistry': '.circuit_breaker',
+        'CircuitBreakerStats': '.circuit_breaker',
+        'CircuitOpenException': '.circuit_breaker',
+        'CircuitState': '.circuit_breaker',
+        'DriverPool': '.driver_pool',
+        'DriverPoolException': '.driver_pool',
+        'DriverPoolRegistry': '.driver_pool',
+        'DriverPoolStats': '.driver_pool',
+        'PooledDriver': '.driver_pool',
+        'CompiledExtractor': '.extraction',
+        'ExtractionException': '.extraction',
+        'ExtractionSpec': '.extraction',
+        'ExtractorRegistry': '.extraction',
+        'FieldExtractionStats': '.extraction',
+        'FieldSpec': '.extraction',
+        'FetchLatencyRegistry': '.fetch_policy',
+        'FetchLatencyStats': '.fetch_policy',
+        'FetchPolicy': '.fetch_policy',
+        'HostLatency': '.fetch_policy',
+        'HttpClientRegistry': '.http_client',
+        'build_http_client': '.http_client',
+        'MercadoLibreScraper': '.mercado_libre',
+        'MercadoLibreScraperException': '.mercado_libre',
+        'ArchivedPage': '.page_archive',
+        'PageArchive': '.page_archive',
+        'PageArchiveRegistry': '.page_archive',
+        'PageArchiveStats': '.page_archive',
+        'HostRateLimiter': '.rate_limiter',
+        'RateLimiterRegistry': '.rate_limiter',
+        'RateLimiterStats': '.rate_limiter',
+        'ReplayFixtures': '.replay',
+        'ReplayServer': '.replay',
+        'build_replay_url': '.replay',
+        'RobotsCache': '.robots',
+        'RobotsEntry': '.robots',
+        'TitleMatch': '.title_matching',
+        'TitleMatcher': '.title_matching',
+        'UserAgentProfile': '.user_agent_profiles',
+        'load_user_agents': '.user_agent_profiles',
+        'score_user_agents': '.user_agent_profiles',
+    },
+)
@@ -0,0 +1,183 @@
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+from pydantic import BaseModel, Field
+
+from .constants import (
+    WAIT_DEFAULT_TIMEOUT,
+    WAIT_MARGIN,
+    WAIT_MAX_TIMEOUT,
+    WAIT_MIN_SAMPLES,
+    WAIT_MIN_TIMEOUT,
+    WAIT_PERCENTILE,
+    WAIT_WINDOW,
+)
+
+
+class SelectorWaitStats(BaseModel):
+    """
+    Snapshot of the wait latencies of a selector.
+
+    Attributes:
+        marketplace (str): The marketplace the selector belongs to.
+        selector (str): The awaited selector.
+        samples (int): Number of recent waits kept.
+        timeouts (int): Total number of waits that hit their deadline.
+        percentile (float): Recent wait latency at the configured percentile, in seconds.
+        deadline (float): Seconds the next wait is allowed to take.
+    """
+
+    marketplace: str
+    selector: str
+    samples: int = Field(default=0)
+    timeouts: int = Field(default=0)
+    percentile: float = Field(default=0.0)
+    deadline: float = Field(default=WAIT_DEFAULT_TIMEOUT)
+
+
+class SelectorLatency:
+    """
+    Recent wait latencies of a selector on a marketplace, used to set the
+    deadline of the next wait. Deadlines are the latency percentile scaled by
+    `margin` and bounded by `min_timeout` and `max_timeout`; until `min_samples`
+    waits were recorded the `default_timeout` is used.
+
+    Waits that hit their deadline are recorded with the deadline as latency, so
+    deadlines grow while a page keeps getting slower.
+
+    Attributes:
+        marketplace (str): The marketplace the selector belongs to.
+        selector (str): The awaited selector.
+    """
+
+    def __init__(
+        self,
+        marketplace: str,
+        selector: str,
+        window: int = WAIT_WINDOW,
+        percentile: float = WAIT_PERCENTILE,
+        margin: float = WAIT_MARGIN,
+        min_samples: int = WAIT_MIN_SAMPLES,
+        default_timeout: float = WAIT_DEFAULT_TIMEOUT,
+        min_timeout: float = WAIT_MIN_TIMEOUT,
+        max_timeout: float = WAIT_MAX_TIMEOUT,
+    ):
+        self.marketplace = marketplace
+        self.selector = selector
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._timeouts = 0
+
+    def _get_percentile(self) -> float:
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        rank = math.ceil(self.percentile / 100 * len(samples))
+        return samples[min(max(rank, 1), len(samples)) - 1]
+
+    def _get_deadline(self) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.default_timeout
+        deadline = self._get_percentile() * self.margin
+        return min(max(deadline, self.min_timeout), self.max_timeout)
+
+    def deadline(self) -> float:
+        """
+        Returns the seconds the next wait of the selector is allowed to take.
+
+        Returns:
+            float: The wait deadline.
+        """
+        with self._lock:
+            return self._get_deadline()
+
+    def record(self, latency: float, timed_out: bool = False):
+        """
+        Records the latency of a wait.
+
+        Args:
+            latency (float): Seconds the wait took.
+            timed_out (bool): Whether the wait hit its deadline.
+        """
+        with self._lock:
+            self._samples.append(latency)
+            if timed_out:
+                self._timeouts += 1
+
+    def stats(self) -> SelectorWaitStats:
+        """
+        Returns a snapshot of the selector latencies.
+
+        Returns:
+            SelectorWaitStats: The selector statistics.
+        """
+        with self._lock:
+            return SelectorWaitStats(
+                marketplace=self.marketplace,
+                selector=self.selector,
+                samples=len(self._samples),
+                timeouts=self._timeouts,
+                percentile=self._get_percentile(),
+                deadline=self._get_deadline(),
+            )
+
+
+class AdaptiveWaitRegistry:
+    """
+    Process-wide registry of selector latencies, one per marketplace and
+    selector, shared by every scraper so deadlines learn from all the recent
+    scrapes.
+
+    Attributes:
+        latencies (Dict[Tuple[str, str], SelectorLatency]): Maps marketplaces and selectors to their latencies.
+    """
+
+    latencies: Dict[Tuple[str, str], SelectorLatency] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_latency(cls, marketplace: str, selector: str) -> SelectorLatency:
+        """
+        Returns the latencies of a selector, creating them on first use.
+
+        Args:
+            marketplace (str): The marketplace the selector belongs to.
+            selector (str): The awaited selector.
+
+        Returns:
+            SelectorLatency: The selector latencies.
+        """
+        key = (marketplace, selector)
+        with cls._lock:
+            latency = cls.latencies.get(key)
+            if latency is None:
+                latency = SelectorLatency(marketplace, selector)
+                cls.latencies[key] = latency
+        return latency
+
+    @classmethod
+    def stats(cls) -> List[SelectorWaitStats]:
+        """
+        Returns the statistics of every registered selector.
+
+        Returns:
+            List[SelectorWaitStats]: One snapshot per marketplace and selector.
+        """
+        return [latency.stats() for latency in list(cls.latencies.values())]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every registered selector latency.
+        """
+        with cls._lock:
+            cls.latencies.clear()
@@ -1,12 +1,64 @@
 from typing import Dict, List
-from urllib.parse import parse_qs, urlparse
 
+from pydantic import Field
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from .base_scraper import BaseScraper
+from .extraction import ExtractionSpec, ExtractorRegistry, FieldSpec
+
+AMAZON_PRODUCT_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='amazon.product',
+        fields={
+            'marketplace_id': FieldSpec(
+                selector='//th[contains(text(), "ASIN")]/following-sibling::td',
+                by='xpath',
+                transforms=['strip'],
+            ),
+            'brand': FieldSpec(
+                selector='//th[contains(text(), "Fabricante")]/following-sibling::td',
+                by='xpath',
+                transforms=['strip'],
+            ),
+            'description': FieldSpec(selector='#title', transforms=['strip']),
+        },
+    )
+)
+
+AMAZON_TITLE = '#title'
+
+AMAZON_OFFERS_LIST = '#aod-offer-list'
+
+
+AMAZON_PROBE_SELECTORS = [
+    '#corePrice_feature_div span.a-offscreen',
+    '#aod-ingress-link',
+    '#olpLinkWidget_feature_div',
+    '#merchant-info',
+]
+
+AMAZON_OFFERS_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='amazon.offers',
+        root_selector='#aod-offer-list #aod-offer',
+        fields={
+            'price': FieldSpec(selector='span.a-offscreen', source='html'),
+            'seller_id': FieldSpec(
+                selector='a.a-size-small.a-link-normal',
+                source='href',
+                transforms=['query:seller'],
+            ),
+            'seller_name': FieldSpec(
+                selector='a.a-size-small.a-link-normal',
+                source='html',
+                transforms=['strip'],
+            ),
+            'seller_url': FieldSpec(
+                selector='a.a-size-small.a-link-normal', source='href'
+            ),
+        },
+    )
+)
 
 
 class AmazonScraperException(Exception):
@@ -21,15 +73,50 @@ class AmazonScraper(BaseScraper):
     """
     Scraper specifically designed for the Amazon marketplace. It extracts seller information such as marketplace ID, brand, description, and pricing data from product pages.
 
+    Product-level fields (ASIN, brand and title) are the same for every offer, so they
+    are read once per scrape and shared by all the offer records.
+
     Inherits from:
         BaseScraper (class): Abstract base class for scraping strategies.
     """
 
+    probe_selectors: List[str] = Field(
+        default_factory=lambda: list(AMAZON_PROBE_SELECTORS)
+    )
+
     def __init__(self, **data):
         """
         Initializes the scraper with a specific logger for 'Amazon'.
         """
-        super().__init__(**data, logger_name='amazon-scraper')
+        super().__init__(
+            **data, logger_name='amazon-scraper', marketplace='amazon'
+        )
+        self._product_fields = None
+
+    async def _extract_product_field(self, field: str, label: str) -> str:
+        """
+        Reads a single product-level field from the loaded product page with the
+        compiled product extractor.
+
+        Args:
+            field (str): Output name of the field in AMAZON_PRODUCT_EXTRACTOR.
+            label (str): Name of the field used in error messages.
+
+        Returns:
+            str: The field value.
+
+        Raises:
+            AmazonScraperException: If the field cannot be read.
+        """
+        try:
+            value = (await self.extract_one(AMAZON_PRODUCT_EXTRACTOR))[field]
+        except Exception as e:
+            raise AmazonScraperException(f'Error while getting {label}: {e}')
+        if value is None:
+            raise AmazonScraperException(
+                f'Error while getting {label}: not found'
+            )
+        return value
 
     async def get_marketplace_id(self) -> str:
         """
@@ -41,16 +128,7 @@ class AmazonScraper(BaseScraper):
         Raises:
             AmazonScraperException: If an error occurs during extraction.
         """
-        marketplace_id = ''
-        try:
-            marketplace_id = self.webdriver.find_element(
-                By.XPATH,
-                '//th[contains(text(), "ASIN")]/following-sibling::td',
-            ).text.strip()
-        except Exception as e:
-            raise AmazonScraperException(f'Error while getting ASIN: {e}')
-
-        return marketplace_id
+        return await self._extract_product_field('marketplace_id', 'ASIN')
 
     async def get_brand(self) -> str:
         """
@@ -62,19 +140,7 @@ class AmazonScraper(BaseScraper):
         Raises:
             AmazonScraperException: If an error occurs during extraction.
         """
-
-        brand = ''
-        try:
-            brand = self.webdriver.find_element(
-                By.XPATH,
-                '//th[contains(text(), "Fabricante")]/following-sibling::td',
-            ).text.strip()
-        except Exception as e:
-            raise AmazonScraperException(
-                f'Error while getting product brand: {e}'
-            )
-
-        return brand
+        return await self._extract_product_field('brand', 'product brand')
 
     async def get_description(self) -> str:
         """
@@ -86,122 +152,109 @@ class AmazonScraper(BaseScraper):
         Raises:
             AmazonScraperException: If an error occurs during extraction.
         """
-        description = ''
-        try:
-            description = self.webdriver.find_element(
-                By.ID, 'title'
-            ).text.strip()
-        except Exception as e:
-            raise AmazonScraperException(
-                f'Error while getting product description: {e}'
-            )
-
-        return description
+        return await self._extract_product_field(
+            'description', 'product description'
+        )
 
-    async def get_price(self, seller: WebElement) -> str:
+    async def get_price(self, seller: Dict) -> str:
         """
-        Extracts the price from the seller's data.
+        Extracts the price from the seller's offer.
 
         Args:
-            seller (WebElement): The seller element.
+            seller (Dict): The offer read by AMAZON_OFFERS_EXTRACTOR.
 
         Returns:
             str: The price.
-
-        Raises:
-            AmazonScraperException: If an error occurs during extraction.
         """
-        price = ''
-        try:
-            price = seller.find_element(
-                By.CSS_SELECTOR, 'span.a-offscreen'
-            ).get_attribute('innerHTML')
-        except Exception as e:
-            raise AmazonScraperException(
-                f'Error while getting product price: {e}'
-            )
+        return seller['price'] or ''
 
-        return price
-
-    async def get_seller_id(self, seller: WebElement) -> str:
+    async def get_seller_id(self, seller: Dict) -> str:
         """
-        Extracts the seller ID from the seller's data.
+        Extracts the seller ID from the seller's offer.
 
         Args:
-            seller (WebElement): The seller element.
+            seller (Dict): The offer read by AMAZON_OFFERS_EXTRACTOR.
 
         Returns:
             str: The seller ID.
-
-        Raises:
-            AmazonScraperException: If an error occurs during extraction.
         """
-        seller_id = ''
-        try:
-            seller_link = seller.find_element(
-                By.CSS_SELECTOR, 'a.a-size-small.a-link-normal'
-            ).get_attribute('href')
-            seller_id = parse_qs(urlparse(seller_link).query).get(
-                'seller', [None]
-            )[0]
-        except Exception as e:
-            raise AmazonScraperException(f'Error while getting seller id: {e}')
-
-        return seller_id
+        return seller['seller_id']
 
-    async def get_seller_name(self, seller: WebElement) -> str:
+    async def get_seller_name(self, seller: Dict) -> str:
         """
-        Extracts the seller name from the seller's data.
+        Extracts the seller name from the seller's offer.
 
         Args:
-            seller (WebElement): The seller element.
+            seller (Dict): The offer read by AMAZON_OFFERS_EXTRACTOR.
 
         Returns:
             str: The seller name.
-
-        Raises:
-            AmazonScraperException: If an error occurs during extraction.
         """
-        seller_name = ''
-        try:
-            seller_name = seller.find_element(
-                By.CSS_SELECTOR, 'a.a-size-small.a-link-normal'
-            ).get_attribute('innerHTML')
-        except Exception as e:
-            raise AmazonScraperException(
-                f'Error while getting seller name: {e}'
-            )
+        return seller['seller_name'] or ''
 
-        return seller_name.strip()
-
-    async def get_seller_url(self, seller: WebElement) -> str:
+    async def get_seller_url(self, seller: Dict) -> str:
         """
-        Extracts the seller URL from the seller's data.
+        Extracts the seller URL from the seller's offer.
 
         Args:
-            seller (WebElement): The seller element.
+            seller (Dict): The offer read by AMAZON_OFFERS_EXTRACTOR.
 
         Returns:
             str: The seller URL.
+        """
+        return seller['seller_url'] or ''
 
-        Raises:
-            AmazonScraperException: If an error occurs during extraction.
+    async def _read_product_fields(self) -> Dict:
         """
-        seller_url = ''
+        Reads the product-level fields from the loaded product page in a single
+        script execution. Fields that cannot be read are logged and left empty.
+
+        Returns:
+            Dict: The marketplace ID, brand and description of the product.
+        """
+        product_fields = {'marketplace_id': '', 'brand': '', 'description': ''}
         try:
-            seller_url = seller.find_element(
-                By.CSS_SELECTOR, 'a.a-size-small.a-link-normal'
-            ).get_attribute('href')
+            page_fields = await self.extract_one(AMAZON_PRODUCT_EXTRACTOR)
+            for field, value in page_fields.items():
+                if value is None:
+                    self.logger.error(
+                        f'Error while getting seller info details: {field} not found'
+                    )
+                else:
+                    product_fields[field] = value
         except Exception as e:
-            raise AmazonScraperException(
-                f'Error while getting seller url: {e}'
+            self.logger.error(
+                f'Unexpected error while getting seller info: {e}'
             )
+        return product_fields
 
-        return seller_url
+    async def get_product_fields(self) -> Dict:
+        """
+        Returns the product-level fields of the current scrape, loading the
+        product page only if they were not read yet.
+
+        Returns:
+            Dict: The marketplace ID, brand and description of the product.
+        """
+        if self._product_fields is None:
+            await self.load_page(str(self.product_url))
+            await self.wait_for(AMAZON_TITLE)
+            self._product_fields = await self._read_product_fields()
+        return self._product_fields
+
+    def _open_offers_list(self):
+        clickable_element = self.webdriver.find_element(
+            By.XPATH,
+            '//div[@class="a-section a-spacing-none daodi-content"]//a[@class="a-link-normal"]',
+        )
+        clickable_element.click()
 
     async def get_sellers_list(self) -> List[Dict]:
         """
-        Extracts the list of sellers from the product page.
+        Extracts the list of sellers from the product page. The offers fields are
+        read for all the sellers with a single script execution, once the offers
+        list is displayed. When pages are archived, the product page is archived
+        again with its offers list, so it can be replayed offline.
 
         Returns:
             List[Dict]: A list of dictionaries, each containing data about a seller.
@@ -212,35 +265,24 @@ class AmazonScraper(BaseScraper):
 
         sellers = []
         try:
-            self.webdriver.get(str(self.product_url))
-            clickable_element = self.webdriver.find_element(
-                By.XPATH,
-                '//div[@class="a-section a-spacing-none daodi-content"]//a[@class="a-link-normal"]',
-            )
-            clickable_element.click()
-            WebDriverWait(self.webdriver, 10).until(
-                EC.visibility_of_element_located((By.ID, 'aod-offer-list'))
-            )
-            sellers_offers = self.webdriver.find_elements(
-                By.CSS_SELECTOR, '#aod-offer-list #aod-offer'
-            )
+            await self.load_page(str(self.product_url))
+            await self.wait_for(AMAZON_TITLE)
+            self._product_fields = await self._read_product_fields()
+            await self.run_in_driver(self._open_offers_list)
+            await self.wait_for(AMAZON_OFFERS_LIST, visible=True)
+            await self.archive_loaded_page(str(self.product_url))
+            sellers_offers = await self.extract(AMAZON_OFFERS_EXTRACTOR)
             for seller_offer in sellers_offers:
                 seller = {
                     'product_url': self.product_url,
                     'marketplace_id': '',
                     'brand': '',
                     'description': '',
-                    'price': '',
-                    'seller_id': '',
-                    'seller_name': '',
-                    'seller_url': '',
+                    'price': await self.get_price(seller_offer),
+                    'seller_id': await self.get_seller_id(seller_offer),
+                    'seller_name': await self.get_seller_name(seller_offer),
+                    'seller_url': await self.get_seller_url(seller_offer),
                 }
-                seller['price'] = await self.get_price(seller_offer)
-                seller['seller_id'] = await self.get_seller_id(seller_offer)
-                seller['seller_name'] = await self.get_seller_name(
-                    seller_offer
-                )
-                seller['seller_url'] = await self.get_seller_url(seller_offer)
                 sellers.append(seller)
         except Exception as e:
             raise AmazonScraperException(
@@ -251,25 +293,17 @@ class AmazonScraper(BaseScraper):
 
     async def get_seller_info(self, seller: Dict) -> Dict:
         """
-        Extracts the seller information from the product page.
+        Completes the seller information with the product-level fields, which are
+        read once per scrape.
 
         Args:
             seller (Dict): The seller element.
 
         Returns:
             Dict: A dictionary containing the seller's information.
-
-        Raises:
-            AmazonScraperException: If an error occurs during extraction.
         """
         try:
-            self.webdriver.get(str(self.product_url))
-            seller['marketplace_id'] = await self.get_marketplace_id()
-            seller['brand'] = await self.get_brand()
-            seller['description'] = await self.get_description()
-
-        except AmazonScraperException as e:
-            self.logger.error(f'Error while getting seller info details: {e}')
+            seller.update(await self.get_product_fields())
         except Exception as e:
             self.logger.error(
                 f'Unexpected error while getting seller info: {e}'
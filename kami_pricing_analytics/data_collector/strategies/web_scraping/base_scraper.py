@@ -1,54 +1,119 @@
 import asyncio
+import functools
 import logging
 import random
+import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
 from pydantic import ConfigDict, Field
-from robotexclusionrulesparser import RobotExclusionRulesParser as Robots
 from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium_stealth import stealth
 from webdriver_manager.chrome import ChromeDriverManager
 
 from kami_pricing_analytics.data_collector import BaseCollector
 
-from .constants import DEFAULT_CRAWL_DELAY, DEFAULT_USER_AGENT, USER_AGENTS
+from .adaptive_wait import AdaptiveWaitRegistry
+from .browser_profile import BrowserProfile
+from .browser_supervisor import BrowserSupervisor
+from .change_probe import (
+    ProbeResult,
+    build_conditional_headers,
+    fingerprint_html,
+)
+from .circuit_breaker import CircuitBreaker
+from .constants import (
+    DEFAULT_CRAWL_DELAY,
+    DEFAULT_USER_AGENT,
+    DRIVER_POOL_ENABLED,
+    PAGE_LOAD_TIMEOUT,
+    PAGES_CONCURRENCY,
+    RATE_LIMIT_ENABLED,
+    SUPERVISOR_ENABLED,
+    WAIT_MAX_POLL_INTERVAL,
+    WAIT_POLL_INTERVAL,
+)
+from .driver_pool import DriverPoolRegistry
+from .extraction import (
+    EXTRACTION_SCRIPT,
+    CompiledExtractor,
+    FieldSpec,
+    build_extraction_arguments,
+)
+from .fetch_policy import FetchLatencyRegistry, FetchPolicy
+from .http_client import HttpClientRegistry
+from .page_archive import PageArchive, PageArchiveRegistry
+from .rate_limiter import RateLimiterRegistry
+from .replay import build_replay_url
+from .robots import RobotsCache
+from .telemetry import ScrapeTelemetry
+from .user_agent_profiles import load_user_agents
 
 
 class BaseScraper(BaseCollector, ABC):
     """
     Abstract base class for scraping strategies. Implements common functionalities
     for web scraping operations, including handling web drivers and HTTP clients
-    with respect for robots.txt constraints.
+    with respect for robots.txt constraints. The robots.txt rules are shared by
+    every scraper through the RobotsCache.
 
     Attributes:
         user_agent (str): Default user agent for HTTP requests.
-        http_client (httpx.AsyncClient): Async HTTP client for making requests.
+        http_client (httpx.AsyncClient): Shared async HTTP client for making requests. When unset, a short-lived client is opened per request.
         base_url (str): Base URL derived from the product URL.
         robots_url (str): URL to the robots.txt file.
         crawl_delay (int): Delay between requests as specified in robots.txt.
         logger_name (str): Name for the logger.
         logger (logging.Logger): Logger instance for logging.
         webdriver (WebDriver): Selenium WebDriver instance.
-        user_agents (list): List of user agents for requests.
+        user_agents (list): List of user agents for requests. Defaults to the user agents of the marketplace profile, or to `USER_AGENTS` when the marketplace was not scored.
+        marketplace (str): Marketplace name, used to share pooled webdrivers.
+        use_driver_pool (bool): Whether to lease webdrivers from the marketplace pool.
+        keep_webdriver (bool): Whether the WebDriver is kept after a successful scrape, so a batch can hand it over to the scraper of its next product. Failed scrapes always release it.
+        webdriver_required (bool): Whether a WebDriver is set up before scraping.
+        pages_concurrency (int): Maximum number of pages loaded at once in browser tabs.
+        rate_limit_enabled (bool): Whether requests are paced by the per-host rate limiters.
+        browser_profile (BrowserProfile): Lightweight browsing profile of the WebDriver sessions. Defaults to the marketplace profile.
+        telemetry (ScrapeTelemetry): Execution report of the last scrape.
+        page_archive (PageArchive): Archive of the raw pages fetched. Defaults to the shared archive, if open; pages are not archived otherwise.
+        replay_url (str): Base URL of a ReplayServer every request is sent to instead of the marketplace, for offline runs.
+        probe_selectors (List[str]): CSS selectors of the price fragment of the server-rendered product page, fingerprinted by `probe`.
+        circuit_breaker (CircuitBreaker): Breaker of the marketplace guarding `execute`, None to scrape unguarded.
+        fetch_policy (FetchPolicy): Retry and hedging policy of `fetch_content`.
     """
 
     user_agent: str = Field(default=DEFAULT_USER_AGENT)
-    http_client: httpx.AsyncClient = Field(default=None)
+    http_client: Optional[httpx.AsyncClient] = Field(default=None)
     base_url: str = Field(default='')
     robots_url: str = Field(default='')
     crawl_delay: int = Field(default=DEFAULT_CRAWL_DELAY)
     logger_name: str = Field(default='pricing-scraper')
     logger: logging.Logger = Field(default=None)
     webdriver: WebDriver = Field(default=None)
-    user_agents: list = USER_AGENTS
+    user_agents: list = Field(default=None)
+    marketplace: str = Field(default='')
+    use_driver_pool: bool = Field(default=DRIVER_POOL_ENABLED)
+    keep_webdriver: bool = Field(default=False)
+    webdriver_required: bool = Field(default=True)
+    pages_concurrency: int = Field(default=PAGES_CONCURRENCY)
+    rate_limit_enabled: bool = Field(default=RATE_LIMIT_ENABLED)
+    browser_profile: BrowserProfile = Field(default=None)
+    telemetry: ScrapeTelemetry = Field(default_factory=ScrapeTelemetry)
+    page_archive: Optional[PageArchive] = Field(default=None)
+    replay_url: Optional[str] = Field(default=None)
+    probe_selectors: List[str] = Field(default_factory=list)
+    circuit_breaker: Optional[CircuitBreaker] = Field(default=None)
+    fetch_policy: FetchPolicy = Field(default_factory=FetchPolicy)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -60,11 +125,22 @@ class BaseScraper(BaseCollector, ABC):
         self.base_url = self.product_url.scheme + '://' + self.product_url.host
         self.robots_url = f'{self.base_url}/robots.txt'
         self._crawl_delay_fetched = False
+        self._driver_lease = None
+        self._driver_executor = None
+        if self.browser_profile is None:
+            self.browser_profile = BrowserProfile.for_marketplace(
+                self.marketplace
+            )
+        if self.page_archive is None:
+            self.page_archive = PageArchiveRegistry.get_archive()
+        if not self.user_agents:
+            self.user_agents = load_user_agents(self.marketplace)
         self.set_logger(self.logger_name)
 
     def _setup_driver(self) -> WebDriver:
         """
-        Configures and returns a headless Selenium WebDriver with random user-agent.
+        Configures and returns a headless Selenium WebDriver with random user-agent
+        and the scraper browser profile.
         Includes modifications to evade detection via `selenium_stealth`.
         """
         options = Options()
@@ -74,10 +150,13 @@ class BaseScraper(BaseCollector, ABC):
 
         user_agent = random.choice(self.user_agents)
         options.add_argument(f'user-agent={user_agent}')
+        self.browser_profile.apply_to_options(options)
 
         driver = webdriver.Chrome(
             service=Service(ChromeDriverManager().install()), options=options
         )
+        if SUPERVISOR_ENABLED:
+            BrowserSupervisor.track(driver, self.marketplace)
         stealth(
             driver,
             languages=['en-US', 'en'],
@@ -87,40 +166,455 @@ class BaseScraper(BaseCollector, ABC):
             renderer='Intel Iris OpenGL Engine',
             fix_hairline=True,
         )
+        self.browser_profile.apply_to_driver(driver)
         return driver
 
     async def set_webdriver(self) -> WebDriver:
         """
         Asynchronously sets up and assigns a WebDriver to this scraper instance.
+        When `use_driver_pool` is enabled the WebDriver is leased from the
+        marketplace pool instead of being launched from scratch, and sessions the
+        pool creates for it are set up with the settings of this scraper.
         Handles exceptions and logs them appropriately.
         """
         try:
-            with ThreadPoolExecutor() as executor:
-                loop = asyncio.get_running_loop()
-                future = loop.run_in_executor(executor, self._setup_driver)
-                driver = await future
-                self.webdriver = driver
+            if self.use_driver_pool:
+                pool = DriverPoolRegistry.get_pool(
+                    self.marketplace or self.logger_name
+                )
+                self._driver_lease = await pool.acquire(self._setup_driver)
+                self.webdriver = self._driver_lease.driver
+            else:
+                self.webdriver = await self.run_in_driver(self._setup_driver)
         except Exception as e:
             self.logger.exception(f'Error getting webdriver: {e}')
 
+    def _get_driver_executor(self) -> ThreadPoolExecutor:
+        if self._driver_lease:
+            return self._driver_lease.executor
+        if self._driver_executor is None:
+            self._driver_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f'webdriver-{self.logger_name}',
+            )
+        return self._driver_executor
+
+    async def run_in_driver(
+        self, function: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """
+        Runs a blocking WebDriver call on the worker thread bound to the current
+        WebDriver, so the event loop keeps serving other requests while Selenium
+        waits on the browser. Leased WebDrivers use the thread of their pooled
+        session; other WebDrivers use a thread owned by this scraper.
+
+        Args:
+            function (Callable[..., Any]): Blocking callable that uses the WebDriver.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            Any: The value returned by the callable.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_driver_executor(),
+            functools.partial(function, *args, **kwargs),
+        )
+
+    async def release_webdriver(self, failed: bool = False):
+        """
+        Releases the WebDriver of this scraper instance. Leased WebDrivers are
+        returned to their pool, which recycles them when `failed` is set; any
+        other WebDriver is quit through the BrowserSupervisor, which kills its
+        processes if it does not quit in time.
+
+        Args:
+            failed (bool): Whether the WebDriver was used in a failed scrape.
+        """
+        try:
+            if self._driver_lease:
+                await self._driver_lease.pool.release(
+                    self._driver_lease, failed=failed
+                )
+            elif self.webdriver:
+                await BrowserSupervisor.quit(
+                    self.webdriver, self.run_in_driver
+                )
+        except Exception as e:
+            self.logger.error(f'Error while releasing webdriver: {e}')
+        finally:
+            if self._driver_executor:
+                self._driver_executor.shutdown(wait=False)
+            self._driver_executor = None
+            self._driver_lease = None
+            self.webdriver = None
+
+    def hand_over_webdriver(self, scraper: 'BaseScraper'):
+        """
+        Moves the WebDriver session of this scraper, along with its pool lease
+        and worker thread, to another scraper of the same marketplace, which
+        then scrapes with it instead of setting up its own.
+
+        Args:
+            scraper (BaseScraper): The scraper taking over the session.
+        """
+        scraper.webdriver = self.webdriver
+        scraper._driver_lease = self._driver_lease
+        scraper._driver_executor = self._driver_executor
+        self.webdriver = None
+        self._driver_lease = None
+        self._driver_executor = None
+
+    async def is_webdriver_reusable(self) -> bool:
+        """
+        Tells whether the WebDriver kept after a scrape can serve another
+        product: leased sessions must be below the page limit of their pool,
+        and every session must be deemed healthy by the BrowserSupervisor.
+
+        Returns:
+            bool: True if the WebDriver can be handed over to another scraper.
+        """
+        if self.webdriver is None:
+            return False
+        lease = self._driver_lease
+        if lease and lease.pages_served >= lease.pool.max_pages:
+            return False
+        return await asyncio.to_thread(
+            BrowserSupervisor.is_healthy, self.webdriver
+        )
+
+    def resolve_url(self, url: str) -> str:
+        """
+        Returns the URL a request is actually sent to: the URL itself, or its
+        path on the replay server when `replay_url` is set. Rate limiting,
+        robots.txt rules and the page archive keep using the marketplace URL.
+
+        Args:
+            url (str): The marketplace URL.
+
+        Returns:
+            str: The URL to request.
+        """
+        if not self.replay_url:
+            return url
+        return build_replay_url(self.replay_url, url)
+
+    def _count_page_load(self):
+        self.telemetry.pages_loaded += 1
+        BrowserSupervisor.record_page(self.webdriver)
+        if self._driver_lease:
+            self._driver_lease.pages_served += 1
+
+    async def load_page(self, url: str):
+        """
+        Navigates the WebDriver to the given URL, accounting the page against the
+        leased session and the scrape telemetry, and archives its source when a
+        page archive is set.
+
+        Args:
+            url (str): URL to load.
+        """
+        await self.throttle(url)
+        await self.run_in_driver(self.webdriver.get, self.resolve_url(url))
+        self._count_page_load()
+        await self.archive_loaded_page(url)
+
+    async def archive_page(self, url: str, content):
+        """
+        Stores a fetched page in the page archive, if any, under the marketplace
+        and the product being scraped. Archiving errors are logged and never
+        abort the scrape.
+
+        Args:
+            url (str): URL of the fetched page.
+            content (Union[str, bytes]): The page content.
+        """
+        if self.page_archive is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.page_archive.store,
+                self.marketplace or self.logger_name,
+                self.sku or str(self.product_url),
+                url,
+                content,
+            )
+            self.telemetry.pages_archived += 1
+        except Exception as e:
+            self.logger.error(f'Error while archiving {url}: {e}')
+
+    async def archive_loaded_page(self, url: str):
+        """
+        Stores the page currently loaded in the WebDriver in the page archive, if
+        any.
+
+        Args:
+            url (str): URL of the loaded page.
+        """
+        if self.page_archive is None:
+            return
+        try:
+            page_source = await self.run_in_driver(
+                lambda: self.webdriver.page_source
+            )
+        except WebDriverException as e:
+            self.logger.error(f'Error while reading page source of {url}: {e}')
+            return
+        await self.archive_page(url, page_source)
+
+    def _is_present(self, by: str, selector: str, visible: bool) -> bool:
+        elements = self.webdriver.find_elements(by, selector)
+        if visible:
+            return any(element.is_displayed() for element in elements)
+        return bool(elements)
+
+    async def wait_for(
+        self, selector: str, by: str = 'css', visible: bool = False
+    ) -> float:
+        """
+        Waits for an element of the loaded page, polling the WebDriver with
+        exponential backoff from the event loop. The deadline is learnt from the
+        recent waits of the same selector on the marketplace, so slow pages get
+        more time and fast pages fail early; the time spent waiting is recorded
+        in the selector latencies and in the scrape telemetry.
+
+        Args:
+            selector (str): CSS selector or XPath of the element.
+            by (str): Selector kind, either 'css' or 'xpath'.
+            visible (bool): Whether the element must be displayed, not only present.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            TimeoutException: If the element is not found before the deadline.
+        """
+        latency = AdaptiveWaitRegistry.get_latency(
+            self.marketplace or self.logger_name, selector
+        )
+        deadline = latency.deadline()
+        locator = By.XPATH if by == 'xpath' else By.CSS_SELECTOR
+        interval = WAIT_POLL_INTERVAL
+        started_at = time.monotonic()
+
+        while True:
+            found = await self.run_in_driver(
+                self._is_present, locator, selector, visible
+            )
+            waited = time.monotonic() - started_at
+            if found or waited >= deadline:
+                break
+            await asyncio.sleep(min(interval, deadline - waited))
+            interval = min(interval * 2, WAIT_MAX_POLL_INTERVAL)
+
+        latency.record(min(waited, deadline), timed_out=not found)
+        self.telemetry.record_wait(selector, waited)
+        if not found:
+            raise TimeoutException(
+                f'{selector} not found after {deadline:.2f} seconds'
+            )
+        return waited
+
+    async def extract_fields(
+        self, fields: Dict[str, FieldSpec], root_selector: str = None
+    ) -> List[Dict]:
+        """
+        Reads every field of every root element of the loaded page with a single
+        script execution, instead of one WebDriver round trip per field.
+
+        Args:
+            fields (Dict[str, FieldSpec]): Maps output names to field specs.
+            root_selector (str): CSS selector of the repeated root elements, such as one element per seller. Empty to use the whole page as the only root.
+
+        Returns:
+            List[Dict]: One dictionary per root element, mapping output names to the values read, or None for fields not found.
+        """
+        rows = await self.run_in_driver(
+            self.webdriver.execute_script,
+            EXTRACTION_SCRIPT,
+            *build_extraction_arguments(fields, root_selector),
+        )
+        return rows or []
+
+    async def extract_page_fields(self, fields: Dict[str, FieldSpec]) -> Dict:
+        """
+        Reads the given fields from the whole loaded page with a single script
+        execution.
+
+        Args:
+            fields (Dict[str, FieldSpec]): Maps output names to field specs.
+
+        Returns:
+            Dict: Maps output names to the values read, or None for fields not found.
+        """
+        rows = await self.extract_fields(fields)
+        return rows[0] if rows else dict.fromkeys(fields)
+
+    async def extract(self, extractor: CompiledExtractor) -> List[Dict]:
+        """
+        Reads a compiled extraction spec from the loaded page with a single
+        script execution, and accounts the time spent on each field.
+
+        Args:
+            extractor (CompiledExtractor): The compiled spec.
+
+        Returns:
+            List[Dict]: One post-processed dictionary per root element.
+        """
+        result = await self.run_in_driver(
+            self.webdriver.execute_script,
+            EXTRACTION_SCRIPT,
+            *extractor.script_arguments,
+        )
+        rows, timings = extractor.process(result)
+        self.telemetry.record_extraction(extractor.name, timings)
+        return rows
+
+    async def extract_one(self, extractor: CompiledExtractor) -> Dict:
+        """
+        Reads a compiled extraction spec without root selector from the loaded page.
+
+        Args:
+            extractor (CompiledExtractor): The compiled spec.
+
+        Returns:
+            Dict: Maps output names to the post-processed values, or None for fields not found.
+        """
+        rows = await self.extract(extractor)
+        return rows[0] if rows else extractor.empty_row()
+
+    def extract_html(
+        self, extractor: CompiledExtractor, content: str, url: str = None
+    ) -> List[Dict]:
+        """
+        Reads a compiled extraction spec from static HTML, such as a page fetched
+        without a WebDriver, and accounts the time spent on each field.
+
+        Args:
+            extractor (CompiledExtractor): The compiled spec.
+            content (str): The page HTML.
+            url (str): URL of the page, to resolve relative links. Defaults to the product URL.
+
+        Returns:
+            List[Dict]: One post-processed dictionary per root element.
+        """
+        rows, timings = extractor.extract_html(
+            content, url or str(self.product_url)
+        )
+        self.telemetry.record_extraction(extractor.name, timings)
+        return rows
+
+    def _open_tab(self, url: str) -> str:
+        handles = set(self.webdriver.window_handles)
+        self.webdriver.execute_script(
+            'window.open(arguments[0], "_blank");', 'about:blank'
+        )
+        handle = (set(self.webdriver.window_handles) - handles).pop()
+        self.webdriver.switch_to.window(handle)
+        self.browser_profile.apply_to_driver(self.webdriver)
+        self.webdriver.execute_script(
+            'window.location.assign(arguments[0]);', self.resolve_url(url)
+        )
+        return handle
+
+    def _wait_page_loaded(self):
+        WebDriverWait(self.webdriver, PAGE_LOAD_TIMEOUT).until(
+            lambda driver: driver.execute_script('return document.readyState')
+            == 'complete'
+        )
+
+    def _switch_to_loaded_tab(self, handle: str):
+        self.webdriver.switch_to.window(handle)
+        self._wait_page_loaded()
+
+    def _close_tabs(self, handles: List[str], main_handle: str):
+        for handle in handles:
+            try:
+                self.webdriver.switch_to.window(handle)
+                self.webdriver.close()
+            except WebDriverException:
+                pass
+        self.webdriver.switch_to.window(main_handle)
+
+    async def load_pages_in_tabs(
+        self, urls: List[str]
+    ) -> AsyncIterator[Tuple[int, str, Optional[WebDriverException]]]:
+        """
+        Loads the given URLs in browser tabs, up to `pages_concurrency` at a time,
+        so the browser fetches them concurrently. The WebDriver is switched to each
+        loaded tab before it is yielded, and the tab is closed once the caller is
+        done with it. A tab that fails to load is yielded with its error, without
+        affecting the other tabs of the batch.
+
+        Args:
+            urls (List[str]): URLs to load.
+
+        Yields:
+            Tuple[int, str, Optional[WebDriverException]]: The position of the URL in `urls`, the URL itself and the error that prevented the page from loading, or None if it loaded.
+        """
+        main_handle = await self.run_in_driver(
+            lambda: self.webdriver.current_window_handle
+        )
+        fan_out = max(self.pages_concurrency, 1)
+
+        for start in range(0, len(urls), fan_out):
+            batch = list(enumerate(urls[start : start + fan_out], start))
+            tabs = []
+            try:
+                for index, url in batch:
+                    await self.throttle(url)
+                    handle = await self.run_in_driver(self._open_tab, url)
+                    tabs.append((handle, index, url))
+
+                for handle, index, url in tabs:
+                    try:
+                        await self.run_in_driver(
+                            self._switch_to_loaded_tab, handle
+                        )
+                    except WebDriverException as e:
+                        yield index, url, e
+                        continue
+                    self._count_page_load()
+                    await self.archive_loaded_page(url)
+                    yield index, url, None
+            finally:
+                await self.run_in_driver(
+                    self._close_tabs,
+                    [handle for handle, _, _ in tabs],
+                    main_handle,
+                )
+
     @asynccontextmanager
     async def get_http_client(self):
         """
         Context manager for HTTP client to ensure proper header setup and cleanup.
+        Yields the shared `http_client` when one was injected, leaving it open for
+        the next requests; otherwise opens a client that is closed on exit.
         """
+        if self.http_client and not self.http_client.is_closed:
+            yield self.http_client
+            return
+
         headers = {'User-Agent': self.user_agent}
         async with httpx.AsyncClient(headers=headers) as client:
             yield client
 
+    def _get_request_headers(self) -> Dict[str, str]:
+        return {'User-Agent': self.user_agent}
+
+    async def _fetch_robots(self, robots_url: str) -> httpx.Response:
+        async with self.get_http_client() as client:
+            return await client.get(
+                self.resolve_url(robots_url),
+                headers=self._get_request_headers(),
+            )
+
     async def _get_crawl_delay_async(self) -> int:
-        rules = Robots()
         try:
-            async with self.get_http_client() as client:
-                response = await client.get(self.robots_url)
-            rules.parse(response.text)
-            user_agent = DEFAULT_USER_AGENT
-            delay = rules.get_crawl_delay(user_agent)
-            return delay if delay is not None else DEFAULT_CRAWL_DELAY
+            return await RobotsCache.get_crawl_delay(
+                self.robots_url, DEFAULT_USER_AGENT, fetch=self._fetch_robots
+            )
         except Exception as e:
             self.logger.exception(f'Error getting crawl delay: {e}')
             return DEFAULT_CRAWL_DELAY
@@ -130,6 +624,34 @@ class BaseScraper(BaseCollector, ABC):
             self.crawl_delay = await self._get_crawl_delay_async()
             self._crawl_delay_fetched = True
 
+    async def _get_host_crawl_delay(self, url: str) -> float:
+        if urlparse(url).netloc == urlparse(self.base_url).netloc:
+            await self._ensure_crawl_delay()
+            return self.crawl_delay
+        try:
+            return await RobotsCache.get_crawl_delay(
+                url, DEFAULT_USER_AGENT, fetch=self._fetch_robots
+            )
+        except Exception as e:
+            self.logger.error(f'Error getting crawl delay of {url}: {e}')
+            return DEFAULT_CRAWL_DELAY
+
+    async def throttle(self, url: str):
+        """
+        Waits for the rate limiter of the URL host, shared by every scraper, and
+        accounts the time spent queued in the scrape telemetry. The limiter is
+        paced by the host robots.txt crawl delay, or by the configured default
+        rate when the host defines none.
+
+        Args:
+            url (str): URL about to be requested.
+        """
+        if not self.rate_limit_enabled:
+            return
+        crawl_delay = await self._get_host_crawl_delay(url)
+        limiter = RateLimiterRegistry.get_limiter(url, crawl_delay)
+        self.telemetry.rate_limit_wait += await limiter.acquire()
+
     def _get_base_url(self) -> str:
         parsed_url = urlparse(str(self.product_url))
         return f'{parsed_url.scheme}://{parsed_url.netloc}'
@@ -137,10 +659,147 @@ class BaseScraper(BaseCollector, ABC):
     def set_logger(self, logger_name: str):
         self.logger = logging.getLogger(logger_name)
 
+    async def _send_attempt(
+        self,
+        url: str,
+        attempt: int,
+        hedged: bool = False,
+        throttled: bool = False,
+    ) -> httpx.Response:
+        if not throttled:
+            await self.throttle(url)
+        start = time.monotonic()
+        try:
+            async with self.get_http_client() as client:
+                response = await asyncio.wait_for(
+                    client.get(
+                        self.resolve_url(url),
+                        headers=self._get_request_headers(),
+                    ),
+                    self.fetch_policy.attempt_timeout,
+                )
+        except asyncio.CancelledError:
+            self.telemetry.record_attempt(
+                url,
+                attempt,
+                time.monotonic() - start,
+                error='cancelled',
+                hedged=hedged,
+            )
+            raise
+        except Exception as e:
+            seconds = time.monotonic() - start
+            if isinstance(e, TimeoutError):
+                FetchLatencyRegistry.get_latency(urlparse(url).netloc).record(
+                    seconds
+                )
+            self.telemetry.record_attempt(
+                url, attempt, seconds, error=e, hedged=hedged
+            )
+            raise
+
+        seconds = time.monotonic() - start
+        FetchLatencyRegistry.get_latency(urlparse(url).netloc).record(seconds)
+        self.telemetry.record_attempt(
+            url, attempt, seconds, status=response.status_code, hedged=hedged
+        )
+        return response
+
+    def _take_retry(self) -> bool:
+        if self.telemetry.retries >= self.fetch_policy.retry_budget:
+            return False
+        self.telemetry.retries += 1
+        return True
+
+    async def _send_hedged(self, url: str, attempt: int) -> httpx.Response:
+        policy = self.fetch_policy
+        latency = FetchLatencyRegistry.get_latency(urlparse(url).netloc)
+        hedge_delay = (
+            latency.hedge_delay(
+                policy.hedge_percentile, policy.hedge_min_samples
+            )
+            if policy.hedge_enabled
+            else None
+        )
+        if hedge_delay is None:
+            return await self._send_attempt(url, attempt)
+
+        # The hedge delay is counted from when the request is sent, not from
+        # when it was queued behind the host rate limiter
+        await self.throttle(url)
+        pending = {
+            asyncio.ensure_future(
+                self._send_attempt(url, attempt, throttled=True)
+            )
+        }
+        done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+        if not done and self._take_retry():
+            latency.record_hedge()
+            pending.add(
+                asyncio.ensure_future(
+                    self._send_attempt(url, attempt, hedged=True)
+                )
+            )
+
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def fetch(self, url: str) -> httpx.Response:
+        """
+        Fetches a URL with the retry and hedging policy of the scraper. Every
+        attempt is paced by the host rate limiter and recorded in the scrape
+        telemetry; retries and hedged requests are spent from the retry budget
+        of the research.
+
+        Args:
+            url (str): URL to fetch.
+
+        Returns:
+            httpx.Response: The response of the last attempt, which may have a retryable status when the attempts or the budget ran out.
+
+        Raises:
+            httpx.HTTPError: If the last attempt failed with an HTTP error.
+            TimeoutError: If the last attempt took longer than the attempt timeout.
+        """
+        policy = self.fetch_policy
+        attempt = 1
+        while True:
+            response, error = None, None
+            try:
+                response = await self._send_hedged(url, attempt)
+            except Exception as e:
+                error = e
+
+            if (
+                attempt >= policy.max_attempts
+                or not policy.is_retryable(response, error)
+                or not self._take_retry()
+            ):
+                if error is not None:
+                    raise error
+                return response
+
+            await asyncio.sleep(policy.backoff(attempt, response))
+            attempt += 1
+
     async def fetch_content(self, url: str = '') -> str:
         """
-        Fetches content from the given URL using the configured HTTP client,
-        respecting the crawl delay defined in robots.txt.
+        Fetches content from the given URL using the configured HTTP client and
+        the retry and hedging policy of the scraper. The response body is
+        archived when a page archive is set.
 
         Args:
             url (str): URL to fetch. If empty, uses the product URL.
@@ -148,12 +807,54 @@ class BaseScraper(BaseCollector, ABC):
         Returns:
             str: The content of the page.
         """
-        await self._ensure_crawl_delay()
-        async with self.get_http_client() as client:
-            product_url = url if url else str(self.product_url)
-            response = await client.get(product_url)
+        product_url = url if url else str(self.product_url)
+        response = await self.fetch(product_url)
+        await self.archive_page(product_url, response.content)
         return response.text
 
+    async def probe(self, snapshot: Dict = None) -> ProbeResult:
+        """
+        Checks whether the product changed since the last research with a
+        single HTTP request, without a WebDriver. The request is conditional on
+        the ETag and Last-Modified of the snapshot; when the server does not
+        answer 304 Not Modified, the price fragment of the page is fingerprinted
+        with `probe_selectors` and compared to the snapshot fingerprint.
+
+        Args:
+            snapshot (Dict): The snapshot of the last probe, as returned by `ProbeResult.snapshot`.
+
+        Returns:
+            ProbeResult: The probe outcome, reported as changed when the fragment cannot be fingerprinted.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        snapshot = snapshot or {}
+        product_url = str(self.product_url)
+        headers = {
+            **self._get_request_headers(),
+            **build_conditional_headers(snapshot),
+        }
+        await self.throttle(product_url)
+        async with self.get_http_client() as client:
+            response = await client.get(
+                self.resolve_url(product_url), headers=headers
+            )
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return ProbeResult(changed=False, not_modified=True, **snapshot)
+        response.raise_for_status()
+        fingerprint = fingerprint_html(response.text, self.probe_selectors)
+        return ProbeResult(
+            changed=(
+                fingerprint is None
+                or fingerprint != snapshot.get('fingerprint')
+            ),
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            fingerprint=fingerprint,
+        )
+
     @abstractmethod
     async def get_marketplace_id(self) -> str:
         """
@@ -217,49 +918,139 @@ class BaseScraper(BaseCollector, ABC):
         """
         pass
 
-    async def scrap_product(self) -> list:
+    async def stream_sellers_info(self, sellers: list) -> AsyncIterator[dict]:
         """
-        Orchestrates the scraping process. Initializes WebDriver, fetches sellers,
-        extracts their info, and ensures cleanup. Logs errors during the process.
+        Extracts the info of every seller in order, yielding each one as soon as
+        it is extracted. Sellers that fail are logged, recorded in the telemetry
+        and skipped.
+
+        Args:
+            sellers (list): The sellers returned by `get_sellers_list`.
+
+        Yields:
+            dict: The info of a seller.
+        """
+        for seller in sellers:
+            try:
+                seller_info = await self.get_seller_info(seller)
+            except Exception as e:
+                self.logger.error(f'Error while getting seller info: {e}')
+                self.telemetry.record_failure('seller_info', seller, e)
+                continue
+            yield seller_info
+
+    async def get_sellers_info(self, sellers: list) -> list:
+        """
+        Extracts the info of every seller, as streamed by `stream_sellers_info`.
+
+        Args:
+            sellers (list): The sellers returned by `get_sellers_list`.
 
         Returns:
             list: List of dictionaries, each containing seller info.
         """
+        return [
+            seller_info
+            async for seller_info in self.stream_sellers_info(sellers)
+        ]
+
+    async def stream_product(self) -> AsyncIterator[dict]:
+        """
+        Orchestrates the scraping process, yielding the info of every seller as
+        soon as it is extracted. Initializes WebDriver when required and not
+        handed over, fetches sellers, extracts their info, and ensures cleanup,
+        also when the caller stops consuming the sellers early, unless
+        `keep_webdriver` is set. Logs errors during the process, which end the
+        stream.
+
+        Yields:
+            dict: The info of a seller.
+        """
+        failed = False
+        self.telemetry = ScrapeTelemetry()
         try:
-            await self.set_webdriver()
+            if self.webdriver_required and self.webdriver is None:
+                await self.set_webdriver()
             sellers = await self.get_sellers_list()
-            sellers_list = []
-            for seller in sellers:
-                try:
-                    seller_info = await self.get_seller_info(seller)
-                    sellers_list.append(seller_info)
-                except Exception as e:
-                    self.logger.error(f'Error while getting seller info: {e}')
-            return sellers_list
+            async for seller_info in self.stream_sellers_info(sellers):
+                yield seller_info
         except WebDriverException as wd_error:
+            failed = True
+            self.telemetry.record_error(wd_error)
             self.logger.error(
                 f'Webdriver Error while scraping product: {wd_error}'
             )
         except Exception as e:
+            failed = True
+            self.telemetry.record_error(e)
             self.logger.error(f'Unexpected Error while scraping product: {e}')
         finally:
-            if self.webdriver:
-                self.webdriver.quit()
+            if failed or not self.keep_webdriver:
+                await self.release_webdriver(failed=failed)
+
+    async def scrap_product(self) -> list:
+        """
+        Scrapes the product and collects the sellers streamed by `stream_product`.
 
-        return []
+        Returns:
+            list: List of dictionaries, each containing seller info.
+        """
+        return [seller_info async for seller_info in self.stream_product()]
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """
+        Streams the sellers of the product as they are scraped. When the scraper
+        has a circuit breaker, the scrape is rejected while the circuit is open,
+        and its outcome is recorded once the stream ends: aborted scrapes and
+        scrapes whose every seller failed count as errors. Streams closed early
+        record no outcome.
+
+        Yields:
+            dict: The info of a seller.
+
+        Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
+        """
+        if self.circuit_breaker is None:
+            async for seller_info in self.stream_product():
+                yield seller_info
+            return
+
+        admission = self.circuit_breaker.acquire()
+        streamed = False
+        try:
+            async for seller_info in self.stream_product():
+                streamed = True
+                yield seller_info
+        except BaseException:
+            self.circuit_breaker.release(admission)
+            raise
+        failed = self.telemetry.error is not None or (
+            not streamed and bool(self.telemetry.failures)
+        )
+        self.circuit_breaker.record(
+            admission, success=not failed, timed_out=self.telemetry.timed_out
+        )
 
     async def execute(self) -> list:
         """
-        Executes the scraping process and returns the results.
+        Executes the scraping process and returns the results, as streamed by
+        `stream`.
 
         Returns:
             list: A list of scraped data.
+
+        Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
         """
-        return await self.scrap_product()
+        return [seller_info async for seller_info in self.stream()]
 
     async def close_http_client(self):
         """
-        Closes the HTTP client if it has been initialized.
+        Closes the HTTP client if it has been initialized and is not shared with
+        other collectors.
         """
-        if self.http_client:
+        if self.http_client and not HttpClientRegistry.is_shared(
+            self.http_client
+        ):
             await self.http_client.aclose()
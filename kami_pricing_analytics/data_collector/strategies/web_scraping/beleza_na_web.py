@@ -1,10 +1,26 @@
-import json
 from typing import Dict, List
 
+from pydantic import Field
 from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.common.by import By
 
 from .base_scraper import BaseScraper
+from .extraction import ExtractionSpec, ExtractorRegistry, FieldSpec
+
+BELEZA_NA_WEB_SELLERS_ROOT = 'a.js-add-to-cart'
+
+BELEZA_NA_WEB_SELLERS_DATA = 'a.js-add-to-cart[data-sku]'
+
+BELEZA_NA_WEB_SELLERS_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='beleza_na_web.sellers',
+        root_selector=BELEZA_NA_WEB_SELLERS_DATA,
+        fields={
+            'seller': FieldSpec(
+                source='data-sku', transforms=['json', 'first']
+            ),
+        },
+    )
+)
 
 
 class BelezaNaWebScraperException(Exception):
@@ -20,15 +36,32 @@ class BelezaNaWebScraper(BaseScraper):
     Scraper specifically designed for the 'Beleza Na Web' marketplace. It extracts seller
     information such as marketplace ID, brand, description, and pricing data from product pages.
 
+    The sellers data is server-rendered in the `data-sku` attribute of the add to
+    cart links, so it is read from a plain HTTP response and the WebDriver is only
+    used as a fallback.
+
+    Attributes:
+        http_extraction (bool): Whether to read the sellers list over HTTP before falling back to the WebDriver.
+
     Inherits from:
         BaseScraper (class): Abstract base class for scraping strategies.
     """
 
+    http_extraction: bool = Field(default=True)
+    webdriver_required: bool = Field(default=False)
+    probe_selectors: List[str] = Field(
+        default_factory=lambda: [BELEZA_NA_WEB_SELLERS_DATA]
+    )
+
     def __init__(self, **data):
         """
         Initializes the scraper with a specific logger for 'Beleza Na Web'.
         """
-        super().__init__(**data, logger_name='beleza-na-web-scraper')
+        super().__init__(
+            **data,
+            logger_name='beleza-na-web-scraper',
+            marketplace='beleza_na_web',
+        )
 
     async def get_marketplace_id(self, seller) -> str:
         """
@@ -159,9 +192,39 @@ class BelezaNaWebScraper(BaseScraper):
     async def get_seller_url(self) -> str:
         return ''
 
+    async def _get_sellers_list_from_http(self) -> List[Dict]:
+        """
+        Retrieves the sellers list from the server-rendered product page, without
+        a WebDriver.
+
+        Returns:
+            list: A list of dictionaries, each containing data about a seller.
+        """
+        content = await self.fetch_content()
+        rows = self.extract_html(BELEZA_NA_WEB_SELLERS_EXTRACTOR, content)
+        return [row['seller'] for row in rows if row['seller']]
+
+    async def _get_sellers_list_from_webdriver(self) -> List[Dict]:
+        """
+        Retrieves the sellers list from the product page rendered by a WebDriver,
+        setting one up if needed. The sellers data of all the add to cart links is
+        read with a single script execution.
+
+        Returns:
+            list: A list of dictionaries, each containing data about a seller.
+        """
+        if not self.webdriver:
+            await self.set_webdriver()
+        await self.load_page(str(self.product_url))
+        await self.wait_for(BELEZA_NA_WEB_SELLERS_ROOT)
+        rows = await self.extract(BELEZA_NA_WEB_SELLERS_EXTRACTOR)
+        return [row['seller'] for row in rows if row['seller']]
+
     async def get_sellers_list(self) -> List[Dict]:
         """
         Retrieves a list of sellers from the product page by scraping specific HTML elements.
+        The page is fetched over HTTP first and rendered by the WebDriver only when
+        that yields no sellers.
 
         Returns:
             list: A list of dictionaries, each containing data about a seller.
@@ -170,16 +233,19 @@ class BelezaNaWebScraper(BaseScraper):
             BelezaNaWebScraperException: If an error occurs while scraping the sellers list.
         """
         sellers = []
-        try:
-            self.webdriver.get(str(self.product_url))
-            id_sellers = self.webdriver.find_elements(
-                By.CSS_SELECTOR, 'a.js-add-to-cart'
-            )
-            for id_seller in id_sellers:
-                sellers_data = id_seller.get_attribute('data-sku')
-                row = json.loads(sellers_data)[0]
-                sellers.append(row)
+        if self.http_extraction:
+            try:
+                sellers = await self._get_sellers_list_from_http()
+            except Exception as e:
+                self.logger.warning(
+                    f'Error while getting sellers list over HTTP, falling back to webdriver: {e}'
+                )
+
+        if sellers:
             return sellers
+
+        try:
+            return await self._get_sellers_list_from_webdriver()
         except WebDriverException as wd_error:
             self.logger.error(
                 f'Webdriver Error while getting sellers list: {wd_error}'
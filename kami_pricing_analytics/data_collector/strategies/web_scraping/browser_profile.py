@@ -0,0 +1,162 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.webdriver import WebDriver
+
+from .constants import settings
+
+RESOURCE_URL_PATTERNS: Dict[str, List[str]] = {
+    'image': [
+        '*.png',
+        '*.jpg',
+        '*.jpeg',
+        '*.gif',
+        '*.webp',
+        '*.avif',
+        '*.svg',
+        '*.ico',
+    ],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheet': ['*.css'],
+    'media': ['*.mp4', '*.webm', '*.m3u8', '*.mp3'],
+    'tracker': [
+        '*doubleclick.net*',
+        '*googlesyndication.com*',
+        '*google-analytics.com*',
+        '*googletagmanager.com*',
+        '*facebook.net*',
+        '*hotjar.com*',
+        '*criteo.com*',
+        '*criteo.net*',
+        '*amazon-adsystem.com*',
+        '*clarity.ms*',
+    ],
+}
+
+CONTENT_SETTINGS_PREFERENCES: Dict[str, str] = {
+    'image': 'profile.managed_default_content_settings.images',
+    'media': 'profile.managed_default_content_settings.media_stream',
+}
+
+
+def _get_list(section: str, key: str, fallback: str = '') -> List[str]:
+    value = settings.get(section, key, fallback=fallback)
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class BrowserProfile(BaseModel):
+    """
+    Lightweight browsing profile applied to the WebDriver sessions of a
+    marketplace. Resource types are blocked through Chrome preferences where
+    Chrome supports it and through DevTools network blocking otherwise, so pages
+    load only what the scrapers read.
+
+    Attributes:
+        enabled (bool): Whether the profile is applied.
+        page_load_strategy (str): Selenium page load strategy, 'eager' returns once the DOM is ready.
+        blocked_resources (List[str]): Resource types to block, keys of RESOURCE_URL_PATTERNS.
+        allowed_resources (List[str]): Resource types the marketplace needs to render its price nodes, never blocked.
+        blocked_urls (List[str]): Extra URL patterns to block.
+        record_network (bool): Whether Chrome records network events, used to measure transferred bytes.
+    """
+
+    enabled: bool = Field(default=True)
+    page_load_strategy: str = Field(default='eager')
+    blocked_resources: List[str] = Field(default_factory=list)
+    allowed_resources: List[str] = Field(default_factory=list)
+    blocked_urls: List[str] = Field(default_factory=list)
+    record_network: bool = Field(default=False)
+
+    @classmethod
+    def for_marketplace(cls, marketplace: str) -> 'BrowserProfile':
+        """
+        Builds the profile of a marketplace from the [browser_profile] settings,
+        with the allowlist and extra patterns of its [browser_profile.<marketplace>]
+        section.
+
+        Args:
+            marketplace (str): The marketplace name.
+
+        Returns:
+            BrowserProfile: The marketplace profile.
+        """
+        section = f'browser_profile.{marketplace}'
+        return cls(
+            enabled=settings.getboolean(
+                'browser_profile', 'ENABLED', fallback=True
+            ),
+            page_load_strategy=settings.get(
+                'browser_profile', 'PAGE_LOAD_STRATEGY', fallback='eager'
+            ),
+            blocked_resources=_get_list(
+                'browser_profile',
+                'BLOCKED_RESOURCES',
+                fallback=','.join(RESOURCE_URL_PATTERNS),
+            ),
+            allowed_resources=_get_list(section, 'ALLOWED_RESOURCES'),
+            blocked_urls=_get_list('browser_profile', 'BLOCKED_URLS')
+            + _get_list(section, 'BLOCKED_URLS'),
+        )
+
+    @property
+    def active_blocked_resources(self) -> List[str]:
+        if not self.enabled:
+            return []
+        return [
+            resource
+            for resource in self.blocked_resources
+            if resource not in self.allowed_resources
+        ]
+
+    def get_blocked_url_patterns(self) -> List[str]:
+        """
+        Returns the URL patterns blocked through DevTools.
+
+        Returns:
+            List[str]: The patterns of the blocked resource types and the extra patterns.
+        """
+        if not self.enabled:
+            return []
+        patterns = []
+        for resource in self.active_blocked_resources:
+            patterns.extend(RESOURCE_URL_PATTERNS.get(resource, []))
+        return patterns + self.blocked_urls
+
+    def apply_to_options(self, options: Options):
+        """
+        Sets the page load strategy and the content preferences on the Chrome
+        options of a new session.
+
+        Args:
+            options (Options): The Chrome options.
+        """
+        if self.record_network:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        if not self.enabled:
+            return
+
+        options.page_load_strategy = self.page_load_strategy
+        preferences = {
+            CONTENT_SETTINGS_PREFERENCES[resource]: 2
+            for resource in self.active_blocked_resources
+            if resource in CONTENT_SETTINGS_PREFERENCES
+        }
+        preferences['profile.default_content_setting_values.notifications'] = 2
+        options.add_experimental_option('prefs', preferences)
+        if 'image' in self.active_blocked_resources:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+
+    def apply_to_driver(self, driver: WebDriver):
+        """
+        Enables DevTools network blocking on the current tab of the session. Must
+        be called for every tab before it navigates.
+
+        Args:
+            driver (WebDriver): The WebDriver session.
+        """
+        patterns = self.get_blocked_url_patterns()
+        if not patterns:
+            return
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
@@ -0,0 +1,506 @@
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel, Field
+
+from .constants import (
+    SUPERVISOR_INTERVAL,
+    SUPERVISOR_MAX_PAGES,
+    SUPERVISOR_MAX_RSS,
+    SUPERVISOR_ORPHAN_GRACE,
+    SUPERVISOR_QUIT_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
+logger = logging.getLogger('browser-supervisor')
+
+PROC_PATH = '/proc'
+
+
+class ProcessInfo(BaseModel):
+    """
+    Snapshot of an operating system process, read from procfs.
+
+    Attributes:
+        pid (int): The process ID.
+        ppid (int): The parent process ID.
+        name (str): The executable name.
+        state (str): The process state, 'Z' for zombies.
+        rss (int): Resident memory in bytes.
+        age (float): Seconds since the process started.
+    """
+
+    pid: int
+    ppid: int
+    name: str
+    state: str
+    rss: int = Field(default=0)
+    age: float = Field(default=0.0)
+
+
+def read_processes() -> Dict[int, ProcessInfo]:
+    """
+    Reads every process visible in procfs.
+
+    Returns:
+        Dict[int, ProcessInfo]: Maps process IDs to their snapshots, empty when procfs is not available.
+    """
+    try:
+        with open(os.path.join(PROC_PATH, 'uptime')) as file:
+            uptime = float(file.read().split()[0])
+        pids = [entry for entry in os.listdir(PROC_PATH) if entry.isdigit()]
+    except OSError:
+        return {}
+
+    ticks = os.sysconf('SC_CLK_TCK')
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    processes = {}
+    for pid in pids:
+        try:
+            with open(os.path.join(PROC_PATH, pid, 'stat')) as file:
+                stat = file.read()
+            with open(os.path.join(PROC_PATH, pid, 'statm')) as file:
+                statm = file.read().split()
+        except OSError:
+            continue
+        fields = stat[stat.rindex(')') + 2 :].split()
+        processes[int(pid)] = ProcessInfo(
+            pid=int(pid),
+            ppid=int(fields[1]),
+            name=stat[stat.index('(') + 1 : stat.rindex(')')],
+            state=fields[0],
+            rss=int(statm[1]) * page_size,
+            age=max(0.0, uptime - int(fields[19]) / ticks),
+        )
+    return processes
+
+
+def get_descendants(
+    pid: int, processes: Dict[int, ProcessInfo]
+) -> List[ProcessInfo]:
+    """
+    Returns the descendants of a process, deepest first.
+
+    Args:
+        pid (int): The root process ID.
+        processes (Dict[int, ProcessInfo]): The processes to search.
+
+    Returns:
+        List[ProcessInfo]: The descendants of the process.
+    """
+    children = {}
+    for process in processes.values():
+        children.setdefault(process.ppid, []).append(process)
+    descendants, stack = [], list(children.get(pid, []))
+    while stack:
+        process = stack.pop()
+        descendants.append(process)
+        stack.extend(children.get(process.pid, []))
+    return descendants[::-1]
+
+
+class BrowserProcessStats(BaseModel):
+    """
+    Snapshot of a supervised browser.
+
+    Attributes:
+        marketplace (str): The marketplace the browser was started for.
+        pid (int): Process ID of the chromedriver.
+        processes (int): Live processes of the browser, chromedriver included.
+        rss (int): Resident memory of the browser processes, in bytes.
+        pages (int): Pages loaded by the browser.
+        age (float): Seconds since the browser was started.
+        healthy (bool): Whether the browser is within the memory and page limits.
+    """
+
+    marketplace: str
+    pid: int
+    processes: int = Field(default=0)
+    rss: int = Field(default=0)
+    pages: int = Field(default=0)
+    age: float = Field(default=0.0)
+    healthy: bool = Field(default=True)
+
+
+class BrowserSupervisorStats(BaseModel):
+    """
+    Snapshot of the BrowserSupervisor.
+
+    Attributes:
+        supported (bool): Whether processes can be inspected, which requires procfs.
+        browsers (List[BrowserProcessStats]): The supervised browsers.
+        processes (int): Live processes of the supervised browsers.
+        rss (int): Resident memory of the supervised browsers, in bytes.
+        killed (int): Browsers killed for exceeding their limits.
+        orphans_reaped (int): Orphaned browser processes killed or reaped.
+    """
+
+    supported: bool
+    browsers: List[BrowserProcessStats] = Field(default_factory=list)
+    processes: int = Field(default=0)
+    rss: int = Field(default=0)
+    killed: int = Field(default=0)
+    orphans_reaped: int = Field(default=0)
+
+
+class SupervisedBrowser:
+    """
+    A browser started by a scraper, identified by the process ID of its
+    chromedriver; Chrome and its helpers are the chromedriver descendants.
+
+    Attributes:
+        pid (int): Process ID of the chromedriver.
+        marketplace (str): The marketplace the browser was started for.
+        driver (weakref.ref): Weak reference to the WebDriver, dead once the WebDriver was collected.
+        pages (int): Pages loaded by the browser.
+        started_at (float): Monotonic timestamp of the browser start.
+    """
+
+    def __init__(self, pid: int, marketplace: str, driver: 'WebDriver'):
+        self.pid = pid
+        self.marketplace = marketplace
+        self.driver = weakref.ref(driver)
+        self.pages = 0
+        self.started_at = time.monotonic()
+
+
+class BrowserSupervisor:
+    """
+    Process-wide supervisor of the browsers started by the scrapers. Every
+    WebDriver is tracked by its chromedriver process; a browser is unhealthy
+    once its processes use more than `max_rss` bytes or it loaded more than
+    `max_pages` pages. The driver pools replace unhealthy browsers when they
+    are leased or released, and every sweep kills browsers over the memory
+    limit, which the scrapers using them see as a WebDriver error.
+
+    Sweeps also reap orphans: browsers whose WebDriver was collected without
+    being quit, such as after a scraper crashed before releasing it, and
+    Chrome processes of this process tree that belong to no tracked browser
+    once `orphan_grace` seconds old.
+
+    Processes are read from procfs; where it is not available the supervisor
+    tracks nothing and reports itself unsupported. WebDrivers whose browser was
+    killed or found dead by a sweep are remembered as retired, so they are not
+    deemed healthy once they stop being supervised.
+
+    Attributes:
+        browsers (Dict[int, SupervisedBrowser]): Maps chromedriver process IDs to their browsers.
+        max_rss (int): Resident memory in bytes allowed per browser.
+        max_pages (int): Pages a browser loads before being replaced.
+        orphan_grace (float): Seconds an untracked Chrome process lives before being reaped.
+        process_names (Tuple[str, ...]): Substrings of the process names treated as browser processes.
+    """
+
+    browsers: Dict[int, SupervisedBrowser] = {}
+    max_rss: int = SUPERVISOR_MAX_RSS
+    max_pages: int = SUPERVISOR_MAX_PAGES
+    orphan_grace: float = SUPERVISOR_ORPHAN_GRACE
+    process_names: Tuple[str, ...] = ('chrome', 'chromium', 'headless_shell')
+    _lock = threading.Lock()
+    _retired: 'weakref.WeakSet[WebDriver]' = weakref.WeakSet()
+    _task: Optional[asyncio.Task] = None
+    _killed = 0
+    _orphans_reaped = 0
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether processes can be inspected, which requires procfs."""
+        return os.path.isdir(PROC_PATH)
+
+    @staticmethod
+    def _get_pid(driver: 'WebDriver') -> Optional[int]:
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        return getattr(process, 'pid', None)
+
+    @classmethod
+    def _find(cls, driver: 'WebDriver') -> Optional[SupervisedBrowser]:
+        pid = cls._get_pid(driver)
+        return cls.browsers.get(pid) if pid is not None else None
+
+    @classmethod
+    def track(cls, driver: 'WebDriver', marketplace: str = ''):
+        """
+        Starts supervising the browser of a WebDriver.
+
+        Args:
+            driver (WebDriver): The WebDriver just started.
+            marketplace (str): The marketplace the browser was started for.
+        """
+        pid = cls._get_pid(driver)
+        if pid is None or not cls.is_supported():
+            return
+        with cls._lock:
+            cls.browsers[pid] = SupervisedBrowser(pid, marketplace, driver)
+
+    @classmethod
+    def record_page(cls, driver: 'WebDriver'):
+        """
+        Accounts a page loaded by the browser of a WebDriver.
+
+        Args:
+            driver (WebDriver): The WebDriver that loaded the page.
+        """
+        with cls._lock:
+            browser = cls._find(driver)
+            if browser is not None:
+                browser.pages += 1
+
+    @classmethod
+    def _measure(
+        cls, browser: SupervisedBrowser, processes: Dict[int, ProcessInfo]
+    ) -> List[ProcessInfo]:
+        root = processes.get(browser.pid)
+        if root is None or root.state == 'Z':
+            return []
+        return get_descendants(browser.pid, processes) + [root]
+
+    @classmethod
+    def _is_healthy(
+        cls, browser: SupervisedBrowser, tree: List[ProcessInfo]
+    ) -> bool:
+        return (
+            bool(tree)
+            and sum(process.rss for process in tree) <= cls.max_rss
+            and browser.pages <= cls.max_pages
+        )
+
+    @classmethod
+    def is_healthy(cls, driver: 'WebDriver') -> bool:
+        """
+        Tells whether the browser of a WebDriver is alive and within the memory
+        and page limits. Browsers that are not supervised are deemed healthy,
+        unless a sweep killed them or found them dead.
+
+        Args:
+            driver (WebDriver): The WebDriver to check.
+
+        Returns:
+            bool: False if the browser should be replaced.
+        """
+        with cls._lock:
+            browser = cls._find(driver)
+            if browser is None:
+                return driver not in cls._retired
+        return cls._is_healthy(
+            browser, cls._measure(browser, read_processes())
+        )
+
+    @staticmethod
+    def _kill(pids: List[int]) -> int:
+        killed = 0
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+                killed += 1
+            except (ProcessLookupError, PermissionError):
+                pass
+        return killed
+
+    @staticmethod
+    def _reap_zombies(processes: Dict[int, ProcessInfo]) -> int:
+        reaped = 0
+        for process in processes.values():
+            if process.state != 'Z' or process.ppid != os.getpid():
+                continue
+            try:
+                if os.waitpid(process.pid, os.WNOHANG)[0]:
+                    reaped += 1
+            except ChildProcessError:
+                pass
+        return reaped
+
+    @classmethod
+    def terminate(cls, driver: 'WebDriver'):
+        """
+        Stops supervising the browser of a WebDriver and kills whatever is left
+        of its processes, such as after `quit` failed or hung.
+
+        Args:
+            driver (WebDriver): The WebDriver that was quit.
+        """
+        with cls._lock:
+            browser = cls._find(driver)
+            if browser is None:
+                return
+            cls.browsers.pop(browser.pid, None)
+        tree = cls._measure(browser, read_processes())
+        cls._kill([process.pid for process in tree])
+
+    @classmethod
+    async def quit(cls, driver: 'WebDriver', run: Callable[..., Awaitable]):
+        """
+        Quits a WebDriver, giving it `SUPERVISOR_QUIT_TIMEOUT` seconds, and
+        terminates whatever is left of its browser, so a hung chromedriver
+        cannot leave Chrome processes behind.
+
+        Args:
+            driver (WebDriver): The WebDriver to quit.
+            run (Callable[..., Awaitable]): Runs a blocking callable on the worker thread of the WebDriver.
+        """
+        try:
+            await asyncio.wait_for(run(driver.quit), SUPERVISOR_QUIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error(
+                f'Webdriver did not quit in {SUPERVISOR_QUIT_TIMEOUT}s, killing it'
+            )
+        except Exception as e:
+            logger.error(f'Error while quitting webdriver: {e}')
+        finally:
+            await asyncio.to_thread(cls.terminate, driver)
+
+    @classmethod
+    def sweep(cls) -> BrowserSupervisorStats:
+        """
+        Kills the browsers over the memory limit and the orphaned browsers, and
+        reaps the zombie processes left by them.
+
+        Returns:
+            BrowserSupervisorStats: The supervisor statistics after the sweep.
+        """
+        processes = read_processes()
+        if not processes:
+            return cls.stats()
+
+        killed, orphans = 0, 0
+        with cls._lock:
+            browsers = list(cls.browsers.values())
+        tracked = set()
+        for browser in browsers:
+            tree = cls._measure(browser, processes)
+            tracked.update(process.pid for process in tree)
+            orphaned = browser.driver() is None
+            over_memory = sum(process.rss for process in tree) > cls.max_rss
+            if tree and not (orphaned or over_memory):
+                continue
+            with cls._lock:
+                cls.browsers.pop(browser.pid, None)
+                driver = browser.driver()
+                if driver is not None:
+                    cls._retired.add(driver)
+            if not tree:
+                continue
+            pids = [process.pid for process in tree]
+            if orphaned:
+                logger.warning(
+                    f'Reaping {browser.marketplace} browser {browser.pid} left without a WebDriver'
+                )
+                orphans += cls._kill(pids)
+            else:
+                logger.warning(
+                    f'Killing {browser.marketplace} browser {browser.pid} over the memory limit'
+                )
+                cls._kill(pids)
+                killed += 1
+
+        untracked = [
+            process.pid
+            for process in get_descendants(os.getpid(), processes)
+            if process.pid not in tracked
+            and process.state != 'Z'
+            and process.age >= cls.orphan_grace
+            and any(name in process.name for name in cls.process_names)
+        ]
+        if untracked:
+            logger.warning(f'Reaping orphaned browser processes {untracked}')
+        orphans += cls._kill(untracked)
+        orphans += cls._reap_zombies(processes)
+
+        with cls._lock:
+            cls._killed += killed
+            cls._orphans_reaped += orphans
+        return cls.stats()
+
+    @classmethod
+    async def _run(cls, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(cls.sweep)
+            except Exception as e:
+                logger.error(f'Error while sweeping browsers: {e}')
+
+    @classmethod
+    def start(cls, interval: float = SUPERVISOR_INTERVAL):
+        """
+        Starts sweeping the browsers every `interval` seconds on the running
+        event loop.
+
+        Args:
+            interval (float): Seconds between sweeps.
+        """
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._run(interval))
+
+    @classmethod
+    async def stop(cls):
+        """
+        Stops the periodic sweeps.
+        """
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @classmethod
+    def stats(cls) -> BrowserSupervisorStats:
+        """
+        Returns the memory and process counts of the supervised browsers.
+
+        Returns:
+            BrowserSupervisorStats: The supervisor statistics.
+        """
+        processes = read_processes()
+        now = time.monotonic()
+        with cls._lock:
+            browsers = list(cls.browsers.values())
+            killed, orphans_reaped = cls._killed, cls._orphans_reaped
+
+        browser_stats = []
+        for browser in browsers:
+            tree = cls._measure(browser, processes)
+            browser_stats.append(
+                BrowserProcessStats(
+                    marketplace=browser.marketplace,
+                    pid=browser.pid,
+                    processes=len(tree),
+                    rss=sum(process.rss for process in tree),
+                    pages=browser.pages,
+                    age=now - browser.started_at,
+                    healthy=cls._is_healthy(browser, tree),
+                )
+            )
+        return BrowserSupervisorStats(
+            supported=cls.is_supported(),
+            browsers=browser_stats,
+            processes=sum(stats.processes for stats in browser_stats),
+            rss=sum(stats.rss for stats in browser_stats),
+            killed=killed,
+            orphans_reaped=orphans_reaped,
+        )
+
+    @classmethod
+    def clear(cls):
+        """
+        Stops supervising every browser and resets the counters.
+        """
+        with cls._lock:
+            cls.browsers.clear()
+            cls._retired.clear()
+            cls._killed = 0
+            cls._orphans_reaped = 0
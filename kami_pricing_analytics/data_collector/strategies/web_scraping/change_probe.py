@@ -0,0 +1,95 @@
+import hashlib
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+from pydantic import BaseModel, Field
+
+
+class ProbeResult(BaseModel):
+    """
+    Outcome of a change probe, compared to the snapshot of the last research.
+
+    Attributes:
+        changed (bool): Whether the product may have changed and needs a full scrape. Probes that cannot tell are reported as changed.
+        not_modified (bool): Whether the server answered the conditional request with 304 Not Modified.
+        etag (Optional[str]): ETag of the product page.
+        last_modified (Optional[str]): Last-Modified date of the product page.
+        fingerprint (Optional[str]): SHA-256 of the price fragment of the product page.
+    """
+
+    changed: bool = Field(default=True)
+    not_modified: bool = Field(default=False)
+    etag: Optional[str] = Field(default=None)
+    last_modified: Optional[str] = Field(default=None)
+    fingerprint: Optional[str] = Field(default=None)
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the validators and fingerprint to compare the next probe with.
+
+        Returns:
+            Dict: The probe snapshot stored with the research.
+        """
+        return self.model_dump(
+            include={'etag', 'last_modified', 'fingerprint'}
+        )
+
+
+def build_conditional_headers(snapshot: Dict) -> Dict[str, str]:
+    """
+    Builds the conditional request headers of a probe snapshot.
+
+    Args:
+        snapshot (Dict): The snapshot of the last probe.
+
+    Returns:
+        Dict[str, str]: The If-None-Match and If-Modified-Since headers available.
+
+    Examples:
+        >>> build_conditional_headers({'etag': '"abc"', 'last_modified': None})
+        {'If-None-Match': '"abc"'}
+    """
+    headers = {}
+    if snapshot.get('etag'):
+        headers['If-None-Match'] = snapshot['etag']
+    if snapshot.get('last_modified'):
+        headers['If-Modified-Since'] = snapshot['last_modified']
+    return headers
+
+
+def fingerprint_html(content: str, selectors: List[str]) -> Optional[str]:
+    """
+    Hashes the text and the `data-*` attributes of the elements matching the
+    CSS selectors, in document order, so changes elsewhere in the page do not
+    change the fingerprint.
+
+    Args:
+        content (str): The page HTML.
+        selectors (List[str]): CSS selectors of the price fragment.
+
+    Returns:
+        Optional[str]: The SHA-256 of the fragment, or None if no selector matched.
+
+    Examples:
+        >>> page = '<div><span class="price">R$ 10</span><p>ad</p></div>'
+        >>> fingerprint_html(page, ['span.price']) == fingerprint_html(
+        ...     page.replace('ad', 'other ad'), ['span.price']
+        ... )
+        True
+        >>> fingerprint_html(page, ['span.missing']) is None
+        True
+    """
+    if not content or not selectors:
+        return None
+    soup = BeautifulSoup(content, 'lxml')
+    digest = hashlib.sha256()
+    matched = False
+    for selector in selectors:
+        for element in soup.select(selector):
+            matched = True
+            digest.update(selector.encode())
+            digest.update(' '.join(element.get_text(' ').split()).encode())
+            for attribute in sorted(element.attrs):
+                if attribute.startswith('data-'):
+                    digest.update(str(element[attribute]).encode())
+    return digest.hexdigest() if matched else None
@@ -0,0 +1,341 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .constants import (
+    CIRCUIT_ERROR_RATE,
+    CIRCUIT_HALF_OPEN_CALLS,
+    CIRCUIT_MIN_CALLS,
+    CIRCUIT_OPEN_DURATION,
+    CIRCUIT_TIMEOUT_RATE,
+    CIRCUIT_WINDOW,
+)
+
+
+class CircuitState(str, Enum):
+    """
+    Enumeration of the circuit breaker states.
+
+    Attributes:
+        CLOSED (str): Calls go through and their outcomes are tracked.
+        OPEN (str): Calls are rejected until the open duration elapses.
+        HALF_OPEN (str): A limited number of trial calls decide whether the circuit closes again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitOpenException(Exception):
+    """
+    Raised when a call is rejected by an open circuit.
+
+    Attributes:
+        marketplace (str): The marketplace of the circuit.
+        retry_after (float): Seconds until the circuit lets a trial call through.
+    """
+
+    def __init__(self, marketplace: str, retry_after: float):
+        self.marketplace = marketplace
+        self.retry_after = retry_after
+        super().__init__(
+            f'Circuit of {marketplace} is open, retry in {retry_after:.0f}s'
+        )
+
+
+class CircuitAdmission:
+    """
+    Admission of a call let through by a CircuitBreaker, handed back to the
+    breaker with the outcome of the call.
+
+    Attributes:
+        trial_round (Optional[int]): The half-open round the call is a trial of, None for a call let through a closed circuit.
+    """
+
+    def __init__(self, trial_round: Optional[int] = None):
+        self.trial_round = trial_round
+
+    @property
+    def trial(self) -> bool:
+        """Whether the call is a trial call of a half-open circuit."""
+        return self.trial_round is not None
+
+
+class CircuitBreakerStats(BaseModel):
+    """
+    Snapshot of a CircuitBreaker state.
+
+    Attributes:
+        marketplace (str): The marketplace guarded by the circuit.
+        state (CircuitState): The current state.
+        calls (int): Calls tracked in the rolling window.
+        errors (int): Failed calls in the rolling window, timeouts included.
+        timeouts (int): Calls that timed out in the rolling window.
+        error_rate (float): Ratio of failed calls in the rolling window.
+        timeout_rate (float): Ratio of timed out calls in the rolling window.
+        rejected (int): Total calls rejected while the circuit was open.
+        opened (int): Number of times the circuit opened.
+        retry_after (float): Seconds until an open circuit lets a trial call through, 0 otherwise.
+    """
+
+    marketplace: str
+    state: CircuitState
+    calls: int = Field(default=0)
+    errors: int = Field(default=0)
+    timeouts: int = Field(default=0)
+    error_rate: float = Field(default=0.0)
+    timeout_rate: float = Field(default=0.0)
+    rejected: int = Field(default=0)
+    opened: int = Field(default=0)
+    retry_after: float = Field(default=0.0)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding the collectors of a marketplace. Call outcomes are
+    kept for `window` seconds; once at least `min_calls` were tracked, the
+    circuit opens when the error rate reaches `error_rate` or the timeout rate
+    reaches `timeout_rate`. An open circuit rejects calls for `open_duration`
+    seconds, then turns half-open and lets `half_open_calls` trial calls through:
+    the circuit closes when all of them succeed and opens again on the first
+    failure. Only the trial calls of the current half-open round decide it:
+    calls let through before the circuit opened, or trials of an earlier round,
+    finishing later are ignored.
+
+    The state is guarded by a thread lock, so the same breaker can be shared by
+    collectors running on different event loops.
+
+    Attributes:
+        marketplace (str): The marketplace guarded by the circuit.
+        window (float): Seconds the call outcomes are tracked for.
+        min_calls (int): Calls tracked before the rates can open the circuit.
+        error_rate (float): Ratio of failed calls that opens the circuit.
+        timeout_rate (float): Ratio of timed out calls that opens the circuit.
+        open_duration (float): Seconds an open circuit rejects calls.
+        half_open_calls (int): Trial calls that must succeed to close the circuit.
+    """
+
+    def __init__(
+        self,
+        marketplace: str,
+        window: float = CIRCUIT_WINDOW,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        error_rate: float = CIRCUIT_ERROR_RATE,
+        timeout_rate: float = CIRCUIT_TIMEOUT_RATE,
+        open_duration: float = CIRCUIT_OPEN_DURATION,
+        half_open_calls: int = CIRCUIT_HALF_OPEN_CALLS,
+    ):
+        self.marketplace = marketplace
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes = deque()
+        self._opened_at = 0.0
+        self._round = 0
+        self._trials = 0
+        self._trial_successes = 0
+        self._rejected = 0
+        self._opened = 0
+
+    def _evict(self, now: float):
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            self._outcomes.popleft()
+
+    def _open(self, now: float):
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._opened += 1
+
+    def _retry_after(self, now: float) -> float:
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_duration - now)
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, turning half-open once the open duration elapsed."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and not self._retry_after(
+                time.monotonic()
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def acquire(self) -> CircuitAdmission:
+        """
+        Lets a call through, or rejects it when the circuit is open or the
+        half-open trial calls are all in flight.
+
+        Raises:
+            CircuitOpenException: If the call is rejected.
+
+        Returns:
+            CircuitAdmission: The admission of the call, to hand back to `record` or `release`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == CircuitState.OPEN:
+                retry_after = self._retry_after(now)
+                if retry_after:
+                    self._rejected += 1
+                    raise CircuitOpenException(self.marketplace, retry_after)
+                self._state = CircuitState.HALF_OPEN
+                self._round += 1
+                self._trials = 0
+                self._trial_successes = 0
+            if self._state == CircuitState.HALF_OPEN:
+                if self._trials >= self.half_open_calls:
+                    self._rejected += 1
+                    raise CircuitOpenException(self.marketplace, 0.0)
+                self._trials += 1
+                return CircuitAdmission(trial_round=self._round)
+            return CircuitAdmission()
+
+    def _is_current_trial(self, admission: CircuitAdmission) -> bool:
+        return (
+            self._state == CircuitState.HALF_OPEN
+            and admission.trial_round == self._round
+        )
+
+    def release(self, admission: CircuitAdmission):
+        """
+        Gives back a call let through without an outcome, such as a cancelled
+        call, so a half-open circuit can let another trial call through.
+
+        Args:
+            admission (CircuitAdmission): The admission returned by `acquire`.
+        """
+        with self._lock:
+            if self._is_current_trial(admission) and self._trials:
+                self._trials -= 1
+
+    def record(
+        self,
+        admission: CircuitAdmission,
+        success: bool,
+        timed_out: bool = False,
+    ):
+        """
+        Records the outcome of a call let through by `acquire`.
+
+        Args:
+            admission (CircuitAdmission): The admission returned by `acquire`.
+            success (bool): Whether the call succeeded.
+            timed_out (bool): Whether the call failed on a timeout.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if admission.trial:
+                if not self._is_current_trial(admission):
+                    return
+                if not success:
+                    self._open(now)
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                return
+            if self._state != CircuitState.CLOSED:
+                return
+
+            self._outcomes.append((now, success, timed_out and not success))
+            self._evict(now)
+            calls, errors, timeouts = self._count()
+            if calls >= self.min_calls and (
+                errors / calls >= self.error_rate
+                or timeouts / calls >= self.timeout_rate
+            ):
+                self._open(now)
+
+    def _count(self) -> tuple:
+        calls = len(self._outcomes)
+        errors = sum(1 for _, success, _ in self._outcomes if not success)
+        timeouts = sum(1 for _, _, timed_out in self._outcomes if timed_out)
+        return calls, errors, timeouts
+
+    def stats(self) -> CircuitBreakerStats:
+        """
+        Returns a snapshot of the circuit state.
+
+        Returns:
+            CircuitBreakerStats: The circuit statistics.
+        """
+        state = self.state
+        with self._lock:
+            now = time.monotonic()
+            self._evict(now)
+            calls, errors, timeouts = self._count()
+            return CircuitBreakerStats(
+                marketplace=self.marketplace,
+                state=state,
+                calls=calls,
+                errors=errors,
+                timeouts=timeouts,
+                error_rate=errors / calls if calls else 0.0,
+                timeout_rate=timeouts / calls if calls else 0.0,
+                rejected=self._rejected,
+                opened=self._opened,
+                retry_after=self._retry_after(now),
+            )
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide registry of circuit breakers, one per marketplace, so a
+    marketplace that is blocking the collectors stops taking browser capacity
+    from the others.
+
+    Attributes:
+        breakers (Dict[str, CircuitBreaker]): Maps marketplaces to their breakers.
+    """
+
+    breakers: Dict[str, CircuitBreaker] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_breaker(cls, marketplace: str) -> CircuitBreaker:
+        """
+        Returns the breaker of a marketplace, creating it on first use.
+
+        Args:
+            marketplace (str): The marketplace name.
+
+        Returns:
+            CircuitBreaker: The marketplace breaker.
+        """
+        with cls._lock:
+            breaker = cls.breakers.get(marketplace)
+            if breaker is None:
+                breaker = CircuitBreaker(marketplace)
+                cls.breakers[marketplace] = breaker
+            return breaker
+
+    @classmethod
+    def stats(cls) -> List[CircuitBreakerStats]:
+        """
+        Returns the statistics of every registered breaker.
+
+        Returns:
+            List[CircuitBreakerStats]: One snapshot per marketplace.
+        """
+        return [breaker.stats() for breaker in list(cls.breakers.values())]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every registered breaker.
+        """
+        with cls._lock:
+            cls.breakers.clear()
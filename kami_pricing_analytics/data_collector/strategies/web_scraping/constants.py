@@ -1,3 +1,10 @@
+import configparser
+import os
+
+settings_path = os.path.join('config', 'settings.cfg')
+settings = configparser.ConfigParser()
+settings.read(settings_path)
+
 DEFAULT_CRAWL_DELAY = 0
 DEFAULT_USER_AGENT = 'Mozilla/5.0'
 USER_AGENTS = [
@@ -7,3 +14,204 @@ USER_AGENTS = [
     'Mozilla/5.0 (iPad; CPU OS 13_2_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.0.3 Mobile/15E148 Safari/604.1',
     'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:88.0) Gecko/20100101 Firefox/88.0',
 ]
+
+DRIVER_POOL_ENABLED = settings.getboolean(
+    'webdriver', 'POOL_ENABLED', fallback=True
+)
+DRIVER_POOL_SIZE = settings.getint('webdriver', 'POOL_SIZE', fallback=2)
+DRIVER_POOL_MAX_PAGES = settings.getint('webdriver', 'MAX_PAGES', fallback=50)
+DRIVER_POOL_ACQUIRE_TIMEOUT = settings.getint(
+    'webdriver', 'ACQUIRE_TIMEOUT', fallback=60
+)
+
+PAGES_CONCURRENCY = settings.getint(
+    'scraping', 'PAGES_CONCURRENCY', fallback=4
+)
+PAGE_LOAD_TIMEOUT = settings.getint(
+    'scraping', 'PAGE_LOAD_TIMEOUT', fallback=30
+)
+
+BATCH_SESSIONS = settings.getint('batch', 'SESSIONS', fallback=1)
+
+MLB_MAX_SEARCH_PAGES = settings.getint(
+    'mercado_livre', 'MAX_SEARCH_PAGES', fallback=10
+)
+MLB_SEARCH_TIME_BUDGET = settings.getint(
+    'mercado_livre', 'SEARCH_TIME_BUDGET', fallback=60
+)
+
+TITLE_MATCH_THRESHOLD = settings.getfloat(
+    'title_matching', 'THRESHOLD', fallback=0.75
+)
+
+HTTP_MAX_CONNECTIONS = settings.getint(
+    'http_client', 'MAX_CONNECTIONS', fallback=10
+)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = settings.getint(
+    'http_client', 'MAX_KEEPALIVE_CONNECTIONS', fallback=5
+)
+HTTP_KEEPALIVE_EXPIRY = settings.getfloat(
+    'http_client', 'KEEPALIVE_EXPIRY', fallback=30
+)
+HTTP_CONNECT_TIMEOUT = settings.getfloat(
+    'http_client', 'CONNECT_TIMEOUT', fallback=5
+)
+HTTP_READ_TIMEOUT = settings.getfloat(
+    'http_client', 'READ_TIMEOUT', fallback=20
+)
+HTTP_POOL_TIMEOUT = settings.getfloat(
+    'http_client', 'POOL_TIMEOUT', fallback=10
+)
+HTTP_HTTP2 = settings.getboolean('http_client', 'HTTP2', fallback=False)
+
+ROBOTS_CACHE_TTL = settings.getfloat('robots', 'CACHE_TTL', fallback=3600)
+ROBOTS_ERROR_TTL = settings.getfloat('robots', 'ERROR_TTL', fallback=300)
+ROBOTS_WARM_UP_URLS = [
+    url.strip()
+    for url in settings.get('robots', 'WARM_UP_URLS', fallback='').split(',')
+    if url.strip()
+]
+
+RATE_LIMIT_ENABLED = settings.getboolean(
+    'rate_limit', 'ENABLED', fallback=True
+)
+RATE_LIMIT_DEFAULT_RATE = settings.getfloat(
+    'rate_limit', 'DEFAULT_RATE', fallback=2
+)
+RATE_LIMIT_BURST = settings.getfloat('rate_limit', 'BURST', fallback=4)
+
+WAIT_DEFAULT_TIMEOUT = settings.getfloat(
+    'adaptive_wait', 'DEFAULT_TIMEOUT', fallback=10
+)
+WAIT_MIN_TIMEOUT = settings.getfloat(
+    'adaptive_wait', 'MIN_TIMEOUT', fallback=2
+)
+WAIT_MAX_TIMEOUT = settings.getfloat(
+    'adaptive_wait', 'MAX_TIMEOUT', fallback=PAGE_LOAD_TIMEOUT
+)
+WAIT_PERCENTILE = settings.getfloat('adaptive_wait', 'PERCENTILE', fallback=95)
+WAIT_MARGIN = settings.getfloat('adaptive_wait', 'MARGIN', fallback=1.5)
+WAIT_WINDOW = settings.getint('adaptive_wait', 'WINDOW', fallback=50)
+WAIT_MIN_SAMPLES = settings.getint('adaptive_wait', 'MIN_SAMPLES', fallback=5)
+WAIT_POLL_INTERVAL = settings.getfloat(
+    'adaptive_wait', 'POLL_INTERVAL', fallback=0.05
+)
+WAIT_MAX_POLL_INTERVAL = settings.getfloat(
+    'adaptive_wait', 'MAX_POLL_INTERVAL', fallback=1
+)
+
+ARCHIVE_ENABLED = settings.getboolean(
+    'page_archive', 'ENABLED', fallback=False
+)
+ARCHIVE_PATH = settings.get(
+    'page_archive', 'PATH', fallback=os.path.join('data', 'page_archive')
+)
+ARCHIVE_SEGMENT_SIZE = settings.getint(
+    'page_archive', 'SEGMENT_SIZE', fallback=64 * 1024 * 1024
+)
+ARCHIVE_MAX_AGE = settings.getfloat(
+    'page_archive', 'MAX_AGE', fallback=30 * 24 * 3600
+)
+ARCHIVE_MAX_BYTES = settings.getint(
+    'page_archive', 'MAX_BYTES', fallback=2 * 1024 * 1024 * 1024
+)
+ARCHIVE_COMPACTION_RATIO = settings.getfloat(
+    'page_archive', 'COMPACTION_RATIO', fallback=0.5
+)
+ARCHIVE_COMPRESSION_LEVEL = settings.getint(
+    'page_archive', 'COMPRESSION_LEVEL', fallback=9
+)
+
+REPLAY_URL = settings.get('replay', 'URL', fallback='') or None
+
+UA_PROFILES_PATH = settings.get(
+    'user_agents',
+    'PROFILES_PATH',
+    fallback=os.path.join('config', 'user_agents'),
+)
+UA_MIN_SCORE = settings.getfloat('user_agents', 'MIN_SCORE', fallback=0.8)
+UA_SIMILARITY_THRESHOLD = settings.getfloat(
+    'user_agents', 'SIMILARITY_THRESHOLD', fallback=0.8
+)
+UA_MINHASH_PERMUTATIONS = settings.getint(
+    'user_agents', 'MINHASH_PERMUTATIONS', fallback=128
+)
+UA_LSH_BANDS = settings.getint('user_agents', 'LSH_BANDS', fallback=32)
+UA_SHINGLE_SIZE = settings.getint('user_agents', 'SHINGLE_SIZE', fallback=3)
+UA_FETCH_CONCURRENCY = settings.getint(
+    'user_agents', 'FETCH_CONCURRENCY', fallback=4
+)
+
+CIRCUIT_BREAKER_ENABLED = settings.getboolean(
+    'circuit_breaker', 'ENABLED', fallback=True
+)
+CIRCUIT_WINDOW = settings.getfloat('circuit_breaker', 'WINDOW', fallback=300)
+CIRCUIT_MIN_CALLS = settings.getint('circuit_breaker', 'MIN_CALLS', fallback=5)
+CIRCUIT_ERROR_RATE = settings.getfloat(
+    'circuit_breaker', 'ERROR_RATE', fallback=0.5
+)
+CIRCUIT_TIMEOUT_RATE = settings.getfloat(
+    'circuit_breaker', 'TIMEOUT_RATE', fallback=0.3
+)
+CIRCUIT_OPEN_DURATION = settings.getfloat(
+    'circuit_breaker', 'OPEN_DURATION', fallback=60
+)
+CIRCUIT_HALF_OPEN_CALLS = settings.getint(
+    'circuit_breaker', 'HALF_OPEN_CALLS', fallback=1
+)
+
+FETCH_MAX_ATTEMPTS = settings.getint(
+    'fetch_policy', 'MAX_ATTEMPTS', fallback=3
+)
+FETCH_ATTEMPT_TIMEOUT = settings.getfloat(
+    'fetch_policy', 'ATTEMPT_TIMEOUT', fallback=30
+)
+FETCH_BACKOFF_BASE = settings.getfloat(
+    'fetch_policy', 'BACKOFF_BASE', fallback=0.5
+)
+FETCH_BACKOFF_MAX = settings.getfloat(
+    'fetch_policy', 'BACKOFF_MAX', fallback=10
+)
+FETCH_RETRY_STATUSES = [
+    int(status)
+    for status in settings.get(
+        'fetch_policy', 'RETRY_STATUSES', fallback='429,500,502,503,504'
+    ).split(',')
+    if status.strip()
+]
+FETCH_RETRY_BUDGET = settings.getint(
+    'fetch_policy', 'RETRY_BUDGET', fallback=10
+)
+FETCH_HEDGE_ENABLED = settings.getboolean(
+    'fetch_policy', 'HEDGE_ENABLED', fallback=False
+)
+FETCH_HEDGE_PERCENTILE = settings.getfloat(
+    'fetch_policy', 'HEDGE_PERCENTILE', fallback=95
+)
+FETCH_HEDGE_MIN_SAMPLES = settings.getint(
+    'fetch_policy', 'HEDGE_MIN_SAMPLES', fallback=20
+)
+FETCH_LATENCY_WINDOW = settings.getint(
+    'fetch_policy', 'LATENCY_WINDOW', fallback=100
+)
+
+SUPERVISOR_ENABLED = settings.getboolean(
+    'browser_supervisor', 'ENABLED', fallback=True
+)
+SUPERVISOR_MAX_RSS = (
+    settings.getint('browser_supervisor', 'MAX_RSS_MB', fallback=1024)
+    * 1024
+    * 1024
+)
+SUPERVISOR_MAX_PAGES = settings.getint(
+    'browser_supervisor', 'MAX_PAGES', fallback=500
+)
+SUPERVISOR_INTERVAL = settings.getfloat(
+    'browser_supervisor', 'INTERVAL', fallback=30
+)
+SUPERVISOR_ORPHAN_GRACE = settings.getfloat(
+    'browser_supervisor', 'ORPHAN_GRACE', fallback=120
+)
+SUPERVISOR_QUIT_TIMEOUT = settings.getfloat(
+    'browser_supervisor', 'QUIT_TIMEOUT', fallback=10
+)
@@ -0,0 +1,438 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field, computed_field
+
+from .browser_supervisor import BrowserSupervisor
+from .constants import (
+    DRIVER_POOL_ACQUIRE_TIMEOUT,
+    DRIVER_POOL_MAX_PAGES,
+    DRIVER_POOL_SIZE,
+)
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
+logger = logging.getLogger('driver-pool')
+
+
+class DriverPoolException(Exception):
+    """
+    Custom exception class for DriverPool-related errors.
+    """
+
+    pass
+
+
+class PooledDriver:
+    """
+    A warm WebDriver session owned by a DriverPool and leased to scrapers.
+    Every interaction with the session runs on its dedicated worker thread, so
+    blocking WebDriver calls never run on the event loop.
+
+    Attributes:
+        driver (WebDriver): The underlying Selenium WebDriver.
+        pool (DriverPool): The pool that owns this session.
+        executor (ThreadPoolExecutor): Single-thread executor bound to the session.
+        pages_served (int): Number of pages loaded since the session was created.
+        leases (int): Number of times the session has been leased.
+        created_at (float): Monotonic timestamp of the session creation.
+    """
+
+    def __init__(
+        self,
+        driver: 'WebDriver',
+        pool: 'DriverPool',
+        executor: ThreadPoolExecutor,
+    ):
+        self.driver = driver
+        self.pool = pool
+        self.executor = executor
+        self.pages_served = 0
+        self.leases = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPoolStats(BaseModel):
+    """
+    Snapshot of a DriverPool usage.
+
+    Attributes:
+        marketplace (str): The marketplace served by the pool.
+        size (int): Number of live sessions, idle or leased.
+        idle (int): Number of sessions waiting for a lease.
+        leased (int): Number of sessions currently leased.
+        max_size (int): Maximum number of live sessions.
+        leases (int): Total number of leases granted.
+        hits (int): Leases served by an already warm session.
+        misses (int): Leases that required a new session.
+        recycled (int): Sessions discarded after an error or the page limit.
+        total_wait_time (float): Accumulated seconds spent waiting for leases.
+    """
+
+    marketplace: str
+    size: int = Field(default=0)
+    idle: int = Field(default=0)
+    leased: int = Field(default=0)
+    max_size: int = Field(default=0)
+    leases: int = Field(default=0)
+    hits: int = Field(default=0)
+    misses: int = Field(default=0)
+    recycled: int = Field(default=0)
+    total_wait_time: float = Field(default=0.0)
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of leases served by a warm session."""
+        return self.hits / self.leases if self.leases else 0.0
+
+    @computed_field
+    @property
+    def average_wait_time(self) -> float:
+        """Average seconds spent waiting for a lease."""
+        return self.total_wait_time / self.leases if self.leases else 0.0
+
+
+class DriverPool:
+    """
+    Keeps warm WebDriver sessions for a single marketplace and leases them to
+    scrapers. Sessions are reset between leases and recycled after an error or
+    once they have served `max_pages` pages.
+
+    The pool state is guarded by a thread lock and waiters are plain futures, so
+    the same pool can be shared by scrapers running on different event loops.
+    Scrapers pass their own factory on each `acquire`, so new sessions are built
+    with the settings of the scraper that needed them and the pool keeps no
+    reference to it.
+
+    Attributes:
+        marketplace (str): The marketplace served by the pool.
+        driver_factory (Optional[Callable[[], 'WebDriver']]): Blocking callable that builds a new session when `acquire` is not given one.
+        max_size (int): Maximum number of live sessions.
+        max_pages (int): Pages served by a session before it is recycled.
+        acquire_timeout (float): Seconds to wait for a free session.
+    """
+
+    def __init__(
+        self,
+        marketplace: str,
+        driver_factory: Optional[Callable[[], 'WebDriver']] = None,
+        max_size: int = DRIVER_POOL_SIZE,
+        max_pages: int = DRIVER_POOL_MAX_PAGES,
+        acquire_timeout: float = DRIVER_POOL_ACQUIRE_TIMEOUT,
+    ):
+        self.marketplace = marketplace
+        self.driver_factory = driver_factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._idle: deque = deque()
+        self._leased: set = set()
+        self._waiters: deque = deque()
+        self._size = 0
+        self._leases = 0
+        self._hits = 0
+        self._misses = 0
+        self._recycled = 0
+        self._total_wait_time = 0.0
+
+    async def _create(
+        self, driver_factory: Callable[[], 'WebDriver']
+    ) -> PooledDriver:
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f'webdriver-{self.marketplace}'
+        )
+        try:
+            driver = await loop.run_in_executor(executor, driver_factory)
+        except Exception:
+            executor.shutdown(wait=False)
+            raise
+        return PooledDriver(driver=driver, pool=self, executor=executor)
+
+    @staticmethod
+    def _reset(driver: 'WebDriver'):
+        """
+        Clears the session state left by the previous lease: extra tabs,
+        cookies and the current page.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception:
+            pass
+        driver.get('about:blank')
+
+    @staticmethod
+    async def _discard(pooled: PooledDriver):
+        loop = asyncio.get_running_loop()
+        await BrowserSupervisor.quit(
+            pooled.driver,
+            functools.partial(loop.run_in_executor, pooled.executor),
+        )
+        pooled.executor.shutdown(wait=False)
+
+    def _wake_next_waiter(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    break
+            else:
+                return
+
+        def _wake():
+            if not waiter.done():
+                waiter.set_result(None)
+
+        waiter.get_loop().call_soon_threadsafe(_wake)
+
+    async def acquire(
+        self, driver_factory: Optional[Callable[[], 'WebDriver']] = None
+    ) -> PooledDriver:
+        """
+        Leases a session, reusing an idle one when available, creating a new one
+        while the pool is below `max_size`, or waiting for a release otherwise.
+        Idle sessions deemed unhealthy by the BrowserSupervisor are replaced.
+
+        Args:
+            driver_factory (Optional[Callable[[], 'WebDriver']]): Blocking callable that builds the session if a new one is needed. Defaults to the pool `driver_factory`.
+
+        Returns:
+            PooledDriver: The leased session.
+
+        Raises:
+            DriverPoolException: If no session could be leased in time or created.
+        """
+        driver_factory = driver_factory or self.driver_factory
+        if driver_factory is None:
+            raise DriverPoolException(
+                f'No factory to create {self.marketplace} webdrivers'
+            )
+        loop = asyncio.get_running_loop()
+        started_at = time.monotonic()
+        deadline = started_at + self.acquire_timeout
+
+        while True:
+            waiter = None
+            create = False
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None and self._size < self.max_size:
+                    self._size += 1
+                    create = True
+                elif pooled is None:
+                    waiter = loop.create_future()
+                    self._waiters.append(waiter)
+
+            if pooled is not None:
+                if not await asyncio.to_thread(
+                    BrowserSupervisor.is_healthy, pooled.driver
+                ):
+                    await self._discard(pooled)
+                    with self._lock:
+                        self._size -= 1
+                        self._recycled += 1
+                    continue
+                with self._lock:
+                    self._hits += 1
+                break
+
+            if create:
+                try:
+                    pooled = await self._create(driver_factory)
+                except Exception as e:
+                    with self._lock:
+                        self._size -= 1
+                    self._wake_next_waiter()
+                    raise DriverPoolException(
+                        f'Error while creating {self.marketplace} webdriver: {e}'
+                    )
+                with self._lock:
+                    self._misses += 1
+                break
+
+            try:
+                await asyncio.wait_for(
+                    waiter, timeout=max(deadline - time.monotonic(), 0)
+                )
+            except asyncio.TimeoutError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                raise DriverPoolException(
+                    f'Timed out waiting for a {self.marketplace} webdriver'
+                )
+
+        with self._lock:
+            pooled.leases += 1
+            self._leases += 1
+            self._total_wait_time += time.monotonic() - started_at
+            self._leased.add(pooled)
+
+        return pooled
+
+    async def release(self, pooled: PooledDriver, failed: bool = False):
+        """
+        Returns a leased session to the pool. The session is reset for the next
+        lease, or discarded if it failed, reached `max_pages`, is deemed
+        unhealthy by the BrowserSupervisor or cannot be reset.
+
+        Args:
+            pooled (PooledDriver): The session to release.
+            failed (bool): Whether the lease ended with an error.
+        """
+        loop = asyncio.get_running_loop()
+        recycle = (
+            failed
+            or pooled.pages_served >= self.max_pages
+            or not await asyncio.to_thread(
+                BrowserSupervisor.is_healthy, pooled.driver
+            )
+        )
+
+        if not recycle:
+            try:
+                await loop.run_in_executor(
+                    pooled.executor, self._reset, pooled.driver
+                )
+            except Exception as e:
+                logger.error(f'Error while resetting webdriver: {e}')
+                recycle = True
+
+        if recycle:
+            await self._discard(pooled)
+
+        with self._lock:
+            self._leased.discard(pooled)
+            if recycle:
+                self._size -= 1
+                self._recycled += 1
+            else:
+                self._idle.append(pooled)
+
+        self._wake_next_waiter()
+
+    @asynccontextmanager
+    async def lease(self):
+        """
+        Context manager that leases a session and releases it on exit, marking it
+        as failed if the block raised.
+
+        Example:
+            async with pool.lease() as pooled:
+                pooled.driver.get(url)
+        """
+        pooled = await self.acquire()
+        try:
+            yield pooled
+        except Exception:
+            await self.release(pooled, failed=True)
+            raise
+        else:
+            await self.release(pooled)
+
+    async def close(self):
+        """
+        Quits every idle session. Leased sessions are quit when released.
+        """
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+        for pooled in idle:
+            await self._discard(pooled)
+
+    def stats(self) -> DriverPoolStats:
+        """
+        Returns a snapshot of the pool usage.
+
+        Returns:
+            DriverPoolStats: The pool statistics.
+        """
+        with self._lock:
+            return DriverPoolStats(
+                marketplace=self.marketplace,
+                size=self._size,
+                idle=len(self._idle),
+                leased=len(self._leased),
+                max_size=self.max_size,
+                leases=self._leases,
+                hits=self._hits,
+                misses=self._misses,
+                recycled=self._recycled,
+                total_wait_time=self._total_wait_time,
+            )
+
+
+class DriverPoolRegistry:
+    """
+    Process-wide registry of driver pools, one per marketplace.
+
+    Attributes:
+        pools (Dict[str, DriverPool]): Maps marketplace names to their pools.
+    """
+
+    pools: Dict[str, DriverPool] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_pool(
+        cls,
+        marketplace: str,
+        driver_factory: Optional[Callable[[], 'WebDriver']] = None,
+    ) -> DriverPool:
+        """
+        Returns the pool for the marketplace, creating it on first use.
+
+        Args:
+            marketplace (str): The marketplace name.
+            driver_factory (Optional[Callable[[], 'WebDriver']]): Blocking callable that builds a new session when `acquire` is not given one.
+
+        Returns:
+            DriverPool: The marketplace pool.
+        """
+        with cls._lock:
+            pool = cls.pools.get(marketplace)
+            if pool is None:
+                pool = DriverPool(
+                    marketplace=marketplace, driver_factory=driver_factory
+                )
+                cls.pools[marketplace] = pool
+        return pool
+
+    @classmethod
+    def stats(cls) -> List[DriverPoolStats]:
+        """
+        Returns the statistics of every registered pool.
+
+        Returns:
+            List[DriverPoolStats]: One snapshot per marketplace.
+        """
+        return [pool.stats() for pool in list(cls.pools.values())]
+
+    @classmethod
+    async def close_all(cls):
+        """
+        Closes and unregisters every pool.
+        """
+        with cls._lock:
+            pools = list(cls.pools.values())
+            cls.pools.clear()
+        for pool in pools:
+            await pool.close()
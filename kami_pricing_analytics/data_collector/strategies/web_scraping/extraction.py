@@ -0,0 +1,536 @@
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from cssselect import GenericTranslator
+from lxml import etree, html
+from pydantic import BaseModel, Field
+
+EXTRACTION_SCRIPT = """
+const [rootSelector, fields, measure] = arguments;
+const timings = {};
+
+function find(root, spec) {
+    if (!spec.selector) {
+        return root;
+    }
+    if (spec.by === 'xpath') {
+        return document.evaluate(
+            spec.selector, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return root.querySelector(spec.selector);
+}
+
+function read(element, source) {
+    if (!element) {
+        return null;
+    }
+    if (source === 'text') {
+        return (element.innerText || element.textContent || '').trim();
+    }
+    if (source === 'html') {
+        return element.innerHTML;
+    }
+    const value = element[source];
+    if (value !== undefined && value !== null && typeof value !== 'object') {
+        return value;
+    }
+    return element.getAttribute(source);
+}
+
+const roots = rootSelector
+    ? Array.from(document.querySelectorAll(rootSelector))
+    : [document];
+
+const rows = roots.map((root) => {
+    const row = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const startedAt = measure ? performance.now() : 0;
+        row[name] = read(find(root, spec), spec.source);
+        if (measure) {
+            timings[name] = (timings[name] || 0) + performance.now() - startedAt;
+        }
+    }
+    return row;
+});
+
+return measure ? {rows: rows, timings: timings} : rows;
+"""
+
+
+class ExtractionException(Exception):
+    """
+    Custom exception class for extraction-related errors.
+    """
+
+    pass
+
+
+def _squash(value: str) -> str:
+    return ' '.join(value.split())
+
+
+def _digits(value: str) -> str:
+    return re.sub(r'\D', '', value)
+
+
+def _first(value: Any) -> Any:
+    return value[0] if value else None
+
+
+TRANSFORMS: Dict[str, Callable[[Any], Any]] = {
+    'strip': str.strip,
+    'squash': _squash,
+    'lower': str.lower,
+    'digits': _digits,
+    'json': json.loads,
+    'first': _first,
+}
+
+URL_SOURCES = {'href', 'src', 'action'}
+
+
+def _build_query_transform(parameter: str) -> Callable[[str], Optional[str]]:
+    def read_query(value: str) -> Optional[str]:
+        return parse_qs(urlparse(value).query).get(parameter, [None])[0]
+
+    return read_query
+
+
+def compile_transforms(names: List[str]) -> List[Callable[[Any], Any]]:
+    """
+    Resolves the names of post-processing steps to their functions. Besides the
+    steps in `TRANSFORMS`, `query:<name>` reads a query parameter of a URL.
+
+    Args:
+        names (List[str]): Names of the steps, in the order they are applied.
+
+    Returns:
+        List[Callable[[Any], Any]]: The step functions.
+
+    Raises:
+        ExtractionException: If a step is unknown.
+
+    Examples:
+        >>> value = ' https://www.amazon.com.br/sp?seller=A1 '
+        >>> for step in compile_transforms(['strip', 'query:seller']):
+        ...     value = step(value)
+        >>> value
+        'A1'
+    """
+    transforms = []
+    for name in names:
+        step, _, parameter = name.partition(':')
+        if step == 'query' and parameter:
+            transforms.append(_build_query_transform(parameter))
+        elif name in TRANSFORMS:
+            transforms.append(TRANSFORMS[name])
+        else:
+            raise ExtractionException(f'Unknown transform: {name}')
+    return transforms
+
+
+class FieldSpec(BaseModel):
+    """
+    Describes how to read a field relative to a root element of the page.
+
+    Attributes:
+        selector (str): CSS selector or XPath of the element holding the field. Empty to read the root itself.
+        by (str): Selector kind, either 'css' or 'xpath'. XPaths relative to a root element must start with '.'.
+        source (str): What to read from the element: 'text' for its visible text, 'html' for its inner HTML, or the name of a property or attribute such as 'href'.
+        transforms (List[str]): Post-processing steps applied in order to the value read, such as 'strip', 'json' or 'query:seller'. Missing values are not transformed.
+        optional (bool): Whether the field may be missing without the extraction being incomplete.
+    """
+
+    selector: str = Field(default='')
+    by: Literal['css', 'xpath'] = Field(default='css')
+    source: str = Field(default='text')
+    transforms: List[str] = Field(default_factory=list)
+    optional: bool = Field(default=False)
+
+
+def build_extraction_arguments(
+    fields: Dict[str, FieldSpec], root_selector: str = None, measure=False
+) -> tuple:
+    """
+    Builds the arguments of `EXTRACTION_SCRIPT` for the given field map.
+
+    Args:
+        fields (Dict[str, FieldSpec]): Maps output names to field specs.
+        root_selector (str): CSS selector of the repeated root elements, such as one element per seller. Empty to use the whole page as the only root.
+        measure (bool): Whether the script also reports the milliseconds spent reading each field.
+
+    Returns:
+        tuple: The script arguments.
+    """
+    arguments = (
+        root_selector or '',
+        {
+            name: spec.model_dump(include={'selector', 'by', 'source'})
+            for name, spec in fields.items()
+        },
+    )
+    if measure:
+        arguments = (*arguments, True)
+    return arguments
+
+
+class ExtractionSpec(BaseModel):
+    """
+    Declarative description of what a marketplace page holds: the fields to
+    read, where to read them from and how to post-process them, either once for
+    the whole page or once per repeated root element, such as one per offer.
+
+    Attributes:
+        name (str): Unique name of the spec, such as 'amazon.offers'.
+        fields (Dict[str, FieldSpec]): Maps output names to field specs.
+        root_selector (str): CSS selector of the repeated root elements. Empty to use the whole page as the only root.
+    """
+
+    name: str
+    fields: Dict[str, FieldSpec]
+    root_selector: str = Field(default='')
+
+
+class FieldExtractionStats(BaseModel):
+    """
+    Snapshot of the extraction cost of a field.
+
+    Attributes:
+        extractor (str): Name of the extraction spec.
+        field (str): Output name of the field.
+        reads (int): Number of values read, one per root element per extraction.
+        misses (int): Number of values not found.
+        seconds (float): Total seconds spent reading the field.
+    """
+
+    extractor: str
+    field: str
+    reads: int = Field(default=0)
+    misses: int = Field(default=0)
+    seconds: float = Field(default=0.0)
+
+
+def _compile_selector(selector: str, by: str, relative: bool) -> etree.XPath:
+    if by == 'xpath':
+        return etree.XPath(selector)
+    prefix = 'descendant::' if relative else 'descendant-or-self::'
+    return etree.XPath(
+        GenericTranslator().css_to_xpath(selector, prefix=prefix)
+    )
+
+
+def _read_element(element: Any, source: str, base_url: str) -> Any:
+    if isinstance(element, str):
+        return element.strip() if source == 'text' else str(element)
+    if source == 'text':
+        return element.text_content().strip()
+    if source == 'html':
+        return (element.text or '') + ''.join(
+            etree.tostring(child, encoding=str, method='html')
+            for child in element
+        )
+    value = element.get(source)
+    if value is not None and source in URL_SOURCES and base_url:
+        return urljoin(base_url, value)
+    return value
+
+
+class _CompiledField:
+    def __init__(self, name: str, spec: FieldSpec):
+        self.name = name
+        self.spec = spec
+        self.xpath = (
+            _compile_selector(spec.selector, spec.by, relative=True)
+            if spec.selector
+            else None
+        )
+        self.transforms = compile_transforms(spec.transforms)
+        self.reads = 0
+        self.misses = 0
+        self.seconds = 0.0
+
+    def read(self, root: Any, base_url: str) -> Any:
+        element = root
+        if self.xpath is not None:
+            matches = self.xpath(root)
+            element = matches[0] if matches else None
+        if element is None:
+            return None
+        return _read_element(element, self.spec.source, base_url)
+
+    def transform(self, value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            for transform in self.transforms:
+                value = transform(value)
+        except Exception as e:
+            raise ExtractionException(
+                f'Error while transforming {self.name}: {e}'
+            )
+        return value
+
+
+class CompiledExtractor:
+    """
+    Extractor compiled once from an ExtractionSpec. Against a live WebDriver,
+    the spec is read with a single `EXTRACTION_SCRIPT` execution whose arguments
+    are built at compile time; against static HTML, the CSS selectors are
+    translated to precompiled XPath expressions evaluated on an lxml tree. Both
+    paths apply the same post-processing and account the time spent per field.
+
+    Attributes:
+        spec (ExtractionSpec): The compiled spec.
+        script_arguments (tuple): Arguments of `EXTRACTION_SCRIPT` for the spec.
+    """
+
+    def __init__(self, spec: ExtractionSpec):
+        self.spec = spec
+        self.script_arguments = build_extraction_arguments(
+            spec.fields, spec.root_selector, measure=True
+        )
+        self._root_xpath = (
+            _compile_selector(spec.root_selector, 'css', relative=False)
+            if spec.root_selector
+            else None
+        )
+        self._fields = [
+            _CompiledField(name, field_spec)
+            for name, field_spec in spec.fields.items()
+        ]
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Name of the compiled spec."""
+        return self.spec.name
+
+    def empty_row(self) -> Dict:
+        """
+        Returns a row with every field missing.
+
+        Returns:
+            Dict: Maps output names to None.
+        """
+        return dict.fromkeys(self.spec.fields)
+
+    def missing_fields(self, row: Dict) -> List[str]:
+        """
+        Lists the required fields that were not found in a row.
+
+        Args:
+            row (Dict): An extracted row.
+
+        Returns:
+            List[str]: Output names of the missing required fields.
+        """
+        return [
+            field.name
+            for field in self._fields
+            if row.get(field.name) is None and not field.spec.optional
+        ]
+
+    def _account(self, rows: List[Dict], timings: Dict[str, float]):
+        with self._lock:
+            for field in self._fields:
+                field.reads += len(rows)
+                field.misses += sum(
+                    row.get(field.name) is None for row in rows
+                )
+                field.seconds += timings.get(field.name, 0.0)
+
+    def _transform(self, rows: List[Dict]) -> List[Dict]:
+        return [
+            {
+                field.name: field.transform(row.get(field.name))
+                for field in self._fields
+            }
+            for row in rows
+        ]
+
+    def process(self, result: Any) -> Tuple[List[Dict], Dict[str, float]]:
+        """
+        Post-processes the result of `EXTRACTION_SCRIPT` run with the
+        `script_arguments` of this extractor.
+
+        Args:
+            result (Any): The script result, with the rows and the milliseconds spent per field. A plain list of rows is accepted as well.
+
+        Returns:
+            Tuple[List[Dict], Dict[str, float]]: The transformed rows and the seconds spent reading each field.
+
+        Raises:
+            ExtractionException: If a value cannot be post-processed.
+        """
+        if isinstance(result, dict):
+            rows = result.get('rows') or []
+            timings = {
+                name: milliseconds / 1000
+                for name, milliseconds in (result.get('timings') or {}).items()
+            }
+        else:
+            rows, timings = result or [], {}
+        self._account(rows, timings)
+        return self._transform(rows), timings
+
+    def extract_tree(
+        self, tree: Any, base_url: str = None
+    ) -> Tuple[List[Dict], Dict[str, float]]:
+        """
+        Extracts the spec from a static lxml tree.
+
+        Args:
+            tree (Any): The lxml document or element.
+            base_url (str): URL of the page, to resolve relative links.
+
+        Returns:
+            Tuple[List[Dict], Dict[str, float]]: The transformed rows and the seconds spent reading each field.
+
+        Raises:
+            ExtractionException: If a value cannot be post-processed.
+        """
+        roots = self._root_xpath(tree) if self._root_xpath else [tree]
+        timings = {field.name: 0.0 for field in self._fields}
+        rows = []
+        for root in roots:
+            row = {}
+            for field in self._fields:
+                started_at = time.perf_counter()
+                row[field.name] = field.read(root, base_url)
+                timings[field.name] += time.perf_counter() - started_at
+            rows.append(row)
+        self._account(rows, timings)
+        return self._transform(rows), timings
+
+    def extract_html(
+        self, content: str, base_url: str = None
+    ) -> Tuple[List[Dict], Dict[str, float]]:
+        """
+        Parses static HTML, such as a plain HTTP response, and extracts the spec.
+
+        Args:
+            content (str): The page HTML.
+            base_url (str): URL of the page, to resolve relative links.
+
+        Returns:
+            Tuple[List[Dict], Dict[str, float]]: The transformed rows and the seconds spent reading each field.
+
+        Raises:
+            ExtractionException: If a value cannot be post-processed.
+
+        Examples:
+            >>> extractor = CompiledExtractor(
+            ...     ExtractionSpec(
+            ...         name='example.offers',
+            ...         root_selector='div.offer',
+            ...         fields={
+            ...             'price': FieldSpec(selector='span.price'),
+            ...             'seller_id': FieldSpec(
+            ...                 selector='a', source='href', transforms=['query:seller']
+            ...             ),
+            ...         },
+            ...     )
+            ... )
+            >>> rows, timings = extractor.extract_html(
+            ...     '<div class="offer"><span class="price">R$ 10</span>'
+            ...     '<a href="/sp?seller=A1">Loja</a></div>'
+            ... )
+            >>> rows
+            [{'price': 'R$ 10', 'seller_id': 'A1'}]
+        """
+        if not content or not content.strip():
+            return [], {}
+        return self.extract_tree(html.fromstring(content), base_url)
+
+    def stats(self) -> List[FieldExtractionStats]:
+        """
+        Returns the extraction cost of every field since the last reset.
+
+        Returns:
+            List[FieldExtractionStats]: One snapshot per field.
+        """
+        with self._lock:
+            return [
+                FieldExtractionStats(
+                    extractor=self.name,
+                    field=field.name,
+                    reads=field.reads,
+                    misses=field.misses,
+                    seconds=field.seconds,
+                )
+                for field in self._fields
+            ]
+
+    def reset(self):
+        """
+        Resets the extraction cost of every field.
+        """
+        with self._lock:
+            for field in self._fields:
+                field.reads = 0
+                field.misses = 0
+                field.seconds = 0.0
+
+
+class ExtractorRegistry:
+    """
+    Process-wide registry of compiled extractors, one per spec name, so every
+    spec is compiled once, when its scraper module is imported, and the
+    extraction cost of all of them is reported in one place.
+
+    Attributes:
+        extractors (Dict[str, CompiledExtractor]): Maps spec names to their compiled extractors.
+    """
+
+    extractors: Dict[str, CompiledExtractor] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def compile(cls, spec: ExtractionSpec) -> CompiledExtractor:
+        """
+        Returns the extractor of a spec, compiling it on first use.
+
+        Args:
+            spec (ExtractionSpec): The extraction spec.
+
+        Returns:
+            CompiledExtractor: The compiled extractor.
+
+        Raises:
+            ExtractionException: If the spec uses an unknown transform.
+        """
+        with cls._lock:
+            extractor = cls.extractors.get(spec.name)
+            if extractor is None or extractor.spec != spec:
+                extractor = CompiledExtractor(spec)
+                cls.extractors[spec.name] = extractor
+        return extractor
+
+    @classmethod
+    def stats(cls) -> List[FieldExtractionStats]:
+        """
+        Returns the extraction cost of every field of every registered extractor.
+
+        Returns:
+            List[FieldExtractionStats]: One snapshot per extractor and field.
+        """
+        return [
+            field_stats
+            for extractor in list(cls.extractors.values())
+            for field_stats in extractor.stats()
+        ]
+
+    @classmethod
+    def clear(cls):
+        """
+        Resets the extraction cost of every registered extractor. Extractors stay
+        registered, since the scraper modules hold them.
+        """
+        with cls._lock:
+            for extractor in cls.extractors.values():
+                extractor.reset()
@@ -0,0 +1,258 @@
+import math
+import random
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+import httpx
+from pydantic import BaseModel, Field
+
+from .constants import (
+    FETCH_ATTEMPT_TIMEOUT,
+    FETCH_BACKOFF_BASE,
+    FETCH_BACKOFF_MAX,
+    FETCH_HEDGE_ENABLED,
+    FETCH_HEDGE_MIN_SAMPLES,
+    FETCH_HEDGE_PERCENTILE,
+    FETCH_LATENCY_WINDOW,
+    FETCH_MAX_ATTEMPTS,
+    FETCH_RETRY_BUDGET,
+    FETCH_RETRY_STATUSES,
+)
+
+RETRYABLE_ERRORS = (
+    TimeoutError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class FetchPolicy(BaseModel):
+    """
+    Retry and hedging policy of the HTTP fetches of a scraper.
+
+    A fetch is attempted up to `max_attempts` times while it fails with a
+    retryable error or answers a retryable status, sleeping a jittered
+    exponential backoff between attempts. When hedging is enabled, an attempt
+    still running after the host latency percentile gets a duplicate request,
+    and the first response wins. Retries and hedges of a research share its
+    `retry_budget`, so a failing host cannot multiply the load it receives.
+
+    Attributes:
+        max_attempts (int): Attempts per fetch, the first one included.
+        attempt_timeout (float): Seconds an attempt is allowed to take.
+        backoff_base (float): Backoff ceiling of the first retry, doubled on every retry.
+        backoff_max (float): Maximum backoff, also capping Retry-After headers.
+        retry_statuses (Set[int]): Response statuses worth retrying.
+        retry_budget (int): Retries and hedged requests allowed per research.
+        hedge_enabled (bool): Whether slow attempts are hedged.
+        hedge_percentile (float): Host latency percentile after which an attempt is hedged.
+        hedge_min_samples (int): Host latencies recorded before attempts are hedged.
+    """
+
+    max_attempts: int = Field(default=FETCH_MAX_ATTEMPTS)
+    attempt_timeout: float = Field(default=FETCH_ATTEMPT_TIMEOUT)
+    backoff_base: float = Field(default=FETCH_BACKOFF_BASE)
+    backoff_max: float = Field(default=FETCH_BACKOFF_MAX)
+    retry_statuses: Set[int] = Field(
+        default_factory=lambda: set(FETCH_RETRY_STATUSES)
+    )
+    retry_budget: int = Field(default=FETCH_RETRY_BUDGET)
+    hedge_enabled: bool = Field(default=FETCH_HEDGE_ENABLED)
+    hedge_percentile: float = Field(default=FETCH_HEDGE_PERCENTILE)
+    hedge_min_samples: int = Field(default=FETCH_HEDGE_MIN_SAMPLES)
+
+    def is_retryable(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Tells whether the outcome of an attempt is worth retrying.
+
+        Args:
+            response (Optional[httpx.Response]): The response of the attempt, if any.
+            error (Optional[Exception]): The error raised by the attempt, if any.
+
+        Returns:
+            bool: True for retryable errors and statuses.
+        """
+        if error is not None:
+            return isinstance(error, RETRYABLE_ERRORS)
+        return response is not None and (
+            response.status_code in self.retry_statuses
+        )
+
+    def backoff(
+        self, retry: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """
+        Returns the seconds to sleep before a retry: a random delay up to the
+        exponential ceiling of the retry ("full jitter"), or the Retry-After
+        header of the response when it sets one.
+
+        Args:
+            retry (int): Number of the retry, starting at 1.
+            response (Optional[httpx.Response]): The response being retried, if any.
+
+        Returns:
+            float: The backoff, at most `backoff_max`.
+
+        Examples:
+            >>> policy = FetchPolicy(backoff_base=1, backoff_max=4)
+            >>> 0 <= policy.backoff(5) <= 4
+            True
+            >>> policy.backoff(1, httpx.Response(503, headers={'Retry-After': '2'}))
+            2.0
+        """
+        retry_after = response.headers.get('Retry-After') if response else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        return random.uniform(0, ceiling)
+
+
+class FetchLatencyStats(BaseModel):
+    """
+    Snapshot of the fetch latencies of a host.
+
+    Attributes:
+        host (str): The fetched host.
+        samples (int): Number of recent latencies kept.
+        percentile (float): Recent latency at the hedging percentile, in seconds.
+        hedged (int): Total number of hedged requests sent to the host.
+    """
+
+    host: str
+    samples: int = Field(default=0)
+    percentile: float = Field(default=0.0)
+    hedged: int = Field(default=0)
+
+
+class HostLatency:
+    """
+    Recent fetch latencies of a host, used to decide when an attempt is slow
+    enough to be hedged.
+
+    Attributes:
+        host (str): The fetched host.
+    """
+
+    def __init__(self, host: str, window: int = FETCH_LATENCY_WINDOW):
+        self.host = host
+
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._hedged = 0
+
+    def _get_percentile(self, percentile: float) -> float:
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        rank = math.ceil(percentile / 100 * len(samples))
+        return samples[min(max(rank, 1), len(samples)) - 1]
+
+    def hedge_delay(
+        self, percentile: float, min_samples: int
+    ) -> Optional[float]:
+        """
+        Returns the seconds after which an attempt is hedged.
+
+        Args:
+            percentile (float): The latency percentile to hedge after.
+            min_samples (int): Latencies required to trust the percentile.
+
+        Returns:
+            Optional[float]: The hedging delay, or None while too few latencies were recorded.
+        """
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            return self._get_percentile(percentile)
+
+    def record(self, latency: float):
+        """
+        Records the latency of a completed attempt.
+
+        Args:
+            latency (float): Seconds the attempt took.
+        """
+        with self._lock:
+            self._samples.append(latency)
+
+    def record_hedge(self):
+        """
+        Accounts a hedged request.
+        """
+        with self._lock:
+            self._hedged += 1
+
+    def stats(
+        self, percentile: float = FETCH_HEDGE_PERCENTILE
+    ) -> FetchLatencyStats:
+        """
+        Returns a snapshot of the host latencies.
+
+        Args:
+            percentile (float): The latency percentile to report.
+
+        Returns:
+            FetchLatencyStats: The host statistics.
+        """
+        with self._lock:
+            return FetchLatencyStats(
+                host=self.host,
+                samples=len(self._samples),
+                percentile=self._get_percentile(percentile),
+                hedged=self._hedged,
+            )
+
+
+class FetchLatencyRegistry:
+    """
+    Process-wide registry of fetch latencies, one per host, shared by every
+    scraper so hedging delays learn from all the recent fetches.
+
+    Attributes:
+        latencies (Dict[str, HostLatency]): Maps hosts to their latencies.
+    """
+
+    latencies: Dict[str, HostLatency] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_latency(cls, host: str) -> HostLatency:
+        """
+        Returns the latencies of a host, creating them on first use.
+
+        Args:
+            host (str): The fetched host.
+
+        Returns:
+            HostLatency: The host latencies.
+        """
+        with cls._lock:
+            latency = cls.latencies.get(host)
+            if latency is None:
+                latency = HostLatency(host)
+                cls.latencies[host] = latency
+        return latency
+
+    @classmethod
+    def stats(cls) -> List[FetchLatencyStats]:
+        """
+        Returns the statistics of every registered host.
+
+        Returns:
+            List[FetchLatencyStats]: One snapshot per host.
+        """
+        return [latency.stats() for latency in list(cls.latencies.values())]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every registered host latency.
+        """
+        with cls._lock:
+            cls.latencies.clear()
@@ -0,0 +1,128 @@
+import importlib.util
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from .constants import (
+    DEFAULT_USER_AGENT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_POOL_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+)
+
+logger = logging.getLogger('http-client')
+
+
+def build_http_client(
+    user_agent: str = DEFAULT_USER_AGENT,
+) -> httpx.AsyncClient:
+    """
+    Builds an HTTP client with the configured connection limits, keep-alive and
+    timeouts. HTTP/2 is enabled when configured and the `h2` package is installed.
+
+    Args:
+        user_agent (str): Default User-Agent header of the client.
+
+    Returns:
+        httpx.AsyncClient: The configured client.
+    """
+    http2 = HTTP_HTTP2 and importlib.util.find_spec('h2') is not None
+    if HTTP_HTTP2 and not http2:
+        logger.warning('HTTP/2 is enabled but h2 is not installed')
+
+    return httpx.AsyncClient(
+        headers={'User-Agent': user_agent},
+        http2=http2,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            HTTP_READ_TIMEOUT,
+            connect=HTTP_CONNECT_TIMEOUT,
+            pool=HTTP_POOL_TIMEOUT,
+        ),
+    )
+
+
+class HttpClientRegistry:
+    """
+    Application-scoped registry of HTTP clients, one per host, so connections to
+    the marketplaces are kept alive and reused across scrapes. The registry is
+    started and closed with the application; while it is stopped no client is
+    handed out and scrapers open short-lived clients of their own.
+
+    Attributes:
+        clients (Dict[str, httpx.AsyncClient]): Maps hosts to their clients.
+        started (bool): Whether the registry is handing out shared clients.
+    """
+
+    clients: Dict[str, httpx.AsyncClient] = {}
+    started: bool = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def start(cls):
+        """
+        Starts handing out shared clients.
+        """
+        cls.started = True
+
+    @classmethod
+    def get_client(cls, url: str) -> Optional[httpx.AsyncClient]:
+        """
+        Returns the shared client of the URL host, creating it on first use.
+
+        Args:
+            url (str): Any URL of the host.
+
+        Returns:
+            Optional[httpx.AsyncClient]: The host client, or None if the registry is not started.
+        """
+        if not cls.started:
+            return None
+
+        host = urlparse(url).netloc
+        with cls._lock:
+            client = cls.clients.get(host)
+            if client is None or client.is_closed:
+                client = build_http_client()
+                cls.clients[host] = client
+        return client
+
+    @classmethod
+    def is_shared(cls, client: httpx.AsyncClient) -> bool:
+        """
+        Checks whether the client is owned by the registry.
+
+        Args:
+            client (httpx.AsyncClient): The client to check.
+
+        Returns:
+            bool: True if the registry owns the client.
+        """
+        return any(client is shared for shared in list(cls.clients.values()))
+
+    @classmethod
+    async def close_all(cls):
+        """
+        Stops the registry and closes every shared client.
+        """
+        with cls._lock:
+            cls.started = False
+            clients = list(cls.clients.values())
+            cls.clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f'Error while closing http client: {e}')
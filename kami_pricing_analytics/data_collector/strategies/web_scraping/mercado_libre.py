@@ -1,5 +1,8 @@
-from typing import Dict, List
-from urllib.parse import parse_qs, urlparse
+import re
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Set, Tuple
+from urllib.parse import parse_qs, urldefrag, urlparse
 
 from pydantic import Field
 from selenium.common.exceptions import NoSuchElementException
@@ -7,7 +10,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from .base_scraper import BaseScraper
-from .constants import USER_AGENTS
+from .constants import (
+    MLB_MAX_SEARCH_PAGES,
+    MLB_SEARCH_TIME_BUDGET,
+    TITLE_MATCH_THRESHOLD,
+    USER_AGENTS,
+)
+from .extraction import ExtractionSpec, ExtractorRegistry, FieldSpec
+from .title_matching import TitleMatcher
+from .user_agent_profiles import load_user_agents
 
 
 class MercadoLibreScraperException(Exception):
@@ -22,6 +33,79 @@ mlb_user_agents = [
     ua for ua in USER_AGENTS if not ua.startswith('Mozilla/5.0 (X11; Ubuntu;')
 ]
 
+MLB_PRODUCT_TITLE = 'h1.ui-pdp-title'
+
+MLB_PRICE_CONTAINER = 'span.andes-money-amount.ui-pdp-price__part'
+
+MLB_PRODUCT_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='mercado_livre.product',
+        fields={
+            'seller_url': FieldSpec(
+                selector="(//div[@id='seller_info']/descendant::a[1] | //div[@id='seller_data']/descendant::a[1])",
+                by='xpath',
+                source='href',
+            ),
+            'brand': FieldSpec(
+                selector="//span[contains(text(), 'Marca:')]/following-sibling::span",
+                by='xpath',
+                transforms=['strip'],
+            ),
+            'description': FieldSpec(selector=MLB_PRODUCT_TITLE),
+            'currency_symbol': FieldSpec(
+                selector=f'{MLB_PRICE_CONTAINER} span.andes-money-amount__currency-symbol'
+            ),
+            'price_fraction': FieldSpec(
+                selector=f'{MLB_PRICE_CONTAINER} span.andes-money-amount__fraction'
+            ),
+            'price_cents': FieldSpec(
+                selector=f'{MLB_PRICE_CONTAINER} span.andes-money-amount__cents',
+                optional=True,
+            ),
+            'seller_name': FieldSpec(
+                selector="//div[@class='ui-pdp-seller__header']/descendant::span[2]",
+                by='xpath',
+            ),
+        },
+    )
+)
+
+MLB_PROBE_SELECTORS = [
+    MLB_PRICE_CONTAINER,
+    'div.ui-pdp-seller__header',
+    'div.ui-pdp-other-sellers',
+]
+
+MLB_SEARCH_RESULTS_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='mercado_livre.search_results',
+        root_selector=(
+            'section.ui-search-results.ui-search-results--without-disclaimer '
+            'a.ui-search-item__group__element.ui-search-link__title-card.ui-search-link'
+        ),
+        fields={
+            'title': FieldSpec(source='title'),
+            'href': FieldSpec(source='href'),
+        },
+    )
+)
+
+MLB_SEARCH_PAGINATION_EXTRACTOR = ExtractorRegistry.compile(
+    ExtractionSpec(
+        name='mercado_livre.search_pagination',
+        fields={
+            'page_count': FieldSpec(
+                selector='li.andes-pagination__page-count', optional=True
+            ),
+            'next_page_url': FieldSpec(
+                selector='li.andes-pagination__button--next a.andes-pagination__link',
+                source='href',
+                optional=True,
+            ),
+        },
+    )
+)
+
 
 class MercadoLibreScraper(BaseScraper):
     """
@@ -30,9 +114,18 @@ class MercadoLibreScraper(BaseScraper):
 
     Attributes:
         search_url (str): Base URL used for constructing search queries.
+        max_search_pages (int): Maximum number of search result pages read per product.
+        search_time_budget (float): Seconds allowed for reading the search result pages.
+        title_match_threshold (float): Minimum similarity of a search result title to the product title.
     """
 
     search_url: str = Field(default='https://lista.mercadolivre.com.br')
+    max_search_pages: int = Field(default=MLB_MAX_SEARCH_PAGES)
+    search_time_budget: float = Field(default=MLB_SEARCH_TIME_BUDGET)
+    title_match_threshold: float = Field(default=TITLE_MATCH_THRESHOLD)
+    probe_selectors: List[str] = Field(
+        default_factory=lambda: list(MLB_PROBE_SELECTORS)
+    )
 
     def __init__(self, **data):
         """
@@ -41,7 +134,10 @@ class MercadoLibreScraper(BaseScraper):
         super().__init__(
             **data,
             logger_name='mercado-libre-scraper',
-            user_agents=mlb_user_agents,
+            marketplace='mercado_livre',
+            user_agents=load_user_agents(
+                'mercado_livre', fallback=mlb_user_agents
+            ),
         )
 
     def _clean_product_description(self, product_description: str) -> str:
@@ -138,9 +234,11 @@ class MercadoLibreScraper(BaseScraper):
             brand_xpath_expression = (
                 "//span[contains(text(), 'Marca:')]/following-sibling::span"
             )
-            brand = self.webdriver.find_element(
-                By.XPATH, brand_xpath_expression
-            ).text.strip()
+            brand = await self.run_in_driver(
+                lambda: self.webdriver.find_element(
+                    By.XPATH, brand_xpath_expression
+                ).text.strip()
+            )
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting product brand: {e}'
@@ -162,9 +260,11 @@ class MercadoLibreScraper(BaseScraper):
         description = ''
 
         try:
-            description = self.webdriver.find_element(
-                By.CSS_SELECTOR, 'h1.ui-pdp-title'
-            ).text
+            description = await self.run_in_driver(
+                lambda: self.webdriver.find_element(
+                    By.CSS_SELECTOR, 'h1.ui-pdp-title'
+                ).text
+            )
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting product description: {e}'
@@ -196,6 +296,22 @@ class MercadoLibreScraper(BaseScraper):
             )
         return price_cents
 
+    def _read_price(self) -> str:
+        price_container = self.webdriver.find_element(
+            By.CSS_SELECTOR, 'span.andes-money-amount.ui-pdp-price__part'
+        )
+        currency_symbol = price_container.find_element(
+            By.CSS_SELECTOR, 'span.andes-money-amount__currency-symbol'
+        ).text
+        price_fraction = price_container.find_element(
+            By.CSS_SELECTOR, 'span.andes-money-amount__fraction'
+        ).text
+        price_cents = self._get_price_cents(price_container)
+
+        if price_cents:
+            return f'{currency_symbol}{price_fraction},{price_cents}'
+        return f'{currency_symbol}{price_fraction}'
+
     async def get_price(self) -> str:
         """
         Retrieves the product price from the product page.
@@ -209,21 +325,7 @@ class MercadoLibreScraper(BaseScraper):
         price = ''
 
         try:
-            price_container = self.webdriver.find_element(
-                By.CSS_SELECTOR, 'span.andes-money-amount.ui-pdp-price__part'
-            )
-            currency_symbol = price_container.find_element(
-                By.CSS_SELECTOR, 'span.andes-money-amount__currency-symbol'
-            ).text
-            price_fraction = price_container.find_element(
-                By.CSS_SELECTOR, 'span.andes-money-amount__fraction'
-            ).text
-            price_cents = self._get_price_cents(price_container)
-
-            if price_cents:
-                price = f'{currency_symbol}{price_fraction},{price_cents}'
-            else:
-                price = f'{currency_symbol}{price_fraction}'
+            price = await self.run_in_driver(self._read_price)
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting product price: {e}'
@@ -273,9 +375,11 @@ class MercadoLibreScraper(BaseScraper):
             seller_name_xpath_expression = (
                 "//div[@class='ui-pdp-seller__header']/descendant::span[2]"
             )
-            seller_name = self.webdriver.find_element(
-                By.XPATH, seller_name_xpath_expression
-            ).text
+            seller_name = await self.run_in_driver(
+                lambda: self.webdriver.find_element(
+                    By.XPATH, seller_name_xpath_expression
+                ).text
+            )
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting seller name: {e}'
@@ -321,10 +425,11 @@ class MercadoLibreScraper(BaseScraper):
         )
 
         try:
-            seller_link_element = self._find_element_by_multiple_xpaths(
-                seller_link_xpaths
+            seller_url = await self.run_in_driver(
+                lambda: self._find_element_by_multiple_xpaths(
+                    seller_link_xpaths
+                ).get_attribute('href')
             )
-            seller_url = seller_link_element.get_attribute('href')
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting seller URL: {e}'
@@ -332,47 +437,217 @@ class MercadoLibreScraper(BaseScraper):
 
         return seller_url
 
-    async def get_seller_info(self, seller_product_page: str) -> Dict:
-        seller_url = ''
+    async def _extract_seller_info(self, seller_product_page: str) -> Dict:
+        """
+        Extracts the seller information from the seller product page currently
+        loaded in the WebDriver, reading every field with a single script execution.
 
-        seller = {
-            'product_url': '',
-            'marketplace_id': '',
-            'brand': '',
-            'description': '',
-            'price': '',
-            'seller_id': '',
-            'seller_name': '',
-            'seller_url': '',
-        }
+        Args:
+            seller_product_page (str): The URL of the loaded seller product page.
 
+        Returns:
+            Dict: A dictionary containing the seller's information.
+
+        Raises:
+            MercadoLibreScraperException: If the seller information cannot be extracted.
+        """
         try:
-            self.webdriver.get(seller_product_page)
-            seller_url = await self.get_seller_url()
-            seller['product_url'] = seller_product_page
-            seller['marketplace_id'] = await self.get_marketplace_id(
-                seller_url
+            page_fields = await self.extract_one(MLB_PRODUCT_EXTRACTOR)
+        except Exception as e:
+            raise MercadoLibreScraperException(
+                f'Unexpected Error while getting seller info from {seller_product_page}: {e}'
             )
-            seller['brand'] = await self.get_brand()
-            seller['description'] = await self.get_description()
-            seller['price'] = await self.get_price()
-            seller['seller_id'] = await self.get_seller_id(seller_url)
-            seller['seller_name'] = await self.get_seller_name()
-            seller['seller_url'] = seller_url
-        except MercadoLibreScraperException as e:
+
+        missing_fields = MLB_PRODUCT_EXTRACTOR.missing_fields(page_fields)
+        if missing_fields:
             raise MercadoLibreScraperException(
-                f'Error while getting seller info details from {seller_product_page}: {e}'
+                f'Error while getting seller info details from {seller_product_page}: {", ".join(missing_fields)} not found'
             )
+
+        seller_url = page_fields['seller_url']
+        price = (
+            f"{page_fields['currency_symbol']}{page_fields['price_fraction']}"
+        )
+        if page_fields['price_cents']:
+            price = f"{price},{page_fields['price_cents']}"
+
+        return {
+            'product_url': seller_product_page,
+            'marketplace_id': await self.get_marketplace_id(seller_url),
+            'brand': page_fields['brand'],
+            'description': page_fields['description'],
+            'price': price,
+            'seller_id': await self.get_seller_id(seller_url),
+            'seller_name': page_fields['seller_name'],
+            'seller_url': seller_url,
+        }
+
+    async def get_seller_info(self, seller_product_page: str) -> Dict:
+        """
+        Loads a seller product page and extracts the seller information.
+
+        Args:
+            seller_product_page (str): The URL of the seller product page.
+
+        Returns:
+            Dict: A dictionary containing the seller's information.
+
+        Raises:
+            MercadoLibreScraperException: If the seller information cannot be retrieved.
+        """
+        try:
+            await self.load_page(seller_product_page)
+            await self.wait_for(MLB_PRODUCT_TITLE)
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Unexpected Error while getting seller info from {seller_product_page}: {e}'
             )
 
-        return seller
+        return await self._extract_seller_info(seller_product_page)
+
+    async def stream_sellers_info(
+        self, sellers: List[str]
+    ) -> AsyncIterator[Dict]:
+        """
+        Loads the seller product pages concurrently in browser tabs, up to
+        `pages_concurrency` at a time, and extracts each one independently,
+        yielding it as soon as it is extracted. Sellers keep the order of
+        `sellers`; pages that fail are logged, recorded in the telemetry and
+        skipped.
+
+        Args:
+            sellers (List[str]): The seller product pages URLs.
+
+        Yields:
+            Dict: The info of a seller.
+        """
+        visited = set()
+
+        try:
+            # Closing the generator on exit closes the seller tabs before the
+            # webdriver is released, even when the stream is stopped early
+            async with aclosing(
+                self.load_pages_in_tabs(sellers)
+            ) as seller_pages:
+                async for index, seller_product_page, error in seller_pages:
+                    visited.add(index)
+                    if error is not None:
+                        self.logger.error(
+                            f'Error while loading seller page: {error}'
+                        )
+                        self.telemetry.record_failure(
+                            'seller_page', seller_product_page, error
+                        )
+                        continue
+                    try:
+                        seller_info = await self._extract_seller_info(
+                            seller_product_page
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            f'Error while getting seller info: {e}'
+                        )
+                        self.telemetry.record_failure(
+                            'seller_info', seller_product_page, e
+                        )
+                        continue
+                    yield seller_info
+        except Exception as e:
+            self.logger.error(f'Error while loading seller pages: {e}')
+            for index, seller_product_page in enumerate(sellers):
+                if index not in visited:
+                    self.telemetry.record_failure(
+                        'seller_page', seller_product_page, e
+                    )
+
+    async def _get_search_pagination(self) -> Tuple[int, int]:
+        """
+        Reads the total number of search result pages and the number of results
+        per page from the pagination of the loaded search page. The page size is
+        inferred from the offset of the "next" link.
+
+        Returns:
+            Tuple[int, int]: The number of pages, 1 if there is no pagination, and the page size.
+        """
+        pages_count, page_size = 1, 50
+        pagination = await self.extract_one(MLB_SEARCH_PAGINATION_EXTRACTOR)
+        page_count_match = re.search(r'(\d+)', pagination['page_count'] or '')
+        if page_count_match:
+            pages_count = int(page_count_match.group(1))
+        offset_match = re.search(
+            r'_Desde_(\d+)', pagination['next_page_url'] or ''
+        )
+        if offset_match:
+            page_size = int(offset_match.group(1)) - 1
+        return pages_count, page_size
+
+    def _build_search_page_urls(
+        self, product_search_url: str, pages_count: int, page_size: int
+    ) -> List[str]:
+        """
+        Builds the URLs of the remaining search result pages, capped by
+        `max_search_pages`.
+
+        Args:
+            product_search_url (str): The URL of the first search result page.
+            pages_count (int): The total number of search result pages.
+            page_size (int): The number of results per page.
+
+        Returns:
+            List[str]: The URLs of the search result pages after the first one.
+        """
+        pages_count = min(pages_count, self.max_search_pages)
+        return [
+            f'{product_search_url}_Desde_{page * page_size + 1}_NoIndex_True'
+            for page in range(1, pages_count)
+        ]
+
+    async def _get_matching_sellers(
+        self, matcher: TitleMatcher, seen: Set[str]
+    ) -> List[str]:
+        """
+        Collects the listings of the loaded search page whose title matches the
+        product title, skipping listings already seen in previous pages. Titles
+        and links of all the listings are read with a single script execution,
+        and all the titles are scored at once. Accepted listings are recorded in
+        the telemetry along with their score.
+
+        Args:
+            matcher (TitleMatcher): The matcher of the product title.
+            seen (Set[str]): The listings already collected, updated in place.
+
+        Returns:
+            List[str]: The new matching sellers URLs.
+        """
+        sellers = []
+        search_results = [
+            search_result
+            for search_result in await self.extract(
+                MLB_SEARCH_RESULTS_EXTRACTOR
+            )
+            if search_result['href']
+        ]
+        matches = matcher.match(
+            [search_result['title'] for search_result in search_results]
+        )
+
+        for match in matches:
+            seller_url = urldefrag(search_results[match.index]['href']).url
+            if seller_url not in seen:
+                seen.add(seller_url)
+                sellers.append(seller_url)
+                self.telemetry.record_title_match(
+                    seller_url, match.title, match.score
+                )
+
+        return sellers
 
     async def get_sellers_list(self) -> List[str]:
         """
-        Retrieves the list of sellers for a given product URL.
+        Retrieves the list of sellers for a given product URL. The first search
+        result page gives the total number of pages; the remaining ones, up to
+        `max_search_pages`, are loaded concurrently in browser tabs until the
+        `search_time_budget` runs out.
 
         Returns:
             List: The list of sellers URLs.
@@ -382,43 +657,81 @@ class MercadoLibreScraper(BaseScraper):
 
         """
         sellers = []
+        seen = set()
 
         try:
-            self.webdriver.get(str(self.product_url))
-            product_description = self.webdriver.find_element(
-                By.CSS_SELECTOR, 'h1.ui-pdp-title'
-            ).text
+            started_at = time.monotonic()
+            await self.load_page(str(self.product_url))
+            await self.wait_for(MLB_PRODUCT_TITLE)
+            product_description = await self.run_in_driver(
+                lambda: self.webdriver.find_element(
+                    By.CSS_SELECTOR, MLB_PRODUCT_TITLE
+                ).text
+            )
             product_search_url = self._build_product_search_url(
                 product_description
             )
-            self.webdriver.get(product_search_url)
-            cleaned_description = set(
-                self._clean_product_description(product_description).split()
+            await self.load_page(product_search_url)
+            matcher = TitleMatcher(
+                product_description, threshold=self.title_match_threshold
             )
-            products_search_result_section = self.webdriver.find_element(
-                By.CSS_SELECTOR,
-                'section.ui-search-results.ui-search-results--without-disclaimer',
+            sellers.extend(await self._get_matching_sellers(matcher, seen))
+            pages_count, page_size = await self._get_search_pagination()
+            search_pages_urls = self._build_search_page_urls(
+                product_search_url, pages_count, page_size
             )
-
-            if products_search_result_section:
-                sellers_urls = products_search_result_section.find_elements(
-                    By.CSS_SELECTOR,
-                    'a.ui-search-item__group__element.ui-search-link__title-card.ui-search-link',
-                )
-                for seller_link in sellers_urls:
-                    title = (
-                        seller_link.get_attribute('title')
-                        if seller_link.get_attribute('title')
-                        else ''
-                    )
-                    cleaned_title = set(
-                        self._clean_product_description(title).split()
-                    )
-                    if cleaned_title == cleaned_description:
-                        sellers.append(seller_link.get_attribute('href'))
         except Exception as e:
             raise MercadoLibreScraperException(
                 f'Error while getting sellers list: {e}'
             )
 
+        visited = set()
+        skip_reason = 'Search time budget exceeded'
+        try:
+            # Closing the generator on exit closes the search tabs before the
+            # seller pages are loaded on the same webdriver
+            async with aclosing(
+                self.load_pages_in_tabs(search_pages_urls)
+            ) as search_pages:
+                async for index, search_page_url, error in search_pages:
+                    if time.monotonic() - started_at > self.search_time_budget:
+                        break
+                    visited.add(index)
+                    if error is not None:
+                        self.logger.error(
+                            f'Error while loading search page: {error}'
+                        )
+                        self.telemetry.record_failure(
+                            'search_page', search_page_url, error
+                        )
+                        continue
+                    try:
+                        sellers.extend(
+                            await self._get_matching_sellers(matcher, seen)
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            f'Error while reading search page: {e}'
+                        )
+                        self.telemetry.record_failure(
+                            'search_page', search_page_url, e
+                        )
+        except Exception as e:
+            self.logger.error(f'Error while loading search pages: {e}')
+            skip_reason = f'Error while loading search pages: {e}'
+
+        skipped_pages = [
+            search_page_url
+            for index, search_page_url in enumerate(search_pages_urls)
+            if index not in visited
+        ]
+        if skipped_pages:
+            self.logger.warning(
+                f'{len(skipped_pages)} search pages were not read: {skip_reason}'
+            )
+            for search_page_url in skipped_pages:
+                self.telemetry.record_failure(
+                    'search_page', search_page_url, skip_reason
+                )
+
         return sellers
@@ -0,0 +1,589 @@
+import hashlib
+import importlib.util
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .constants import (
+    ARCHIVE_COMPACTION_RATIO,
+    ARCHIVE_COMPRESSION_LEVEL,
+    ARCHIVE_MAX_AGE,
+    ARCHIVE_MAX_BYTES,
+    ARCHIVE_PATH,
+    ARCHIVE_SEGMENT_SIZE,
+)
+
+logger = logging.getLogger('page-archive')
+
+ZSTD_AVAILABLE = importlib.util.find_spec('zstandard') is not None
+
+if ZSTD_AVAILABLE:
+    import zstandard
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    marketplace TEXT NOT NULL,
+    product_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES blobs (content_hash),
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_product
+    ON pages (marketplace, product_id, fetched_at);
+CREATE INDEX IF NOT EXISTS pages_fetched_at ON pages (fetched_at);
+CREATE INDEX IF NOT EXISTS pages_content_hash ON pages (content_hash);
+CREATE INDEX IF NOT EXISTS blobs_segment ON blobs (segment);
+"""
+
+
+class ArchivedPage(BaseModel):
+    """
+    Index entry of a page stored in the PageArchive.
+
+    Attributes:
+        marketplace (str): The marketplace the page belongs to.
+        product_id (str): Identifier of the scraped product, its SKU or URL.
+        url (str): URL of the fetched page.
+        content_hash (str): SHA-256 of the page content, the key of the stored blob.
+        fetched_at (float): Unix timestamp of the fetch.
+        size (int): Size of the page content in bytes.
+        stored_size (int): Size of the compressed blob in bytes.
+    """
+
+    marketplace: str
+    product_id: str
+    url: str
+    content_hash: str
+    fetched_at: float
+    size: int = Field(default=0)
+    stored_size: int = Field(default=0)
+
+
+class PageArchiveStats(BaseModel):
+    """
+    Snapshot of a PageArchive usage.
+
+    Attributes:
+        pages (int): Number of archived fetches.
+        blobs (int): Number of distinct page contents stored.
+        size (int): Total size of the distinct page contents in bytes.
+        stored_size (int): Total size of the compressed blobs in bytes.
+        segments (int): Number of segment files on disk.
+        codec (str): Compression codec of new blobs, 'zstd' or 'zlib'.
+    """
+
+    pages: int = Field(default=0)
+    blobs: int = Field(default=0)
+    size: int = Field(default=0)
+    stored_size: int = Field(default=0)
+    segments: int = Field(default=0)
+    codec: str = Field(default='zstd')
+
+
+class PageArchive:
+    """
+    Content-addressed archive of the raw pages fetched by the scrapers, so
+    extraction can be replayed without scraping again. Page contents are
+    compressed and appended to segment files, once per distinct SHA-256; every
+    fetch is indexed by marketplace, product and timestamp in a SQLite index
+    pointing to the blob of its content.
+
+    Blobs are compressed with zstd when the `zstandard` package is installed and
+    with zlib otherwise; the codec is recorded per blob, so archives stay readable
+    either way. Segments are read through memory maps, so compressed blobs can be
+    handed out without copies.
+
+    Storage growth is bounded by the retention policy, enforced when the archive
+    is opened and every time a segment is sealed: fetches older than `max_age`
+    are dropped, then the oldest fetches until the blobs fit in `max_bytes`.
+    Segments left without live blobs are deleted, and sealed segments whose live
+    ratio fell under `compaction_ratio` have their live blobs moved to the active
+    segment.
+
+    Attributes:
+        path (str): Directory of the index and the segment files.
+        segment_size (int): Bytes after which the active segment is sealed.
+        max_age (float): Seconds a fetch is kept, 0 to keep fetches regardless of age.
+        max_bytes (int): Maximum size of the stored blobs, 0 for no limit.
+        compaction_ratio (float): Live ratio under which sealed segments are compacted.
+        codec (str): Compression codec of new blobs, 'zstd' or 'zlib'.
+    """
+
+    def __init__(
+        self,
+        path: str = ARCHIVE_PATH,
+        segment_size: int = ARCHIVE_SEGMENT_SIZE,
+        max_age: float = ARCHIVE_MAX_AGE,
+        max_bytes: int = ARCHIVE_MAX_BYTES,
+        compaction_ratio: float = ARCHIVE_COMPACTION_RATIO,
+        compression_level: int = ARCHIVE_COMPRESSION_LEVEL,
+        codec: str = None,
+    ):
+        self.path = path
+        self.segment_size = segment_size
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.compaction_ratio = compaction_ratio
+        self.compression_level = compression_level
+        self.codec = codec or ('zstd' if ZSTD_AVAILABLE else 'zlib')
+        if self.codec == 'zstd' and not ZSTD_AVAILABLE:
+            raise ValueError('zstd codec requires the zstandard package')
+
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.RLock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._index = sqlite3.connect(
+            os.path.join(self.path, 'index.sqlite'), check_same_thread=False
+        )
+        self._index.executescript(INDEX_SCHEMA)
+        self._active_segment = self._get_last_segment()
+        self.enforce_retention()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, f'{segment:06d}.seg')
+
+    def _list_segments(self) -> List[int]:
+        return sorted(
+            int(name.split('.')[0])
+            for name in os.listdir(self.path)
+            if name.endswith('.seg')
+        )
+
+    def _get_last_segment(self) -> int:
+        segments = self._list_segments()
+        return segments[-1] if segments else 0
+
+    def _compress(self, content: bytes) -> bytes:
+        if self.codec == 'zstd':
+            return zstandard.ZstdCompressor(
+                level=self.compression_level
+            ).compress(content)
+        return zlib.compress(content, min(self.compression_level, 9))
+
+    @staticmethod
+    def _decompress(codec: str, blob: Union[bytes, memoryview]) -> bytes:
+        if codec == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise ValueError('zstd blobs require the zstandard package')
+            return zstandard.ZstdDecompressor().decompress(blob)
+        return zlib.decompress(blob)
+
+    def _append(self, blob: bytes) -> tuple:
+        """
+        Appends a blob to the active segment, sealing it first when the blob
+        would make it outgrow `segment_size`.
+
+        Returns:
+            tuple: The segment and offset of the blob.
+        """
+        segment_path = self._segment_path(self._active_segment)
+        offset = (
+            os.path.getsize(segment_path)
+            if os.path.exists(segment_path)
+            else 0
+        )
+        if offset and offset + len(blob) > self.segment_size:
+            self._active_segment += 1
+            segment_path = self._segment_path(self._active_segment)
+            offset = 0
+        with open(segment_path, 'ab') as segment_file:
+            segment_file.write(blob)
+        self._maps.pop(self._active_segment, None)
+        return self._active_segment, offset
+
+    def store(
+        self,
+        marketplace: str,
+        product_id: str,
+        url: str,
+        content: Union[str, bytes],
+        fetched_at: float = None,
+    ) -> ArchivedPage:
+        """
+        Archives a fetched page. The content is stored only if no blob with the
+        same hash exists; the fetch is always indexed.
+
+        Args:
+            marketplace (str): The marketplace the page belongs to.
+            product_id (str): Identifier of the scraped product.
+            url (str): URL of the fetched page.
+            content (Union[str, bytes]): The page content, text is encoded as UTF-8.
+            fetched_at (float): Unix timestamp of the fetch, defaults to now.
+
+        Returns:
+            ArchivedPage: The index entry of the fetch.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        content_hash = hashlib.sha256(content).hexdigest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+
+        with self._lock:
+            row = self._index.execute(
+                'SELECT length FROM blobs WHERE content_hash = ?',
+                (content_hash,),
+            ).fetchone()
+            sealed = False
+            if row is None:
+                blob = self._compress(content)
+                active_segment = self._active_segment
+                segment, offset = self._append(blob)
+                sealed = segment != active_segment
+                self._index.execute(
+                    'INSERT INTO blobs VALUES (?, ?, ?, ?, ?, ?)',
+                    (
+                        content_hash,
+                        self.codec,
+                        segment,
+                        offset,
+                        len(blob),
+                        len(content),
+                    ),
+                )
+                stored_size = len(blob)
+            else:
+                stored_size = row[0]
+            self._index.execute(
+                'INSERT INTO pages (marketplace, product_id, url, content_hash, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (marketplace, product_id, url, content_hash, fetched_at),
+            )
+            self._index.commit()
+            if sealed:
+                self.enforce_retention()
+
+        return ArchivedPage(
+            marketplace=marketplace,
+            product_id=product_id,
+            url=url,
+            content_hash=content_hash,
+            fetched_at=fetched_at,
+            size=len(content),
+            stored_size=stored_size,
+        )
+
+    def find(
+        self,
+        marketplace: str = None,
+        product_id: str = None,
+        since: float = None,
+        until: float = None,
+    ) -> List[ArchivedPage]:
+        """
+        Lists the archived fetches matching the given filters, oldest first.
+
+        Args:
+            marketplace (str): Only fetches of this marketplace.
+            product_id (str): Only fetches of this product.
+            since (float): Only fetches at or after this Unix timestamp.
+            until (float): Only fetches before this Unix timestamp.
+
+        Returns:
+            List[ArchivedPage]: The matching fetches.
+        """
+        filters, parameters = [], []
+        for clause, value in (
+            ('pages.marketplace = ?', marketplace),
+            ('pages.product_id = ?', product_id),
+            ('pages.fetched_at >= ?', since),
+            ('pages.fetched_at < ?', until),
+        ):
+            if value is not None:
+                filters.append(clause)
+                parameters.append(value)
+        where = f'WHERE {" AND ".join(filters)}' if filters else ''
+
+        with self._lock:
+            rows = self._index.execute(
+                'SELECT pages.marketplace, pages.product_id, pages.url, '
+                'pages.content_hash, pages.fetched_at, blobs.size, blobs.length '
+                'FROM pages JOIN blobs USING (content_hash) '
+                f'{where} ORDER BY pages.fetched_at, pages.id',
+                parameters,
+            ).fetchall()
+
+        return [
+            ArchivedPage(
+                marketplace=row[0],
+                product_id=row[1],
+                url=row[2],
+                content_hash=row[3],
+                fetched_at=row[4],
+                size=row[5],
+                stored_size=row[6],
+            )
+            for row in rows
+        ]
+
+    def open_segment(self, segment: int) -> mmap.mmap:
+        """
+        Returns a read-only memory map of a segment file. Maps are cached, and
+        the map of the active segment is renewed after it grows.
+
+        Args:
+            segment (int): The segment number.
+
+        Returns:
+            mmap.mmap: The segment memory map.
+        """
+        with self._lock:
+            segment_map = self._maps.get(segment)
+            if segment_map is None:
+                with open(self._segment_path(segment), 'rb') as segment_file:
+                    segment_map = mmap.mmap(
+                        segment_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                self._maps[segment] = segment_map
+            return segment_map
+
+    def _get_blob_location(self, content_hash: str) -> tuple:
+        with self._lock:
+            row = self._index.execute(
+                'SELECT codec, segment, offset, length FROM blobs '
+                'WHERE content_hash = ?',
+                (content_hash,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f'Page content {content_hash} is not archived')
+        return row
+
+    def read_compressed(self, content_hash: str) -> memoryview:
+        """
+        Returns the compressed blob of a page content as a view over the segment
+        memory map, without copying it.
+
+        Args:
+            content_hash (str): SHA-256 of the page content.
+
+        Returns:
+            memoryview: The compressed blob.
+
+        Raises:
+            KeyError: If the content is not archived.
+        """
+        _, segment, offset, length = self._get_blob_location(content_hash)
+        return memoryview(self.open_segment(segment))[offset : offset + length]
+
+    def read(self, content_hash: str) -> bytes:
+        """
+        Returns the content of an archived page.
+
+        Args:
+            content_hash (str): SHA-256 of the page content.
+
+        Returns:
+            bytes: The page content.
+
+        Raises:
+            KeyError: If the content is not archived.
+        """
+        codec, segment, offset, length = self._get_blob_location(content_hash)
+        blob = memoryview(self.open_segment(segment))[offset : offset + length]
+        try:
+            return self._decompress(codec, blob)
+        finally:
+            blob.release()
+
+    def _drop_segment(self, segment: int):
+        segment_map = self._maps.pop(segment, None)
+        if segment_map is not None:
+            try:
+                segment_map.close()
+            except BufferError:
+                pass
+        try:
+            os.remove(self._segment_path(segment))
+        except FileNotFoundError:
+            pass
+
+    def _compact_segment(self, segment: int):
+        blobs = self._index.execute(
+            'SELECT content_hash, offset, length FROM blobs WHERE segment = ?',
+            (segment,),
+        ).fetchall()
+        with open(self._segment_path(segment), 'rb') as segment_file:
+            for content_hash, offset, length in blobs:
+                segment_file.seek(offset)
+                new_segment, new_offset = self._append(
+                    segment_file.read(length)
+                )
+                self._index.execute(
+                    'UPDATE blobs SET segment = ?, offset = ? '
+                    'WHERE content_hash = ?',
+                    (new_segment, new_offset, content_hash),
+                )
+        self._index.commit()
+        self._drop_segment(segment)
+
+    def enforce_retention(self, now: float = None) -> int:
+        """
+        Applies the retention policy: drops expired fetches, then the oldest
+        fetches until the blobs fit in `max_bytes`, deletes the blobs no fetch
+        refers to and reclaims the space of the sealed segments.
+
+        Args:
+            now (float): Unix timestamp used to expire fetches, defaults to now.
+
+        Returns:
+            int: Number of fetches dropped.
+        """
+        now = time.time() if now is None else now
+        dropped = 0
+        with self._lock:
+            if self.max_age:
+                dropped += self._index.execute(
+                    'DELETE FROM pages WHERE fetched_at < ?',
+                    (now - self.max_age,),
+                ).rowcount
+                self._delete_orphan_blobs()
+
+            if self.max_bytes:
+                while self._get_stored_size() > self.max_bytes:
+                    oldest = self._index.execute(
+                        'SELECT content_hash FROM pages '
+                        'ORDER BY fetched_at, id LIMIT 1'
+                    ).fetchone()
+                    if oldest is None:
+                        break
+                    dropped += self._index.execute(
+                        'DELETE FROM pages WHERE content_hash = ?', oldest
+                    ).rowcount
+                    self._delete_orphan_blobs()
+            self._index.commit()
+
+            live_sizes = dict(
+                self._index.execute(
+                    'SELECT segment, SUM(length) FROM blobs GROUP BY segment'
+                ).fetchall()
+            )
+            for segment in self._list_segments():
+                if segment == self._active_segment:
+                    continue
+                live_size = live_sizes.get(segment, 0)
+                if not live_size:
+                    self._drop_segment(segment)
+                elif (
+                    live_size
+                    < os.path.getsize(self._segment_path(segment))
+                    * self.compaction_ratio
+                ):
+                    self._compact_segment(segment)
+
+        if dropped:
+            logger.info(f'{dropped} archived pages dropped by retention')
+        return dropped
+
+    def _delete_orphan_blobs(self):
+        self._index.execute(
+            'DELETE FROM blobs WHERE content_hash NOT IN '
+            '(SELECT content_hash FROM pages)'
+        )
+
+    def _get_stored_size(self) -> int:
+        return self._index.execute(
+            'SELECT COALESCE(SUM(length), 0) FROM blobs'
+        ).fetchone()[0]
+
+    def stats(self) -> PageArchiveStats:
+        """
+        Returns a snapshot of the archive usage.
+
+        Returns:
+            PageArchiveStats: The archive statistics.
+        """
+        with self._lock:
+            pages = self._index.execute(
+                'SELECT COUNT(*) FROM pages'
+            ).fetchone()
+            blobs = self._index.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), '
+                'COALESCE(SUM(length), 0) FROM blobs'
+            ).fetchone()
+            return PageArchiveStats(
+                pages=pages[0],
+                blobs=blobs[0],
+                size=blobs[1],
+                stored_size=blobs[2],
+                segments=len(self._list_segments()),
+                codec=self.codec,
+            )
+
+    def close(self):
+        """
+        Closes the segment memory maps and the index.
+        """
+        with self._lock:
+            for segment in list(self._maps):
+                segment_map = self._maps.pop(segment)
+                try:
+                    segment_map.close()
+                except BufferError:
+                    pass
+            self._index.close()
+
+
+class PageArchiveRegistry:
+    """
+    Application-scoped holder of the PageArchive shared by every scraper. The
+    archive is opened and closed with the application; while it is closed
+    scrapers do not archive the pages they fetch.
+
+    Attributes:
+        archive (Optional[PageArchive]): The open archive, if any.
+    """
+
+    archive: Optional[PageArchive] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str = ARCHIVE_PATH, **settings) -> PageArchive:
+        """
+        Opens the shared archive, enforcing its retention policy.
+
+        Args:
+            path (str): Directory of the archive.
+            **settings: Other PageArchive settings.
+
+        Returns:
+            PageArchive: The shared archive.
+        """
+        with cls._lock:
+            if cls.archive is None:
+                cls.archive = PageArchive(path, **settings)
+        return cls.archive
+
+    @classmethod
+    def get_archive(cls) -> Optional[PageArchive]:
+        """
+        Returns the shared archive.
+
+        Returns:
+            Optional[PageArchive]: The archive, or None if it is not open.
+        """
+        return cls.archive
+
+    @classmethod
+    def close(cls):
+        """
+        Closes the shared archive.
+        """
+        with cls._lock:
+            archive, cls.archive = cls.archive, None
+        if archive is not None:
+            archive.close()
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field, computed_field
+
+from .constants import RATE_LIMIT_BURST, RATE_LIMIT_DEFAULT_RATE
+
+
+class RateLimiterStats(BaseModel):
+    """
+    Snapshot of a HostRateLimiter usage.
+
+    Attributes:
+        host (str): The host paced by the limiter.
+        rate (float): Requests allowed per second.
+        capacity (float): Maximum burst of requests.
+        acquisitions (int): Total number of requests paced.
+        delayed (int): Requests that had to wait for a token.
+        total_wait_time (float): Accumulated seconds requests spent queued.
+    """
+
+    host: str
+    rate: float
+    capacity: float
+    acquisitions: int = Field(default=0)
+    delayed: int = Field(default=0)
+    total_wait_time: float = Field(default=0.0)
+
+    @computed_field
+    @property
+    def average_wait_time(self) -> float:
+        """Average seconds a request spent queued."""
+        return (
+            self.total_wait_time / self.acquisitions
+            if self.acquisitions
+            else 0.0
+        )
+
+
+class HostRateLimiter:
+    """
+    Token bucket pacing the requests sent to a single host. Every request takes
+    a token; tokens are refilled at `rate` per second up to `capacity`. Requests
+    arriving on an empty bucket reserve the next token and sleep until it is
+    refilled, so concurrent callers are served in arrival order.
+
+    The bucket state is guarded by a thread lock, so the same limiter can be
+    shared by scrapers running on different event loops.
+
+    Attributes:
+        host (str): The host paced by the limiter.
+        rate (float): Requests allowed per second.
+        capacity (float): Maximum burst of requests.
+    """
+
+    def __init__(self, host: str, rate: float, capacity: float):
+        self.host = host
+        self.rate = rate
+        self.capacity = capacity
+
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._acquisitions = 0
+        self._delayed = 0
+        self._total_wait_time = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def set_rate(self, rate: float, capacity: float):
+        """
+        Changes the pace of the limiter, keeping the tokens already refilled.
+
+        Args:
+            rate (float): Requests allowed per second.
+            capacity (float): Maximum burst of requests.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(self._tokens, capacity)
+
+    async def acquire(self) -> float:
+        """
+        Takes a token, waiting for it to be refilled if the bucket is empty.
+
+        Returns:
+            float: Seconds spent waiting for the token.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._acquisitions += 1
+            self._total_wait_time += wait
+            if wait:
+                self._delayed += 1
+
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> RateLimiterStats:
+        """
+        Returns a snapshot of the limiter usage.
+
+        Returns:
+            RateLimiterStats: The limiter statistics.
+        """
+        with self._lock:
+            return RateLimiterStats(
+                host=self.host,
+                rate=self.rate,
+                capacity=self.capacity,
+                acquisitions=self._acquisitions,
+                delayed=self._delayed,
+                total_wait_time=self._total_wait_time,
+            )
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide registry of rate limiters, one per host. A host with a robots.txt
+    crawl delay is paced to one request per delay; other hosts use the configured
+    default rate and burst.
+
+    Attributes:
+        limiters (Dict[str, HostRateLimiter]): Maps hosts to their limiters.
+    """
+
+    limiters: Dict[str, HostRateLimiter] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_pace(crawl_delay: float) -> tuple:
+        if crawl_delay and crawl_delay > 0:
+            return 1 / crawl_delay, 1
+        return RATE_LIMIT_DEFAULT_RATE, RATE_LIMIT_BURST
+
+    @classmethod
+    def get_limiter(cls, url: str, crawl_delay: float = 0) -> HostRateLimiter:
+        """
+        Returns the limiter of the URL host, creating it on first use and
+        updating its pace when the crawl delay changed.
+
+        Args:
+            url (str): Any URL of the host.
+            crawl_delay (float): The host crawl delay in seconds, 0 if none.
+
+        Returns:
+            HostRateLimiter: The host limiter.
+        """
+        host = urlparse(url).netloc
+        rate, capacity = cls._get_pace(crawl_delay)
+        with cls._lock:
+            limiter = cls.limiters.get(host)
+            if limiter is None:
+                limiter = HostRateLimiter(host, rate, capacity)
+                cls.limiters[host] = limiter
+        if (limiter.rate, limiter.capacity) != (rate, capacity):
+            limiter.set_rate(rate, capacity)
+        return limiter
+
+    @classmethod
+    def stats(cls) -> List[RateLimiterStats]:
+        """
+        Returns the statistics of every registered limiter.
+
+        Returns:
+            List[RateLimiterStats]: One snapshot per host.
+        """
+        return [limiter.stats() for limiter in list(cls.limiters.values())]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every registered limiter.
+        """
+        with cls._lock:
+            cls.limiters.clear()
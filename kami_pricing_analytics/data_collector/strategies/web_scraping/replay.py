@@ -0,0 +1,282 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from .page_archive import PageArchive
+
+logger = logging.getLogger('replay')
+
+MANIFEST_FILE = 'manifest.json'
+
+SCRIPT_PATTERN = re.compile(rb'<script\b[^>]*>.*?</script\s*>', re.S | re.I)
+
+REPLAY_CHUNK_SIZE = 16 * 1024
+
+
+def build_replay_url(replay_url: str, url: str) -> str:
+    """
+    Rewrites a marketplace URL to its path on a ReplayServer, keeping the host
+    in the path so a single server replays every marketplace.
+
+    Args:
+        replay_url (str): Base URL of the replay server.
+        url (str): The marketplace URL.
+
+    Returns:
+        str: The URL on the replay server.
+
+    Examples:
+        >>> build_replay_url('http://127.0.0.1:8000', 'https://www.amazon.com.br/dp/B0?th=1')
+        'http://127.0.0.1:8000/www.amazon.com.br/dp/B0?th=1'
+    """
+    parsed_url = urlparse(url)
+    replay_path = f'/{parsed_url.netloc}{parsed_url.path or "/"}'
+    if parsed_url.query:
+        replay_path = f'{replay_path}?{parsed_url.query}'
+    return f'{replay_url.rstrip("/")}{replay_path}'
+
+
+def parse_replay_path(replay_path: str) -> str:
+    """
+    Recovers the marketplace URL of a replay server path.
+
+    Args:
+        replay_path (str): Path and query of a request to the replay server.
+
+    Returns:
+        str: The marketplace URL.
+
+    Examples:
+        >>> parse_replay_path('/www.amazon.com.br/dp/B0?th=1')
+        'https://www.amazon.com.br/dp/B0?th=1'
+    """
+    return f'https://{replay_path.lstrip("/")}'
+
+
+def _normalize_url(url: str) -> str:
+    parsed_url = urlparse(url)
+    normalized = f'{parsed_url.netloc}{parsed_url.path or "/"}'
+    if parsed_url.query:
+        normalized = f'{normalized}?{parsed_url.query}'
+    return normalized
+
+
+class ReplayFixtures:
+    """
+    Directory of recorded marketplace responses, replayed by the ReplayServer.
+    Each response body is kept in its own file, and `manifest.json` maps the
+    recorded URLs to their files and content types. URLs are matched without
+    their scheme and fragment.
+
+    Attributes:
+        directory (str): Directory of the fixtures.
+        entries (Dict[str, Dict]): Maps normalized URLs to their file and content type.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as manifest_file:
+                self.entries = json.load(manifest_file)
+
+    def add(
+        self,
+        url: str,
+        content: Union[str, bytes],
+        content_type: str = 'text/html; charset=utf-8',
+    ):
+        """
+        Records the response of a URL, replacing any previous recording.
+
+        Args:
+            url (str): The marketplace URL.
+            content (Union[str, bytes]): The response body, text is encoded as UTF-8.
+            content_type (str): The response content type.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        key = _normalize_url(url)
+        file_name = f'{hashlib.sha256(key.encode()).hexdigest()[:32]}.body'
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, file_name), 'wb') as body:
+            body.write(content)
+        with self._lock:
+            self.entries[key] = {
+                'url': url,
+                'file': file_name,
+                'content_type': content_type,
+            }
+
+    def get(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Returns the recorded response of a URL.
+
+        Args:
+            url (str): The marketplace URL.
+
+        Returns:
+            Optional[Tuple[bytes, str]]: The response body and content type, or None if the URL was not recorded.
+        """
+        entry = self.entries.get(_normalize_url(url))
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, entry['file']), 'rb') as body:
+            return body.read(), entry['content_type']
+
+    def save(self):
+        """
+        Writes the manifest of the recorded responses.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            with open(
+                os.path.join(self.directory, MANIFEST_FILE), 'w'
+            ) as manifest_file:
+                json.dump(self.entries, manifest_file, indent=2)
+
+    @classmethod
+    def from_archive(
+        cls,
+        archive: PageArchive,
+        directory: str,
+        marketplace: str = None,
+        product_id: str = None,
+    ) -> 'ReplayFixtures':
+        """
+        Records the pages of a PageArchive as fixtures, keeping the latest fetch
+        of every URL, such as the Amazon product page captured once its offers
+        list was opened.
+
+        Args:
+            archive (PageArchive): The archive the scrapers recorded to.
+            directory (str): Directory of the fixtures.
+            marketplace (str): Only pages of this marketplace.
+            product_id (str): Only pages of this product.
+
+        Returns:
+            ReplayFixtures: The saved fixtures.
+        """
+        fixtures = cls(directory)
+        for page in archive.find(
+            marketplace=marketplace, product_id=product_id
+        ):
+            fixtures.add(page.url, archive.read(page.content_hash))
+        fixtures.save()
+        return fixtures
+
+
+class ReplayServer:
+    """
+    Local HTTP server replaying ReplayFixtures to the scrapers, so collectors
+    run offline with reproducible timings. Requests are served at
+    `/<host>/<path>`, as built by `build_replay_url`; unknown URLs get a 404.
+
+    Every response is delayed by `latency` seconds and, when `bandwidth` is set,
+    streamed at that many bytes per second. Scripts are stripped from the
+    recorded pages by default, since they are snapshots of the rendered DOM and
+    live scripts would reach the real marketplaces.
+
+    Attributes:
+        fixtures (ReplayFixtures): The recorded responses.
+        latency (float): Seconds added before every response.
+        bandwidth (int): Bytes per second of the responses, 0 for no limit.
+        strip_scripts (bool): Whether to remove the scripts of HTML responses.
+        requests (int): Number of requests served.
+    """
+
+    def __init__(
+        self,
+        fixtures: ReplayFixtures,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        bandwidth: int = 0,
+        strip_scripts: bool = True,
+    ):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.strip_scripts = strip_scripts
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._build_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, to be given to the scrapers."""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _build_handler(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                recorded = server.fixtures.get(parse_replay_path(self.path))
+                if server.latency:
+                    time.sleep(server.latency)
+                if recorded is None:
+                    self.send_error(404)
+                    return
+                body, content_type = recorded
+                if server.strip_scripts and 'html' in content_type:
+                    body = SCRIPT_PATTERN.sub(b'', body)
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                server._write(self.wfile, body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return ReplayHandler
+
+    def _write(self, wfile, body: bytes):
+        if not self.bandwidth:
+            wfile.write(body)
+            return
+        for start in range(0, len(body), REPLAY_CHUNK_SIZE):
+            chunk = body[start : start + REPLAY_CHUNK_SIZE]
+            wfile.write(chunk)
+            time.sleep(len(chunk) / self.bandwidth)
+
+    def start(self) -> 'ReplayServer':
+        """
+        Starts serving on a background thread.
+
+        Returns:
+            ReplayServer: The running server.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving and releases the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+from robotexclusionrulesparser import RobotExclusionRulesParser as Robots
+
+from .constants import (
+    DEFAULT_CRAWL_DELAY,
+    DEFAULT_USER_AGENT,
+    ROBOTS_CACHE_TTL,
+    ROBOTS_ERROR_TTL,
+)
+from .http_client import HttpClientRegistry, build_http_client
+
+logger = logging.getLogger('robots-cache')
+
+RobotsFetcher = Callable[[str], Awaitable[httpx.Response]]
+
+
+class RobotsEntry(BaseModel):
+    """
+    Parsed robots.txt of a host.
+
+    Attributes:
+        host (str): The host the rules apply to.
+        rules (Robots): The parsed robots.txt rules.
+        fetched_at (float): Monotonic timestamp of the last successful fetch.
+        expires_at (float): Monotonic timestamp after which the rules are refreshed.
+        stale (bool): Whether the last refresh failed and older rules are being served.
+    """
+
+    host: str
+    rules: Robots
+    fetched_at: float = Field(default=0.0)
+    expires_at: float = Field(default=0.0)
+    stale: bool = Field(default=False)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+async def fetch_robots(robots_url: str) -> httpx.Response:
+    """
+    Downloads a robots.txt file with the shared client of its host, or with a
+    short-lived client when the HttpClientRegistry is not started.
+
+    Args:
+        robots_url (str): URL of the robots.txt file.
+
+    Returns:
+        httpx.Response: The HTTP response.
+    """
+    client = HttpClientRegistry.get_client(robots_url)
+    if client is not None:
+        return await client.get(robots_url)
+    async with build_http_client() as client:
+        return await client.get(robots_url)
+
+
+class RobotsCache:
+    """
+    Process-wide cache of parsed robots.txt files, keyed by host. Rules are kept
+    for `ttl` seconds; when a refresh fails the previous rules keep being served
+    and the refresh is retried after `error_ttl` seconds. When the first fetch
+    of a host fails the error is raised, and permissive rules are served until
+    the fetch is retried after `error_ttl` seconds.
+
+    Attributes:
+        entries (Dict[str, RobotsEntry]): Maps hosts to their parsed rules.
+        ttl (float): Seconds a successfully fetched robots.txt is kept.
+        error_ttl (float): Seconds before a failed fetch is retried.
+    """
+
+    entries: Dict[str, RobotsEntry] = {}
+    ttl: float = ROBOTS_CACHE_TTL
+    error_ttl: float = ROBOTS_ERROR_TTL
+    _locks: Dict[str, asyncio.Lock] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return urlparse(url).netloc
+
+    @staticmethod
+    def _get_robots_url(url: str) -> str:
+        parsed_url = urlparse(url)
+        return f'{parsed_url.scheme}://{parsed_url.netloc}/robots.txt'
+
+    @classmethod
+    def _get_host_lock(cls, host: str) -> asyncio.Lock:
+        with cls._lock:
+            lock = cls._locks.get(host)
+            if lock is None:
+                lock = asyncio.Lock()
+                cls._locks[host] = lock
+        return lock
+
+    @classmethod
+    async def _refresh(
+        cls, host: str, robots_url: str, fetch: RobotsFetcher
+    ) -> RobotsEntry:
+        now = time.monotonic()
+        cached = cls.entries.get(host)
+        try:
+            response = await fetch(robots_url)
+            if response.status_code >= 500:
+                raise httpx.HTTPStatusError(
+                    f'Server error {response.status_code}',
+                    request=response.request,
+                    response=response,
+                )
+            rules = Robots()
+            if response.status_code < 400:
+                rules.parse(response.text)
+            entry = RobotsEntry(
+                host=host,
+                rules=rules,
+                fetched_at=now,
+                expires_at=now + cls.ttl,
+            )
+        except Exception as e:
+            logger.warning(f'Error while fetching {robots_url}: {e}')
+            if cached is None:
+                cls.entries[host] = RobotsEntry(
+                    host=host,
+                    rules=Robots(),
+                    expires_at=now + cls.error_ttl,
+                    stale=True,
+                )
+                raise
+            entry = cached.model_copy(
+                update={'expires_at': now + cls.error_ttl, 'stale': True}
+            )
+        cls.entries[host] = entry
+        return entry
+
+    @classmethod
+    async def get_entry(
+        cls, url: str, fetch: Optional[RobotsFetcher] = None
+    ) -> RobotsEntry:
+        """
+        Returns the cached robots.txt rules of the URL host, fetching them when
+        missing or expired. Concurrent callers for the same host share a single
+        fetch.
+
+        Args:
+            url (str): Any URL of the host.
+            fetch (Optional[RobotsFetcher]): Coroutine function downloading the robots.txt URL. Defaults to `fetch_robots`.
+
+        Returns:
+            RobotsEntry: The host rules.
+
+        Raises:
+            Exception: If the first fetch of the host fails.
+        """
+        host = cls._get_host(url)
+        entry = cls.entries.get(host)
+        if entry is not None and not entry.expired:
+            return entry
+
+        async with cls._get_host_lock(host):
+            entry = cls.entries.get(host)
+            if entry is not None and not entry.expired:
+                return entry
+            return await cls._refresh(
+                host, cls._get_robots_url(url), fetch or fetch_robots
+            )
+
+    @classmethod
+    async def get_crawl_delay(
+        cls,
+        url: str,
+        user_agent: str = DEFAULT_USER_AGENT,
+        fetch: Optional[RobotsFetcher] = None,
+    ) -> float:
+        """
+        Returns the crawl delay of the URL host for the user agent.
+
+        Args:
+            url (str): Any URL of the host.
+            user_agent (str): The user agent to check.
+            fetch (Optional[RobotsFetcher]): Coroutine function downloading the robots.txt URL.
+
+        Returns:
+            float: The crawl delay in seconds, or DEFAULT_CRAWL_DELAY if none is defined.
+        """
+        entry = await cls.get_entry(url, fetch)
+        delay = entry.rules.get_crawl_delay(user_agent)
+        return delay if delay is not None else DEFAULT_CRAWL_DELAY
+
+    @classmethod
+    async def is_allowed(
+        cls,
+        url: str,
+        user_agent: str = DEFAULT_USER_AGENT,
+        fetch: Optional[RobotsFetcher] = None,
+    ) -> bool:
+        """
+        Checks whether the user agent may fetch the URL. Once the host rules are
+        cached the check does not touch the network.
+
+        Args:
+            url (str): The URL to check.
+            user_agent (str): The user agent to check.
+            fetch (Optional[RobotsFetcher]): Coroutine function downloading the robots.txt URL.
+
+        Returns:
+            bool: True if robots.txt allows the URL.
+        """
+        entry = await cls.get_entry(url, fetch)
+        return entry.rules.is_allowed(user_agent, url)
+
+    @classmethod
+    async def warm_up(cls, urls: List[str]):
+        """
+        Fetches the robots.txt of the given hosts concurrently. Failures are
+        cached like in any other fetch and never raised.
+
+        Args:
+            urls (List[str]): Any URL of each host.
+        """
+        await asyncio.gather(
+            *(cls.get_entry(url) for url in urls), return_exceptions=True
+        )
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops every cached entry.
+        """
+        with cls._lock:
+            cls.entries.clear()
+            cls._locks.clear()
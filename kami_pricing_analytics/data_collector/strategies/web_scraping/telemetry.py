@@ -0,0 +1,139 @@
+import asyncio
+from typing import Dict, List, Optional, Union
+
+import httpx
+from pydantic import BaseModel, Field
+from selenium.common.exceptions import TimeoutException
+
+TIMEOUT_ERRORS = (
+    TimeoutError,
+    asyncio.TimeoutError,
+    httpx.TimeoutException,
+    TimeoutException,
+)
+
+
+class ScrapeTelemetry(BaseModel):
+    """
+    Per-scrape execution report, reset at the beginning of every scrape.
+
+    Attributes:
+        pages_loaded (int): Number of pages loaded by the WebDriver.
+        pages_archived (int): Number of fetched pages stored in the page archive.
+        rate_limit_wait (float): Seconds requests spent queued by the per-host rate limiters.
+        selector_waits (Dict[str, float]): Seconds spent waiting for each awaited selector.
+        field_costs (Dict[str, float]): Seconds spent reading each field of the compiled extractors, keyed by '<extractor>.<field>'.
+        failures (List[Dict]): Steps that failed without aborting the scrape, each with the step name, the target and the error message.
+        fetch_attempts (List[Dict]): HTTP fetch attempts, each with the URL, the attempt number, whether it was hedged, the response status or the error and the seconds it took.
+        retries (int): Retries and hedged requests sent, spent from the retry budget of the research.
+        title_matches (List[Dict]): Search results accepted by the title matching, each with the listing URL, its title and its score.
+        error (Optional[str]): The error that aborted the scrape, None if it completed.
+        timed_out (bool): Whether the scrape was aborted by a timeout.
+    """
+
+    pages_loaded: int = Field(default=0)
+    pages_archived: int = Field(default=0)
+    rate_limit_wait: float = Field(default=0.0)
+    selector_waits: Dict[str, float] = Field(default_factory=dict)
+    field_costs: Dict[str, float] = Field(default_factory=dict)
+    failures: List[Dict] = Field(default_factory=list)
+    fetch_attempts: List[Dict] = Field(default_factory=list)
+    retries: int = Field(default=0)
+    title_matches: List[Dict] = Field(default_factory=list)
+    error: Optional[str] = Field(default=None)
+    timed_out: bool = Field(default=False)
+
+    def record_failure(
+        self, step: str, target: str, error: Union[Exception, str]
+    ):
+        """
+        Records a failure that did not abort the scrape.
+
+        Args:
+            step (str): The scraping step that failed.
+            target (str): The URL or identifier being processed.
+            error (Union[Exception, str]): The error raised or a description of it.
+        """
+        self.failures.append(
+            {'step': step, 'target': str(target), 'error': str(error)}
+        )
+
+    def record_attempt(
+        self,
+        url: str,
+        attempt: int,
+        seconds: float,
+        status: Optional[int] = None,
+        error: Optional[Union[Exception, str]] = None,
+        hedged: bool = False,
+    ):
+        """
+        Records an HTTP fetch attempt.
+
+        Args:
+            url (str): The fetched URL.
+            attempt (int): Number of the attempt, starting at 1.
+            seconds (float): Seconds the attempt took.
+            status (Optional[int]): The response status, None if no response was received.
+            error (Optional[Union[Exception, str]]): The error raised by the attempt, if any.
+            hedged (bool): Whether the attempt was a hedged request.
+        """
+        self.fetch_attempts.append(
+            {
+                'url': str(url),
+                'attempt': attempt,
+                'hedged': hedged,
+                'status': status,
+                'error': (str(error) or type(error).__name__)
+                if error is not None
+                else None,
+                'seconds': seconds,
+            }
+        )
+
+    def record_title_match(self, target: str, title: str, score: float):
+        """
+        Records a search result accepted by the title matching.
+
+        Args:
+            target (str): The URL of the listing.
+            title (str): The title of the listing.
+            score (float): The similarity of the title to the product title.
+        """
+        self.title_matches.append(
+            {'target': str(target), 'title': title, 'score': round(score, 4)}
+        )
+
+    def record_error(self, error: Exception):
+        """
+        Records the error that aborted the scrape.
+
+        Args:
+            error (Exception): The error raised.
+        """
+        self.error = str(error) or type(error).__name__
+        self.timed_out = isinstance(error, TIMEOUT_ERRORS)
+
+    def record_wait(self, selector: str, wait: float):
+        """
+        Accounts the time spent waiting for a selector.
+
+        Args:
+            selector (str): The awaited selector.
+            wait (float): Seconds spent waiting.
+        """
+        self.selector_waits[selector] = (
+            self.selector_waits.get(selector, 0.0) + wait
+        )
+
+    def record_extraction(self, extractor: str, timings: Dict[str, float]):
+        """
+        Accounts the time spent reading the fields of an extractor.
+
+        Args:
+            extractor (str): Name of the extraction spec.
+            timings (Dict[str, float]): Seconds spent reading each field.
+        """
+        for field, seconds in timings.items():
+            key = f'{extractor}.{field}'
+            self.field_costs[key] = self.field_costs.get(key, 0.0) + seconds
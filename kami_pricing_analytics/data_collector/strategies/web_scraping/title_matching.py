@@ -0,0 +1,185 @@
+import re
+import unicodedata
+from typing import Dict, List
+
+import numpy as np
+from pydantic import BaseModel
+
+from .constants import TITLE_MATCH_THRESHOLD
+
+
+def _build_title_translation() -> Dict[int, str]:
+    """
+    Builds the translation table of the title normalisation over the Latin
+    script: accented letters are folded to their base letter and punctuation is
+    turned into spaces. Other characters are left unchanged, symbols and
+    punctuation beyond the table being removed by `NON_WORD_PATTERN`.
+
+    Returns:
+        Dict[int, str]: The translation table, for `str.translate`.
+    """
+    table = {}
+    for codepoint in range(0x250):
+        char = chr(codepoint)
+        if char.isspace():
+            continue
+        if not char.isalnum():
+            table[codepoint] = ' '
+            continue
+        folded = ''.join(
+            c
+            for c in unicodedata.normalize('NFKD', char)
+            if not unicodedata.combining(c)
+        )
+        if folded and folded != char:
+            table[codepoint] = folded
+    return table
+
+
+TITLE_TRANSLATION = _build_title_translation()
+
+NON_WORD_PATTERN = re.compile(r'[^\w\s]|_')
+
+QUANTITY_UNIT_PATTERN = re.compile(
+    r'(?<=\d)\s+(?=(?:ml|l|g|kg|mg|oz|cm|mm|un)\b)'
+)
+
+
+class TitleMatch(BaseModel):
+    """
+    A candidate title matching the reference title.
+
+    Attributes:
+        index (int): The position of the candidate in the scored titles.
+        title (str): The candidate title.
+        score (float): The similarity to the reference title, from 0 to 1.
+    """
+
+    index: int
+    title: str
+    score: float
+
+
+class TitleMatcher:
+    """
+    Matches candidate titles, such as the listings of a search result page,
+    against a reference product title.
+
+    Titles are lowercased, folded with a precompiled translation table and split
+    into tokens, quantities being joined to their unit. A batch of candidates is
+    scored at once with a weighted Tversky similarity over a token matrix: every
+    token weighs its inverse document frequency in the batch, so tokens shared
+    by every listing weigh less than the ones telling listings apart, and tokens
+    of the reference missing from a candidate cost more than extra candidate
+    tokens, such as "original" or "envio rapido". Identical token sets score 1.
+
+    Attributes:
+        reference (List[str]): The tokens of the reference title.
+        threshold (float): Minimum score of a matching candidate.
+        missing_weight (float): Cost of the reference tokens missing from a candidate.
+        extra_weight (float): Cost of the candidate tokens missing from the reference.
+    """
+
+    def __init__(
+        self,
+        reference: str,
+        threshold: float = TITLE_MATCH_THRESHOLD,
+        missing_weight: float = 1.0,
+        extra_weight: float = 0.5,
+    ):
+        self.reference = self.tokenize(reference)
+        self.threshold = threshold
+        self.missing_weight = missing_weight
+        self.extra_weight = extra_weight
+
+    @staticmethod
+    def tokenize(title: str) -> List[str]:
+        """
+        Normalises a title and splits it into distinct tokens, in order.
+        Punctuation and symbols, such as dashes, quotes and trademark signs,
+        are dropped. Quantities are joined to their unit, so "300 ml" and
+        "300ml" match.
+
+        Args:
+            title (str): The title to normalise.
+
+        Returns:
+            List[str]: The distinct tokens of the title.
+
+        Examples:
+            >>> TitleMatcher.tokenize('Shampoo Hidratação - 300 ml, Shampoo!')
+            ['shampoo', 'hidratacao', '300ml']
+        """
+        title = (title or '').lower().translate(TITLE_TRANSLATION)
+        title = NON_WORD_PATTERN.sub(' ', title)
+        tokens = QUANTITY_UNIT_PATTERN.sub('', title).split()
+        return list(dict.fromkeys(tokens))
+
+    def score(self, titles: List[str]) -> np.ndarray:
+        """
+        Scores candidate titles against the reference title.
+
+        Args:
+            titles (List[str]): The candidate titles.
+
+        Returns:
+            np.ndarray: The similarity of every candidate, from 0 to 1.
+
+        Examples:
+            >>> matcher = TitleMatcher('Shampoo Anticaspa 300ml')
+            >>> matcher.score(['shampoo anticaspa 300ML', 'Shampoo 1L']).round(2).tolist()
+            [1.0, 0.23]
+        """
+        if not titles:
+            return np.zeros(0)
+
+        vocabulary = {
+            token: column for column, token in enumerate(self.reference)
+        }
+        rows, columns = [], []
+        for row, title in enumerate(titles):
+            for token in self.tokenize(title):
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        candidates = np.zeros((len(titles), len(vocabulary)), dtype=bool)
+        candidates[rows, columns] = True
+        reference = np.zeros(len(vocabulary), dtype=bool)
+        reference[: len(self.reference)] = True
+
+        documents = len(titles) + 1
+        frequencies = candidates.sum(axis=0) + reference
+        weights = np.log((1 + documents) / (1 + frequencies)) + 1
+
+        intersection = (candidates & reference) @ weights
+        missing = (~candidates & reference) @ weights
+        extra = (candidates & ~reference) @ weights
+        total = (
+            intersection
+            + self.missing_weight * missing
+            + self.extra_weight * extra
+        )
+        return np.divide(
+            intersection,
+            total,
+            out=np.zeros(len(titles)),
+            where=total > 0,
+        )
+
+    def match(self, titles: List[str]) -> List[TitleMatch]:
+        """
+        Returns the candidate titles scoring at least the threshold.
+
+        Args:
+            titles (List[str]): The candidate titles.
+
+        Returns:
+            List[TitleMatch]: The matching candidates, in the order of `titles`.
+        """
+        scores = self.score(titles)
+        return [
+            TitleMatch(
+                index=index, title=titles[index] or '', score=scores[index]
+            )
+            for index in np.flatnonzero(scores >= self.threshold).tolist()
+        ]
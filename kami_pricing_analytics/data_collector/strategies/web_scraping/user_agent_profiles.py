@@ -0,0 +1,216 @@
+"""
+Scores the user agents of a marketplace and saves its profile, loaded by the
+scrapers at startup.
+
+Usage:
+    python -m kami_pricing_analytics.data_collector.strategies.web_scraping.user_agent_profiles
+        MARKETPLACE URL [--threshold SIMILARITY]
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from .constants import (
+    UA_MIN_SCORE,
+    UA_PROFILES_PATH,
+    UA_SIMILARITY_THRESHOLD,
+    USER_AGENTS,
+)
+from .utils import (
+    MinHasher,
+    estimate_similarity,
+    fetch_user_agent_contents,
+    group_signatures,
+    shingle,
+)
+
+logger = logging.getLogger('user-agent-profiles')
+
+
+class UserAgentProfile(BaseModel):
+    """
+    Scores of the user agents of a marketplace. A user agent scores the
+    estimated similarity of the page it received to the most complete page
+    received by any of them, so agents served block pages, captchas or stripped
+    down layouts score low; agents whose request failed score 0.
+
+    Attributes:
+        marketplace (str): The marketplace the user agents were scored on.
+        url (str): The page fetched to score them.
+        threshold (float): The similarity used to group the user agents.
+        scored_at (datetime): When the user agents were scored.
+        groups (List[List[str]]): User agents that received similar pages.
+        scores (Dict[str, float]): Maps user agents to their scores.
+    """
+
+    marketplace: str
+    url: str
+    threshold: float = Field(default=UA_SIMILARITY_THRESHOLD)
+    scored_at: datetime = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc)
+    )
+    groups: List[List[str]] = Field(default_factory=list)
+    scores: Dict[str, float] = Field(default_factory=dict)
+
+    def select(self, min_score: float = UA_MIN_SCORE) -> List[str]:
+        """
+        Returns the user agents scoring at least `min_score`, best first.
+
+        Args:
+            min_score (float): The minimum score.
+
+        Returns:
+            List[str]: The selected user agents.
+        """
+        return sorted(
+            (
+                user_agent
+                for user_agent, score in self.scores.items()
+                if score >= min_score
+            ),
+            key=lambda user_agent: -self.scores[user_agent],
+        )
+
+
+async def score_user_agents(
+    marketplace: str,
+    url: str,
+    user_agents: List[str] = USER_AGENTS,
+    threshold: float = UA_SIMILARITY_THRESHOLD,
+    client: httpx.AsyncClient = None,
+) -> UserAgentProfile:
+    """
+    Fetches a marketplace page once per user agent, concurrently, and scores
+    every user agent against the most complete page received.
+
+    Args:
+        marketplace (str): The marketplace the page belongs to.
+        url (str): The page to fetch, such as a product page.
+        user_agents (List[str]): The user agents to score.
+        threshold (float): The similarity to group two user agents together.
+        client (httpx.AsyncClient): Client to send the requests with.
+
+    Returns:
+        UserAgentProfile: The marketplace profile.
+    """
+    responses = await fetch_user_agent_contents(user_agents, url, client)
+    hasher = MinHasher()
+    signatures = {}
+    sizes = {}
+    for user_agent, response in responses.items():
+        if response is None or not response.is_success:
+            continue
+        content = response.text.strip()
+        signatures[user_agent] = hasher.signature(content)
+        sizes[user_agent] = shingle(content, hasher.shingle_size).size
+
+    scores = dict.fromkeys(user_agents, 0.0)
+    if signatures:
+        reference = signatures[max(sizes, key=sizes.get)]
+        for user_agent, signature in signatures.items():
+            scores[user_agent] = estimate_similarity(signature, reference)
+
+    return UserAgentProfile(
+        marketplace=marketplace,
+        url=url,
+        threshold=threshold,
+        groups=group_signatures(signatures, threshold),
+        scores=scores,
+    )
+
+
+def _get_profile_path(marketplace: str, directory: str = UA_PROFILES_PATH):
+    return os.path.join(directory, f'{marketplace}.json')
+
+
+def save_profile(profile: UserAgentProfile, directory: str = UA_PROFILES_PATH):
+    """
+    Saves a marketplace profile, replacing the previous one.
+
+    Args:
+        profile (UserAgentProfile): The profile to save.
+        directory (str): Directory of the profiles.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(_get_profile_path(profile.marketplace, directory), 'w') as file:
+        file.write(profile.model_dump_json(indent=2))
+    load_profile.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def load_profile(
+    marketplace: str, directory: str = UA_PROFILES_PATH
+) -> Optional[UserAgentProfile]:
+    """
+    Loads the profile of a marketplace, once per process.
+
+    Args:
+        marketplace (str): The marketplace name.
+        directory (str): Directory of the profiles.
+
+    Returns:
+        Optional[UserAgentProfile]: The profile, or None if the marketplace was not scored or its profile cannot be read.
+    """
+    profile_path = _get_profile_path(marketplace, directory)
+    if not marketplace or not os.path.exists(profile_path):
+        return None
+    try:
+        with open(profile_path) as file:
+            return UserAgentProfile(**json.load(file))
+    except Exception as e:
+        logger.error(f'Error while loading user agent profile: {e}')
+        return None
+
+
+def load_user_agents(
+    marketplace: str,
+    fallback: List[str] = USER_AGENTS,
+    min_score: float = UA_MIN_SCORE,
+    directory: str = UA_PROFILES_PATH,
+) -> List[str]:
+    """
+    Returns the user agents of a marketplace scoring at least `min_score`.
+
+    Args:
+        marketplace (str): The marketplace name.
+        fallback (List[str]): User agents used when the marketplace was not scored or none of its user agents qualifies.
+        min_score (float): The minimum score.
+        directory (str): Directory of the profiles.
+
+    Returns:
+        List[str]: The user agents of the marketplace scrapers.
+    """
+    profile = load_profile(marketplace, directory)
+    user_agents = profile.select(min_score) if profile else []
+    return user_agents or list(fallback)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('marketplace')
+    parser.add_argument('url')
+    parser.add_argument(
+        '--threshold', type=float, default=UA_SIMILARITY_THRESHOLD
+    )
+    args = parser.parse_args()
+
+    profile = asyncio.run(
+        score_user_agents(args.marketplace, args.url, threshold=args.threshold)
+    )
+    save_profile(profile)
+    for user_agent in sorted(profile.scores, key=profile.scores.get):
+        print(f'{profile.scores[user_agent]:>6.2f}  {user_agent}')
+    print(f'{len(profile.groups)} groups, profile saved to {UA_PROFILES_PATH}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,21 @@
-import itertools
+import asyncio
+import zlib
 from collections import defaultdict
+from typing import Dict, List, Optional
 
-import requests
+import httpx
+import numpy as np
+
+from .constants import (
+    UA_FETCH_CONCURRENCY,
+    UA_LSH_BANDS,
+    UA_MINHASH_PERMUTATIONS,
+    UA_SHINGLE_SIZE,
+)
+from .http_client import HttpClientRegistry, build_http_client
+from .rate_limiter import RateLimiterRegistry
+
+MINHASH_PRIME = (1 << 31) - 1
 
 
 def jaccard_similarity(content1, content2):
@@ -13,84 +27,241 @@ def jaccard_similarity(content1, content2):
     return len(intersection) / len(union) if union else 0
 
 
-def group_user_agents_by_content_similarity(user_agents, url, threshold=0.8):
+def shingle(content: str, size: int = UA_SHINGLE_SIZE) -> np.ndarray:
     """
-    Makes HTTP requests to the given URL with different user agents and groups them
-    based on the similarity of the HTML content returned.
+    Hashes the distinct word n-grams of a content.
+
+    Args:
+        content (str): The content to shingle.
+        size (int): Number of words per shingle.
+
+    Returns:
+        np.ndarray: The distinct shingle hashes, as unsigned integers below `MINHASH_PRIME`.
+    """
+    tokens = content.split()
+    if len(tokens) < size:
+        tokens = [' '.join(tokens)] if tokens else []
+        size = 1
+    hashes = {
+        zlib.crc32(' '.join(tokens[index : index + size]).encode())
+        % MINHASH_PRIME
+        for index in range(len(tokens) - size + 1)
+    }
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures, whose agreement ratio estimates the Jaccard
+    similarity of the shingle sets of two contents without comparing them.
+
+    Attributes:
+        permutations (int): Length of the signatures.
+        shingle_size (int): Number of words per shingle.
+    """
+
+    def __init__(
+        self,
+        permutations: int = UA_MINHASH_PERMUTATIONS,
+        shingle_size: int = UA_SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        self.permutations = permutations
+        self.shingle_size = shingle_size
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(
+            1, MINHASH_PRIME, size=permutations, dtype=np.uint64
+        )
+        self._b = generator.integers(
+            0, MINHASH_PRIME, size=permutations, dtype=np.uint64
+        )
+
+    def signature(self, content: str) -> np.ndarray:
+        """
+        Computes the signature of a content.
+
+        Args:
+            content (str): The content to sign.
+
+        Returns:
+            np.ndarray: The MinHash signature.
+        """
+        shingles = shingle(content, self.shingle_size)
+        if not shingles.size:
+            return np.full(self.permutations, MINHASH_PRIME, dtype=np.uint64)
+        hashes = (
+            self._a[:, None] * shingles[None, :] + self._b[:, None]
+        ) % MINHASH_PRIME
+        return hashes.min(axis=1)
+
+
+def estimate_similarity(
+    signature1: np.ndarray, signature2: np.ndarray
+) -> float:
+    """
+    Estimates the Jaccard similarity of two contents from their signatures.
+
+    Args:
+        signature1 (np.ndarray): Signature of the first content.
+        signature2 (np.ndarray): Signature of the second content.
+
+    Returns:
+        float: The estimated similarity, between 0 and 1.
+
+    Examples:
+        >>> hasher = MinHasher()
+        >>> page = 'price 29 90 seller beleza na web store add to cart'
+        >>> estimate_similarity(hasher.signature(page), hasher.signature(page))
+        1.0
+    """
+    return float(np.mean(signature1 == signature2))
+
+
+def group_signatures(
+    signatures: Dict[str, np.ndarray],
+    threshold: float,
+    bands: int = UA_LSH_BANDS,
+) -> List[List[str]]:
+    """
+    Groups keys whose signatures are similar. Locality-sensitive hashing splits
+    every signature in bands, so only keys sharing a band are compared; pairs
+    over the threshold are merged into the same group.
+
+    Args:
+        signatures (Dict[str, np.ndarray]): Maps keys to their signatures.
+        threshold (float): The estimated similarity to consider two keys alike.
+        bands (int): Number of bands the signatures are split in.
+
+    Returns:
+        List[List[str]]: The groups of keys, in the order the keys were given.
+    """
+    keys = list(signatures)
+    parents = {key: key for key in keys}
+
+    def find(key):
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    buckets = defaultdict(list)
+    for key, signature in signatures.items():
+        for band, rows in enumerate(np.array_split(signature, bands)):
+            buckets[(band, rows.tobytes())].append(key)
+
+    compared = set()
+    for bucket in buckets.values():
+        for index, key1 in enumerate(bucket):
+            for key2 in bucket[index + 1 :]:
+                pair = (key1, key2)
+                if pair in compared:
+                    continue
+                compared.add(pair)
+                if (
+                    estimate_similarity(signatures[key1], signatures[key2])
+                    >= threshold
+                ):
+                    parents[find(key2)] = find(key1)
+
+    groups = defaultdict(list)
+    for key in keys:
+        groups[find(key)].append(key)
+    return list(groups.values())
+
+
+async def fetch_user_agent_contents(
+    user_agents: List[str],
+    url: str,
+    client: httpx.AsyncClient = None,
+    concurrency: int = UA_FETCH_CONCURRENCY,
+) -> Dict[str, Optional[httpx.Response]]:
+    """
+    Fetches a URL once per user agent, concurrently, through the shared client
+    of the host and paced by its rate limiter.
+
+    Args:
+        user_agents (List[str]): The user agents to fetch the URL with.
+        url (str): The target URL.
+        client (httpx.AsyncClient): Client to send the requests with. Defaults to the shared client of the host, or a short-lived one.
+        concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        Dict[str, Optional[httpx.Response]]: Maps user agents to their responses, or None when the request failed.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiterRegistry.get_limiter(url)
+
+    async def fetch(http_client, user_agent):
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                return await http_client.get(
+                    url, headers={'User-Agent': user_agent}
+                )
+            except httpx.HTTPError:
+                return None
+
+    async def fetch_all(http_client):
+        responses = await asyncio.gather(
+            *(fetch(http_client, user_agent) for user_agent in user_agents)
+        )
+        return dict(zip(user_agents, responses))
+
+    client = client or HttpClientRegistry.get_client(url)
+    if client is not None:
+        return await fetch_all(client)
+    async with build_http_client() as http_client:
+        return await fetch_all(http_client)
+
+
+async def group_user_agents_by_content_similarity(
+    user_agents, url, threshold=0.8, client=None
+):
+    """
+    Makes concurrent HTTP requests to the given URL with different user agents and
+    groups them based on the similarity of the HTML content returned, estimated
+    with MinHash signatures.
 
     Args:
         user_agents (list): A list of user agent strings to test.
         url (str): The target URL from which to fetch content.
         threshold (float): The similarity threshold to consider two contents as similar.
+        client (httpx.AsyncClient): Client to send the requests with.
 
     Returns:
         list: A list of lists, where each sublist contains user agents that received
-        similar HTML content based on the defined threshold.
+        similar HTML content based on the defined threshold. User agents whose
+        request failed are left out.
     """
-    responses = {}
+    responses = await fetch_user_agent_contents(user_agents, url, client)
+    hasher = MinHasher()
+    signatures = {
+        user_agent: hasher.signature(response.text.strip())
+        for user_agent, response in responses.items()
+        if response is not None
+    }
+    return group_signatures(signatures, threshold)
 
-    # Fetch the HTML content for each user agent and store it
-    for ua in user_agents:
-        headers = {'User-Agent': ua}
-        response = requests.get(url, headers=headers)
-        content = response.text.strip()
-        responses[ua] = content
 
-    # Calculate similarity between all pairs of content
-    compared = set()
-    groups = []
-    for ua1, ua2 in itertools.combinations(responses.keys(), 2):
-        pair = frozenset([ua1, ua2])
-        if pair not in compared:
-            compared.add(pair)
-            if jaccard_similarity(responses[ua1], responses[ua2]) >= threshold:
-                # Merge groups containing ua1 or ua2
-                merged_group = {ua1, ua2}
-                groups_to_merge = []
-                for group in groups:
-                    if ua1 in group or ua2 in group:
-                        merged_group.update(group)
-                        groups_to_merge.append(group)
-                for group in groups_to_merge:
-                    groups.remove(group)
-                groups.append(merged_group)
-
-    # Add any user agents that have not been grouped
-    all_grouped_ua = set(itertools.chain.from_iterable(groups))
-    for ua in responses.keys():
-        if ua not in all_grouped_ua:
-            groups.append({ua})
-
-    return [list(group) for group in groups]
-
-
-def group_user_agents_by_identical_content(user_agents, url):
+async def group_user_agents_by_identical_content(
+    user_agents, url, client=None
+):
     """
-    Makes HTTP requests to the given URL with different user agents and groups them
-    based on the similarity of the HTML content returned.
+    Makes concurrent HTTP requests to the given URL with different user agents and
+    groups them based on the similarity of the HTML content returned.
 
     Args:
         user_agents (list): A list of user agent strings to test.
         url (str): The target URL from which to fetch content.
+        client (httpx.AsyncClient): Client to send the requests with.
 
     Returns:
         list: A list of lists, where each sublist contains user agents that received
         the same HTML content.
     """
-    # Dictionary to store responses with HTML content as key and list of user agents as value
+    responses = await fetch_user_agent_contents(user_agents, url, client)
     content_dict = defaultdict(list)
-
-    # Fetch the HTML content for each user agent
-    for ua in user_agents:
-        headers = {'User-Agent': ua}
-        response = requests.get(url, headers=headers)
-        content = response.text
-
-        # Normalize content for comparison (optional, could be more sophisticated)
-        normalized_content = content.strip()
-
-        # Group user agents by identical HTML content
-        content_dict[normalized_content].append(ua)
-
-    # Only return groups of user agents
+    for user_agent, response in responses.items():
+        if response is not None:
+            content_dict[response.text.strip()].append(user_agent)
     return list(content_dict.values())
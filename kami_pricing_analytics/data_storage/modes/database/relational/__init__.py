@@ -1,8 +1,21 @@
-from .models import PricingResearchModel
-from .mssql import SQLServerSettings, SQLServerStorage
-from .mysql import MySQLSettings, MySQLStorage
-from .plsql import PLSQLSettings, PLSQLStorage
-from .postgresql import PostgreSQLSettings, PostgreSQLStorage
-from .settings import DatabaseSettings
-from .sqlite import SQLiteSettings, SQLiteStorage
-from .storage import DatabaseStorage, DatabaseStorageException
+from kami_pricing_analytics.lazy_imports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        'PricingResearchModel': '.models',
+        'SQLServerSettings': '.mssql',
+        'SQLServerStorage': '.mssql',
+        'MySQLSettings': '.mysql',
+        'MySQLStorage': '.mysql',
+        'PLSQLSettings': '.plsql',
+        'PLSQLStorage': '.plsql',
+        'PostgreSQLSettings': '.postgresql',
+        'PostgreSQLStorage': '.postgresql',
+        'DatabaseSettings': '.settings',
+        'SQLiteSettings': '.sqlite',
+        'SQLiteStorage': '.sqlite',
+        'DatabaseStorage': '.storage',
+        'DatabaseStorageException': '.storage',
+    },
+)
@@ -23,6 +23,9 @@ class PricingResearchModel(Base):
         strategy (str): The strategy used for gathering pricing data.
         sellers (JSON): A JSON object containing information about the sellers offering the product.
         conducted_at (datetime): The timestamp when the research was conducted.
+        telemetry (JSON): A JSON object with the execution report of the collector, such as the number of pages loaded.
+        checked_at (datetime): The timestamp of the last change probe that found the research still current.
+        probe (JSON): A JSON object with the snapshot of the last change probe, such as the price fragment fingerprint.
 
     Table name:
         pricing_research
@@ -41,10 +44,13 @@ class PricingResearchModel(Base):
     url = Column(String(512), nullable=True)
     strategy = Column(String(255), nullable=True)
     sellers = Column(JSON)
+    telemetry = Column(JSON, nullable=True)
+    probe = Column(JSON, nullable=True)
 
     conducted_at = Column(
         TIMESTAMP(timezone=True), default=lambda: datetime.now(tz=timezone.utc)
     )
+    checked_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
         """
@@ -1,19 +1,15 @@
-from typing import Dict, Type
+from typing import Dict, Type, Union
 
-from kami_pricing_analytics.data_storage import BaseStorage, StorageModeOptions
-from kami_pricing_analytics.data_storage.modes.database.relational import (
+from kami_pricing_analytics.data_storage.base_storage import (
+    BaseStorage,
+    StorageModeOptions,
+)
+from kami_pricing_analytics.data_storage.modes.database.relational.settings import (
     DatabaseSettings,
-    MySQLSettings,
-    MySQLStorage,
-    PLSQLSettings,
-    PLSQLStorage,
-    PostgreSQLSettings,
-    PostgreSQLStorage,
-    SQLiteSettings,
-    SQLiteStorage,
-    SQLServerSettings,
-    SQLServerStorage,
 )
+from kami_pricing_analytics.lazy_imports import resolve
+
+RELATIONAL = 'kami_pricing_analytics.data_storage.modes.database.relational'
 
 storage_options = [
     f'{option.value} - {option.name}' for option in StorageModeOptions
@@ -23,29 +19,36 @@ storage_options = [
 class StorageFactory:
     """
     Factory class for managing storage instances across different database technologies.
+    Classes may be registered by their 'module:class' path, and are imported when
+    their mode is first used, so only the database driver of the configured mode
+    is loaded.
 
     Attributes:
-        storage_mapping (Dict[StorageModeOptions, Type[BaseStorage]]): Maps storage modes to corresponding storage classes.
-        settings_mapping (Dict[StorageModeOptions, Type[DatabaseSettings]]): Maps storage modes to corresponding settings classes.
+        storage_mapping (Dict[StorageModeOptions, Union[str, Type[BaseStorage]]]): Maps storage modes to corresponding storage classes.
+        settings_mapping (Dict[StorageModeOptions, Union[str, Type[DatabaseSettings]]]): Maps storage modes to corresponding settings classes.
     """
 
-    storage_mapping: Dict[StorageModeOptions, Type[BaseStorage]] = {}
-    settings_mapping: Dict[StorageModeOptions, Type[DatabaseSettings]] = {}
+    storage_mapping: Dict[
+        StorageModeOptions, Union[str, Type[BaseStorage]]
+    ] = {}
+    settings_mapping: Dict[
+        StorageModeOptions, Union[str, Type[DatabaseSettings]]
+    ] = {}
 
     @classmethod
     def register_mode(
         cls,
         mode: StorageModeOptions,
-        storage: Type[BaseStorage],
-        settings: Type[DatabaseSettings],
+        storage: Union[str, Type[BaseStorage]],
+        settings: Union[str, Type[DatabaseSettings]],
     ) -> bool:
         """
         Registers a storage mode with its corresponding storage and settings classes.
 
         Args:
             mode (StorageModeOptions): The storage mode identifier.
-            storage (Type[BaseStorage]): The storage class.
-            settings (Type[DatabaseSettings]): The settings class.
+            storage (Union[str, Type[BaseStorage]]): The storage class, or its 'module:class' path.
+            settings (Union[str, Type[DatabaseSettings]]): The settings class, or its 'module:class' path.
 
         Returns:
             bool: True if the storage mode was successfully registered, False otherwise.
@@ -85,9 +88,13 @@ class StorageFactory:
                 raise ValueError(
                     f'Unsupported STORAGE_MODE: {mode}. Available options: {storage_options}'
                 )
-            settings_class = cls.settings_mapping.get(storage_mode_option)
+            settings_class = resolve(
+                cls.settings_mapping.get(storage_mode_option)
+            )
             settings = settings_class()
-            storage_class = cls.storage_mapping.get(storage_mode_option)
+            storage_class = resolve(
+                cls.storage_mapping.get(storage_mode_option)
+            )
             storage_mode = storage_class(settings=settings)
         except Exception as e:
             raise ValueError(f'Error while retrieving storage mode: {e}')
@@ -98,23 +105,27 @@ class StorageFactory:
 class DatabaseSettingsFactory:
     """
     Factory class for managing database settings instances specific to storage modes.
+    Classes may be registered by their 'module:class' path, and are imported when
+    first retrieved.
 
     Attributes:
-        settings_mapping (Dict[StorageModeOptions, Type[DatabaseSettings]]): Maps storage modes to corresponding settings classes.
+        settings_mapping (Dict[StorageModeOptions, Union[str, Type[DatabaseSettings]]]): Maps storage modes to corresponding settings classes.
     """
 
-    settings_mapping: Dict[StorageModeOptions, Type[DatabaseSettings]] = {}
+    settings_mapping: Dict[
+        StorageModeOptions, Union[str, Type[DatabaseSettings]]
+    ] = {}
 
     @classmethod
     def register_settings(
-        cls, mode: int, settings: Type[DatabaseSettings]
+        cls, mode: int, settings: Union[str, Type[DatabaseSettings]]
     ) -> bool:
         """
         Registers database settings for a specific storage mode.
 
         Args:
             mode (int): The database mode identifier.
-            settings (Type[DatabaseSettings]): The settings class.
+            settings (Union[str, Type[DatabaseSettings]]): The settings class, or its 'module:class' path.
 
         Returns:
             bool: True if the database settings were successfully registered, False otherwise.
@@ -160,37 +171,48 @@ class DatabaseSettingsFactory:
             raise ValueError(
                 f'Unsupported Database Settings: {mode}. Available options: {storage_options}'
             )
-        return settings
+        return resolve(settings)
 
 
 DatabaseSettingsFactory.register_settings(
-    StorageModeOptions.SQLITE, SQLiteSettings
+    StorageModeOptions.SQLITE, f'{RELATIONAL}.sqlite:SQLiteSettings'
 )
 DatabaseSettingsFactory.register_settings(
-    StorageModeOptions.POSTGRESQL, PostgreSQLSettings
+    StorageModeOptions.POSTGRESQL,
+    f'{RELATIONAL}.postgresql:PostgreSQLSettings',
 )
 DatabaseSettingsFactory.register_settings(
-    StorageModeOptions.MYSQL, MySQLSettings
+    StorageModeOptions.MYSQL, f'{RELATIONAL}.mysql:MySQLSettings'
 )
 DatabaseSettingsFactory.register_settings(
-    StorageModeOptions.SQLSERVER, SQLServerSettings
+    StorageModeOptions.SQLSERVER, f'{RELATIONAL}.mssql:SQLServerSettings'
 )
 DatabaseSettingsFactory.register_settings(
-    StorageModeOptions.PLSQL, PLSQLSettings
+    StorageModeOptions.PLSQL, f'{RELATIONAL}.plsql:PLSQLSettings'
 )
 
 StorageFactory.register_mode(
-    StorageModeOptions.SQLITE, SQLiteStorage, SQLiteSettings
+    StorageModeOptions.SQLITE,
+    f'{RELATIONAL}.sqlite:SQLiteStorage',
+    f'{RELATIONAL}.sqlite:SQLiteSettings',
 )
 StorageFactory.register_mode(
-    StorageModeOptions.POSTGRESQL, PostgreSQLStorage, PostgreSQLSettings
+    StorageModeOptions.POSTGRESQL,
+    f'{RELATIONAL}.postgresql:PostgreSQLStorage',
+    f'{RELATIONAL}.postgresql:PostgreSQLSettings',
 )
 StorageFactory.register_mode(
-    StorageModeOptions.MYSQL, MySQLStorage, MySQLSettings
+    StorageModeOptions.MYSQL,
+    f'{RELATIONAL}.mysql:MySQLStorage',
+    f'{RELATIONAL}.mysql:MySQLSettings',
 )
 StorageFactory.register_mode(
-    StorageModeOptions.SQLSERVER, SQLServerStorage, SQLServerSettings
+    StorageModeOptions.SQLSERVER,
+    f'{RELATIONAL}.mssql:SQLServerStorage',
+    f'{RELATIONAL}.mssql:SQLServerSettings',
 )
 StorageFactory.register_mode(
-    StorageModeOptions.PLSQL, PLSQLStorage, PLSQLSettings
+    StorageModeOptions.PLSQL,
+    f'{RELATIONAL}.plsql:PLSQLStorage',
+    f'{RELATIONAL}.plsql:PLSQLSettings',
 )
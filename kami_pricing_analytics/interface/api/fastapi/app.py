@@ -1,12 +1,39 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from kami_pricing_analytics.data_collector import CollectorOptions
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    QuotaExceededException,
+    QuotaRegistry,
+    ResponseCache,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    AdaptiveWaitRegistry,
+    BrowserSupervisor,
+    CircuitBreakerRegistry,
+    CircuitOpenException,
+    DriverPoolRegistry,
+    FetchLatencyRegistry,
+    HttpClientRegistry,
+    PageArchiveRegistry,
+    RateLimiterRegistry,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping.constants import (
+    ARCHIVE_ENABLED,
+    ROBOTS_WARM_UP_URLS,
+    SUPERVISOR_ENABLED,
+)
 from kami_pricing_analytics.interface.api import PricingResearchRequest
 
+logger = logging.getLogger('research_api')
+
 # API application instance
 research_app = FastAPI(
     title='KAMI-Pricing Analytics API',
@@ -37,6 +64,42 @@ class PricingResearchPayload(BaseModel):
     store_result: bool = Field(default=False)
 
 
+def raise_circuit_open(error: CircuitOpenException):
+    """
+    Raises the HTTP error of a research rejected by an open circuit, telling the
+    client when the marketplace is tried again.
+
+    Args:
+        error (CircuitOpenException): The rejection of the circuit breaker.
+
+    Raises:
+        HTTPException: A 503 error with a Retry-After header.
+    """
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={'Retry-After': str(max(1, round(error.retry_after)))},
+    )
+
+
+def raise_quota_exceeded(error: QuotaExceededException):
+    """
+    Raises the HTTP error of a research rejected because the quota of its
+    pricing API is spent, telling the client when the quota is restored.
+
+    Args:
+        error (QuotaExceededException): The rejection of the API quota.
+
+    Raises:
+        HTTPException: A 429 error with a Retry-After header.
+    """
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(error),
+        headers={'Retry-After': str(max(1, round(error.retry_after)))},
+    )
+
+
 @research_app.post(
     '/research',
     response_model=Dict[str, List[Dict[str, Any]]],
@@ -52,10 +115,12 @@ class PricingResearchPayload(BaseModel):
         - beleza_na_web: Beleza na Web
         - amazon: Amazon
         - mercado_livre: Mercado Livre
+        - google_shopping: Google Shopping, whose ID is the search query
     - `marketplace_id`: ID of the product on the marketplace.
     - `strategy`: Strategy to be used to collect the data.
       Strategies supported:
         - 0: Web Scraping
+        - 1: Google Shopping, for a Google Shopping search URL (its `q` parameter is the query)
     - `store_result`: Store the results in a database.
     """,
 )
@@ -75,6 +140,10 @@ async def post_research(payload: PricingResearchPayload) -> Dict[str, Any]:
         sellers = await request.post()
         return {'result': sellers}
 
+    except CircuitOpenException as e:
+        raise_circuit_open(e)
+    except QuotaExceededException as e:
+        raise_quota_exceeded(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
@@ -86,6 +155,64 @@ async def post_research(payload: PricingResearchPayload) -> Dict[str, Any]:
         )
 
 
+@research_app.post(
+    '/research/stream',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary='Conduct a pricing research over a product, streaming the sellers.',
+    description="""
+    Conduct a pricing research over a product like `POST /research`, but stream the sellers as newline-delimited JSON (`application/x-ndjson`), one seller per line, as soon as each one is collected. The results are stored once the research is complete when `store_result` is set.
+
+    Errors raised before the first seller is collected are answered with the same statuses as `POST /research`; errors raised afterwards end the stream early.
+    """,
+)
+async def stream_research(
+    payload: PricingResearchPayload,
+) -> StreamingResponse:
+    """
+    Endpoint to initiate pricing research and stream the sellers as they are collected.
+
+    Args:
+        payload (PricingResearchPayload): The payload containing research parameters.
+
+    Returns:
+        StreamingResponse: The sellers, as newline-delimited JSON.
+    """
+    try:
+        request = PricingResearchRequest(**payload.model_dump())
+        sellers = request.stream()
+        first_seller = await anext(sellers, None)
+    except CircuitOpenException as e:
+        raise_circuit_open(e)
+    except QuotaExceededException as e:
+        raise_quota_exceeded(e)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'An unexpected error occurred: {str(e)}',
+        )
+
+    async def write_sellers():
+        if first_seller is None:
+            return
+        yield json.dumps(first_seller, default=str) + '\n'
+        try:
+            async for seller in sellers:
+                yield json.dumps(seller, default=str) + '\n'
+        except Exception as e:
+            logger.error(f'Research stream ended early: {e}')
+        finally:
+            await sellers.aclose()
+
+    return StreamingResponse(
+        write_sellers(), media_type='application/x-ndjson'
+    )
+
+
 @research_app.get(
     '/research',
     response_model=Dict[str, List[Dict[str, Any]]],
@@ -99,6 +226,7 @@ async def post_research(payload: PricingResearchPayload) -> Dict[str, Any]:
         - beleza_na_web: Beleza na Web
         - amazon: Amazon
         - mercado_livre: Mercado Livre
+        - google_shopping: Google Shopping, whose ID is the search query
     - `marketplace_id`: ID of the product on the marketplace.
     """,
 )
@@ -120,7 +248,12 @@ async def get_research(
             marketplace=marketplace, marketplace_id=marketplace_id
         )
         request = PricingResearchRequest(**payload.model_dump())
-        return await request.get()
+        sellers = await request.get()
+        return {'result': sellers}
+    except CircuitOpenException as e:
+        raise_circuit_open(e)
+    except QuotaExceededException as e:
+        raise_quota_exceeded(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
@@ -132,6 +265,212 @@ async def get_research(
         )
 
 
+@research_app.get(
+    '/collectors/driver-pools',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the usage of the webdriver pools.',
+    description="""
+    Retrieve one entry per marketplace webdriver pool with its size, idle and leased sessions, total leases, hit rate and wait time.
+    """,
+)
+async def get_driver_pools() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the webdriver pools.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each pool.
+    """
+    stats = DriverPoolRegistry.stats()
+    return {'result': [pool_stats.model_dump() for pool_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/rate-limiters',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the usage of the per-host rate limiters.',
+    description="""
+    Retrieve one entry per host rate limiter with its rate, burst capacity, paced and delayed requests, and queueing delay.
+    """,
+)
+async def get_rate_limiters() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the per-host rate limiters.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each limiter.
+    """
+    stats = RateLimiterRegistry.stats()
+    return {'result': [limiter_stats.model_dump() for limiter_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/waits',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the adaptive wait deadlines of the scrapers.',
+    description="""
+    Retrieve one entry per marketplace and awaited selector with its recent waits, timeouts, latency percentile and current deadline.
+    """,
+)
+async def get_waits() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the adaptive waits.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each selector.
+    """
+    stats = AdaptiveWaitRegistry.stats()
+    return {'result': [wait_stats.model_dump() for wait_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/extraction',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the extraction cost of the marketplace fields.',
+    description="""
+    Retrieve one entry per extraction spec and field with the values read, the values not found and the seconds spent reading them.
+    """,
+)
+async def get_extraction() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the compiled extractors.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each field.
+    """
+    from kami_pricing_analytics.data_collector.strategies.web_scraping.extraction import (
+        ExtractorRegistry,
+    )
+
+    stats = ExtractorRegistry.stats()
+    return {'result': [field_stats.model_dump() for field_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/browsers',
+    response_model=Dict[str, Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the memory and processes of the scraper browsers.',
+    description="""
+    Retrieve the browsers supervised on this host with their process count, resident memory, pages loaded and health, along with the browsers killed over the memory limit and the orphaned browser processes reaped.
+    """,
+)
+async def get_browsers() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the browser supervisor.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the supervisor statistics.
+    """
+    stats = await asyncio.to_thread(BrowserSupervisor.stats)
+    return {'result': stats.model_dump()}
+
+
+@research_app.get(
+    '/collectors/circuit-breakers',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the state of the marketplace circuit breakers.',
+    description="""
+    Retrieve one entry per marketplace circuit breaker with its state (closed, open or half_open), the scrapes, errors and timeouts of its rolling window, the rejected scrapes and the seconds until an open circuit is tried again.
+    """,
+)
+async def get_circuit_breakers() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the state of the marketplace circuit breakers.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each breaker.
+    """
+    stats = CircuitBreakerRegistry.stats()
+    return {'result': [breaker_stats.model_dump() for breaker_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/fetch-latencies',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the fetch latencies of the marketplace hosts.',
+    description="""
+    Retrieve one entry per host with the recent HTTP fetch latencies kept, the latency percentile after which a fetch is hedged and the hedged requests sent.
+    """,
+)
+async def get_fetch_latencies() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the fetch latencies of the marketplace hosts.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each host.
+    """
+    stats = FetchLatencyRegistry.stats()
+    return {'result': [host_stats.model_dump() for host_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/page-archive',
+    response_model=Dict[str, Optional[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the usage of the raw page archive.',
+    description="""
+    Retrieve the archived fetches, distinct page contents, raw and compressed sizes, segment files and codec of the page archive, or null when the archive is disabled.
+    """,
+)
+async def get_page_archive() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the page archive.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the archive statistics.
+    """
+    archive = PageArchiveRegistry.get_archive()
+    if archive is None:
+        return {'result': None}
+    stats = await asyncio.to_thread(archive.stats)
+    return {'result': stats.model_dump()}
+
+
+@research_app.get(
+    '/collectors/api-quotas',
+    response_model=Dict[str, List[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the quota usage of the pricing APIs.',
+    description="""
+    Retrieve one entry per pricing API with its quota per period, the requests sent in the current period, the requests rejected over the quota and the seconds until the quota is restored.
+    """,
+)
+async def get_api_quotas() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the quota usage of the pricing APIs.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the statistics of each quota.
+    """
+    stats = QuotaRegistry.stats()
+    return {'result': [quota_stats.model_dump() for quota_stats in stats]}
+
+
+@research_app.get(
+    '/collectors/api-cache',
+    response_model=Dict[str, Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+    summary='Retrieve the usage of the pricing API response cache.',
+    description="""
+    Retrieve the cached responses, their time to live, the lookups served from the cache or missed and the responses evicted.
+    """,
+)
+async def get_api_cache() -> Dict[str, Any]:
+    """
+    Endpoint to retrieve the statistics of the pricing API response cache.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the cache statistics.
+    """
+    return {'result': ResponseCache.stats().model_dump()}
+
+
 @research_app.exception_handler(ValueError)
 async def handle_value_error(request, exc) -> JSONResponse:
     """
@@ -150,7 +489,37 @@ async def handle_value_error(request, exc) -> JSONResponse:
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan, starting the shared HTTP clients, opening the page
+    archive when enabled, starting the browser supervisor when enabled and
+    warming the robots.txt cache in the background on startup, and releasing
+    the shared scraping resources on shutdown.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    # Imported here so the robots.txt parser is only loaded by the server
+    from kami_pricing_analytics.data_collector.strategies.web_scraping.robots import (
+        RobotsCache,
+    )
+
+    HttpClientRegistry.start()
+    if ARCHIVE_ENABLED:
+        await asyncio.to_thread(PageArchiveRegistry.open)
+    if SUPERVISOR_ENABLED:
+        BrowserSupervisor.start()
+    warm_up = asyncio.create_task(RobotsCache.warm_up(ROBOTS_WARM_UP_URLS))
+    yield
+    warm_up.cancel()
+    await HttpClientRegistry.close_all()
+    await DriverPoolRegistry.close_all()
+    await BrowserSupervisor.stop()
+    PageArchiveRegistry.close()
+
+
 # Mounting the research app on the main FastAPI app
 research_app.include_router(api_router, prefix='/api')
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.mount('/api', research_app)
@@ -1,11 +1,18 @@
 import asyncio
 import configparser
+import logging
 import os
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
 from kami_pricing_analytics.data_collector import CollectorOptions
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    QuotaExceededException,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    CircuitOpenException,
+)
 from kami_pricing_analytics.data_storage import StorageModeOptions
 from kami_pricing_analytics.schemas import PricingResearch
 from kami_pricing_analytics.services import PricingService
@@ -15,6 +22,11 @@ settings_path = os.path.join('config', 'settings.cfg')
 settings = configparser.ConfigParser()
 settings.read(settings_path)
 storage_mode = StorageModeOptions(settings.getint('storage', 'MODE'))
+change_probe_enabled = settings.getboolean(
+    'change_probe', 'ENABLED', fallback=True
+)
+
+logger = logging.getLogger('pricing_research_request')
 
 
 class PricingResearchRequestException(Exception):
@@ -140,6 +152,8 @@ class PricingResearchRequest(BaseModel):
             List[Dict]: A list of seller data from the conducted research.
 
         Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
+            QuotaExceededException: If the quota of the pricing API is spent.
             PricingResearchRequestError: If an error occurs during processing.
         """
 
@@ -154,6 +168,8 @@ class PricingResearchRequest(BaseModel):
                 asyncio.create_task(self.service.store_research())
 
             response = self.service.research.sellers
+        except (CircuitOpenException, QuotaExceededException):
+            raise
         except ValueError as e:
             raise ValueError(f'Value Error while processing research: {e}')
         except Exception as e:
@@ -163,14 +179,65 @@ class PricingResearchRequest(BaseModel):
 
         return response
 
+    async def stream(self) -> AsyncIterator[Dict]:
+        """
+        Submits the pricing research request, yielding the seller data as soon as
+        it is collected, and optionally stores the results once the research is
+        complete.
+
+        Yields:
+            Dict: The data of a seller from the conducted research.
+
+        Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
+            QuotaExceededException: If the quota of the pricing API is spent.
+            PricingResearchRequestError: If an error occurs during processing.
+        """
+        try:
+            self.validate_input()
+            self.service.set_strategy()
+            async for seller in self.service.stream_research():
+                yield seller
+
+            if self.store_result:
+                self.service.set_storage()
+                asyncio.create_task(self.service.store_research())
+        except (CircuitOpenException, QuotaExceededException):
+            raise
+        except ValueError as e:
+            raise ValueError(f'Value Error while processing research: {e}')
+        except Exception as e:
+            raise ValueError(
+                f'Unexpected error while processing research: {e}'
+            )
+
+    async def refresh_research(self):
+        """
+        Conducts the research of an expired stored research again, keeping the
+        stored sellers when the circuit of the marketplace is open or the quota
+        of the pricing API is spent.
+        """
+        try:
+            await self.post()
+        except (CircuitOpenException, QuotaExceededException) as e:
+            logger.warning(
+                f'Serving stale research of {self.service.research.url}: {e}'
+            )
+
     async def get(self) -> List[Dict]:
         """
         Retrieves pricing research data or triggers a new research if necessary.
+        Expired research is first probed for changes, and only scraped again
+        when the product may have changed. When the circuit of the marketplace
+        is open or the quota of the pricing API is spent, the expired research
+        is served stale instead.
 
         Returns:
             List[Dict]: A list of seller data from the retrieved or newly conducted research.
 
         Raises:
+            CircuitOpenException: If the circuit of the marketplace is open and no research is stored.
+            QuotaExceededException: If the quota of the pricing API is spent and no research is stored.
             PricingResearchRequestError: If an error occurs during retrieval or processing.
         """
 
@@ -179,14 +246,21 @@ class PricingResearchRequest(BaseModel):
         try:
             await self.service.retrieve_research()
 
-            if (
-                not self.service.research.sellers
-                or self.service.research.expired
-            ):
+            if not self.service.research.sellers:
                 self.store_result = True
                 await self.post()
+            elif self.service.research.expired:
+                self.store_result = True
+                is_current = (
+                    change_probe_enabled
+                    and await self.service.probe_research()
+                )
+                if not is_current:
+                    await self.refresh_research()
 
-            reponse = self.service.research.sellers
+            response = self.service.research.sellers
+        except (CircuitOpenException, QuotaExceededException):
+            raise
         except ValueError as e:
             raise PricingResearchRequestException(
                 f'Value Error while getting research: {e}'
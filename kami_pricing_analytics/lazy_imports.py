@@ -0,0 +1,70 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+def resolve(reference: Union[str, Any]) -> Any:
+    """
+    Resolves a lazy reference to the object it names, importing its module on
+    first use. References that are not strings are returned as they are.
+
+    Args:
+        reference (Union[str, Any]): A 'module:attribute' path, or the object itself.
+
+    Returns:
+        Any: The referenced object.
+
+    Raises:
+        ImportError: If the module or the attribute does not exist.
+
+    Examples:
+        >>> resolve('collections:OrderedDict').__name__
+        'OrderedDict'
+        >>> resolve(dict) is dict
+        True
+    """
+    if not isinstance(reference, str):
+        return reference
+    module_name, _, attribute = reference.partition(':')
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attribute)
+    except AttributeError:
+        raise ImportError(f'{module_name} has no attribute {attribute}')
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the module `__getattr__` and `__dir__` of a package whose public
+    names are imported from their submodule on first access, so importing the
+    package does not import the dependencies of every submodule.
+
+    Args:
+        namespace (Dict[str, Any]): The namespace of the package, `globals()` of its `__init__`.
+        exports (Dict[str, str]): Maps the public names to their submodule, relative to the package.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The `__getattr__` and `__dir__` of the package.
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(
+            globals(), {'AmazonScraper': '.amazon'}
+        )
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            )
+        value = getattr(importlib.import_module(submodule, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
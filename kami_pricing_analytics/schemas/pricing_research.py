@@ -38,6 +38,9 @@ class PricingResearch(BaseModel):
         category (str): Product category.
         sellers (List[Dict]): List of sellers offering the product.
         conducted_at (datetime): Timestamp when the research was conducted.
+        telemetry (Dict): Execution report of the collector that conducted the research.
+        checked_at (datetime): Timestamp of the last change probe that found the research still current.
+        probe (Dict): Snapshot of the last change probe, with the page validators and price fragment fingerprint.
     """
 
     sku: str = Field(default=None)
@@ -49,6 +52,9 @@ class PricingResearch(BaseModel):
     category: str = Field(default=None)
     sellers: List[Dict] = Field(default=None)
     conducted_at: datetime = Field(default=None)
+    telemetry: Dict = Field(default=None)
+    checked_at: datetime = Field(default=None)
+    probe: Dict = Field(default=None)
 
     model_config = ConfigDict(
         title='Pricing Research',
@@ -109,6 +115,7 @@ class PricingResearch(BaseModel):
     def extract_marketplace_from_url(self) -> 'PricingResearch':
         """
         Extracts and sets the marketplace ID from the URL if not explicitly provided.
+        Google search URLs belong to the google_shopping marketplace.
 
         Returns:
             PricingResearch: The instance of the PricingResearch model.
@@ -118,6 +125,11 @@ class PricingResearch(BaseModel):
         """
         try:
             if self.url and not self.marketplace:
+                if MarketPlaceOptions.get_search_query(str(self.url)):
+                    self.marketplace = (
+                        MarketPlaceOptions.GOOGLE_SHOPPING.name.lower()
+                    )
+                    return self
                 parsed_url = urlparse(str(self.url))
                 for option in MarketPlaceOptions:
                     marketplace_name = option.name.lower().replace('_', '')
@@ -134,6 +146,7 @@ class PricingResearch(BaseModel):
     def extract_marketplace_id_from_url(self) -> 'PricingResearch':
         """
         Extracts and sets the marketplace from the URL if not explicitly provided.
+        The marketplace ID of a Google search URL is its search query.
 
         Returns:
             PricingResearch: The instance of the PricingResearch model.
@@ -144,6 +157,10 @@ class PricingResearch(BaseModel):
         try:
             if self.url and not self.marketplace_id:
                 url = str(self.url)
+                search_query = MarketPlaceOptions.get_search_query(url)
+                if search_query:
+                    self.marketplace_id = search_query
+                    return self
                 for option in MarketPlaceOptions:
                     marketplace_name = option.name.lower().replace('_', '')
                     if marketplace_name in url and option.url_pattern:
@@ -161,6 +178,17 @@ class PricingResearch(BaseModel):
             )
         return self
 
+    def extend_validity(self) -> datetime:
+        """
+        Marks the research as still current, after a change probe found the
+        product unchanged, so it expires `update_delay` seconds from now.
+
+        Returns:
+            datetime: The new `checked_at` timestamp.
+        """
+        self.checked_at = datetime.now(tz=timezone.utc)
+        return self.checked_at
+
     def update_research_data(self, result: list) -> bool:
         """
         Updates the research data with the result from the strategy execution.
@@ -196,7 +224,8 @@ class PricingResearch(BaseModel):
     @property
     def expired(self) -> bool:
         """
-        Determines if the current research data is expired based on the update delay.
+        Determines if the current research data is expired based on the update delay,
+        counted from the research or from the last change probe that found it current.
 
         Returns:
             bool: True if the data is expired, False otherwise.
@@ -204,7 +233,10 @@ class PricingResearch(BaseModel):
 
         is_expired = False
         try:
-            is_expired = self.conducted_at + timedelta(
+            validated_at = max(
+                self.conducted_at, self.checked_at or self.conducted_at
+            )
+            is_expired = validated_at + timedelta(
                 seconds=update_delay
             ) < datetime.now(tz=timezone.utc)
         except Exception as e:
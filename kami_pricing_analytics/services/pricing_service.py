@@ -1,7 +1,11 @@
+import asyncio
 import json
+import logging
+import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import AsyncIterator, Dict
 
-from asyncpg.exceptions import DataError
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from kami_pricing_analytics.data_collector import (
@@ -9,9 +13,33 @@ from kami_pricing_analytics.data_collector import (
     CollectorFactory,
     CollectorOptions,
 )
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    QuotaExceededException,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    CircuitOpenException,
+)
 from kami_pricing_analytics.data_storage import BaseStorage, StorageFactory
 from kami_pricing_analytics.schemas import PricingResearch
 
+logger = logging.getLogger('pricing_service')
+
+
+def _is_data_error(error: Exception) -> bool:
+    """
+    Checks whether an error is a DataError of the asyncpg driver. The driver is
+    only imported by the PostgreSQL storage, so if it was never loaded the error
+    cannot come from it, and it is not imported just to check.
+
+    Args:
+        error (Exception): The error to check.
+
+    Returns:
+        bool: True if the error is an asyncpg DataError.
+    """
+    exceptions = sys.modules.get('asyncpg.exceptions')
+    return exceptions is not None and isinstance(error, exceptions.DataError)
+
 
 class PricingServiceException(Exception):
     """
@@ -109,6 +137,8 @@ class PricingService(BaseModel):
         Conducts the research using the assigned strategy and updates the research data.
 
         Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
+            QuotaExceededException: If the quota of the pricing API is spent.
             PricingServiceException: If there is an error during the research process.
 
         Returns:
@@ -118,9 +148,15 @@ class PricingService(BaseModel):
         is_conducted = False
 
         try:
-            result = await self.strategy.execute()
+            async with self.probing():
+                result = await self.strategy.execute()
             self.research.update_research_data(result)
+            telemetry = getattr(self.strategy, 'telemetry', None)
+            if telemetry is not None:
+                self.research.telemetry = telemetry.model_dump()
             is_conducted = True
+        except (CircuitOpenException, QuotaExceededException):
+            raise
         except ValueError as e:
             raise PricingServiceException(
                 f'Value Error while conducting research: {e}'
@@ -132,6 +168,42 @@ class PricingService(BaseModel):
 
         return is_conducted
 
+    async def stream_research(self) -> AsyncIterator[Dict]:
+        """
+        Conducts the research using the assigned strategy, yielding every seller
+        as soon as the strategy collects it. The research data is updated once
+        the strategy is exhausted, so it can be stored as in `conduct_research`.
+
+        Raises:
+            CircuitOpenException: If the circuit of the marketplace is open.
+            QuotaExceededException: If the quota of the pricing API is spent.
+            PricingServiceException: If there is an error during the research process.
+
+        Yields:
+            Dict: The data of a seller.
+        """
+        result = []
+
+        try:
+            async with self.probing():
+                async for seller in self.strategy.stream():
+                    result.append(seller)
+                    yield seller
+            self.research.update_research_data(result)
+            telemetry = getattr(self.strategy, 'telemetry', None)
+            if telemetry is not None:
+                self.research.telemetry = telemetry.model_dump()
+        except (CircuitOpenException, QuotaExceededException):
+            raise
+        except ValueError as e:
+            raise PricingServiceException(
+                f'Value Error while conducting research: {e}'
+            )
+        except Exception as e:
+            raise PricingServiceException(
+                f'Unexpected error while conducting research: {e}'
+            )
+
     async def store_research(self) -> bool:
         """
         Stores the research data using the configured storage mode if storage is enabled.
@@ -154,11 +226,12 @@ class PricingService(BaseModel):
                     self.collector_option
                 ).name
 
-                # Convert 'conducted_at' to datetime object if it is a string
-                if isinstance(research_data['conducted_at'], str):
-                    research_data['conducted_at'] = datetime.fromisoformat(
-                        research_data['conducted_at']
-                    )
+                # Convert the timestamps to datetime objects if they are strings
+                for timestamp in ('conducted_at', 'checked_at'):
+                    if isinstance(research_data.get(timestamp), str):
+                        research_data[timestamp] = datetime.fromisoformat(
+                            research_data[timestamp]
+                        )
 
                 await self.storage.save(research_data)
                 is_result_stored = True
@@ -166,11 +239,11 @@ class PricingService(BaseModel):
             raise PricingServiceException(
                 f'Value Error while storing research: {e}'
             )
-        except DataError as e:
-            raise PricingServiceException(
-                f'Data Error while storing research: {e}'
-            )
         except Exception as e:
+            if _is_data_error(e):
+                raise PricingServiceException(
+                    f'Data Error while storing research: {e}'
+                )
             raise PricingServiceException(
                 f'Unexpected error while storing research: {e}'
             )
@@ -207,3 +280,87 @@ class PricingService(BaseModel):
             )
 
         return is_research_retrieved
+
+    async def capture_probe(self):
+        """
+        Stores the change probe snapshot of the product in the research, so the
+        next refresh can tell whether the product changed. Strategies without a
+        probe and failed probes leave the research unchanged.
+        """
+        probe = getattr(self.strategy, 'probe', None)
+        if probe is None:
+            return
+        try:
+            result = await probe()
+            self.research.probe = result.snapshot()
+        except Exception as e:
+            logger.warning(f'Change probe of {self.research.url} failed: {e}')
+
+    @asynccontextmanager
+    async def probing(self):
+        """
+        Context manager capturing the change probe of a research without one
+        while the block runs, so the probe request overlaps the scrape instead
+        of delaying it. The probe is awaited on exit, or cancelled if the block
+        raised.
+
+        Example:
+            async with service.probing():
+                result = await service.strategy.execute()
+        """
+        if self.research.probe is not None:
+            yield
+            return
+
+        probe = asyncio.create_task(self.capture_probe())
+        try:
+            yield
+        except BaseException:
+            probe.cancel()
+            await asyncio.gather(probe, return_exceptions=True)
+            raise
+        await probe
+
+    async def probe_research(self) -> bool:
+        """
+        Probes the product of an expired research with a conditional HTTP request
+        and, when it did not change since the stored snapshot, extends the research
+        validity in place of a full scrape. The snapshot is replaced by the probe
+        either way, so a following scrape stores it along with its sellers.
+
+        Returns:
+            bool: True if the research is still current and was extended, False if it needs a full scrape.
+        """
+        probe = getattr(self.strategy, 'probe', None)
+        if probe is None or not self.research.probe:
+            return False
+
+        try:
+            result = await probe(self.research.probe)
+        except Exception as e:
+            logger.warning(f'Change probe of {self.research.url} failed: {e}')
+            return False
+
+        self.research.probe = result.snapshot()
+        if result.changed:
+            return False
+
+        self.research.extend_validity()
+        if self.store_result and self.storage is not None:
+            try:
+                await self.storage.update(
+                    criteria={
+                        'marketplace': self.research.marketplace,
+                        'marketplace_id': self.research.marketplace_id,
+                        'conducted_at': self.research.conducted_at,
+                    },
+                    data={
+                        'checked_at': self.research.checked_at,
+                        'probe': self.research.probe,
+                    },
+                )
+            except Exception as e:
+                logger.warning(
+                    f'Could not extend research of {self.research.url}: {e}'
+                )
+        return True
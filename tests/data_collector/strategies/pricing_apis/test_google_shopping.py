@@ -0,0 +1,281 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from kami_pricing_analytics.data_collector import (
+    CollectorFactory,
+    CollectorOptions,
+)
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    GoogleShoppingAPI,
+    GoogleShoppingSettings,
+    PricingApiException,
+    QuotaExceededException,
+    QuotaRegistry,
+    ResponseCache,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    FetchPolicy,
+)
+from kami_pricing_analytics.schemas import PricingResearch
+
+PAGE_SIZE = 2
+
+
+class StubShoppingServer:
+    """
+    Local stand-in for a SerpApi compatible Google Shopping endpoint, serving
+    `pages` pages of offers per query and failing the first `failures` requests.
+    """
+
+    def __init__(self, pages: int = 2, failures: int = 0):
+        self.pages = pages
+        self.failures = failures
+        self.requests = []
+        self._server = ThreadingHTTPServer(
+            ('127.0.0.1', 0), self._build_handler()
+        )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}/search.json'
+
+    def _build_payload(self, params: dict) -> dict:
+        query = params['q']
+        if query == 'nothing':
+            return {
+                'error': "Google hasn't returned any results for this query."
+            }
+        page = int(params.get('start', 0)) // PAGE_SIZE
+        payload = {
+            'shopping_results': [
+                {
+                    'product_id': f'{query}-{page}-{position}',
+                    'title': f'{query} offer {page}-{position}',
+                    'price': f'R$ {10 + position},00',
+                    'source': f'Store {position}',
+                    'link': f'https://store{position}.com/{query}',
+                }
+                for position in range(PAGE_SIZE)
+            ],
+            'serpapi_pagination': {},
+        }
+        if page + 1 < self.pages:
+            payload['serpapi_pagination']['next'] = 'next-page'
+        return payload
+
+    def _build_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = {
+                    key: values[0]
+                    for key, values in parse_qs(
+                        urlparse(self.path).query
+                    ).items()
+                }
+                stub.requests.append(params)
+                if stub.failures:
+                    stub.failures -= 1
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                if params['q'] == 'maintenance':
+                    body = b'<html>Service under maintenance</html>'
+                    content_type = 'text/html'
+                else:
+                    body = json.dumps(stub._build_payload(params)).encode()
+                    content_type = 'application/json'
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> 'StubShoppingServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestGoogleShoppingAPI(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        ResponseCache.clear()
+        QuotaRegistry.clear()
+        self.addCleanup(ResponseCache.clear)
+        self.addCleanup(QuotaRegistry.clear)
+        self.server = StubShoppingServer()
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    def build_api(self, query: str = 'shampoo', **kwargs) -> GoogleShoppingAPI:
+        kwargs.setdefault('quota_limit', 0)
+        kwargs.setdefault('max_pages', 5)
+        return GoogleShoppingAPI(
+            product_url=f'https://www.google.com.br/search?tbm=shop&q={query}',
+            api_url=self.server.url,
+            page_size=PAGE_SIZE,
+            settings=GoogleShoppingSettings(google_shopping_api_key='secret'),
+            fetch_policy=FetchPolicy(backoff_base=0, backoff_max=0),
+            **kwargs,
+        )
+
+    async def test_execute_reads_every_page_as_sellers(self):
+        api = self.build_api()
+
+        sellers = await api.execute()
+
+        self.assertEqual(len(sellers), 2 * PAGE_SIZE)
+        self.assertEqual(
+            sellers[0],
+            {
+                'marketplace_id': 'shampoo',
+                'brand': '',
+                'description': 'shampoo offer 0-0',
+                'price': 'R$ 10,00',
+                'seller_id': '',
+                'seller_name': 'Store 0',
+                'seller_url': 'https://store0.com/shampoo',
+            },
+        )
+        self.assertEqual(
+            [request['start'] for request in self.server.requests], ['0', '2']
+        )
+        self.assertEqual(self.server.requests[0]['api_key'], 'secret')
+        self.assertEqual(self.server.requests[0]['engine'], 'google_shopping')
+        self.assertEqual(api.telemetry.pages, 2)
+        self.assertEqual(api.telemetry.requests, 2)
+
+    async def test_max_pages_bounds_pagination(self):
+        api = self.build_api(max_pages=1)
+
+        sellers = await api.execute()
+
+        self.assertEqual(len(sellers), PAGE_SIZE)
+        self.assertEqual(len(self.server.requests), 1)
+
+    async def test_repeated_query_is_served_from_cache(self):
+        await self.build_api().execute()
+        api = self.build_api()
+
+        sellers = await api.execute()
+
+        self.assertEqual(len(sellers), 2 * PAGE_SIZE)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(api.telemetry.cache_hits, 2)
+        self.assertEqual(api.telemetry.requests, 0)
+        self.assertNotIn('secret', ''.join(ResponseCache.entries))
+
+    async def test_spent_quota_rejects_requests_before_sending(self):
+        api = self.build_api(quota_limit=1)
+
+        with self.assertRaises(QuotaExceededException):
+            await api.execute()
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(QuotaRegistry.stats()[0].rejected, 1)
+        self.assertIsNotNone(api.telemetry.error)
+
+    async def test_failed_requests_are_retried(self):
+        self.server.failures = 1
+        api = self.build_api(max_pages=1)
+
+        sellers = await api.execute()
+
+        self.assertEqual(len(sellers), PAGE_SIZE)
+        self.assertEqual(api.telemetry.retries, 1)
+        self.assertEqual(len(self.server.requests), 2)
+
+    async def test_errors_do_not_leak_the_api_key(self):
+        self.server.failures = 10
+        api = self.build_api(max_pages=1)
+
+        with self.assertRaises(PricingApiException) as context:
+            await api.execute()
+
+        self.assertIn('503', str(context.exception))
+        self.assertNotIn('secret', str(context.exception))
+
+    async def test_invalid_body_raises_pricing_api_exception(self):
+        api = self.build_api(query='maintenance')
+
+        with self.assertRaises(PricingApiException) as context:
+            await api.execute()
+
+        self.assertIn('200', str(context.exception))
+        self.assertIn('Service under maintenance', str(context.exception))
+        self.assertNotIn('secret', str(context.exception))
+
+    async def test_query_without_results_returns_no_sellers(self):
+        api = self.build_api(query='nothing')
+
+        self.assertEqual(await api.execute(), [])
+
+    async def test_search_many_sends_repeated_queries_once(self):
+        api = self.build_api(max_pages=1, concurrency=2)
+
+        results = await api.search_many(['shampoo', 'conditioner', 'shampoo'])
+
+        self.assertEqual(list(results), ['shampoo', 'conditioner'])
+        self.assertEqual(
+            results['conditioner'][0]['description'], 'conditioner offer 0-0'
+        )
+        self.assertEqual(len(self.server.requests), 2)
+
+    async def test_search_many_raises_spent_quota(self):
+        api = self.build_api(max_pages=1, concurrency=2, quota_limit=1)
+
+        with self.assertRaises(QuotaExceededException):
+            await api.search_many(['shampoo', 'conditioner'])
+
+        self.assertEqual(QuotaRegistry.stats()[0].rejected, 1)
+
+    async def test_search_many_raises_failed_query(self):
+        self.server.failures = 10
+        api = self.build_api(max_pages=1, concurrency=2)
+
+        with self.assertRaises(PricingApiException):
+            await api.search_many(['shampoo', 'conditioner'])
+
+    def test_sku_is_searched_as_google_shopping_marketplace_id(self):
+        research = PricingResearch(
+            marketplace='google_shopping', marketplace_id='7891234 300ml'
+        )
+        api = GoogleShoppingAPI(product_url=str(research.url))
+
+        self.assertEqual(api.get_query(), '7891234 300ml')
+
+    def test_url_without_query_is_rejected(self):
+        api = GoogleShoppingAPI(
+            product_url='https://www.google.com.br/shopping'
+        )
+
+        with self.assertRaises(ValueError):
+            api.get_query()
+
+    def test_collector_factory_serves_google_shopping_option(self):
+        api = CollectorFactory.get_strategy(
+            CollectorOptions.GOOGLE_SHOPPING.value,
+            'https://www.google.com.br/search?tbm=shop&q=shampoo',
+        )
+
+        self.assertIsInstance(api, GoogleShoppingAPI)
+        self.assertEqual(api.get_query(), 'shampoo')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    ApiQuota,
+    QuotaExceededException,
+    QuotaRegistry,
+)
+
+MONOTONIC = 'kami_pricing_analytics.data_collector.strategies.pricing_apis.quota.time.monotonic'
+
+
+class TestApiQuota(unittest.TestCase):
+    def test_quota_rejects_requests_until_the_period_ends(self):
+        with patch(MONOTONIC, return_value=0):
+            quota = ApiQuota('mock', limit=2, period=60)
+            quota.acquire()
+            quota.acquire()
+
+            with self.assertRaises(QuotaExceededException) as context:
+                quota.acquire()
+            self.assertEqual(context.exception.retry_after, 60)
+
+        with patch(MONOTONIC, return_value=61):
+            quota.acquire()
+            stats = quota.stats()
+
+        self.assertEqual((stats.used, stats.rejected), (1, 1))
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.resets_in, 59)
+
+    def test_zero_limit_never_rejects(self):
+        quota = ApiQuota('mock', limit=0, period=60)
+
+        for _ in range(100):
+            quota.acquire()
+
+        self.assertEqual(quota.stats().used, 100)
+
+
+class TestQuotaRegistry(unittest.TestCase):
+    def setUp(self):
+        QuotaRegistry.clear()
+        self.addCleanup(QuotaRegistry.clear)
+
+    def test_get_quota_is_shared_and_follows_configuration(self):
+        quota = QuotaRegistry.get_quota('mock', 10, 60)
+        quota.acquire()
+
+        same_quota = QuotaRegistry.get_quota('mock', 20, 60)
+
+        self.assertIs(quota, same_quota)
+        self.assertEqual(quota.limit, 20)
+        self.assertEqual(quota.stats().used, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
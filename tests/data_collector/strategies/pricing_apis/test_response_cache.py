@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch
+
+from kami_pricing_analytics.data_collector.strategies.pricing_apis import (
+    ResponseCache,
+)
+
+MONOTONIC = 'kami_pricing_analytics.data_collector.strategies.pricing_apis.response_cache.time.monotonic'
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        ResponseCache.clear()
+        self.addCleanup(ResponseCache.clear)
+
+    def test_responses_expire_after_ttl(self):
+        with patch.object(ResponseCache, 'ttl', 10), patch(
+            MONOTONIC, return_value=0
+        ):
+            ResponseCache.store('key', {'offers': 1})
+            self.assertEqual(ResponseCache.get('key'), {'offers': 1})
+
+        with patch(MONOTONIC, return_value=11):
+            self.assertIsNone(ResponseCache.get('key'))
+
+        stats = ResponseCache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 0))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_least_recently_used_responses_are_evicted(self):
+        with patch.object(ResponseCache, 'max_entries', 2):
+            ResponseCache.store('first', 1)
+            ResponseCache.store('second', 2)
+            ResponseCache.get('first')
+            ResponseCache.store('third', 3)
+
+        self.assertEqual(list(ResponseCache.entries), ['first', 'third'])
+        self.assertEqual(ResponseCache.stats().evictions, 1)
+
+    def test_zero_ttl_disables_caching(self):
+        with patch.object(ResponseCache, 'ttl', 0):
+            ResponseCache.store('key', 1)
+
+        self.assertIsNone(ResponseCache.get('key'))
+
+
+if __name__ == '__main__':
+    unittest.main()
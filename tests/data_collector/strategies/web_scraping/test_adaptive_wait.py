@@ -0,0 +1,67 @@
+import unittest
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    AdaptiveWaitRegistry,
+    SelectorLatency,
+)
+
+
+class TestSelectorLatency(unittest.TestCase):
+    def setUp(self):
+        self.latency = SelectorLatency(
+            'mock',
+            'div.offers',
+            percentile=90,
+            margin=2,
+            min_samples=3,
+            default_timeout=10,
+            min_timeout=0.5,
+            max_timeout=5,
+        )
+
+    def test_default_timeout_is_used_until_min_samples(self):
+        self.latency.record(0.2)
+        self.latency.record(0.3)
+
+        self.assertEqual(self.latency.deadline(), 10)
+
+    def test_deadline_follows_latency_percentile(self):
+        for latency in [0.5, 0.6, 0.7, 0.8, 1.0]:
+            self.latency.record(latency)
+
+        stats = self.latency.stats()
+        self.assertEqual(stats.percentile, 1.0)
+        self.assertEqual(stats.deadline, 2.0)
+
+    def test_deadline_is_bounded(self):
+        for _ in range(3):
+            self.latency.record(0.01)
+        self.assertEqual(self.latency.deadline(), 0.5)
+
+        for _ in range(3):
+            self.latency.record(4, timed_out=True)
+        self.assertEqual(self.latency.deadline(), 5)
+        self.assertEqual(self.latency.stats().timeouts, 3)
+
+
+class TestAdaptiveWaitRegistry(unittest.TestCase):
+    def setUp(self):
+        AdaptiveWaitRegistry.clear()
+
+    def tearDown(self):
+        AdaptiveWaitRegistry.clear()
+
+    def test_latencies_are_shared_per_marketplace_and_selector(self):
+        latency = AdaptiveWaitRegistry.get_latency('amazon', '#title')
+        same_latency = AdaptiveWaitRegistry.get_latency('amazon', '#title')
+        other_latency = AdaptiveWaitRegistry.get_latency(
+            'mercado_livre', '#title'
+        )
+
+        self.assertIs(latency, same_latency)
+        self.assertIsNot(latency, other_latency)
+        self.assertEqual(len(AdaptiveWaitRegistry.stats()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
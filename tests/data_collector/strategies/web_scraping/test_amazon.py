@@ -1,11 +1,9 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
     AmazonScraper,
+    AmazonScraperException,
 )
 
 
@@ -13,6 +11,7 @@ class TestAmazonScraper(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.scraper = AmazonScraper(
             product_url='https://www.amazon.com/dp/B07GYX8QRJ',
+            rate_limit_enabled=False,
         )
         self.seller_data = {
             'ASIN': 'B07GYX8QRJ',
@@ -24,128 +23,84 @@ class TestAmazonScraper(unittest.IsolatedAsyncioTestCase):
             'SellerURL': 'https://www.amazon.com/seller-profile',
         }
         self.scraper.webdriver = MagicMock()
-        self.mock_seller_link_element = MagicMock(spec=WebElement)
-        self.mock_seller_link_element.find_element.return_value.get_attribute.return_value = f"https://www.amazon.com/gp/aag/main?seller={self.seller_data['SellerID']}"
-        self.mock_seller_name_element = MagicMock(spec=WebElement)
-        self.mock_seller_name_element.find_element.return_value.get_attribute.return_value = self.seller_data[
-            'SellerName'
-        ]
-        self.mock_price_element = MagicMock(spec=WebElement)
-        self.mock_price_element.find_element.return_value.get_attribute.return_value = self.seller_data[
-            'Price'
-        ]
+        self.seller_offer = {
+            'price': self.seller_data['Price'],
+            'seller_id': self.seller_data['SellerID'],
+            'seller_name': self.seller_data['SellerName'],
+            'seller_url': self.seller_data['SellerURL'],
+        }
 
     async def test_get_marketplace_id_success(self):
-        mock_element = MagicMock()
-        mock_element.text = self.seller_data['ASIN']
-        self.scraper.webdriver.find_element.return_value = mock_element
+        self.mock_page_fields()
 
         marketplace_id = await self.scraper.get_marketplace_id()
         self.assertEqual(marketplace_id, self.seller_data['ASIN'])
-        self.scraper.webdriver.find_element.assert_called_once_with(
-            By.XPATH, '//th[contains(text(), "ASIN")]/following-sibling::td'
-        )
+        self.scraper.webdriver.find_element.assert_not_called()
 
     async def test_get_brand_success(self):
-        mock_element = MagicMock()
-        mock_element.text = self.seller_data['Brand']
-        self.scraper.webdriver.find_element.return_value = mock_element
+        self.mock_page_fields()
 
         brand = await self.scraper.get_brand()
         self.assertEqual(brand, self.seller_data['Brand'])
-        self.scraper.webdriver.find_element.assert_called_once_with(
-            By.XPATH,
-            '//th[contains(text(), "Fabricante")]/following-sibling::td',
-        )
 
     async def test_get_description_success(self):
-        mock_element = MagicMock()
-        mock_element.text = self.seller_data['Description']
-        self.scraper.webdriver.find_element.return_value = mock_element
+        self.mock_page_fields()
 
         description = await self.scraper.get_description()
         self.assertEqual(description, self.seller_data['Description'])
-        self.scraper.webdriver.find_element.assert_called_once_with(
-            By.ID, 'title'
-        )
+
+    async def test_get_brand_not_found_raises_exception(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {'marketplace_id': 'B07GYX8QRJ', 'brand': None, 'description': ''}
+        ]
+
+        with self.assertRaises(AmazonScraperException):
+            await self.scraper.get_brand()
 
     async def test_get_seller_id(self):
-        self.scraper.webdriver.find_element.return_value = (
-            self.mock_seller_link_element
-        )
-        seller_id = await self.scraper.get_seller_id(
-            self.mock_seller_link_element
-        )
+        seller_id = await self.scraper.get_seller_id(self.seller_offer)
         self.assertEqual(seller_id, self.seller_data['SellerID'])
 
     async def test_get_seller_name(self):
-        self.scraper.webdriver.find_element.return_value = (
-            self.mock_seller_name_element
-        )
-        seller_name = await self.scraper.get_seller_name(
-            self.mock_seller_name_element
-        )
+        seller_name = await self.scraper.get_seller_name(self.seller_offer)
         self.assertEqual(seller_name, self.seller_data['SellerName'])
 
     async def test_get_price(self):
-        self.scraper.webdriver.find_element.return_value = (
-            self.mock_price_element
-        )
-        price = await self.scraper.get_price(self.mock_price_element)
+        price = await self.scraper.get_price(self.seller_offer)
         self.assertEqual(price, self.seller_data['Price'])
 
     async def test_get_seller_url(self):
-        mock_element = MagicMock(spec=WebElement)
-        expected_url = 'https://www.amazon.com/seller-profile'
-        mock_element.find_element.return_value.get_attribute.return_value = (
-            expected_url
-        )
+        seller_url = await self.scraper.get_seller_url(self.seller_offer)
+        self.assertEqual(seller_url, self.seller_data['SellerURL'])
 
-        self.scraper.webdriver.find_element.return_value = mock_element
-        seller_url = await self.scraper.get_seller_url(mock_element)
-        self.assertEqual(seller_url, expected_url)
-        mock_element.find_element.assert_called_once_with(
-            By.CSS_SELECTOR, 'a.a-size-small.a-link-normal'
-        )
+    def mock_page_fields(self, offers_count=1):
+        product_fields = [
+            {
+                'marketplace_id': self.seller_data['ASIN'],
+                'brand': self.seller_data['Brand'],
+                'description': self.seller_data['Description'],
+            }
+        ]
+        seller_url = f"https://www.amazon.com/gp/aag/main?seller={self.seller_data['SellerID']}"
+        offers_fields = [
+            {
+                'price': self.seller_data['Price'],
+                'seller_id': seller_url,
+                'seller_name': f" {self.seller_data['SellerName']} ",
+                'seller_url': seller_url,
+            }
+        ] * offers_count
 
-    @patch('selenium.webdriver.support.ui.WebDriverWait.until')
-    @patch('selenium.webdriver.Chrome.find_elements')
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_price',
-        new_callable=AsyncMock,
-    )
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_seller_id',
-        new_callable=AsyncMock,
-    )
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_seller_name',
-        new_callable=AsyncMock,
-    )
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_seller_url',
-        new_callable=AsyncMock,
-    )
-    async def test_get_sellers_list_success(
-        self,
-        mock_get_seller_url,
-        mock_get_seller_name,
-        mock_get_seller_id,
-        mock_get_price,
-        mock_find_elements,
-        mock_wait_until,
-    ):
-        mock_wait_until.return_value = None
-        mock_get_price.return_value = self.seller_data['Price']
-        mock_get_seller_id.return_value = self.seller_data['SellerID']
-        mock_get_seller_name.return_value = self.seller_data['SellerName']
-        mock_get_seller_url.return_value = self.seller_data['SellerURL']
+        def execute_script(script, root_selector, fields, *args):
+            if root_selector:
+                return offers_fields
+            return product_fields
 
-        mock_seller_offer = MagicMock(spec=WebElement)
-        mock_find_elements.return_value = [mock_seller_offer]
+        self.scraper.webdriver.execute_script.side_effect = execute_script
 
-        self.scraper.webdriver.find_element.return_value = mock_seller_offer
-        self.scraper.webdriver.find_elements = mock_find_elements
+    @patch.object(AmazonScraper, 'wait_for', new_callable=AsyncMock)
+    async def test_get_sellers_list_success(self, mock_wait_for):
+        self.mock_page_fields()
 
         sellers = await self.scraper.get_sellers_list()
 
@@ -158,7 +113,7 @@ class TestAmazonScraper(unittest.IsolatedAsyncioTestCase):
                 'price': self.seller_data['Price'],
                 'seller_id': self.seller_data['SellerID'],
                 'seller_name': self.seller_data['SellerName'],
-                'seller_url': self.seller_data['SellerURL'],
+                'seller_url': f"https://www.amazon.com/gp/aag/main?seller={self.seller_data['SellerID']}",
             }
         ]
         self.assertEqual(
@@ -169,22 +124,12 @@ class TestAmazonScraper(unittest.IsolatedAsyncioTestCase):
             expected_sellers,
             'Sellers list does not match expected sellers.',
         )
+        self.scraper.webdriver.find_elements.assert_not_called()
+        mock_wait_for.assert_any_await('#aod-offer-list', visible=True)
+
+    async def test_get_seller_info(self):
+        self.mock_page_fields()
 
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_marketplace_id',
-        return_value='B07GYX8QRJ',
-    )
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_brand',
-        return_value='Amazon',
-    )
-    @patch(
-        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.get_description',
-        return_value='Amazon Echo Dot 3rd Generation',
-    )
-    async def test_get_seller_info(
-        self, mock_get_marketplace_id, mock_get_brand, mock_get_description
-    ):
         seller_info = await self.scraper.get_seller_info({})
         expected = {
             'marketplace_id': 'B07GYX8QRJ',
@@ -193,6 +138,26 @@ class TestAmazonScraper(unittest.IsolatedAsyncioTestCase):
         }
         self.assertEqual(seller_info, expected)
 
+    @patch.object(AmazonScraper, 'wait_for', new_callable=AsyncMock)
+    async def test_product_fields_are_read_once_per_product(
+        self, mock_wait_for
+    ):
+        self.mock_page_fields(offers_count=3)
+
+        sellers = await self.scraper.get_sellers_info(
+            await self.scraper.get_sellers_list()
+        )
+
+        self.assertEqual(len(sellers), 3)
+        for seller in sellers:
+            self.assertEqual(seller['marketplace_id'], 'B07GYX8QRJ')
+            self.assertEqual(seller['brand'], 'Amazon')
+        self.scraper.webdriver.get.assert_called_once_with(
+            str(self.scraper.product_url)
+        )
+        self.assertEqual(self.scraper.webdriver.execute_script.call_count, 2)
+        self.assertEqual(self.scraper.telemetry.pages_loaded, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,26 @@
+import asyncio
+import threading
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.webdriver import WebDriver
 
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    AdaptiveWaitRegistry,
     BaseScraper,
+    DriverPoolRegistry,
+    ExtractionSpec,
+    ExtractorRegistry,
+    FetchLatencyRegistry,
+    FetchPolicy,
+    FieldSpec,
+    RateLimiterRegistry,
+    RobotsCache,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping.extraction import (
+    EXTRACTION_SCRIPT,
 )
 
 
@@ -38,6 +54,11 @@ class MockScraper(BaseScraper):
 
 
 class TestBaseScraper(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RobotsCache.clear()
+        RateLimiterRegistry.clear()
+        AdaptiveWaitRegistry.clear()
+
     def test_set_logger(self):
         scraper = MockScraper(product_url='https://www.mock.com')
         scraper.set_logger('mock_logger_name')
@@ -98,6 +119,409 @@ class TestBaseScraper(unittest.IsolatedAsyncioTestCase):
             )
             mock_logger.error.assert_not_called()
 
+    async def test_extract_fields_runs_a_single_script(self):
+        scraper = MockScraper(product_url='https://www.mock.com')
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.execute_script.return_value = [
+            {'price': '10'},
+            {'price': '20'},
+        ]
+        fields = {'price': FieldSpec(selector='span.price', source='html')}
+
+        rows = await scraper.extract_fields(fields, root_selector='div.offer')
+
+        self.assertEqual(rows, [{'price': '10'}, {'price': '20'}])
+        scraper.webdriver.execute_script.assert_called_once_with(
+            EXTRACTION_SCRIPT,
+            'div.offer',
+            {
+                'price': {
+                    'selector': 'span.price',
+                    'by': 'css',
+                    'source': 'html',
+                }
+            },
+        )
+
+    async def test_extract_runs_compiled_spec_and_records_field_costs(self):
+        extractor = ExtractorRegistry.compile(
+            ExtractionSpec(
+                name='mock.offers',
+                root_selector='div.offer',
+                fields={
+                    'price': FieldSpec(
+                        selector='span.price', transforms=['strip']
+                    )
+                },
+            )
+        )
+        scraper = MockScraper(product_url='https://www.mock.com')
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.execute_script.return_value = {
+            'rows': [{'price': ' 10 '}, {'price': None}],
+            'timings': {'price': 4.0},
+        }
+
+        rows = await scraper.extract(extractor)
+
+        self.assertEqual(rows, [{'price': '10'}, {'price': None}])
+        scraper.webdriver.execute_script.assert_called_once_with(
+            EXTRACTION_SCRIPT, *extractor.script_arguments
+        )
+        self.assertEqual(extractor.script_arguments[-1], True)
+        self.assertEqual(
+            scraper.telemetry.field_costs, {'mock.offers.price': 0.004}
+        )
+
+    async def test_scrap_product_returns_leased_webdriver_to_pool(self):
+        mock_driver = MagicMock()
+        mock_driver.window_handles = ['main']
+        scraper = MockScraper(
+            product_url='http://mock.com', marketplace='mock_pool'
+        )
+        with patch.object(scraper, '_setup_driver', return_value=mock_driver):
+            result = await scraper.scrap_product()
+
+        pool_stats = DriverPoolRegistry.pools['mock_pool'].stats()
+        self.assertEqual(len(result), 2)
+        self.assertIsNone(scraper.webdriver)
+        self.assertEqual(pool_stats.idle, 1)
+        self.assertEqual(pool_stats.leased, 0)
+        mock_driver.quit.assert_not_called()
+        await DriverPoolRegistry.close_all()
+
+    async def test_stream_product_yields_sellers_as_they_are_extracted(self):
+        extracted = []
+
+        class StreamingScraper(MockScraper):
+            async def get_seller_info(self, seller):
+                extracted.append(seller)
+                return await super().get_seller_info(seller)
+
+        mock_driver = MagicMock()
+        mock_driver.window_handles = ['main']
+        scraper = StreamingScraper(
+            product_url='http://mock.com', marketplace='mock_stream'
+        )
+        with patch.object(scraper, '_setup_driver', return_value=mock_driver):
+            sellers = scraper.stream_product()
+            first_seller = await anext(sellers)
+            self.assertEqual(first_seller['id'], 'seller1')
+            self.assertEqual(extracted, ['seller1'])
+            await sellers.aclose()
+
+        pool_stats = DriverPoolRegistry.pools['mock_stream'].stats()
+        self.assertEqual(extracted, ['seller1'])
+        self.assertIsNone(scraper.webdriver)
+        self.assertEqual(pool_stats.leased, 0)
+        await DriverPoolRegistry.close_all()
+
+    async def test_webdriver_calls_run_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        driver_threads = []
+        scraper = MockScraper(product_url='https://www.mock.com')
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.get.side_effect = lambda url: driver_threads.append(
+            threading.get_ident()
+        )
+
+        await asyncio.gather(
+            scraper.load_page('https://www.mock.com/1'),
+            scraper.load_page('https://www.mock.com/2'),
+        )
+
+        self.assertEqual(len(driver_threads), 2)
+        self.assertEqual(len(set(driver_threads)), 1)
+        self.assertNotIn(loop_thread, driver_threads)
+        self.assertEqual(scraper.telemetry.pages_loaded, 2)
+        await scraper.release_webdriver()
+
+    async def test_leased_webdriver_runs_on_its_session_thread(self):
+        mock_driver = MagicMock()
+        mock_driver.window_handles = ['main']
+        scraper = MockScraper(
+            product_url='http://mock.com', marketplace='mock_thread'
+        )
+        with patch.object(scraper, '_setup_driver', return_value=mock_driver):
+            await scraper.set_webdriver()
+
+        session_thread = await scraper.run_in_driver(threading.get_ident)
+
+        lease = scraper._driver_lease
+        self.assertEqual(
+            session_thread,
+            await asyncio.wrap_future(
+                lease.executor.submit(threading.get_ident)
+            ),
+        )
+        await scraper.release_webdriver()
+        await DriverPoolRegistry.close_all()
+
+    async def test_load_page_waits_for_host_rate_limiter(self):
+        scraper = MockScraper(product_url='https://www.mock.com')
+        scraper.webdriver = MagicMock()
+        scraper._crawl_delay_fetched = True
+        scraper.crawl_delay = 0.05
+
+        await scraper.load_page('https://www.mock.com/1')
+        await scraper.load_page('https://www.mock.com/2')
+
+        limiter_stats = RateLimiterRegistry.stats()[0]
+        self.assertEqual(limiter_stats.host, 'www.mock.com')
+        self.assertEqual(limiter_stats.rate, 20)
+        self.assertEqual(limiter_stats.delayed, 1)
+        self.assertGreater(scraper.telemetry.rate_limit_wait, 0.04)
+        await scraper.release_webdriver()
+
+    async def test_load_pages_in_tabs_reports_tab_load_errors(self):
+        scraper = MockScraper(
+            product_url='https://www.mock.com', pages_concurrency=3
+        )
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.current_window_handle = 'main'
+        scraper._crawl_delay_fetched = True
+        closed = []
+
+        def switch_to_loaded_tab(handle):
+            if handle == 'tab-https://www.mock.com/2':
+                raise TimeoutException('page load timed out')
+
+        with patch.object(
+            scraper, '_open_tab', side_effect=lambda url: f'tab-{url}'
+        ), patch.object(
+            scraper, '_switch_to_loaded_tab', side_effect=switch_to_loaded_tab
+        ), patch.object(
+            scraper,
+            '_close_tabs',
+            side_effect=lambda handles, main: closed.extend(handles),
+        ):
+            loaded = [
+                (index, url, error)
+                async for index, url, error in scraper.load_pages_in_tabs(
+                    [f'https://www.mock.com/{page}' for page in range(1, 4)]
+                )
+            ]
+
+        self.assertEqual([index for index, _, _ in loaded], [0, 1, 2])
+        self.assertIsNone(loaded[0][2])
+        self.assertIsInstance(loaded[1][2], TimeoutException)
+        self.assertIsNone(loaded[2][2])
+        self.assertEqual(scraper.telemetry.pages_loaded, 2)
+        self.assertEqual(len(closed), 3)
+        await scraper.release_webdriver()
+
+    async def test_wait_for_polls_until_element_is_present(self):
+        scraper = MockScraper(
+            product_url='https://www.mock.com', marketplace='mock_wait'
+        )
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.find_elements.side_effect = [[], [], [MagicMock()]]
+
+        waited = await scraper.wait_for('div.offers')
+
+        wait_stats = AdaptiveWaitRegistry.stats()[0]
+        self.assertEqual(scraper.webdriver.find_elements.call_count, 3)
+        self.assertEqual(wait_stats.marketplace, 'mock_wait')
+        self.assertEqual(wait_stats.samples, 1)
+        self.assertEqual(
+            scraper.telemetry.selector_waits['div.offers'], waited
+        )
+        await scraper.release_webdriver()
+
+    async def test_wait_for_raises_after_learnt_deadline(self):
+        scraper = MockScraper(
+            product_url='https://www.mock.com', marketplace='mock_wait'
+        )
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.find_elements.return_value = []
+        latency = AdaptiveWaitRegistry.get_latency('mock_wait', 'div.offers')
+        latency.min_timeout = 0.05
+        for _ in range(latency.min_samples):
+            latency.record(0.01)
+
+        with self.assertRaises(TimeoutException):
+            await scraper.wait_for('div.offers')
+
+        self.assertEqual(latency.stats().timeouts, 1)
+        self.assertGreaterEqual(
+            scraper.telemetry.selector_waits['div.offers'], 0.05
+        )
+        await scraper.release_webdriver()
+
+    async def test_probe_reports_unchanged_page_on_not_modified(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(304)
+
+        scraper = MockScraper(
+            product_url='https://www.mock.com/product',
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ),
+        )
+        scraper._crawl_delay_fetched = True
+        scraper.crawl_delay = 0
+
+        result = await scraper.probe({'etag': '"v1"', 'fingerprint': 'abc'})
+
+        self.assertFalse(result.changed)
+        self.assertTrue(result.not_modified)
+        self.assertEqual(result.fingerprint, 'abc')
+        self.assertEqual(requests[0].headers['If-None-Match'], '"v1"')
+        await scraper.http_client.aclose()
+
+    async def test_probe_compares_price_fragment_fingerprint(self):
+        prices = ['R$ 10', 'R$ 10', 'R$ 12']
+
+        def handler(request):
+            page = f'<span class="price">{prices.pop(0)}</span><p>{len(prices)}</p>'
+            return httpx.Response(200, text=page)
+
+        scraper = MockScraper(
+            product_url='https://www.mock.com/product',
+            probe_selectors=['span.price'],
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ),
+        )
+        scraper._crawl_delay_fetched = True
+        scraper.crawl_delay = 0
+
+        first = await scraper.probe()
+        second = await scraper.probe(first.snapshot())
+        third = await scraper.probe(second.snapshot())
+
+        self.assertTrue(first.changed)
+        self.assertFalse(second.changed)
+        self.assertFalse(second.not_modified)
+        self.assertTrue(third.changed)
+        await scraper.http_client.aclose()
+
+
+class TestFetchPolicy(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RateLimiterRegistry.clear()
+        FetchLatencyRegistry.clear()
+
+    def build_scraper(self, handler, **policy):
+        scraper = MockScraper(
+            product_url='https://www.mock.com/product',
+            http_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ),
+            rate_limit_enabled=False,
+            fetch_policy=FetchPolicy(backoff_base=0, **policy),
+        )
+        return scraper
+
+    async def test_retries_retryable_statuses_and_errors(self):
+        outcomes = [httpx.ConnectError('reset'), 503, 200]
+
+        def handler(request):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, text=str(outcome))
+
+        scraper = self.build_scraper(handler, max_attempts=3)
+
+        content = await scraper.fetch_content()
+
+        self.assertEqual(content, '200')
+        self.assertEqual(
+            [
+                (attempt['attempt'], attempt['status'], attempt['error'])
+                for attempt in scraper.telemetry.fetch_attempts
+            ],
+            [(1, None, 'reset'), (2, 503, None), (3, 200, None)],
+        )
+        self.assertEqual(scraper.telemetry.retries, 2)
+        await scraper.http_client.aclose()
+
+    async def test_does_not_retry_other_statuses(self):
+        scraper = self.build_scraper(lambda request: httpx.Response(404))
+
+        response = await scraper.fetch('https://www.mock.com/product')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(len(scraper.telemetry.fetch_attempts), 1)
+        await scraper.http_client.aclose()
+
+    async def test_retry_budget_is_shared_by_the_research(self):
+        scraper = self.build_scraper(
+            lambda request: httpx.Response(503), max_attempts=3, retry_budget=3
+        )
+
+        first = await scraper.fetch('https://www.mock.com/product')
+        second = await scraper.fetch('https://www.mock.com/other')
+
+        self.assertEqual(first.status_code, 503)
+        self.assertEqual(second.status_code, 503)
+        self.assertEqual(len(scraper.telemetry.fetch_attempts), 5)
+        self.assertEqual(scraper.telemetry.retries, 3)
+        await scraper.http_client.aclose()
+
+    async def test_raises_the_last_error_when_attempts_run_out(self):
+        def handler(request):
+            raise httpx.ConnectError('refused')
+
+        scraper = self.build_scraper(handler, max_attempts=2)
+
+        with self.assertRaises(httpx.ConnectError):
+            await scraper.fetch_content()
+        self.assertEqual(len(scraper.telemetry.fetch_attempts), 2)
+        await scraper.http_client.aclose()
+
+    async def test_slow_attempt_is_hedged_and_first_response_wins(self):
+        delays = [1.0, 0.0]
+
+        async def handler(request):
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return httpx.Response(200, text=f'slept {delay}')
+
+        latency = FetchLatencyRegistry.get_latency('www.mock.com')
+        for _ in range(5):
+            latency.record(0.01)
+        scraper = self.build_scraper(
+            handler, hedge_enabled=True, hedge_min_samples=5
+        )
+
+        content = await scraper.fetch_content()
+
+        self.assertEqual(content, 'slept 0.0')
+        attempts = scraper.telemetry.fetch_attempts
+        self.assertEqual(
+            [(attempt['hedged'], attempt['error']) for attempt in attempts],
+            [(True, None), (False, 'cancelled')],
+        )
+        self.assertEqual(scraper.telemetry.retries, 1)
+        self.assertEqual(latency.stats().hedged, 1)
+        await scraper.http_client.aclose()
+
+    async def test_time_queued_on_rate_limiter_does_not_trigger_hedge(self):
+        latency = FetchLatencyRegistry.get_latency('www.mock.com')
+        for _ in range(5):
+            latency.record(0.01)
+        scraper = self.build_scraper(
+            lambda request: httpx.Response(200),
+            hedge_enabled=True,
+            hedge_min_samples=5,
+        )
+        scraper.rate_limit_enabled = True
+        scraper._crawl_delay_fetched = True
+        scraper.crawl_delay = 0.2
+
+        await scraper.fetch('https://www.mock.com/1')
+        await scraper.fetch('https://www.mock.com/2')
+
+        self.assertGreater(scraper.telemetry.rate_limit_wait, 0.1)
+        self.assertEqual(len(scraper.telemetry.fetch_attempts), 2)
+        self.assertEqual(latency.stats().hedged, 0)
+        await scraper.http_client.aclose()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,7 @@
+import html
 import json
 import unittest
-from unittest.mock import MagicMock, patch
-
-from selenium.webdriver.remote.webelement import WebElement
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
     BelezaNaWebScraper,
@@ -13,6 +12,7 @@ class TestBelezaNaWebScraper(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.scraper = BelezaNaWebScraper(
             product_url='https://www.belezanaweb.com.br/some-product',
+            rate_limit_enabled=False,
         )
         self.seller_data = {
             'sku': 'SKU12345',
@@ -52,9 +52,13 @@ class TestBelezaNaWebScraper(unittest.IsolatedAsyncioTestCase):
         seller_name = await self.scraper.get_seller_name(self.seller_data)
         self.assertEqual(seller_name, self.seller_data['seller']['name'])
 
-    @patch('selenium.webdriver.Chrome.find_elements')
-    async def test_get_sellers_list_success(self, mock_find_elements):
-        mock_web_element = MagicMock(spec=WebElement)
+    @patch.object(
+        BelezaNaWebScraper,
+        'fetch_content',
+        new_callable=AsyncMock,
+        side_effect=Exception('mock_exception'),
+    )
+    async def test_get_sellers_list_success(self, mock_fetch_content):
         mock_seller_data = json.dumps(
             [
                 {
@@ -69,10 +73,9 @@ class TestBelezaNaWebScraper(unittest.IsolatedAsyncioTestCase):
                 }
             ]
         )
-        mock_web_element.get_attribute.return_value = mock_seller_data
-
-        mock_find_elements.return_value = [mock_web_element]
-        self.scraper.webdriver.find_elements = mock_find_elements
+        self.scraper.webdriver.execute_script.return_value = [
+            {'seller': mock_seller_data}
+        ]
 
         sellers = await self.scraper.get_sellers_list()
 
@@ -86,6 +89,38 @@ class TestBelezaNaWebScraper(unittest.IsolatedAsyncioTestCase):
             'Sellers list does not match expected sellers.',
         )
 
+    @patch.object(BelezaNaWebScraper, 'fetch_content', new_callable=AsyncMock)
+    async def test_get_sellers_list_over_http(self, mock_fetch_content):
+        sellers_data = html.escape(json.dumps([self.seller_data]))
+        mock_fetch_content.return_value = f"""
+            <html><body>
+                <a class="btn js-add-to-cart" data-sku="{sellers_data}">Comprar</a>
+                <a class="btn js-add-to-cart" data-sku="[]">Comprar</a>
+                <a class="btn js-add-to-cart" data-sku="{sellers_data}">Comprar</a>
+            </body></html>
+        """
+
+        sellers = await self.scraper.get_sellers_list()
+
+        self.assertEqual(sellers, [self.seller_data, self.seller_data])
+        self.scraper.webdriver.execute_script.assert_not_called()
+
+    @patch.object(BelezaNaWebScraper, 'fetch_content', new_callable=AsyncMock)
+    async def test_get_sellers_list_falls_back_to_webdriver(
+        self, mock_fetch_content
+    ):
+        mock_fetch_content.return_value = '<html><body></body></html>'
+        self.scraper.webdriver.execute_script.return_value = [
+            {'seller': json.dumps([self.seller_data])}
+        ]
+
+        sellers = await self.scraper.get_sellers_list()
+
+        self.assertEqual(sellers, [self.seller_data])
+        self.scraper.webdriver.get.assert_called_once_with(
+            str(self.scraper.product_url)
+        )
+
     @patch.object(
         BelezaNaWebScraper, 'get_marketplace_id', return_value='SKU12345'
     )
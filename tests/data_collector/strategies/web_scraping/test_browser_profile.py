@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, call
+
+from selenium.webdriver.chrome.options import Options
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    AmazonScraper,
+    BrowserProfile,
+)
+
+
+class TestBrowserProfile(unittest.TestCase):
+    def setUp(self):
+        self.profile = BrowserProfile(
+            blocked_resources=['image', 'stylesheet', 'tracker'],
+            allowed_resources=['stylesheet'],
+            blocked_urls=['*mock-ads.com*'],
+        )
+
+    def test_allowed_resources_are_not_blocked(self):
+        patterns = self.profile.get_blocked_url_patterns()
+
+        self.assertIn('*.png', patterns)
+        self.assertIn('*doubleclick.net*', patterns)
+        self.assertIn('*mock-ads.com*', patterns)
+        self.assertNotIn('*.css', patterns)
+
+    def test_apply_to_options_sets_eager_strategy_and_preferences(self):
+        options = Options()
+
+        self.profile.apply_to_options(options)
+
+        self.assertEqual(options.page_load_strategy, 'eager')
+        preferences = options.experimental_options['prefs']
+        self.assertEqual(
+            preferences['profile.managed_default_content_settings.images'], 2
+        )
+
+    def test_apply_to_driver_blocks_urls_through_devtools(self):
+        driver = MagicMock()
+
+        self.profile.apply_to_driver(driver)
+
+        driver.execute_cdp_cmd.assert_has_calls(
+            [
+                call('Network.enable', {}),
+                call(
+                    'Network.setBlockedURLs',
+                    {'urls': self.profile.get_blocked_url_patterns()},
+                ),
+            ]
+        )
+
+    def test_disabled_profile_changes_nothing(self):
+        profile = self.profile.model_copy(update={'enabled': False})
+        options = Options()
+        driver = MagicMock()
+
+        profile.apply_to_options(options)
+        profile.apply_to_driver(driver)
+
+        self.assertEqual(options.page_load_strategy, 'normal')
+        self.assertNotIn('prefs', options.experimental_options)
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_scrapers_use_their_marketplace_profile(self):
+        scraper = AmazonScraper(product_url='https://www.amazon.com.br/dp/1')
+
+        self.assertEqual(
+            scraper.browser_profile, BrowserProfile.for_marketplace('amazon')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
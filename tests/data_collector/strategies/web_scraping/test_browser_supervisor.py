@@ -0,0 +1,200 @@
+import asyncio
+import gc
+import subprocess
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BrowserSupervisor,
+    DriverPool,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping.browser_supervisor import (
+    get_descendants,
+    read_processes,
+)
+
+
+class FakeService:
+    def __init__(self, process):
+        self.process = process
+
+
+class FakeDriver:
+    def __init__(self, quit_event=None):
+        self.service = FakeService(
+            subprocess.Popen(['sh', '-c', 'sleep 30 & wait'])
+        )
+        self.quit_event = quit_event
+
+        self.window_handles = ['main']
+        self.switch_to = MagicMock()
+
+    def quit(self):
+        if self.quit_event is not None:
+            self.quit_event.wait()
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_cdp_cmd(self, command, args):
+        pass
+
+    def get(self, url):
+        pass
+
+
+def wait_for_children(pid, count=1):
+    for _ in range(100):
+        if len(get_descendants(pid, read_processes())) >= count:
+            return
+        time.sleep(0.01)
+
+
+def is_alive(pid):
+    process = read_processes().get(pid)
+    return process is not None and process.state != 'Z'
+
+
+def wait_until_dead(pids):
+    for _ in range(100):
+        if not any(is_alive(pid) for pid in pids):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@unittest.skipUnless(
+    BrowserSupervisor.is_supported(), 'procfs is not available'
+)
+class TestBrowserSupervisor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        BrowserSupervisor.clear()
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.kill()
+            process.wait()
+        BrowserSupervisor.clear()
+
+    def start_driver(self, **kwargs):
+        driver = FakeDriver(**kwargs)
+        process = driver.service.process
+        self.processes.append(process)
+        wait_for_children(process.pid)
+        return driver, process.pid
+
+    def get_tree(self, pid):
+        return [pid] + [
+            process.pid for process in get_descendants(pid, read_processes())
+        ]
+
+    def test_reports_memory_processes_and_pages(self):
+        driver, pid = self.start_driver()
+        BrowserSupervisor.track(driver, 'amazon')
+        BrowserSupervisor.record_page(driver)
+
+        stats = BrowserSupervisor.stats()
+
+        self.assertTrue(stats.supported)
+        self.assertEqual(len(stats.browsers), 1)
+        browser = stats.browsers[0]
+        self.assertEqual((browser.marketplace, browser.pid), ('amazon', pid))
+        self.assertEqual(browser.processes, 2)
+        self.assertEqual(browser.pages, 1)
+        self.assertGreater(browser.rss, 0)
+        self.assertTrue(browser.healthy)
+        self.assertEqual(stats.rss, browser.rss)
+
+    def test_browsers_over_the_limits_are_unhealthy(self):
+        driver, _ = self.start_driver()
+        BrowserSupervisor.track(driver, 'amazon')
+
+        with patch.object(BrowserSupervisor, 'max_pages', 1):
+            BrowserSupervisor.record_page(driver)
+            self.assertTrue(BrowserSupervisor.is_healthy(driver))
+            BrowserSupervisor.record_page(driver)
+            self.assertFalse(BrowserSupervisor.is_healthy(driver))
+
+        with patch.object(BrowserSupervisor, 'max_rss', 1):
+            BrowserSupervisor.clear()
+            BrowserSupervisor.track(driver, 'amazon')
+            self.assertFalse(BrowserSupervisor.is_healthy(driver))
+
+    def test_sweep_kills_browsers_over_the_memory_limit(self):
+        driver, pid = self.start_driver()
+        BrowserSupervisor.track(driver, 'amazon')
+        tree = self.get_tree(pid)
+
+        with patch.object(BrowserSupervisor, 'max_rss', 1):
+            stats = BrowserSupervisor.sweep()
+
+        self.assertEqual(stats.killed, 1)
+        self.assertEqual(stats.browsers, [])
+        self.assertTrue(wait_until_dead(tree))
+
+    def test_sweep_reaps_browsers_whose_driver_was_collected(self):
+        driver, pid = self.start_driver()
+        BrowserSupervisor.track(driver, 'amazon')
+        tree = self.get_tree(pid)
+        del driver
+        gc.collect()
+
+        stats = BrowserSupervisor.sweep()
+
+        self.assertEqual(stats.orphans_reaped, 2)
+        self.assertTrue(wait_until_dead(tree))
+
+    def test_sweep_reaps_untracked_browser_processes(self):
+        _, pid = self.start_driver()
+        tree = self.get_tree(pid)
+
+        with patch.object(
+            BrowserSupervisor, 'process_names', ('sleep',)
+        ), patch.object(BrowserSupervisor, 'orphan_grace', 0):
+            stats = BrowserSupervisor.sweep()
+
+        self.assertEqual(stats.orphans_reaped, 1)
+        self.assertTrue(wait_until_dead(tree[1:]))
+
+    async def test_pool_replaces_idle_session_killed_by_a_sweep(self):
+        def driver_factory():
+            driver, _ = self.start_driver()
+            BrowserSupervisor.track(driver, 'amazon')
+            return driver
+
+        pool = DriverPool('amazon', driver_factory=driver_factory)
+        first = await pool.acquire()
+        await pool.release(first)
+
+        with patch.object(BrowserSupervisor, 'max_rss', 1):
+            BrowserSupervisor.sweep()
+        self.assertFalse(BrowserSupervisor.is_healthy(first.driver))
+        second = await pool.acquire()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(pool.stats().recycled, 1)
+        await pool.release(second)
+        await pool.close()
+
+    async def test_quit_kills_a_hung_driver(self):
+        quit_event = threading.Event()
+        driver, pid = self.start_driver(quit_event=quit_event)
+        BrowserSupervisor.track(driver, 'amazon')
+        tree = self.get_tree(pid)
+
+        with patch(
+            'kami_pricing_analytics.data_collector.strategies.web_scraping.browser_supervisor.SUPERVISOR_QUIT_TIMEOUT',
+            0.05,
+        ):
+            await BrowserSupervisor.quit(driver, asyncio.to_thread)
+        quit_event.set()
+
+        self.assertEqual(BrowserSupervisor.stats().browsers, [])
+        self.assertTrue(wait_until_dead(tree))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import time
+import unittest
+from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BaseScraper,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenException,
+    CircuitState,
+)
+
+
+class MockScraper(BaseScraper):
+    webdriver_required: bool = False
+    marketplace: str = 'mock'
+    error: Optional[Exception] = None
+
+    async def get_marketplace_id(self):
+        return 'mock_marketplace_id'
+
+    async def get_brand(self):
+        return 'mock_brand'
+
+    async def get_description(self):
+        return 'mock_description'
+
+    async def get_price(self):
+        return 'mock_price'
+
+    async def get_seller_id(self):
+        return 'mock_seller_id'
+
+    async def get_seller_name(self):
+        return 'mock_seller_name'
+
+    async def get_seller_url(self):
+        return 'mock_seller_url'
+
+    async def get_seller_info(self, seller):
+        return {'seller': seller}
+
+    async def get_sellers_list(self):
+        if self.error:
+            raise self.error
+        return ['seller1']
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def build_breaker(self, **kwargs):
+        options = {
+            'window': 60,
+            'min_calls': 4,
+            'error_rate': 0.5,
+            'timeout_rate': 0.5,
+            'open_duration': 0.05,
+            'half_open_calls': 2,
+        }
+        options.update(kwargs)
+        return CircuitBreaker('mock', **options)
+
+    def record_calls(self, breaker, outcomes):
+        for success, timed_out in outcomes:
+            breaker.record(breaker.acquire(), success, timed_out)
+
+    def test_opens_once_the_error_rate_is_reached(self):
+        breaker = self.build_breaker()
+
+        self.record_calls(
+            breaker, [(True, False), (False, False), (True, False)]
+        )
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+        self.record_calls(breaker, [(False, False)])
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenException) as context:
+            breaker.acquire()
+        self.assertGreater(context.exception.retry_after, 0)
+        self.assertEqual(breaker.stats().rejected, 1)
+
+    def test_opens_once_the_timeout_rate_is_reached(self):
+        breaker = self.build_breaker(error_rate=1.0, timeout_rate=0.25)
+
+        self.record_calls(breaker, [(True, False)] * 3 + [(False, True)])
+
+        stats = breaker.stats()
+        self.assertEqual(stats.state, CircuitState.OPEN)
+        self.assertEqual(stats.timeouts, 1)
+        self.assertEqual(stats.timeout_rate, 0.25)
+
+    def test_half_open_trials_close_the_circuit(self):
+        breaker = self.build_breaker()
+        self.record_calls(breaker, [(False, False)] * 4)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        first = breaker.acquire()
+        second = breaker.acquire()
+        with self.assertRaises(CircuitOpenException):
+            breaker.acquire()
+        self.assertTrue(first.trial)
+        breaker.record(first, True)
+        breaker.record(second, True)
+
+        stats = breaker.stats()
+        self.assertEqual(stats.state, CircuitState.CLOSED)
+        self.assertEqual(stats.calls, 0)
+
+    def test_failed_half_open_trial_opens_the_circuit_again(self):
+        breaker = self.build_breaker()
+        self.record_calls(breaker, [(False, False)] * 4)
+        time.sleep(0.06)
+
+        breaker.record(breaker.acquire(), False)
+
+        stats = breaker.stats()
+        self.assertEqual(stats.state, CircuitState.OPEN)
+        self.assertEqual(stats.opened, 2)
+
+    def test_released_trial_lets_another_trial_through(self):
+        breaker = self.build_breaker(half_open_calls=1)
+        self.record_calls(breaker, [(False, False)] * 4)
+        time.sleep(0.06)
+
+        breaker.release(breaker.acquire())
+        breaker.record(breaker.acquire(), True)
+
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_calls_admitted_before_opening_are_not_trials(self):
+        breaker = self.build_breaker(half_open_calls=1)
+        in_flight = breaker.acquire()
+        cancelled = breaker.acquire()
+        self.record_calls(breaker, [(False, False)] * 4)
+        time.sleep(0.06)
+
+        trial = breaker.acquire()
+        breaker.release(cancelled)
+        breaker.record(in_flight, True)
+
+        self.assertFalse(in_flight.trial)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        with self.assertRaises(CircuitOpenException):
+            breaker.acquire()
+        breaker.record(trial, True)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_trials_of_an_earlier_round_are_ignored(self):
+        breaker = self.build_breaker()
+        self.record_calls(breaker, [(False, False)] * 4)
+        time.sleep(0.06)
+        stale = breaker.acquire()
+        breaker.record(breaker.acquire(), False)
+        time.sleep(0.06)
+
+        trial = breaker.acquire()
+        breaker.record(stale, True)
+        breaker.record(trial, True)
+
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+
+
+class TestGuardedScraper(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        CircuitBreakerRegistry.clear()
+
+    def build_scraper(self, breaker, error=None):
+        return MockScraper(
+            product_url='https://www.mock.com/product',
+            circuit_breaker=breaker,
+            error=error,
+        )
+
+    async def test_execute_records_outcomes_and_fails_fast_when_open(self):
+        breaker = CircuitBreaker(
+            'mock', min_calls=2, error_rate=0.5, open_duration=60
+        )
+
+        sellers = await self.build_scraper(breaker).execute()
+        self.assertEqual(sellers, [{'seller': 'seller1'}])
+
+        scraper = self.build_scraper(breaker, TimeoutException('blocked'))
+        self.assertEqual(await scraper.execute(), [])
+        self.assertTrue(scraper.telemetry.timed_out)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+        with self.assertRaises(CircuitOpenException):
+            await self.build_scraper(breaker).execute()
+
+        stats = breaker.stats()
+        self.assertEqual(
+            (stats.calls, stats.errors, stats.timeouts), (2, 1, 1)
+        )
+        self.assertEqual(stats.rejected, 1)
+
+    def test_registry_keeps_one_breaker_per_marketplace(self):
+        breaker = CircuitBreakerRegistry.get_breaker('amazon')
+
+        self.assertIs(CircuitBreakerRegistry.get_breaker('amazon'), breaker)
+        self.assertIsNot(
+            CircuitBreakerRegistry.get_breaker('mercado_livre'), breaker
+        )
+        self.assertEqual(
+            [stats.marketplace for stats in CircuitBreakerRegistry.stats()],
+            ['amazon', 'mercado_livre'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    DriverPool,
+    DriverPoolException,
+    DriverPoolRegistry,
+)
+
+
+def mock_driver_factory():
+    driver = MagicMock()
+    driver.window_handles = ['main']
+    return driver
+
+
+class TestDriverPool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.factory = MagicMock(side_effect=mock_driver_factory)
+        self.pool = DriverPool(
+            marketplace='mock',
+            driver_factory=self.factory,
+            max_size=1,
+            max_pages=2,
+            acquire_timeout=0.2,
+        )
+
+    async def test_released_driver_is_reused(self):
+        first = await self.pool.acquire()
+        await self.pool.release(first)
+        second = await self.pool.acquire()
+
+        self.assertIs(first, second)
+        self.factory.assert_called_once()
+        stats = self.pool.stats()
+        self.assertEqual(stats.leases, 2)
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    async def test_release_resets_session_state(self):
+        pooled = await self.pool.acquire()
+        pooled.driver.window_handles = ['main', 'tab']
+        await self.pool.release(pooled)
+
+        pooled.driver.close.assert_called_once()
+        pooled.driver.delete_all_cookies.assert_called_once()
+        pooled.driver.get.assert_called_with('about:blank')
+
+    async def test_failed_driver_is_recycled(self):
+        pooled = await self.pool.acquire()
+        await self.pool.release(pooled, failed=True)
+
+        pooled.driver.quit.assert_called_once()
+        self.assertEqual(self.pool.stats().size, 0)
+        self.assertEqual(self.pool.stats().recycled, 1)
+
+    async def test_driver_is_recycled_after_max_pages(self):
+        pooled = await self.pool.acquire()
+        pooled.pages_served = 2
+        await self.pool.release(pooled)
+        second = await self.pool.acquire()
+
+        self.assertIsNot(pooled, second)
+        self.assertEqual(self.factory.call_count, 2)
+
+    async def test_acquire_waits_for_release(self):
+        pooled = await self.pool.acquire()
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            await self.pool.release(pooled)
+
+        release_task = asyncio.create_task(release_later())
+        second = await self.pool.acquire()
+        await release_task
+
+        self.assertIs(pooled, second)
+        self.assertGreater(self.pool.stats().total_wait_time, 0)
+
+    async def test_acquire_timeout_raises_exception(self):
+        await self.pool.acquire()
+        with self.assertRaises(DriverPoolException):
+            await self.pool.acquire()
+
+    async def test_lease_marks_failed_driver(self):
+        with self.assertRaises(ValueError):
+            async with self.pool.lease() as pooled:
+                raise ValueError('mock_error')
+
+        pooled.driver.quit.assert_called_once()
+
+    async def test_creation_error_frees_slot(self):
+        self.factory.side_effect = Exception('mock_exception')
+        with self.assertRaises(DriverPoolException):
+            await self.pool.acquire()
+        self.assertEqual(self.pool.stats().size, 0)
+
+
+class TestDriverPoolRegistry(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await DriverPoolRegistry.close_all()
+
+    async def asyncTearDown(self):
+        await DriverPoolRegistry.close_all()
+
+    async def test_get_pool_returns_same_pool_per_marketplace(self):
+        pool = DriverPoolRegistry.get_pool('mock', mock_driver_factory)
+        same_pool = DriverPoolRegistry.get_pool('mock', mock_driver_factory)
+        other_pool = DriverPoolRegistry.get_pool('other', mock_driver_factory)
+
+        self.assertIs(pool, same_pool)
+        self.assertIsNot(pool, other_pool)
+        self.assertEqual(len(DriverPoolRegistry.stats()), 2)
+
+    async def test_sessions_are_built_by_the_factory_of_each_acquire(self):
+        pool = DriverPoolRegistry.get_pool('mock')
+        first_factory = MagicMock(side_effect=mock_driver_factory)
+        second_factory = MagicMock(side_effect=mock_driver_factory)
+
+        first = await pool.acquire(first_factory)
+        second = await pool.acquire(second_factory)
+
+        first_factory.assert_called_once()
+        second_factory.assert_called_once()
+        self.assertIsNone(pool.driver_factory)
+        await pool.release(first)
+        await pool.release(second)
+
+    async def test_acquire_without_factory_raises(self):
+        pool = DriverPoolRegistry.get_pool('mock')
+
+        with self.assertRaises(DriverPoolException):
+            await pool.acquire()
+
+
+if __name__ == '__main__':
+    unittest.main()
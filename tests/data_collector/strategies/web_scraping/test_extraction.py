@@ -0,0 +1,177 @@
+import unittest
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    CompiledExtractor,
+    ExtractionException,
+    ExtractionSpec,
+    ExtractorRegistry,
+    FieldSpec,
+)
+
+OFFERS_PAGE = """
+<html><body>
+    <h1 id="title">  Shampoo Anticaspa  </h1>
+    <table><tr><th>ASIN</th><td> B07GYX8QRJ </td></tr></table>
+    <div class="offer">
+        <span class="price">R$ <b>29,90</b></span>
+        <a class="seller" href="/sp?seller=A1">Loja A</a>
+    </div>
+    <div class="offer">
+        <span class="price">R$ <b>31,00</b></span>
+    </div>
+</body></html>
+"""
+
+OFFERS_SPEC = ExtractionSpec(
+    name='test.offers',
+    root_selector='div.offer',
+    fields={
+        'price': FieldSpec(selector='span.price', transforms=['squash']),
+        'price_html': FieldSpec(selector='span.price', source='html'),
+        'seller_id': FieldSpec(
+            selector='a.seller', source='href', transforms=['query:seller']
+        ),
+        'seller_url': FieldSpec(selector='a.seller', source='href'),
+    },
+)
+
+PRODUCT_SPEC = ExtractionSpec(
+    name='test.product',
+    fields={
+        'marketplace_id': FieldSpec(
+            selector='//th[contains(text(), "ASIN")]/following-sibling::td',
+            by='xpath',
+            transforms=['strip'],
+        ),
+        'description': FieldSpec(selector='#title'),
+        'brand': FieldSpec(selector='#brand', optional=True),
+    },
+)
+
+
+class TestCompiledExtractor(unittest.TestCase):
+    def test_extracts_one_row_per_root_from_static_html(self):
+        extractor = CompiledExtractor(OFFERS_SPEC)
+
+        rows, timings = extractor.extract_html(
+            OFFERS_PAGE, 'https://www.mock.com/product'
+        )
+
+        self.assertEqual(
+            rows,
+            [
+                {
+                    'price': 'R$ 29,90',
+                    'price_html': 'R$ <b>29,90</b>',
+                    'seller_id': 'A1',
+                    'seller_url': 'https://www.mock.com/sp?seller=A1',
+                },
+                {
+                    'price': 'R$ 31,00',
+                    'price_html': 'R$ <b>31,00</b>',
+                    'seller_id': None,
+                    'seller_url': None,
+                },
+            ],
+        )
+        self.assertEqual(set(timings), set(OFFERS_SPEC.fields))
+
+    def test_reads_xpath_fields_and_reports_missing_required_fields(self):
+        extractor = CompiledExtractor(PRODUCT_SPEC)
+
+        rows, _ = extractor.extract_html(OFFERS_PAGE)
+
+        self.assertEqual(
+            rows,
+            [
+                {
+                    'marketplace_id': 'B07GYX8QRJ',
+                    'description': 'Shampoo Anticaspa',
+                    'brand': None,
+                }
+            ],
+        )
+        self.assertEqual(extractor.missing_fields(rows[0]), [])
+        self.assertEqual(
+            extractor.missing_fields(extractor.empty_row()),
+            ['marketplace_id', 'description'],
+        )
+
+    def test_processes_driver_results_with_the_same_transforms(self):
+        extractor = CompiledExtractor(OFFERS_SPEC)
+
+        rows, timings = extractor.process(
+            {
+                'rows': [
+                    {
+                        'price': ' R$\n29,90 ',
+                        'price_html': 'R$ <b>29,90</b>',
+                        'seller_id': 'https://www.mock.com/sp?seller=A1',
+                        'seller_url': 'https://www.mock.com/sp?seller=A1',
+                    }
+                ],
+                'timings': {'price': 2.0, 'seller_id': 0.5},
+            }
+        )
+
+        self.assertEqual(rows[0]['price'], 'R$ 29,90')
+        self.assertEqual(rows[0]['seller_id'], 'A1')
+        self.assertEqual(timings, {'price': 0.002, 'seller_id': 0.0005})
+
+    def test_accounts_reads_and_misses_per_field(self):
+        extractor = CompiledExtractor(OFFERS_SPEC)
+
+        extractor.extract_html(OFFERS_PAGE)
+        extractor.process([{'price': '10'}])
+
+        stats = {
+            field_stats.field: field_stats for field_stats in extractor.stats()
+        }
+        self.assertEqual(stats['price'].reads, 3)
+        self.assertEqual(stats['price'].misses, 0)
+        self.assertEqual(stats['seller_url'].misses, 2)
+        self.assertGreater(stats['price'].seconds, 0)
+
+        extractor.reset()
+        self.assertEqual(extractor.stats()[0].reads, 0)
+
+    def test_failed_transform_raises_extraction_exception(self):
+        extractor = CompiledExtractor(
+            ExtractionSpec(
+                name='test.json',
+                fields={
+                    'data': FieldSpec(source='data-sku', transforms=['json'])
+                },
+                root_selector='a',
+            )
+        )
+
+        with self.assertRaises(ExtractionException):
+            extractor.extract_html('<a data-sku="not json">Comprar</a>')
+
+    def test_unknown_transform_fails_at_compile_time(self):
+        with self.assertRaises(ExtractionException):
+            CompiledExtractor(
+                ExtractionSpec(
+                    name='test.unknown',
+                    fields={'price': FieldSpec(transforms=['currency'])},
+                )
+            )
+
+
+class TestExtractorRegistry(unittest.TestCase):
+    def test_compiles_each_spec_once(self):
+        extractor = ExtractorRegistry.compile(PRODUCT_SPEC)
+
+        self.assertIs(ExtractorRegistry.compile(PRODUCT_SPEC), extractor)
+        self.assertIn(
+            ('test.product', 'marketplace_id'),
+            {
+                (field_stats.extractor, field_stats.field)
+                for field_stats in ExtractorRegistry.stats()
+            },
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
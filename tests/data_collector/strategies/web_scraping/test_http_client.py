@@ -0,0 +1,80 @@
+import unittest
+
+import httpx
+
+from kami_pricing_analytics.data_collector import CollectorFactory
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BelezaNaWebScraper,
+    HttpClientRegistry,
+)
+
+
+class TestHttpClientRegistry(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await HttpClientRegistry.close_all()
+
+    async def asyncTearDown(self):
+        await HttpClientRegistry.close_all()
+
+    def test_get_client_returns_none_when_not_started(self):
+        self.assertIsNone(
+            HttpClientRegistry.get_client('https://www.mock.com/product')
+        )
+
+    def test_get_client_returns_same_client_per_host(self):
+        HttpClientRegistry.start()
+        client = HttpClientRegistry.get_client('https://www.mock.com/1')
+        same_client = HttpClientRegistry.get_client('https://www.mock.com/2')
+        other_client = HttpClientRegistry.get_client('https://www.other.com/1')
+
+        self.assertIs(client, same_client)
+        self.assertIsNot(client, other_client)
+        self.assertTrue(HttpClientRegistry.is_shared(client))
+
+    async def test_close_all_closes_clients(self):
+        HttpClientRegistry.start()
+        client = HttpClientRegistry.get_client('https://www.mock.com/1')
+
+        await HttpClientRegistry.close_all()
+
+        self.assertTrue(client.is_closed)
+        self.assertFalse(HttpClientRegistry.started)
+        self.assertEqual(HttpClientRegistry.clients, {})
+
+    def test_collector_factory_injects_shared_client(self):
+        HttpClientRegistry.start()
+        product_url = 'https://www.belezanaweb.com.br/mock-product'
+        scraper = CollectorFactory.get_strategy(
+            collector_option=0, product_url=product_url
+        )
+
+        self.assertIs(
+            scraper.http_client, HttpClientRegistry.get_client(product_url)
+        )
+
+    async def test_fetch_content_reuses_injected_client(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text='mock_content')
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper = BelezaNaWebScraper(
+            product_url='https://www.belezanaweb.com.br/mock-product',
+            http_client=client,
+        )
+
+        first = await scraper.fetch_content()
+        second = await scraper.fetch_content()
+
+        self.assertEqual((first, second), ('mock_content', 'mock_content'))
+        self.assertFalse(client.is_closed)
+        self.assertEqual(
+            requests[-1].headers['User-Agent'], scraper.user_agent
+        )
+        await client.aclose()
+
+
+if __name__ == '__main__':
+    unittest.main()
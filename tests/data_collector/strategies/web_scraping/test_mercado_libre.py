@@ -1,17 +1,51 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from selenium.webdriver.common.by import By
 
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
     MercadoLibreScraper,
+    MercadoLibreScraperException,
+    TitleMatcher,
 )
 
 
+class MockTabsDriver:
+    def __init__(self):
+        self.current_window_handle = 'main'
+        self.window_handles = ['main']
+        self.tabs = {'main': 'about:blank'}
+        self.switch_to = MagicMock()
+        self.switch_to.window.side_effect = self._switch_to_window
+
+    def _switch_to_window(self, handle):
+        self.current_window_handle = handle
+
+    @property
+    def current_url(self):
+        return self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if 'window.open' in script:
+            handle = f'tab-{len(self.tabs)}'
+            self.tabs[handle] = args[0]
+            self.window_handles.append(handle)
+        elif 'location.assign' in script:
+            self.tabs[self.current_window_handle] = args[0]
+        return 'complete'
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return {}
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
 class TestMercadoLibreScraper(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.scraper = MercadoLibreScraper(
-            product_url='https://www.mercadolivre.com.br/some-product'
+            product_url='https://www.mercadolivre.com.br/some-product',
+            rate_limit_enabled=False,
         )
         seller_id = '4567'
         marketplace_id = 'MLB12345'
@@ -111,6 +145,181 @@ class TestMercadoLibreScraper(unittest.IsolatedAsyncioTestCase):
         seller_url = await self.scraper.get_seller_url()
         self.assertEqual(seller_url, self.seller_data['seller_url'])
 
+    async def test_get_search_pagination(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {
+                'page_count': 'de 20',
+                'next_page_url': 'https://lista.mercadolivre.com.br/shampoo_Desde_49_NoIndex_True',
+            }
+        ]
+
+        pagination = await self.scraper._get_search_pagination()
+
+        self.assertEqual(pagination, (20, 48))
+
+    async def test_get_search_pagination_without_pagination(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {'page_count': None, 'next_page_url': None}
+        ]
+
+        pagination = await self.scraper._get_search_pagination()
+
+        self.assertEqual(pagination, (1, 50))
+
+    def test_build_search_page_urls(self):
+        self.scraper.max_search_pages = 3
+
+        search_page_urls = self.scraper._build_search_page_urls(
+            'https://lista.mercadolivre.com.br/shampoo', 20, 48
+        )
+
+        self.assertEqual(
+            search_page_urls,
+            [
+                'https://lista.mercadolivre.com.br/shampoo_Desde_49_NoIndex_True',
+                'https://lista.mercadolivre.com.br/shampoo_Desde_97_NoIndex_True',
+            ],
+        )
+
+    async def test_get_matching_sellers_skips_seen_listings(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {
+                'title': 'Shampoo Anticaspa',
+                'href': 'https://mock.com/1#position=1',
+            },
+            {
+                'title': 'Shampoo Anticaspa',
+                'href': 'https://mock.com/2#position=2',
+            },
+            {'title': 'Condicionador', 'href': 'https://mock.com/3'},
+        ]
+        seen = {'https://mock.com/1'}
+
+        sellers = await self.scraper._get_matching_sellers(
+            TitleMatcher('Shampoo Anticaspa'), seen
+        )
+
+        self.assertEqual(sellers, ['https://mock.com/2'])
+        self.assertEqual(seen, {'https://mock.com/1', 'https://mock.com/2'})
+
+    async def test_get_matching_sellers_accepts_near_identical_titles(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {
+                'title': 'Shampoo Anticaspa Natura Ekos 300ml',
+                'href': 'https://mock.com/1',
+            },
+            {
+                'title': 'Shampoo Anticaspa Natura Ekos 300 ml - Original',
+                'href': 'https://mock.com/2',
+            },
+            {
+                'title': 'Condicionador Natura Ekos 300ml',
+                'href': 'https://mock.com/3',
+            },
+            {'title': 'Shampoo Natura Ekos', 'href': None},
+        ]
+
+        sellers = await self.scraper._get_matching_sellers(
+            TitleMatcher('Shampoo Anticaspa Natura Ekos 300ml'),
+            set(),
+        )
+
+        self.assertEqual(sellers, ['https://mock.com/1', 'https://mock.com/2'])
+        matches = self.scraper.telemetry.title_matches
+        self.assertEqual(
+            [match['target'] for match in matches],
+            ['https://mock.com/1', 'https://mock.com/2'],
+        )
+        self.assertEqual(matches[0]['score'], 1.0)
+        self.assertLess(matches[1]['score'], 1.0)
+
+    async def test_extract_seller_info_reads_page_in_one_script(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {
+                'seller_url': self.seller_data['seller_url'],
+                'brand': self.seller_data['brand'],
+                'description': self.seller_data['description'],
+                'currency_symbol': 'R$',
+                'price_fraction': '29',
+                'price_cents': '90',
+                'seller_name': self.seller_data['seller_name'],
+            }
+        ]
+
+        seller = await self.scraper._extract_seller_info('https://mock.com/1')
+
+        self.assertEqual(
+            seller, {**self.seller_data, 'product_url': 'https://mock.com/1'}
+        )
+        self.scraper.webdriver.execute_script.assert_called_once()
+        self.scraper.webdriver.find_element.assert_not_called()
+
+    async def test_extract_seller_info_missing_field_raises_exception(self):
+        self.scraper.webdriver.execute_script.return_value = [
+            {
+                'seller_url': self.seller_data['seller_url'],
+                'brand': None,
+                'description': self.seller_data['description'],
+                'currency_symbol': 'R$',
+                'price_fraction': '29',
+                'price_cents': None,
+                'seller_name': self.seller_data['seller_name'],
+            }
+        ]
+
+        with self.assertRaises(MercadoLibreScraperException):
+            await self.scraper._extract_seller_info('https://mock.com/1')
+
+    async def test_get_sellers_info_loads_pages_concurrently_in_order(self):
+        seller_pages = [f'https://mock.com/page-{index}' for index in range(5)]
+        driver = MockTabsDriver()
+        self.scraper.webdriver = driver
+        self.scraper.pages_concurrency = 2
+
+        async def extract_seller_info(seller_product_page):
+            self.assertEqual(driver.current_url, seller_product_page)
+            if seller_product_page.endswith('page-3'):
+                raise Exception('mock_exception')
+            return {'product_url': seller_product_page}
+
+        with patch.object(
+            self.scraper,
+            '_extract_seller_info',
+            side_effect=extract_seller_info,
+        ):
+            sellers = await self.scraper.get_sellers_info(seller_pages)
+
+        self.assertEqual(
+            [seller['product_url'] for seller in sellers],
+            [seller_pages[index] for index in (0, 1, 2, 4)],
+        )
+        self.assertEqual(len(self.scraper.telemetry.failures), 1)
+        self.assertEqual(
+            self.scraper.telemetry.failures[0]['target'], seller_pages[3]
+        )
+        self.assertEqual(driver.window_handles, ['main'])
+        self.assertEqual(driver.current_window_handle, 'main')
+
+    async def test_stream_sellers_info_closes_tabs_when_stopped_early(self):
+        seller_pages = [f'https://mock.com/page-{index}' for index in range(4)]
+        driver = MockTabsDriver()
+        self.scraper.webdriver = driver
+        self.scraper.pages_concurrency = 2
+
+        with patch.object(
+            self.scraper,
+            '_extract_seller_info',
+            side_effect=lambda page: {'product_url': page},
+        ):
+            stream = self.scraper.stream_sellers_info(seller_pages)
+            first = await anext(stream)
+            self.assertEqual(len(driver.window_handles), 3)
+            await stream.aclose()
+
+        self.assertEqual(first['product_url'], seller_pages[0])
+        self.assertEqual(driver.window_handles, ['main'])
+        self.assertEqual(driver.current_window_handle, 'main')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,141 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BelezaNaWebScraper,
+    PageArchive,
+    PageArchiveRegistry,
+    RateLimiterRegistry,
+)
+
+
+class TestPageArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = PageArchive(self.directory.name, max_age=0, max_bytes=0)
+
+    def tearDown(self):
+        self.archive.close()
+        self.directory.cleanup()
+
+    def test_identical_pages_are_stored_once(self):
+        first = self.archive.store(
+            'amazon', 'B07GYX8QRJ', 'https://a/1', '<html>1</html>', 10
+        )
+        second = self.archive.store(
+            'amazon', 'B07GYX8QRJ', 'https://a/1', '<html>1</html>', 20
+        )
+
+        stats = self.archive.stats()
+        self.assertEqual(first.content_hash, second.content_hash)
+        self.assertEqual((stats.pages, stats.blobs), (2, 1))
+        self.assertEqual(
+            self.archive.read(first.content_hash), b'<html>1</html>'
+        )
+
+    def test_pages_are_indexed_by_marketplace_product_and_time(self):
+        self.archive.store('amazon', 'p1', 'https://a/1', 'a', 10)
+        self.archive.store('amazon', 'p2', 'https://a/2', 'b', 20)
+        self.archive.store('mercado_livre', 'p1', 'https://m/1', 'c', 30)
+
+        pages = self.archive.find(marketplace='amazon', since=15)
+
+        self.assertEqual([page.url for page in pages], ['https://a/2'])
+        self.assertEqual(len(self.archive.find(product_id='p1')), 2)
+
+    def test_compressed_blob_is_a_view_of_the_segment(self):
+        page = self.archive.store('amazon', 'p1', 'https://a/1', 'a' * 1000)
+
+        blob = self.archive.read_compressed(page.content_hash)
+
+        self.assertIsInstance(blob, memoryview)
+        self.assertEqual(len(blob), page.stored_size)
+        self.assertLess(page.stored_size, page.size)
+        blob.release()
+
+    def test_zlib_archives_are_readable(self):
+        archive = PageArchive(
+            os.path.join(self.directory.name, 'zlib'),
+            max_age=0,
+            max_bytes=0,
+            codec='zlib',
+        )
+        page = archive.store('amazon', 'p1', 'https://a/1', 'content')
+
+        self.assertEqual(archive.read(page.content_hash), b'content')
+        archive.close()
+
+    def test_sealing_a_segment_drops_expired_pages_and_empty_segments(self):
+        archive = PageArchive(
+            os.path.join(self.directory.name, 'retention'),
+            segment_size=64,
+            max_age=100,
+            max_bytes=0,
+        )
+        now = time.time()
+        old_page = archive.store(
+            'amazon', 'p1', 'https://a/1', os.urandom(80), now - 200
+        )
+        archive.store('amazon', 'p1', 'https://a/1', os.urandom(80), now)
+
+        archive.enforce_retention(now=now)
+
+        self.assertEqual(len(archive.find()), 1)
+        self.assertEqual(archive.stats().segments, 1)
+        with self.assertRaises(KeyError):
+            archive.read(old_page.content_hash)
+        archive.close()
+
+    def test_retention_bounds_stored_size(self):
+        archive = PageArchive(
+            os.path.join(self.directory.name, 'size'),
+            max_age=0,
+            max_bytes=250,
+        )
+        for fetched_at in range(3):
+            archive.store(
+                'amazon', 'p1', 'https://a/1', os.urandom(100), fetched_at
+            )
+
+        archive.enforce_retention()
+
+        pages = archive.find()
+        self.assertEqual([page.fetched_at for page in pages], [1, 2])
+        self.assertLessEqual(archive.stats().stored_size, 250)
+        archive.close()
+
+
+class TestScraperPageArchive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RateLimiterRegistry.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        PageArchiveRegistry.open(self.directory.name, max_age=0, max_bytes=0)
+
+    def tearDown(self):
+        PageArchiveRegistry.close()
+        self.directory.cleanup()
+
+    async def test_loaded_pages_are_archived(self):
+        scraper = BelezaNaWebScraper(
+            product_url='https://www.belezanaweb.com.br/produto',
+            rate_limit_enabled=False,
+        )
+        scraper.webdriver = MagicMock()
+        scraper.webdriver.page_source = '<html>page</html>'
+
+        await scraper.load_page(str(scraper.product_url))
+
+        pages = PageArchiveRegistry.get_archive().find(
+            marketplace='beleza_na_web'
+        )
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0].product_id, str(scraper.product_url))
+        self.assertEqual(scraper.telemetry.pages_archived, 1)
+        await scraper.release_webdriver()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import time
+import unittest
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    HostRateLimiter,
+    RateLimiterRegistry,
+)
+
+
+class TestHostRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_is_served_without_waiting(self):
+        limiter = HostRateLimiter('www.mock.com', rate=10, capacity=3)
+
+        waits = [await limiter.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+        self.assertEqual(limiter.stats().delayed, 0)
+
+    async def test_requests_over_the_burst_are_paced(self):
+        limiter = HostRateLimiter('www.mock.com', rate=20, capacity=1)
+        started_at = time.monotonic()
+
+        waits = await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.09)
+        self.assertEqual(sorted(waits)[0], 0.0)
+        self.assertAlmostEqual(sorted(waits)[-1], 0.1, places=2)
+        stats = limiter.stats()
+        self.assertEqual(stats.acquisitions, 3)
+        self.assertEqual(stats.delayed, 2)
+        self.assertAlmostEqual(stats.average_wait_time, 0.05, places=2)
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+    def setUp(self):
+        RateLimiterRegistry.clear()
+
+    def tearDown(self):
+        RateLimiterRegistry.clear()
+
+    def test_crawl_delay_sets_the_pace_of_the_host(self):
+        limiter = RateLimiterRegistry.get_limiter('https://www.mock.com/1', 2)
+        same_limiter = RateLimiterRegistry.get_limiter(
+            'https://www.mock.com/2', 4
+        )
+
+        self.assertIs(limiter, same_limiter)
+        self.assertEqual((limiter.rate, limiter.capacity), (0.25, 1))
+
+    def test_hosts_without_crawl_delay_use_default_pace(self):
+        limiter = RateLimiterRegistry.get_limiter('https://www.mock.com/1')
+
+        self.assertEqual(
+            (limiter.rate, limiter.capacity),
+            RateLimiterRegistry._get_pace(0),
+        )
+        self.assertEqual(len(RateLimiterRegistry.stats()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import html
+import json
+import tempfile
+import time
+import unittest
+
+import httpx
+
+from kami_pricing_analytics.data_collector import (
+    CollectorFactory,
+    CollectorOptions,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    RateLimiterRegistry,
+    ReplayFixtures,
+    ReplayServer,
+    RobotsCache,
+    build_replay_url,
+)
+
+PRODUCT_URL = 'https://www.belezanaweb.com.br/shampoo-anticaspa'
+
+SELLER_DATA = {
+    'sku': 'SKU12345',
+    'brand': 'Natura',
+    'name': 'Shampoo Anticaspa',
+    'price': 'R$29,90',
+    'seller': {'id': '9876', 'name': 'Beleza na Web Store'},
+}
+
+PRODUCT_PAGE = (
+    '<html><body><script>track()</script>'
+    '<a class="js-add-to-cart" data-sku="'
+    f'{html.escape(json.dumps([SELLER_DATA]))}">Comprar</a>'
+    '</body></html>'
+)
+
+
+class TestReplayServer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RobotsCache.clear()
+        RateLimiterRegistry.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        fixtures = ReplayFixtures(self.directory.name)
+        fixtures.add(PRODUCT_URL, PRODUCT_PAGE)
+        fixtures.save()
+        self.server = ReplayServer(
+            ReplayFixtures(self.directory.name), latency=0.05
+        ).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.directory.cleanup()
+        CollectorFactory.replay_url = None
+
+    async def test_recorded_pages_are_served_with_latency(self):
+        async with httpx.AsyncClient() as client:
+            started_at = time.monotonic()
+            response = await client.get(
+                build_replay_url(self.server.url, PRODUCT_URL)
+            )
+            missing = await client.get(
+                build_replay_url(self.server.url, f'{PRODUCT_URL}/missing')
+            )
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.1)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('js-add-to-cart', response.text)
+        self.assertNotIn('<script>', response.text)
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_collector_factory_points_scrapers_at_replay_server(self):
+        CollectorFactory.replay_url = self.server.url
+        scraper = CollectorFactory.get_strategy(
+            CollectorOptions.WEB_SCRAPING.value, PRODUCT_URL
+        )
+
+        sellers = await scraper.execute()
+
+        self.assertEqual(len(sellers), 1)
+        self.assertEqual(sellers[0]['seller_id'], '9876')
+        self.assertEqual(sellers[0]['price'], 'R$29,90')
+        self.assertEqual(self.server.requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
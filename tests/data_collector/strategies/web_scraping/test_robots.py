@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+import httpx
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    RobotsCache,
+)
+
+ROBOTS_TXT = """
+User-agent: *
+Crawl-delay: 2
+Disallow: /private
+"""
+
+
+def mock_response(status_code=200, text=ROBOTS_TXT):
+    return httpx.Response(
+        status_code,
+        text=text,
+        request=httpx.Request('GET', 'https://www.mock.com/robots.txt'),
+    )
+
+
+class TestRobotsCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RobotsCache.clear()
+        self.fetch = AsyncMock(return_value=mock_response())
+
+    def tearDown(self):
+        RobotsCache.clear()
+
+    async def test_rules_are_fetched_once_per_host(self):
+        delay = await RobotsCache.get_crawl_delay(
+            'https://www.mock.com/product/1', fetch=self.fetch
+        )
+        allowed = await RobotsCache.is_allowed(
+            'https://www.mock.com/product/2', fetch=self.fetch
+        )
+        denied = await RobotsCache.is_allowed(
+            'https://www.mock.com/private/1', fetch=self.fetch
+        )
+
+        self.assertEqual(delay, 2)
+        self.assertTrue(allowed)
+        self.assertFalse(denied)
+        self.fetch.assert_awaited_once_with('https://www.mock.com/robots.txt')
+
+    async def test_concurrent_callers_share_a_single_fetch(self):
+        await asyncio.gather(
+            *(
+                RobotsCache.get_entry('https://www.mock.com/', self.fetch)
+                for _ in range(5)
+            )
+        )
+        self.fetch.assert_awaited_once()
+
+    async def test_expired_rules_are_refreshed(self):
+        entry = await RobotsCache.get_entry(
+            'https://www.mock.com/', self.fetch
+        )
+        entry.expires_at = 0
+
+        await RobotsCache.get_entry('https://www.mock.com/', self.fetch)
+
+        self.assertEqual(self.fetch.await_count, 2)
+
+    async def test_stale_rules_are_served_on_error(self):
+        entry = await RobotsCache.get_entry(
+            'https://www.mock.com/', self.fetch
+        )
+        entry.expires_at = 0
+        self.fetch.side_effect = httpx.ConnectError('mock_error')
+
+        delay = await RobotsCache.get_crawl_delay(
+            'https://www.mock.com/', fetch=self.fetch
+        )
+
+        self.assertEqual(delay, 2)
+        self.assertTrue(RobotsCache.entries['www.mock.com'].stale)
+
+    async def test_missing_robots_allows_everything(self):
+        self.fetch.return_value = mock_response(404, 'not found')
+
+        allowed = await RobotsCache.is_allowed(
+            'https://www.mock.com/private/1', fetch=self.fetch
+        )
+
+        self.assertTrue(allowed)
+        self.assertFalse(RobotsCache.entries['www.mock.com'].stale)
+
+    async def test_first_error_is_raised_then_rules_are_permissive(self):
+        self.fetch.return_value = mock_response(503, '')
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await RobotsCache.get_entry('https://www.mock.com/', self.fetch)
+        allowed = await RobotsCache.is_allowed(
+            'https://www.mock.com/private/1', fetch=self.fetch
+        )
+
+        self.assertTrue(allowed)
+        self.assertTrue(RobotsCache.entries['www.mock.com'].stale)
+        self.fetch.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
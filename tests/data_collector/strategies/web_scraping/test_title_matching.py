@@ -0,0 +1,76 @@
+import unittest
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    TitleMatcher,
+)
+
+
+class TestTitleMatcher(unittest.TestCase):
+    def test_tokenize_folds_accents_and_punctuation(self):
+        self.assertEqual(
+            TitleMatcher.tokenize('Máscara Capilar Nutrição/Brilho (250g)'),
+            ['mascara', 'capilar', 'nutricao', 'brilho', '250g'],
+        )
+        self.assertEqual(TitleMatcher.tokenize(None), [])
+
+    def test_tokenize_drops_symbols_beyond_latin_punctuation(self):
+        self.assertEqual(
+            TitleMatcher.tokenize(
+                'Shampoo Anticaspa – 300ml ™ “Original” • Kit — 2un®'
+            ),
+            ['shampoo', 'anticaspa', '300ml', 'original', 'kit', '2un'],
+        )
+        matcher = TitleMatcher('Shampoo Anticaspa 300ml')
+        self.assertEqual(
+            matcher.score(['Shampoo Anticaspa – 300ml']).tolist(), [1.0]
+        )
+
+    def test_identical_token_sets_score_one(self):
+        matcher = TitleMatcher('Shampoo Anticaspa 300ml')
+
+        scores = matcher.score(
+            ['300ml ANTICASPA shampoo', 'Shampoo Anticaspa, 300ml!']
+        )
+
+        self.assertEqual(scores.tolist(), [1.0, 1.0])
+
+    def test_distinguishing_tokens_weigh_more_than_shared_ones(self):
+        matcher = TitleMatcher('Shampoo Anticaspa Natura 300ml')
+
+        missing_shared, missing_volume = matcher.score(
+            [
+                'Anticaspa Natura 300ml',
+                'Shampoo Anticaspa Natura',
+                'Shampoo Hidratante Natura 300ml',
+                'Shampoo Natura 1l',
+            ]
+        )[:2]
+
+        self.assertGreater(missing_shared, missing_volume)
+
+    def test_match_returns_candidates_above_threshold_with_scores(self):
+        matcher = TitleMatcher('Shampoo Anticaspa 300ml', threshold=0.7)
+        titles = [
+            'Condicionador 300ml',
+            'Shampoo Anticaspa 300ml',
+            'Shampoo Anticaspa 300ml Original',
+            None,
+        ]
+
+        matches = matcher.match(titles)
+
+        self.assertEqual([match.index for match in matches], [1, 2])
+        self.assertEqual(matches[0].score, 1.0)
+        self.assertGreaterEqual(matches[1].score, 0.7)
+        self.assertLess(matches[1].score, 1.0)
+        self.assertEqual(matches[1].title, 'Shampoo Anticaspa 300ml Original')
+
+    def test_empty_batch_has_no_matches(self):
+        matcher = TitleMatcher('Shampoo')
+
+        self.assertEqual(matcher.score([]).tolist(), [])
+        self.assertEqual(matcher.match([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
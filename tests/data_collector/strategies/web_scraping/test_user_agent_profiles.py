@@ -0,0 +1,155 @@
+import asyncio
+import tempfile
+import unittest
+
+import httpx
+
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    RateLimiterRegistry,
+    load_user_agents,
+    score_user_agents,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping.user_agent_profiles import (
+    load_profile,
+    save_profile,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping.utils import (
+    MinHasher,
+    estimate_similarity,
+    group_signatures,
+    group_user_agents_by_content_similarity,
+    shingle,
+)
+
+PRODUCT_PAGE = ' '.join(
+    f'offer {index} sold by store {index} for R$ {index},90 add to cart'
+    for index in range(60)
+)
+
+BLOCKED_PAGE = 'please type the characters you see in this image to continue'
+
+
+def build_client(pages, delay=0.0):
+    in_flight = {'current': 0, 'max': 0}
+
+    async def handler(request):
+        in_flight['current'] += 1
+        in_flight['max'] = max(in_flight['max'], in_flight['current'])
+        await asyncio.sleep(delay)
+        in_flight['current'] -= 1
+        page = pages[request.headers['User-Agent']]
+        if page is None:
+            return httpx.Response(503)
+        return httpx.Response(200, text=page)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), in_flight
+
+
+class TestMinHash(unittest.TestCase):
+    def test_signature_similarity_estimates_jaccard_similarity(self):
+        hasher = MinHasher(permutations=256)
+        edited_page = PRODUCT_PAGE.replace('offer 5 ', 'listing 5 ')
+        shingles1 = set(shingle(PRODUCT_PAGE).tolist())
+        shingles2 = set(shingle(edited_page).tolist())
+        jaccard = len(shingles1 & shingles2) / len(shingles1 | shingles2)
+
+        estimate = estimate_similarity(
+            hasher.signature(PRODUCT_PAGE), hasher.signature(edited_page)
+        )
+
+        self.assertAlmostEqual(estimate, jaccard, delta=0.1)
+        self.assertLess(
+            estimate_similarity(
+                hasher.signature(PRODUCT_PAGE), hasher.signature(BLOCKED_PAGE)
+            ),
+            0.1,
+        )
+
+    def test_group_signatures_merges_similar_contents(self):
+        hasher = MinHasher()
+        signatures = {
+            'chrome': hasher.signature(PRODUCT_PAGE),
+            'safari': hasher.signature(PRODUCT_PAGE + ' footer'),
+            'ie': hasher.signature(BLOCKED_PAGE),
+        }
+
+        groups = group_signatures(signatures, threshold=0.8)
+
+        self.assertEqual(groups, [['chrome', 'safari'], ['ie']])
+
+
+class TestUserAgentProfiles(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        RateLimiterRegistry.clear()
+        load_profile.cache_clear()
+        self.pages = {
+            'chrome': PRODUCT_PAGE,
+            'safari': PRODUCT_PAGE,
+            'ie': BLOCKED_PAGE,
+            'ubuntu': None,
+        }
+
+    async def test_groups_user_agents_fetching_concurrently(self):
+        client, in_flight = build_client(self.pages, delay=0.05)
+
+        groups = await group_user_agents_by_content_similarity(
+            list(self.pages), 'https://www.mock.com/product', client=client
+        )
+
+        self.assertEqual(groups, [['chrome', 'safari'], ['ie'], ['ubuntu']])
+        self.assertGreater(in_flight['max'], 1)
+        await client.aclose()
+
+    async def test_scores_user_agents_against_most_complete_page(self):
+        client, _ = build_client(self.pages)
+
+        profile = await score_user_agents(
+            'mock',
+            'https://www.mock.com/product',
+            user_agents=list(self.pages),
+            client=client,
+        )
+
+        self.assertEqual(profile.scores['chrome'], 1.0)
+        self.assertEqual(profile.scores['safari'], 1.0)
+        self.assertLess(profile.scores['ie'], 0.1)
+        self.assertEqual(profile.scores['ubuntu'], 0.0)
+        self.assertEqual(profile.select(0.8), ['chrome', 'safari'])
+        await client.aclose()
+
+    async def test_saved_profile_is_loaded_with_fallback(self):
+        client, _ = build_client(self.pages)
+        profile = await score_user_agents(
+            'mock',
+            'https://www.mock.com/product',
+            user_agents=list(self.pages),
+            client=client,
+        )
+        await client.aclose()
+
+        with tempfile.TemporaryDirectory() as directory:
+            save_profile(profile, directory)
+
+            self.assertEqual(
+                load_user_agents('mock', directory=directory),
+                ['chrome', 'safari'],
+            )
+            self.assertEqual(
+                load_user_agents(
+                    'mock',
+                    fallback=['default'],
+                    min_score=1.1,
+                    directory=directory,
+                ),
+                ['default'],
+            )
+            self.assertEqual(
+                load_user_agents(
+                    'unscored', fallback=['default'], directory=directory
+                ),
+                ['default'],
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
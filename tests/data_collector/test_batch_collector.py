@@ -0,0 +1,144 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kami_pricing_analytics.data_collector import (
+    BatchCollector,
+    CollectorFactory,
+)
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    BaseScraper,
+)
+
+
+class MockScraper(BaseScraper):
+    use_driver_pool: bool = False
+    marketplace: str = 'mock'
+
+    async def get_marketplace_id(self):
+        return 'mock_marketplace_id'
+
+    async def get_brand(self):
+        return 'mock_brand'
+
+    async def get_description(self):
+        return 'mock_description'
+
+    async def get_price(self):
+        return 'mock_price'
+
+    async def get_seller_id(self):
+        return 'mock_seller_id'
+
+    async def get_seller_name(self):
+        return 'mock_seller_name'
+
+    async def get_seller_url(self):
+        return 'mock_seller_url'
+
+    async def get_seller_info(self, seller):
+        return {'product': str(self.product_url), 'seller': seller}
+
+    async def get_sellers_list(self):
+        await self.run_in_driver(self.webdriver.get, str(self.product_url))
+        if 'broken' in str(self.product_url):
+            raise ValueError('Product page changed')
+        return ['seller1']
+
+
+class TestBatchCollector(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.drivers = []
+        setup_patcher = patch.object(
+            MockScraper, '_setup_driver', side_effect=self.setup_driver
+        )
+        setup_patcher.start()
+        self.addCleanup(setup_patcher.stop)
+        factory_patcher = patch.object(
+            CollectorFactory,
+            'get_strategy',
+            side_effect=lambda collector_option, product_url: MockScraper(
+                product_url=product_url
+            ),
+        )
+        factory_patcher.start()
+        self.addCleanup(factory_patcher.stop)
+
+    def setup_driver(self):
+        driver = MagicMock()
+        self.drivers.append(driver)
+        return driver
+
+    def build_batch(self, *paths, **kwargs):
+        return BatchCollector(
+            product_urls=[f'https://www.mock.com/{path}' for path in paths],
+            **kwargs,
+        )
+
+    async def test_products_share_one_session_in_order(self):
+        batch = self.build_batch('p1', 'p2', 'p3')
+
+        results = [result async for result in batch.stream()]
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(
+            [result.sellers[0]['product'] for result in results],
+            batch.product_urls,
+        )
+        self.assertEqual(len(self.drivers), 1)
+        self.assertEqual(
+            [call.args[0] for call in self.drivers[0].get.call_args_list],
+            batch.product_urls,
+        )
+        self.drivers[0].quit.assert_called_once()
+
+    async def test_failed_product_is_isolated_and_recycles_the_session(self):
+        batch = self.build_batch('p1', 'broken', 'p3')
+
+        results = await batch.execute()
+
+        self.assertEqual(
+            [bool(result.sellers) for result in results], [True, False, True]
+        )
+        self.assertIn('Product page changed', results[1].error)
+        self.assertEqual(results[1].telemetry['error'], 'Product page changed')
+        self.assertIsNone(results[2].error)
+        self.assertEqual(len(self.drivers), 2)
+        for driver in self.drivers:
+            driver.quit.assert_called_once()
+
+    async def test_sessions_scrape_products_concurrently(self):
+        batch = self.build_batch('p1', 'p2', 'p3', 'p4', sessions=2)
+
+        results = await batch.execute()
+
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertTrue(all(result.sellers for result in results))
+        self.assertEqual(len(self.drivers), 2)
+        self.assertEqual(
+            sum(driver.get.call_count for driver in self.drivers), 4
+        )
+
+    async def test_closing_the_stream_releases_the_sessions(self):
+        batch = self.build_batch('p1', 'p2', 'p3')
+
+        results = batch.stream()
+        await anext(results)
+        await results.aclose()
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(self.drivers), 1)
+        self.drivers[0].quit.assert_called_once()
+
+    def test_products_must_share_a_marketplace(self):
+        with self.assertRaises(ValueError):
+            BatchCollector(
+                product_urls=[
+                    'https://www.amazon.com.br/dp/B01',
+                    'https://www.mercadolivre.com.br/p/MLB1',
+                ]
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
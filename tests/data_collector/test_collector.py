@@ -7,6 +7,7 @@ from kami_pricing_analytics.data_collector import (
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
     AmazonScraper,
     BelezaNaWebScraper,
+    CircuitBreakerRegistry,
     MercadoLibreScraper,
 )
 
@@ -47,6 +48,30 @@ class TestCollectorFactory(unittest.TestCase):
                 'https://www.amazon.com.br/prodcut',
             )
 
+    def test_strategies_share_the_marketplace_circuit_breaker(self):
+        scraper = CollectorFactory.get_strategy(
+            CollectorOptions.WEB_SCRAPING.value,
+            'https://www.amazon.com.br/prodcut',
+        )
+        self.assertIs(
+            scraper.circuit_breaker,
+            CircuitBreakerRegistry.get_breaker('amazon'),
+        )
+
+    def test_registered_scraper_is_imported_on_first_use(self):
+        CollectorFactory.register_scraper(
+            'mockmarket',
+            'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon:AmazonScraper',
+        )
+        self.addCleanup(CollectorFactory.scraper_mapping.pop, 'mockmarket')
+
+        scraper = CollectorFactory.get_strategy(
+            CollectorOptions.WEB_SCRAPING.value,
+            'https://www.mockmarket.com.br/prodcut',
+        )
+
+        self.assertIsInstance(scraper, AmazonScraper)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import unittest
+
+APP_MODULE = 'kami_pricing_analytics.interface.api.fastapi.app'
+
+
+class TestAppImports(unittest.TestCase):
+    def test_app_import_leaves_drivers_unloaded(self):
+        code = (
+            f'import sys, {APP_MODULE}; '
+            "print(' '.join(sorted({module.split('.')[0] for module in sys.modules})))"
+        )
+        process = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = set(process.stdout.split())
+
+        for package in (
+            'selenium',
+            'selenium_stealth',
+            'webdriver_manager',
+            'robotexclusionrulesparser',
+            'lxml',
+            'sqlalchemy',
+            'asyncpg',
+        ):
+            self.assertNotIn(package, loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
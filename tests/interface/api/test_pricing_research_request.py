@@ -4,6 +4,9 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 from kami_pricing_analytics.data_collector import CollectorOptions
+from kami_pricing_analytics.data_collector.strategies.web_scraping import (
+    CircuitOpenException,
+)
 from kami_pricing_analytics.interface.api import (
     PricingResearchRequest,
     PricingResearchRequestException,
@@ -151,6 +154,74 @@ class TestPricingResearchRequest(unittest.IsolatedAsyncioTestCase):
             self.request.service.research.sellers, ['seller1', 'seller2']
         )
 
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.probe_research',
+        new_callable=AsyncMock,
+    )
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.retrieve_research'
+    )
+    @patch(
+        'kami_pricing_analytics.interface.api.pricing_research_request.PricingResearchRequest.post'
+    )
+    async def test_get_expired_unchanged_data_skips_post(
+        self, mock_post, mock_retrieve_research, mock_probe_research
+    ):
+        mock_probe_research.return_value = True
+        self.request.service.research.sellers = ['seller1', 'seller2']
+        self.request.service.research.conducted_at = datetime.now(
+            tz=timezone.utc
+        ) - timedelta(seconds=3600)
+
+        await self.request.get()
+
+        mock_probe_research.assert_awaited_once()
+        mock_post.assert_not_called()
+
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.conduct_research',
+        new_callable=AsyncMock,
+    )
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.probe_research',
+        new_callable=AsyncMock,
+    )
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.retrieve_research'
+    )
+    async def test_get_serves_stale_data_while_circuit_is_open(
+        self,
+        mock_retrieve_research,
+        mock_probe_research,
+        mock_conduct_research,
+    ):
+        mock_probe_research.return_value = False
+        mock_conduct_research.side_effect = CircuitOpenException('amazon', 30)
+        self.request.service.research.sellers = ['seller1', 'seller2']
+        self.request.service.research.conducted_at = datetime.now(
+            tz=timezone.utc
+        ) - timedelta(seconds=3600)
+
+        response = await self.request.get()
+
+        mock_conduct_research.assert_awaited_once()
+        self.assertEqual(response, ['seller1', 'seller2'])
+
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.conduct_research',
+        new_callable=AsyncMock,
+    )
+    @patch(
+        'kami_pricing_analytics.services.pricing_service.PricingService.retrieve_research'
+    )
+    async def test_get_fails_fast_without_stored_data_while_circuit_is_open(
+        self, mock_retrieve_research, mock_conduct_research
+    ):
+        mock_conduct_research.side_effect = CircuitOpenException('amazon', 30)
+
+        with self.assertRaises(CircuitOpenException):
+            await self.request.get()
+
 
 if __name__ == '__main__':
     unittest.main()
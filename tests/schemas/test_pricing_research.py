@@ -52,6 +52,27 @@ class TestPricingResearch(unittest.TestCase):
         instance.extract_marketplace_id_from_url()
         self.assertEqual(instance.marketplace_id, 'B07GYX8QRJ')
 
+    def test_google_search_url_is_identified_by_its_query(self):
+        instance = PricingResearch(
+            url='https://www.google.com.br/search?tbm=shop&q=shampoo+300ml'
+        )
+        self.assertEqual(instance.marketplace, 'google_shopping')
+        self.assertEqual(instance.marketplace_id, 'shampoo 300ml')
+
+        instance.update_research_data(
+            [{'marketplace_id': 'shampoo 300ml', 'description': 'Shampoo'}]
+        )
+        self.assertEqual(instance.marketplace_id, 'shampoo 300ml')
+
+    def test_google_shopping_url_set_from_query(self):
+        instance = PricingResearch(
+            marketplace='google_shopping', marketplace_id='shampoo 300ml'
+        )
+        self.assertEqual(
+            str(instance.url),
+            'https://www.google.com.br/search?tbm=shop&q=shampoo+300ml',
+        )
+
     def test_update_research_data(self):
         instance = PricingResearch(**self.valid_data)
         result_data = [
@@ -79,6 +100,18 @@ class TestPricingResearch(unittest.TestCase):
         instance.conducted_at = datetime.now(tz=timezone.utc)
         self.assertFalse(instance.expired)
 
+    def test_extend_validity_renews_expired_research(self):
+        expired_time = datetime.now(tz=timezone.utc) - timedelta(seconds=3600)
+        instance = PricingResearch(
+            **self.valid_data, conducted_at=expired_time
+        )
+        self.assertTrue(instance.expired)
+
+        instance.extend_validity()
+
+        self.assertFalse(instance.expired)
+        self.assertEqual(instance.conducted_at, expired_time)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,12 @@
+import asyncio
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 from kami_pricing_analytics.data_collector import CollectorOptions
 from kami_pricing_analytics.data_collector.strategies.web_scraping import (
     BaseScraper,
+    ProbeResult,
 )
 from kami_pricing_analytics.data_storage import StorageModeOptions
 from kami_pricing_analytics.data_storage.modes.database.relational import (
@@ -22,6 +25,12 @@ class TestPricingService(unittest.IsolatedAsyncioTestCase):
             storage_mode=StorageModeOptions.SQLITE.value,
             store_result=True,
         )
+        probe_patcher = patch.object(
+            BaseScraper, 'probe', new_callable=AsyncMock
+        )
+        self.mock_probe = probe_patcher.start()
+        self.mock_probe.return_value = ProbeResult(fingerprint='abc')
+        self.addCleanup(probe_patcher.stop)
 
     def test_default_strategy_should_be_web_scraping(self):
         self.pricing_service.set_strategy()
@@ -169,6 +178,118 @@ class TestPricingService(unittest.IsolatedAsyncioTestCase):
 
         mock_save.assert_not_called()
 
+    @patch(
+        'kami_pricing_analytics.data_collector.strategies.web_scraping.amazon.AmazonScraper.execute',
+        new_callable=AsyncMock,
+    )
+    async def test_conduct_research_captures_probe_snapshot(
+        self, mock_execute
+    ):
+        mock_execute.return_value = []
+
+        await self.pricing_service.conduct_research()
+
+        self.mock_probe.assert_awaited_once_with()
+        self.assertEqual(
+            self.pricing_service.research.probe['fingerprint'], 'abc'
+        )
+
+    async def test_conduct_research_probes_while_scraping(self):
+        scraping = asyncio.Event()
+
+        async def probe(*args):
+            await asyncio.wait_for(scraping.wait(), timeout=1)
+            return ProbeResult(fingerprint='abc')
+
+        async def execute(_):
+            scraping.set()
+            await asyncio.sleep(0.01)
+            return []
+
+        self.mock_probe.side_effect = probe
+        with patch.object(
+            type(self.pricing_service.strategy), 'execute', new=execute
+        ):
+            await self.pricing_service.conduct_research()
+
+        self.assertEqual(
+            self.pricing_service.research.probe['fingerprint'], 'abc'
+        )
+
+    async def test_stream_research_yields_sellers_then_updates_research(self):
+        sellers = [
+            {'marketplace_id': '12345', 'brand': 'Test Brand'},
+            {'marketplace_id': '12345', 'brand': 'Test Brand'},
+        ]
+
+        async def stream(_):
+            for seller in sellers:
+                self.assertIsNone(self.pricing_service.research.conducted_at)
+                yield seller
+
+        with patch.object(
+            type(self.pricing_service.strategy), 'stream', new=stream
+        ):
+            streamed = [
+                seller
+                async for seller in self.pricing_service.stream_research()
+            ]
+
+        self.assertEqual(streamed, sellers)
+        self.assertEqual(self.pricing_service.research.sellers, sellers)
+        self.assertEqual(self.pricing_service.research.marketplace_id, '12345')
+        self.assertIsNotNone(self.pricing_service.research.conducted_at)
+
+    @patch(
+        'kami_pricing_analytics.data_storage.modes.database.relational.sqlite.SQLiteStorage.update',
+        new_callable=AsyncMock,
+    )
+    async def test_probe_research_extends_unchanged_research(
+        self, mock_update
+    ):
+        research = self.pricing_service.research
+        research.conducted_at = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=3600
+        )
+        research.probe = {'etag': '"v1"', 'fingerprint': 'abc'}
+        self.mock_probe.return_value = ProbeResult(
+            changed=False, not_modified=True, **research.probe
+        )
+
+        is_current = await self.pricing_service.probe_research()
+
+        self.assertTrue(is_current)
+        self.assertFalse(research.expired)
+        self.mock_probe.assert_awaited_once_with(
+            {'etag': '"v1"', 'fingerprint': 'abc'}
+        )
+        mock_update.assert_awaited_once()
+        self.assertEqual(
+            mock_update.call_args.kwargs['data']['checked_at'],
+            research.checked_at,
+        )
+
+    @patch(
+        'kami_pricing_analytics.data_storage.modes.database.relational.sqlite.SQLiteStorage.update',
+        new_callable=AsyncMock,
+    )
+    async def test_probe_research_keeps_changed_research_expired(
+        self, mock_update
+    ):
+        research = self.pricing_service.research
+        research.conducted_at = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=3600
+        )
+        research.probe = {'fingerprint': 'abc'}
+        self.mock_probe.return_value = ProbeResult(fingerprint='def')
+
+        is_current = await self.pricing_service.probe_research()
+
+        self.assertFalse(is_current)
+        self.assertTrue(research.expired)
+        self.assertEqual(research.probe['fingerprint'], 'def')
+        mock_update.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()